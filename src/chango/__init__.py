@@ -1,23 +1,56 @@
 # SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
 #
 # SPDX-License-Identifier: MIT
+from typing import TYPE_CHECKING
 
 __all__ = [
     "ChangeNoteInfo",
     "Version",
+    "VersionHistoryFragment",
     "__version__",
     "abc",
     "action",
+    "aio",
     "concrete",
     "config",
     "constants",
     "error",
+    "export",
     "helpers",
+    "monorepo",
 ]
 
-from . import __about__, abc, action, concrete, config, constants, error, helpers
-from ._changenoteinfo import ChangeNoteInfo
-from ._version import Version
+from . import __about__
+from ._utils.lazy import lazy_module_attributes
+
+if TYPE_CHECKING:
+    from . import abc, action, aio, concrete, config, constants, error, export, helpers, monorepo
+    from ._changenoteinfo import ChangeNoteInfo
+    from ._version import Version
+    from ._versionhistoryfragment import VersionHistoryFragment
 
 #: :obj:`str`: The version of the ``chango`` library as string
 __version__: str = __about__.__version__
+
+# Submodules and classes are imported on first access. Importing e.g. chango.Version hence
+# doesn't import the third party dependencies of the other submodules.
+__getattr__, __dir__ = lazy_module_attributes(
+    __name__,
+    submodules=(
+        "abc",
+        "action",
+        "aio",
+        "concrete",
+        "config",
+        "constants",
+        "error",
+        "export",
+        "helpers",
+        "monorepo",
+    ),
+    attributes={
+        "ChangeNoteInfo": "._changenoteinfo",
+        "Version": "._version",
+        "VersionHistoryFragment": "._versionhistoryfragment",
+    },
+)
@@ -2,7 +2,7 @@
 #
 #  SPDX-License-Identifier: MIT
 
-from ._cli import app  # pragma: no cover
+from ._cli import main  # pragma: no cover
 
 if __name__ == "__main__":  # pragma: no cover
-    app()
+    main()
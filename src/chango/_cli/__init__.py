@@ -1,47 +1,40 @@
 # SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
 #
 # SPDX-License-Identifier: MIT
-__all__ = ["app"]
+import sys
+from typing import TYPE_CHECKING
 
-import os
-from typing import Annotated
+__all__ = ["app", "main"]
 
-import typer
+from .. import __about__
+from .._utils.lazy import lazy_module_attributes
+from . import _daemon
 
-from .. import __version__
-from .config import app as config_app
-from .edit import edit
-from .new import new
-from .release import release
-from .report import app as report_app
-
-app = typer.Typer(
-    help="CLI for chango - CHANgelog GOvernor for Your Project", rich_markup_mode="rich"
-)
+if TYPE_CHECKING:
+    from ._app import app
 
 
-def version_callback(value: bool) -> None:
-    if value:
-        typer.echo(__version__)
-        raise typer.Exit
+def main() -> None:
+    """Entry point of the ``chango`` command."""
+    # Answer the most common meta query without importing the CLI framework
+    if sys.argv[1:] == ["--version"]:
+        sys.stdout.write(f"{__about__.__version__}\n")
+        return
 
+    # A running 'chango serve' daemon already holds a warm instance. Other commands, e.g. help
+    # requests, don't try to connect to it at all.
+    if (
+        _daemon.should_forward(args := sys.argv[1:])
+        and (exit_code := _daemon.forward(args)) is not None
+    ):
+        sys.exit(exit_code)
 
-@app.callback()
-def main(
-    _version: Annotated[
-        bool,
-        typer.Option("--version", callback=version_callback, help="Show the version and exit."),
-    ] = False,
-) -> None:
-    pass
+    # The subcommands are in turn only imported when they are invoked
+    from ._app import app  # noqa: PLC0415
 
+    app()
 
-app.add_typer(config_app, name="config")
-app.command()(edit)
-app.command()(new)
-app.command()(release)
-app.add_typer(report_app, name="report")
 
-if os.getenv("SPHINX_BUILD") == "True":  # pragma: no cover
-    # See https://github.com/fastapi/typer/issues/200#issuecomment-795873331
-    _typer_click_object = typer.main.get_command(app)
+__getattr__, __dir__ = lazy_module_attributes(
+    __name__, submodules=(), attributes={"app": "._app", "_typer_click_object": "._app"}
+)
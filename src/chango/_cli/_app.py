@@ -0,0 +1,57 @@
+# SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
+#
+# SPDX-License-Identifier: MIT
+__all__ = ["app"]
+
+import os
+from typing import Annotated
+
+import typer
+
+from .. import __version__
+from .utils.lazy import LazyTyperGroup
+
+
+class _ChanGoGroup(LazyTyperGroup):
+    # Same order as typer would list eagerly registered commands and sub-apps
+    lazy_commands = {  # noqa: RUF012
+        "check": "chango._cli.check:check",
+        "edit": "chango._cli.edit:edit",
+        "export": "chango._cli.export:export",
+        "new": "chango._cli.new:new",
+        "pack": "chango._cli.pack:pack",
+        "release": "chango._cli.release:release",
+        "serve": "chango._cli.serve:serve",
+        "unpack": "chango._cli.pack:unpack",
+        "watch": "chango._cli.watch:watch",
+        "config": "chango._cli.config:app",
+        "report": "chango._cli.report:app",
+    }
+
+
+app = typer.Typer(
+    help="CLI for chango - CHANgelog GOvernor for Your Project",
+    rich_markup_mode="rich",
+    cls=_ChanGoGroup,
+)
+
+
+def version_callback(value: bool) -> None:
+    if value:
+        typer.echo(__version__)
+        raise typer.Exit
+
+
+@app.callback()
+def main(
+    _version: Annotated[
+        bool,
+        typer.Option("--version", callback=version_callback, help="Show the version and exit."),
+    ] = False,
+) -> None:
+    pass
+
+
+if os.getenv("SPHINX_BUILD") == "True":  # pragma: no cover
+    # See https://github.com/fastapi/typer/issues/200#issuecomment-795873331
+    _typer_click_object = typer.main.get_command(app)
@@ -0,0 +1,158 @@
+#  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
+#
+#  SPDX-License-Identifier: MIT
+"""Client side of the ``chango serve`` daemon. This module is imported on every invocation of
+the CLI and must hence only import from the standard library.
+"""
+
+import hashlib
+import json
+import os
+import socket
+import stat
+import subprocess
+import sys
+import tempfile
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+#: Name of the environment variable that controls forwarding to the daemon. ``"0"`` disables
+#: forwarding and ``"auto"`` additionally starts the daemon in the background if it's not
+#: running yet.
+DAEMON_ENV_VAR = "CHANGO_DAEMON"
+#: Commands that are forwarded to the daemon. Commands that open an editor run in-process.
+FORWARDED_COMMANDS = frozenset({"new", "pack", "release", "report", "unpack"})
+_NO_EDIT_OPTIONS = frozenset({"--no-edit", "-ne"})
+_HELP_OPTIONS = frozenset({"--help"})
+_CONNECT_TIMEOUT = 0.5
+
+
+def get_socket_directory() -> Path:
+    """Get the per-user directory that holds the sockets. It's located in ``XDG_RUNTIME_DIR`` or
+    the temporary directory, which may be shared with other users.
+    """
+    directory = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return Path(directory) / f"chango-{os.getuid()}"
+
+
+def ensure_socket_directory(directory: Path) -> None:
+    """Create the socket directory such that only the current user can access it.
+
+    Raises:
+        :class:`PermissionError`: If the directory exists but is not private to the current user.
+    """
+    directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+    # lstat, such that a symlink planted by another user is not followed
+    info = directory.lstat()
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+        raise PermissionError(
+            f"Refusing to use {directory}: it must be a directory with mode 0700 that is owned "
+            "by the current user."
+        )
+
+
+def get_socket_path(pyproject_toml_path: Path | None = None) -> Path:
+    """Get the path of the socket of the daemon serving the given ``pyproject.toml`` file.
+    Defaults to the file in the current working directory, as used by the CLI.
+    """
+    path = (pyproject_toml_path or Path.cwd() / "pyproject.toml").resolve()
+    digest = hashlib.sha256(str(path).encode()).hexdigest()[:16]
+    return get_socket_directory() / f"chango-{digest}.sock"
+
+
+def should_forward(args: Sequence[str]) -> bool:
+    """Check by the command name and options whether the command may be forwarded. This is
+    cheap and should be called before trying to connect to the daemon.
+    """
+    if os.environ.get(DAEMON_ENV_VAR) == "0" or not args or args[0] not in FORWARDED_COMMANDS:
+        return False
+    # Help is printed quickly in-process and doesn't need the instance
+    if not _HELP_OPTIONS.isdisjoint(args):
+        return False
+    # 'chango new' opens the editor by default
+    return args[0] != "new" or not _NO_EDIT_OPTIONS.isdisjoint(args)
+
+
+def connect(socket_path: Path) -> socket.socket:
+    """Connect to the daemon.
+
+    Raises:
+        :class:`PermissionError`: If the socket is owned by another user.
+        :class:`OSError`: If the daemon is not running.
+    """
+    # Otherwise, another user could pre-create the socket and answer in place of the daemon
+    if socket_path.stat().st_uid != os.getuid():
+        raise PermissionError(f"Refusing to connect to {socket_path}: owned by another user.")
+
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.settimeout(_CONNECT_TIMEOUT)
+        client.connect(str(socket_path))
+    except OSError:
+        client.close()
+        raise
+    # The command itself may take arbitrarily long
+    client.settimeout(None)
+    return client
+
+
+def exchange(client: socket.socket, request: dict[str, Any]) -> dict[str, Any]:
+    """Send a request to the daemon and wait for the response. The request is terminated by
+    shutting down the writing side of the connection, the response by closing the connection.
+    """
+    client.sendall(json.dumps(request).encode())
+    client.shutdown(socket.SHUT_WR)
+    chunks = []
+    while chunk := client.recv(65536):
+        chunks.append(chunk)
+    return json.loads(b"".join(chunks))
+
+
+def start_daemon() -> None:
+    """Start the daemon for the current working directory in the background."""
+    subprocess.Popen(
+        [sys.executable, "-m", "chango", "serve"],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+def forward(args: Sequence[str]) -> int | None:
+    """Run the command in the daemon if it is running.
+
+    Returns:
+        :obj:`int` | :obj:`None`: The exit code of the command or :obj:`None` if the command
+            has to be run in-process.
+    """
+    if not should_forward(args):
+        return None
+
+    try:
+        client = connect(get_socket_path())
+    except PermissionError as exc:
+        sys.stderr.write(f"Warning: {exc} Running the command without the daemon.\n")
+        return None
+    except OSError:
+        if os.environ.get(DAEMON_ENV_VAR) == "auto":
+            start_daemon()
+        return None
+
+    with client:
+        try:
+            response = exchange(
+                client, {"args": list(args), "cwd": str(Path.cwd()), "env": dict(os.environ)}
+            )
+        except (OSError, ValueError) as exc:
+            # The command may have been executed already, so running it again is not safe
+            sys.stderr.write(f"Error: Lost connection to the chango daemon: {exc}\n")
+            return 1
+
+    # The daemon declines requests if its configuration is outdated
+    if response.get("exit_code") is None:
+        return None
+    sys.stdout.write(response["stdout"])
+    sys.stderr.write(response["stderr"])
+    return int(response["exit_code"])
@@ -0,0 +1,91 @@
+#  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
+#
+#  SPDX-License-Identifier: MIT
+
+__all__ = ["check"]
+
+import json
+import os
+from enum import StrEnum
+from typing import Annotated
+
+import typer
+
+from chango.config import get_chango_instance
+from chango.error import ChanGoError
+
+from .._utils.check import CheckResult, check_change_notes, check_staged_change_notes
+
+
+class OutputFormat(StrEnum):
+    TEXT = "text"
+    JSON = "json"
+
+
+JOBS = Annotated[
+    int,
+    typer.Option(
+        "-j", "--jobs", help="The number of parallel workers. 0 uses one per CPU.", min=0
+    ),
+]
+FORMAT = Annotated[
+    OutputFormat,
+    typer.Option(
+        "-f", "--format", help="The output format. 'json' prints a single machine-readable object."
+    ),
+]
+
+
+def resolve_jobs(jobs: int) -> int:
+    return jobs or os.cpu_count() or 1
+
+
+def report_result(result: CheckResult, output_format: OutputFormat) -> None:
+    """Print the problems and exit with code 1 if there are any."""
+    if output_format is OutputFormat.JSON:
+        typer.echo(
+            json.dumps(
+                {
+                    "checked": result.checked,
+                    "problems": [problem.to_json() for problem in result.problems],
+                }
+            )
+        )
+    else:
+        for problem in result.problems:
+            typer.echo(f"{problem.path}: {problem.kind}: {problem.message}")
+        typer.echo(
+            f"Checked {result.checked} change note(s), found {len(result.problems)} problem(s)."
+        )
+
+    if result.problems:
+        raise typer.Exit(1)
+
+
+def check(
+    jobs: JOBS = 1,
+    output_format: FORMAT = OutputFormat.TEXT,
+    staged: Annotated[
+        bool,
+        typer.Option(
+            "--staged",
+            help=(
+                "Only check the change notes staged in git, e.g. in a pre-commit hook. UID "
+                "collisions are checked against the files in the git index."
+            ),
+        ),
+    ] = False,
+) -> None:
+    """Validate all change notes. Reports change notes that can't be parsed, change notes that
+    share a UID and files in the change note directories that are not change notes.
+    """
+    chango = get_chango_instance()
+    if not staged:
+        report_result(check_change_notes(chango, resolve_jobs(jobs)), output_format)
+        return
+
+    try:
+        result = check_staged_change_notes(chango, resolve_jobs(jobs))
+    except ChanGoError as exc:
+        raise typer.BadParameter(str(exc)) from exc
+    report_result(result, output_format)
@@ -9,6 +9,9 @@ from typing import Annotated
 import typer
 
 from chango.config import get_chango_instance
+from chango.error import ChanGoError
+
+from .._utils.sources import get_directory_scanners
 
 
 def edit(
@@ -20,4 +23,19 @@ def edit(
     ],
 ) -> None:
     """Edit an existing change note in the default editor."""
-    typer.launch(get_chango_instance().scanner.lookup_change_note(uid).file_path.as_posix())
+    scanner = get_chango_instance().scanner
+    try:
+        info = scanner.lookup_change_note(uid)
+    except ChanGoError as exc:
+        raise typer.BadParameter(str(exc)) from exc
+
+    if info.version is not None and any(
+        directory_scanner.is_packed(info.version)
+        for directory_scanner in get_directory_scanners(scanner)
+    ):
+        raise typer.BadParameter(
+            f"Change note '{uid}' is stored in the pack file of version "
+            f"'{info.version.uid}'. Unpack it with 'chango unpack --uid {info.version.uid}' "
+            "to edit the change note."
+        )
+    typer.launch(info.file_path.as_posix())
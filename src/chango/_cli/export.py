@@ -0,0 +1,72 @@
+#  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
+#
+#  SPDX-License-Identifier: MIT
+
+__all__ = ["export"]
+
+import contextlib
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from enum import StrEnum
+from typing import Annotated
+
+import typer
+
+from chango.config import get_chango_instance
+
+from .._utils.files import UTF8
+from ..export import iter_change_note_records
+from .utils.types import OUTPUT_FILE
+
+
+class ExportFormat(StrEnum):
+    JSONL = "jsonl"
+
+
+def export(
+    output_format: Annotated[
+        ExportFormat,
+        typer.Option(
+            "-f",
+            "--format",
+            help="The output format. 'jsonl' writes one JSON object per change note and line.",
+        ),
+    ] = ExportFormat.JSONL,
+    output: OUTPUT_FILE = None,
+    start_from: Annotated[
+        str | None,
+        typer.Option(help="The version to start from. Defaults to the earliest version."),
+    ] = None,
+    end_at: Annotated[
+        str | None,
+        typer.Option(
+            help=(
+                "The version to end at. Defaults to the latest version, including unreleased "
+                "changes."
+            )
+        ),
+    ] = None,
+    jobs: Annotated[
+        int,
+        typer.Option(
+            "-j", "--jobs", help="The number of threads used to load the versions.", min=1
+        ),
+    ] = 1,
+) -> None:
+    """Export all change notes in a machine-readable format. The output is written while the
+    versions are loaded, so the memory usage does not grow with the size of the history.
+    """
+    chango = get_chango_instance()
+    with contextlib.ExitStack() as stack:
+        executor = stack.enter_context(ThreadPoolExecutor(max_workers=jobs)) if jobs > 1 else None
+        file = stack.enter_context(output.open("w", encoding=UTF8)) if output else sys.stdout
+        # Only JSON Lines is supported for now, the option is there for future formats
+        if output_format is ExportFormat.JSONL:
+            for record in iter_change_note_records(
+                chango, start_from=start_from, end_at=end_at, executor=executor, prefetch=2 * jobs
+            ):
+                file.write(json.dumps(record.to_json()) + "\n")
+
+    if output:
+        typer.echo(f"Export written to {output}")
@@ -0,0 +1,77 @@
+#  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
+#
+#  SPDX-License-Identifier: MIT
+
+__all__ = ["pack", "unpack"]
+
+from typing import Annotated
+
+import typer
+
+from chango.concrete import DirectoryVersionScanner
+from chango.config import get_chango_instance
+from chango.error import ChanGoError
+
+from .._utils.sources import get_directory_scanners
+
+_UIDS_OPTION = typer.Option(
+    "--uid", help="The unique identifier of a version. May be passed multiple times."
+)
+_ALL_OPTION = typer.Option("--all", help="Process all versions.")
+
+
+def _select_versions(
+    uids: list[str] | None, all_versions: bool, packed: bool
+) -> list[tuple[DirectoryVersionScanner, str]]:
+    if bool(uids) == all_versions:
+        raise typer.BadParameter("Pass either at least one '--uid' or '--all'.")
+
+    scanners = get_directory_scanners(get_chango_instance().scanner)
+    if not scanners:
+        raise typer.BadParameter(
+            "Packing is only supported for chango instances using a DirectoryVersionScanner."
+        )
+
+    if all_versions:
+        return [
+            (scanner, version.uid)
+            for scanner in scanners
+            for version in sorted(
+                scanner.get_available_versions(), key=lambda version: (version.date, version.uid)
+            )
+            if scanner.is_packed(version) != packed
+        ]
+
+    selected = []
+    for uid in uids or ():
+        scanner = next((scanner for scanner in scanners if scanner.is_available(uid)), None)
+        if scanner is None:
+            raise typer.BadParameter(f"Version '{uid}' not available.")
+        selected.append((scanner, uid))
+    return selected
+
+
+def pack(
+    uids: Annotated[list[str] | None, _UIDS_OPTION] = None,
+    all_versions: Annotated[bool, _ALL_OPTION] = False,
+) -> None:
+    """Compact the change notes of released versions into a single pack file per version."""
+    for scanner, uid in _select_versions(uids, all_versions, packed=True):
+        try:
+            path = scanner.pack_version(uid)
+        except ChanGoError as exc:
+            raise typer.BadParameter(str(exc)) from exc
+        typer.echo(f"Packed version {uid} into {path}")
+
+
+def unpack(
+    uids: Annotated[list[str] | None, _UIDS_OPTION] = None,
+    all_versions: Annotated[bool, _ALL_OPTION] = False,
+) -> None:
+    """Extract the change notes of packed versions into version directories."""
+    for scanner, uid in _select_versions(uids, all_versions, packed=False):
+        try:
+            path = scanner.unpack_version(uid)
+        except ChanGoError as exc:
+            raise typer.BadParameter(str(exc)) from exc
+        typer.echo(f"Unpacked version {uid} into {path}")
@@ -4,14 +4,21 @@
 
 __all__ = ["app"]
 
+import datetime as dtm
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Annotated
 
 import typer
 
+from chango import VersionHistoryFragment
 from chango.config import get_chango_instance
 
 from ..constants import MarkupLanguage
+from ..error import ValidationError
+from ..monorepo import MonorepoChanGo
 from .utils.types import MARKUP, OUTPUT_FILE
+from .utils.types import date as date_callback
 
 app = typer.Typer(help="Generate reports for one or multiple versions.")
 
@@ -51,3 +58,134 @@ def history(markup: MARKUP = MarkupLanguage.MARKDOWN, output: OUTPUT_FILE = None
         typer.echo(f"Report written to {output}")
     else:
         typer.echo(text)
+
+
+@app.command()
+def monorepo(
+    root: Annotated[
+        Path,
+        typer.Option(
+            help="The directory to search for chango configurations.", exists=True, file_okay=False
+        ),
+    ] = Path(),
+    since: Annotated[
+        dtm.date | None,
+        typer.Option(
+            help="Only include versions released on or after this date.",
+            parser=date_callback,
+            show_default=False,
+        ),
+    ] = None,
+    jobs: Annotated[
+        int | None,
+        typer.Option(
+            "-j",
+            "--jobs",
+            help="The number of threads used to load the version notes.",
+            min=1,
+            show_default=False,
+        ),
+    ] = None,
+    markup: MARKUP = MarkupLanguage.MARKDOWN,
+    output: OUTPUT_FILE = None,
+) -> None:
+    """Print a combined report of all chango configurations found below a directory, e.g. the
+    packages of a monorepo.
+    """
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        text = MonorepoChanGo.from_root(root, executor=executor).render(markup, since=since)
+    if output:
+        output.write_text(text)
+        typer.echo(f"Report written to {output}")
+    else:
+        typer.echo(text)
+
+
+@app.command()
+def fragment(
+    versions: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--versions",
+            help=(
+                "The unique identifier of a version to render. May be passed multiple times. "
+                "If neither this nor '--unreleased' is passed, all versions are rendered."
+            ),
+            show_default=False,
+        ),
+    ] = None,
+    unreleased: Annotated[
+        bool, typer.Option("--unreleased", help="Render the unreleased changes.")
+    ] = False,
+    markup: MARKUP = MarkupLanguage.MARKDOWN,
+    output_dir: Annotated[
+        Path,
+        typer.Option(
+            "-d",
+            "--output-dir",
+            help="The directory to write the fragment files to.",
+            file_okay=False,
+        ),
+    ] = Path(),
+) -> None:
+    """Render versions into fragment files, which can be combined with 'chango report merge'.
+    This allows to split the rendering of large version histories across several processes.
+    """
+    chango = get_chango_instance()
+    scanner = chango.scanner
+
+    # The positions must be the same as in a version history loaded in a single process, such
+    # that the merged output is identical to 'chango report history'
+    all_versions: list[str | None] = [None] if scanner.has_unreleased_changes() else []
+    all_versions.extend(version.uid for version in scanner.get_available_versions())
+    positions = {uid: position for position, uid in enumerate(all_versions)}
+
+    if versions or unreleased:
+        selected: list[str | None] = [None] if unreleased else []
+        selected.extend(versions or ())
+    else:
+        selected = all_versions
+    for uid in selected:
+        if uid not in positions:
+            raise typer.BadParameter(f"Version '{uid or 'Unreleased'}' not available.")
+
+    version_history = chango.build_version_history()
+    for uid in selected:
+        version_history.add_version_note(chango.load_version_note(uid))
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    for version_fragment in version_history.render_fragments(markup, positions=positions):
+        path = version_fragment.to_file(
+            output_dir / f"{version_fragment.uid or 'unreleased'}.fragment.json"
+        )
+        typer.echo(f"Fragment written to {path}")
+
+
+@app.command()
+def merge(
+    files: Annotated[
+        list[Path],
+        typer.Argument(
+            help="The fragment files written by 'chango report fragment'.",
+            exists=True,
+            dir_okay=False,
+            show_default=False,
+        ),
+    ],
+    output: OUTPUT_FILE = None,
+) -> None:
+    """Combine fragment files into a report of the version history."""
+    try:
+        text = (
+            get_chango_instance()
+            .build_version_history()
+            .merge_fragments(VersionHistoryFragment.from_file(path) for path in files)
+        )
+    except (ValidationError, NotImplementedError) as exc:
+        raise typer.BadParameter(str(exc)) from exc
+
+    if output:
+        output.write_text(text)
+        typer.echo(f"Report written to {output}")
+    else:
+        typer.echo(text)
@@ -0,0 +1,250 @@
+#  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
+#
+#  SPDX-License-Identifier: MIT
+
+__all__ = ["ChanGoDaemon", "serve"]
+
+import contextlib
+import io
+import json
+import os
+import socket
+import traceback
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Annotated, Any
+
+import click
+import typer
+
+from chango.abc import VersionScanner
+from chango.concrete import (
+    BackwardCompatibleVersionScanner,
+    CachingChanGo,
+    DirectoryVersionScanner,
+    DirectoryVersionScannerWatcher,
+)
+from chango.config import ChanGoConfig, get_chango_instance
+
+from .._utils.config import get_pyproject_toml_path
+from .._utils.sources import collect_source_paths, compute_fingerprint
+from ..config._cache import get_module_file
+from ._daemon import connect, ensure_socket_directory, get_socket_path
+
+
+@contextlib.contextmanager
+def _environment(environment: dict[str, str]) -> Iterator[None]:
+    original = os.environ.copy()
+    os.environ.clear()
+    os.environ.update(environment)
+    try:
+        yield
+    finally:
+        os.environ.clear()
+        os.environ.update(original)
+
+
+def _stat(path: Path | None) -> tuple[int, int] | None:
+    if path is None:
+        return None
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _split_scanners(
+    scanner: VersionScanner,
+) -> tuple[list[DirectoryVersionScanner], list[VersionScanner]]:
+    """Split the scanner into the directory-based scanners, which are watched for changes, and
+    the remaining scanners, whose sources are fingerprinted.
+    """
+    if isinstance(scanner, DirectoryVersionScanner):
+        return [scanner], []
+    if isinstance(scanner, BackwardCompatibleVersionScanner):
+        directory_scanners: list[DirectoryVersionScanner] = []
+        other_scanners: list[VersionScanner] = []
+        for sub_scanner in scanner.scanners:
+            sub_directory_scanners, sub_other_scanners = _split_scanners(sub_scanner)
+            directory_scanners.extend(sub_directory_scanners)
+            other_scanners.extend(sub_other_scanners)
+        return directory_scanners, other_scanners
+    return [], [scanner]
+
+
+class ChanGoDaemon:
+    """Serves CLI commands for one ``pyproject.toml`` file from a warm
+    :class:`~chango.abc.ChanGo` instance.
+
+    Before each command, the daemon revalidates its state. Changes of the change note
+    directories of :class:`~chango.concrete.DirectoryVersionScanner` instances are picked up via
+    :class:`~chango.concrete.DirectoryVersionScannerWatcher`, which updates only the affected
+    caches. For other scanners, the modification times and sizes of the change note files are
+    checked and the caches are invalidated if they changed.
+    If the configuration file or the module that the instance is imported from changed, the
+    daemon declines the command, such that the client runs it in-process, and shuts down.
+
+    Args:
+        pyproject_toml_path (:class:`~pathlib.Path`): The configuration file.
+        socket_path (:class:`~pathlib.Path`): The Unix domain socket to listen on.
+        idle_timeout (:obj:`float` | :obj:`None`): Shut down after this many seconds without
+            commands. :obj:`None` means never.
+    """
+
+    def __init__(
+        self, pyproject_toml_path: Path, socket_path: Path, idle_timeout: float | None
+    ) -> None:
+        self.pyproject_toml_path = pyproject_toml_path
+        self.socket_path = socket_path
+        self.idle_timeout = idle_timeout
+
+        # Imported here, since importing the app module imports this module lazily
+        from ._app import app  # noqa: PLC0415
+
+        self._command = typer.main.get_command(app)
+        config = ChanGoConfig.load(pyproject_toml_path)
+        self.chango = get_chango_instance(pyproject_toml_path)
+        self._module_file = get_module_file(config)
+        self._config_state = self._get_config_state()
+        directory_scanners, self._other_scanners = _split_scanners(self.chango.scanner)
+        self._watchers = [
+            DirectoryVersionScannerWatcher(scanner) for scanner in directory_scanners
+        ]
+        self._fingerprint = self._get_fingerprint()
+
+    def _get_config_state(self) -> tuple[Any, ...]:
+        return _stat(self.pyproject_toml_path), _stat(self._module_file)
+
+    def _get_fingerprint(self) -> str:
+        return compute_fingerprint(
+            path for scanner in self._other_scanners for path in collect_source_paths(scanner)
+        )
+
+    def revalidate(self) -> bool:
+        """Invalidate the caches of the instance if the change notes changed.
+
+        Returns:
+            :obj:`bool`: Whether the configuration is still valid.
+        """
+        if self._get_config_state() != self._config_state:
+            return False
+
+        changed = False
+        for watcher in self._watchers:
+            # Applies the pending changes to the caches of the scanner without waiting for more
+            changed |= bool(watcher.wait_for_changes(timeout=0))
+        if self._other_scanners and (fingerprint := self._get_fingerprint()) != self._fingerprint:
+            self._fingerprint = fingerprint
+            changed = True
+            for scanner in self._other_scanners:
+                scanner.invalidate_caches()
+
+        if changed and isinstance(self.chango, CachingChanGo):
+            self.chango.clear_cache()
+        return True
+
+    def close(self) -> None:
+        """Stop watching the change note directories."""
+        for watcher in self._watchers:
+            watcher.stop()
+
+    def run_command(self, args: list[str]) -> dict[str, Any]:
+        """Run a CLI command and capture its output."""
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                result = self._command.main(args=args, prog_name="chango", standalone_mode=False)
+                exit_code = result if isinstance(result, int) else 0
+            except click.ClickException as exc:
+                exc.show()
+                exit_code = exc.exit_code
+            except click.Abort:
+                stderr.write("Aborted!\n")
+                exit_code = 1
+            except Exception:
+                traceback.print_exc()
+                exit_code = 1
+        return {"exit_code": exit_code, "stdout": stdout.getvalue(), "stderr": stderr.getvalue()}
+
+    def handle(self, connection: socket.socket) -> bool:
+        """Handle a single request.
+
+        Returns:
+            :obj:`bool`: Whether the daemon should continue serving.
+        """
+        chunks = []
+        while chunk := connection.recv(65536):
+            chunks.append(chunk)
+        request = json.loads(b"".join(chunks))
+
+        if not (valid := self.revalidate()):
+            response: dict[str, Any] = {"exit_code": None}
+        else:
+            os.chdir(request["cwd"])
+            # The command sees the environment of the client, as it would when run in-process
+            with _environment(request.get("env", os.environ)):
+                response = self.run_command(request["args"])
+        connection.sendall(json.dumps(response).encode())
+        return valid
+
+    def serve(self) -> None:
+        """Serve until the idle timeout expires or the configuration changes."""
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+            # Create the socket with mode 0600 right away instead of restricting it after binding
+            umask = os.umask(0o177)
+            try:
+                server.bind(str(self.socket_path))
+            finally:
+                os.umask(umask)
+            try:
+                server.listen()
+                server.settimeout(self.idle_timeout)
+                while True:
+                    try:
+                        connection, _ = server.accept()
+                    except TimeoutError:
+                        return
+                    with connection:
+                        connection.settimeout(None)
+                        if not self.handle(connection):
+                            return
+            finally:
+                self.socket_path.unlink(missing_ok=True)
+                self.close()
+
+
+def serve(
+    idle_timeout: Annotated[
+        float,
+        typer.Option(
+            help="Shut down after this many seconds without commands. 0 means never.", min=0
+        ),
+    ] = 600,
+) -> None:
+    """Serve CLI commands from a warm instance for the current directory.
+
+    While the daemon is running, the commands [code]new --no-edit[/code], [code]pack[/code],
+    [code]release[/code], [code]report[/code] and [code]unpack[/code] are forwarded to it.
+    Set the environment variable [code]CHANGO_DAEMON[/code] to [code]0[/code] to disable
+    forwarding or to [code]auto[/code] to start the daemon automatically.
+    """
+    pyproject_toml_path = get_pyproject_toml_path(None)
+    if not pyproject_toml_path.exists():
+        raise typer.BadParameter(f"File not found: {pyproject_toml_path}")
+
+    socket_path = get_socket_path(pyproject_toml_path)
+    try:
+        ensure_socket_directory(socket_path.parent)
+    except PermissionError as exc:
+        raise typer.BadParameter(str(exc)) from exc
+    try:
+        with connect(socket_path):
+            raise typer.BadParameter(f"A daemon is already listening on {socket_path}")
+    except OSError:
+        # Left behind by a daemon that did not shut down cleanly
+        socket_path.unlink(missing_ok=True)
+
+    daemon = ChanGoDaemon(pyproject_toml_path, socket_path, idle_timeout or None)
+    typer.echo(f"Serving {pyproject_toml_path} on {socket_path}")
+    daemon.serve()
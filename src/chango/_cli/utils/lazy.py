@@ -0,0 +1,54 @@
+#  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
+#
+#  SPDX-License-Identifier: MIT
+import importlib
+from collections.abc import Mapping
+from typing import Any, ClassVar
+
+import click
+import typer
+from typer.core import MarkupMode, TyperGroup
+
+
+class _LazyCommand(click.Command):
+    """Placeholder for a command that is not imported yet. Listing the placeholders allows
+    click to suggest commands for typos without importing them.
+    """
+
+    def __init__(self, name: str, import_path: str) -> None:
+        super().__init__(name)
+        self.command_name = name
+        self.import_path = import_path
+
+    def load(self, rich_markup_mode: MarkupMode) -> click.Command:
+        module_name, _, attribute = self.import_path.partition(":")
+        obj = getattr(importlib.import_module(module_name), attribute)
+
+        # Build the command exactly like typer builds eagerly registered commands
+        wrapper = typer.Typer(rich_markup_mode=rich_markup_mode)
+        if isinstance(obj, typer.Typer):
+            wrapper.add_typer(obj, name=self.command_name)
+        else:
+            wrapper.command(name=self.command_name)(obj)
+        return typer.main.get_group(wrapper).commands[self.command_name]
+
+
+class LazyTyperGroup(TyperGroup):
+    """Group that imports the modules implementing its subcommands only when the subcommand is
+    invoked or its help is shown. Subclasses define the subcommands in :attr:`lazy_commands`,
+    which maps the command names to ``"module:attribute"`` import paths. The attribute may be a
+    function or a :class:`typer.Typer` instance.
+    """
+
+    lazy_commands: ClassVar[Mapping[str, str]] = {}
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        for name, import_path in self.lazy_commands.items():
+            self.commands.setdefault(name, _LazyCommand(name, import_path))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        command = super().get_command(ctx, cmd_name)
+        if isinstance(command, _LazyCommand):
+            command = self.commands[cmd_name] = command.load(self.rich_markup_mode)
+        return command
@@ -0,0 +1,167 @@
+#  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
+#
+#  SPDX-License-Identifier: MIT
+
+__all__ = ["watch"]
+
+import threading
+import time
+from pathlib import Path
+from typing import Annotated, Any
+
+import typer
+
+from chango.abc import ChanGo
+from chango.concrete import CachingChanGo, DirectoryVersionScanner, DirectoryVersionScannerWatcher
+from chango.config import get_chango_instance
+from chango.constants import MarkupLanguage
+from chango.error import ChanGoError
+
+from .._utils.files import UTF8, atomic_write_bytes
+from .._utils.sources import collect_source_paths, compute_fingerprint
+from .utils.types import markup_callback
+
+
+def _optional_markup_callback(value: str | None) -> MarkupLanguage | None:
+    return None if value is None else markup_callback(value)
+
+
+def _invalidate(chango: ChanGo[Any, Any, Any, Any]) -> None:
+    if isinstance(chango, CachingChanGo):
+        chango.clear_cache()
+    else:
+        chango.scanner.invalidate_caches()
+
+
+class VersionNoteRenderer:
+    """Renders a version note into target files and keeps them up to date."""
+
+    def __init__(
+        self,
+        chango: ChanGo[Any, Any, Any, Any],
+        uid: str | None,
+        targets: dict[Path, MarkupLanguage],
+    ) -> None:
+        self.chango = chango
+        self.uid = uid
+        self.targets = targets
+
+    def render(self) -> None:
+        start = time.perf_counter()
+        try:
+            version_note = self.chango.load_version_note(self.uid)
+        except ChanGoError as exc:
+            # The version may become available later on, e.g. after a release
+            typer.echo(f"Error: {exc}", err=True)
+            return
+
+        updated = []
+        for path, markup in self.targets.items():
+            data = version_note.render(markup=markup).encode(UTF8)
+            # Skipping unchanged files avoids needless reloads of previews watching the targets
+            if not path.is_file() or path.read_bytes() != data:
+                atomic_write_bytes(path, data)
+                updated.append(path)
+
+        elapsed = (time.perf_counter() - start) * 1000
+        for path in updated:
+            typer.echo(f"Updated {path} in {elapsed:.0f} ms")
+
+    def watch(self, debounce: float, poll_interval: float, stop: threading.Event) -> None:
+        """Render the version note and re-render it whenever its change notes change, until
+        ``stop`` is set.
+        """
+        self.render()
+        chango = self.chango
+
+        if isinstance(scanner := chango.scanner, DirectoryVersionScanner):
+            watcher = DirectoryVersionScannerWatcher(
+                scanner, batch_delay=debounce, poll_interval=poll_interval
+            )
+            try:
+                while not stop.is_set():
+                    # The watcher already updated the scanner caches. Only the cached notes of a
+                    # wrapping CachingChanGo may be outdated.
+                    if self.uid in watcher.wait_for_changes(timeout=poll_interval):
+                        if isinstance(chango, CachingChanGo):
+                            chango.clear_cache()
+                        self.render()
+            finally:
+                watcher.stop()
+            return
+
+        # Other scanners don't tell which version changed, so every change triggers a re-render
+        fingerprint = compute_fingerprint(collect_source_paths(scanner))
+        while not stop.wait(poll_interval):
+            # The paths of the change notes are collected from the scanner and may be cached
+            _invalidate(chango)
+            if (new := compute_fingerprint(collect_source_paths(scanner))) != fingerprint:
+                fingerprint = new
+                stop.wait(debounce)
+                _invalidate(chango)
+                self.render()
+
+
+def watch(
+    outputs: Annotated[
+        list[Path],
+        typer.Argument(
+            help=(
+                "The files to render the version note into. The markup language is derived "
+                "from the file extension unless '--markup' is passed."
+            ),
+            dir_okay=False,
+            writable=True,
+            show_default=False,
+        ),
+    ],
+    uid: Annotated[
+        str,
+        typer.Option(
+            help=(
+                "The unique identifier of the version to render. Leave empty for unreleased "
+                "changes."
+            ),
+            show_default=False,
+        ),
+    ],
+    markup: Annotated[
+        str | None,
+        typer.Option(
+            "-m",
+            "--markup",
+            help="The markup language to use for all files.",
+            callback=_optional_markup_callback,
+            show_default=False,
+        ),
+    ] = None,
+    debounce: Annotated[
+        float, typer.Option(help="Seconds to wait for further changes before re-rendering.", min=0)
+    ] = 0.05,
+    poll_interval: Annotated[
+        float,
+        typer.Option(
+            help="Seconds between checks if the changes can't be watched directly.", min=0
+        ),
+    ] = 1,
+) -> None:
+    """Render a version note into files and re-render it whenever its change notes change.
+    Runs until interrupted.
+    """
+    targets: dict[Path, MarkupLanguage] = {}
+    for path in outputs:
+        try:
+            targets[path] = MarkupLanguage.from_string(markup or path.suffix)
+        except ValueError as exc:
+            raise typer.BadParameter(
+                f"Can't derive the markup language of '{path}'. Pass '--markup' explicitly."
+            ) from exc
+
+    chango = get_chango_instance()
+    typer.echo(f"Watching version {uid}" if uid else "Watching the unreleased changes")
+    try:
+        VersionNoteRenderer(chango, uid or None, targets).watch(
+            debounce, poll_interval, threading.Event()
+        )
+    except KeyboardInterrupt:
+        typer.echo("Stopped watching")
@@ -0,0 +1,66 @@
+#  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
+#
+#  SPDX-License-Identifier: MIT
+import threading
+from collections.abc import Callable
+from typing import Any, cast
+
+_MISSING: Any = object()
+
+
+class SnapshotCache[T]:
+    """A lazily built value that is safe to share between threads.
+
+    The value is built into a local object and published with a single attribute assignment, so
+    readers either see a complete snapshot or none at all. Concurrent rebuilds are coalesced: only
+    one thread builds the value while the others wait for and reuse the result. A snapshot that
+    was built while :meth:`invalidate` was called is returned to the building thread but not
+    published, since it may be outdated already.
+    """
+
+    def __init__(self, build: Callable[[], T]) -> None:
+        self._build = build
+        self._value: T = _MISSING
+        self._generation = 0
+        # Guards `_value` and `_generation`. Builds are serialized by a separate lock, such that
+        # `invalidate` doesn't have to wait for a running build.
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()
+
+    def _publish(self, value: T, generation: int) -> None:
+        with self._lock:
+            if generation == self._generation:
+                self._value = value
+
+    def get(self) -> T:
+        if (value := self._value) is not _MISSING:
+            return value
+
+        with self._build_lock:
+            with self._lock:
+                # Another thread may have published a snapshot while we were waiting for the lock
+                if (value := self._value) is not _MISSING:
+                    return value
+                generation = self._generation
+
+            value = self._build()
+            self._publish(value, generation)
+            return cast("T", value)
+
+    def update(self, transform: Callable[[T], T]) -> None:
+        """Publish a modified copy of the current snapshot. ``transform`` must not modify the
+        snapshot it receives, as other threads may still read from it. Does nothing if no
+        snapshot is built, since the next build reflects the modification anyway.
+        """
+        with self._build_lock:
+            with self._lock:
+                if (value := self._value) is _MISSING:
+                    return
+                generation = self._generation
+
+            self._publish(transform(value), generation)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._value = _MISSING
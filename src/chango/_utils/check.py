@@ -0,0 +1,389 @@
+#  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
+#
+#  SPDX-License-Identifier: MIT
+"""Validation of the change notes of a :class:`~chango.abc.ChanGo` instance as done by
+``chango check``.
+"""
+
+import pickle
+import sys
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
+from pathlib import Path
+from typing import Any, Literal, NamedTuple
+
+from .._changenoteinfo import ChangeNoteInfo
+from ..abc import ChangeNote, ChanGo
+from ..concrete import BackwardCompatibleChanGo, DirectoryVersionScanner
+from ..error import ChanGoError, ValidationError
+from .filename import FileName
+from .git import CatFileBatch, get_top_level, list_staged_files
+
+type ProblemKind = Literal["invalid", "duplicate", "orphan"]
+
+# Large enough to amortize the overhead of sending the data to the worker processes
+_MIN_CHUNK_SIZE = 64
+
+
+class Problem(NamedTuple):
+    kind: ProblemKind
+    path: Path
+    message: str
+    uid: str | None = None
+    version: str | None = None
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "path": str(self.path),
+            "uid": self.uid,
+            "version": self.version,
+            "message": self.message,
+        }
+
+
+class NoteFile(NamedTuple):
+    path: Path
+    version: str | None
+    slug: str
+    uid: str
+
+
+class CheckResult(NamedTuple):
+    checked: int
+    problems: list[Problem]
+
+
+def get_change_note_type(chango: ChanGo[Any, Any, Any, Any]) -> type[ChangeNote]:
+    return type(chango.build_template_change_note("check"))
+
+
+def _parse(note_type: type[ChangeNote], slug: str, uid: str, data: bytes) -> str | None:
+    # ValueError covers decoding errors of the file contents
+    try:
+        note_type.from_bytes(slug=slug, uid=uid, data=data)
+    except (ValueError, ValidationError) as exc:
+        return str(exc) or type(exc).__name__
+    return None
+
+
+def _parse_chunk(
+    note_type: type[ChangeNote], chunk: Sequence[tuple[str, str, bytes]]
+) -> list[str | None]:
+    return [_parse(note_type, *item) for item in chunk]
+
+
+def _get_import_root(cls: type) -> str | None:
+    """The directory from which the module defining ``cls`` can be imported by its name."""
+    module_file = getattr(sys.modules.get(cls.__module__), "__file__", None)
+    if module_file is None:
+        return None
+    path = Path(module_file).resolve()
+    depth = cls.__module__.count(".") + (path.stem == "__init__")
+    return str(path.parents[depth])
+
+
+def _is_picklable(cls: type) -> bool:
+    # Classes are pickled by reference. Classes built dynamically, e.g. by
+    # SectionChangeNote.with_sections, can't be looked up by their name and are hence parsed
+    # in the current process.
+    try:
+        pickle.dumps(cls)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return False
+    return True
+
+
+def _init_worker(sys_path: list[str]) -> None:
+    # With the spawn start method, the workers import the change note type when unpickling it
+    sys.path[:] = sys_path
+
+
+def parse_all(
+    note_type: type[ChangeNote], items: Sequence[tuple[str, str, bytes]], jobs: int
+) -> list[str | None]:
+    """Parse ``(slug, uid, data)`` items with ``jobs`` worker processes.
+
+    Returns:
+        The error messages in the order of the items, :obj:`None` for valid items.
+    """
+    if jobs <= 1 or len(items) <= _MIN_CHUNK_SIZE or not _is_picklable(note_type):
+        return _parse_chunk(note_type, items)
+
+    # A few chunks per worker balance the load if some notes are slower to parse
+    size = max(_MIN_CHUNK_SIZE, -(-len(items) // (jobs * 4)))
+    chunks = [items[start : start + size] for start in range(0, len(items), size)]
+    # The change note type may be defined in the configuration module. Its directory is removed
+    # from sys.path again after the configuration is imported.
+    sys_path = list(sys.path)
+    if (root := _get_import_root(note_type)) is not None and root not in sys_path:
+        sys_path.insert(0, root)
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=_init_worker, initargs=(sys_path,)
+    ) as executor:
+        return [
+            error
+            for errors in executor.map(_parse_chunk, repeat(note_type), chunks)
+            for error in errors
+        ]
+
+
+def _is_hidden(path: Path) -> bool:
+    # E.g. '.gitkeep' files that keep empty directories in git
+    return path.name.startswith(".")
+
+
+def discover_files(scanner: DirectoryVersionScanner) -> tuple[list[NoteFile], list[Problem]]:
+    """Find the change note files of all versions and the files whose names are not valid change
+    note file names. Hidden files are ignored.
+    """
+    files = []
+    orphans = []
+    for version in (None, *(version.uid for version in scanner.get_available_versions())):
+        for path in sorted(scanner.list_files(version)):
+            if _is_hidden(path):
+                continue
+            try:
+                name = FileName.from_string(path.name)
+            except ValidationError:
+                orphans.append(
+                    Problem(
+                        "orphan",
+                        path,
+                        "File name does not match '<slug>.<uid>.<extension>'.",
+                        version=version,
+                    )
+                )
+            else:
+                files.append(NoteFile(path, version, name.slug, name.uid))
+    return files, orphans
+
+
+def read_note_file(scanner: DirectoryVersionScanner, note_file: NoteFile) -> bytes:
+    if not scanner.is_packed(note_file.version):
+        return note_file.path.read_bytes()
+    version = scanner.get_version(note_file.version) if note_file.version else None
+    return scanner.read_change_note_bytes(ChangeNoteInfo(note_file.uid, version, note_file.path))
+
+
+def validate_files(
+    chango: ChanGo[Any, Any, Any, Any],
+    scanner: DirectoryVersionScanner,
+    files: Sequence[NoteFile],
+    jobs: int,
+) -> list[Problem]:
+    items = [(file.slug, file.uid, read_note_file(scanner, file)) for file in files]
+    errors = parse_all(get_change_note_type(chango), items, jobs)
+    return [
+        Problem("invalid", file.path, error, file.uid, file.version)
+        for file, error in zip(files, errors, strict=True)
+        if error is not None
+    ]
+
+
+def _duplicate(file: NoteFile, others: Iterable[Path]) -> Problem:
+    return Problem(
+        "duplicate",
+        file.path,
+        f"UID '{file.uid}' is also used by {', '.join(map(str, others))}.",
+        file.uid,
+        file.version,
+    )
+
+
+def find_duplicates(files: Iterable[NoteFile]) -> list[Problem]:
+    by_uid: defaultdict[str, list[NoteFile]] = defaultdict(list)
+    for file in files:
+        by_uid[file.uid].append(file)
+
+    return [
+        _duplicate(file, (other.path for other in group if other is not file))
+        for group in by_uid.values()
+        if len(group) > 1
+        for file in group
+    ]
+
+
+def get_directory_instances(
+    chango: ChanGo[Any, Any, Any, Any],
+) -> list[tuple[ChanGo[Any, Any, Any, Any], DirectoryVersionScanner]] | None:
+    """Unwrap the instance into the instances that read their change notes from directories,
+    together with their scanners. Each instance parses its change notes with its own change note
+    type.
+
+    Returns:
+        The instances and scanners or :obj:`None` if any of the instances uses a different
+        scanner.
+    """
+    if isinstance(chango, BackwardCompatibleChanGo):
+        instances = []
+        for sub_instance in chango.instances:
+            if (sub_instances := get_directory_instances(sub_instance)) is None:
+                return None
+            instances.extend(sub_instances)
+        return instances
+    if isinstance(scanner := chango.scanner, DirectoryVersionScanner):
+        return [(chango, scanner)]
+    return None
+
+
+def _check_generic(chango: ChanGo[Any, Any, Any, Any], jobs: int) -> CheckResult:
+    # Other scanners don't expose files, so the notes are loaded by UID
+    scanner = chango.scanner
+    versions = [version.uid for version in scanner.get_available_versions()]
+    if scanner.has_unreleased_changes():
+        versions.insert(0, None)
+    uids = [(version, uid) for version in versions for uid in scanner.get_changes(version)]
+
+    def validate(uid: str) -> str | None:
+        try:
+            chango.load_change_note(uid)
+        except (ValueError, ValidationError) as exc:
+            return str(exc) or type(exc).__name__
+        return None
+
+    with ThreadPoolExecutor(max_workers=max(jobs, 1)) as executor:
+        errors = list(executor.map(validate, (uid for _, uid in uids)))
+
+    problems = []
+    files = []
+    for (version, uid), error in zip(uids, errors, strict=True):
+        path = scanner.lookup_change_note(uid).file_path
+        files.append(NoteFile(path, version, "", uid))
+        if error is not None:
+            problems.append(Problem("invalid", path, error, uid, version))
+    return CheckResult(len(uids), [*problems, *find_duplicates(files)])
+
+
+def check_change_notes(chango: ChanGo[Any, Any, Any, Any], jobs: int = 1) -> CheckResult:
+    """Validate all change notes of the instance.
+
+    Args:
+        chango: The instance to check.
+        jobs: The number of workers to parse the change notes with. For
+            :class:`~chango.concrete.DirectoryVersionScanner`, these are processes.
+
+    Returns:
+        The number of checked change notes and the problems, sorted by path.
+    """
+    if (instances := get_directory_instances(chango)) is None:
+        result = _check_generic(chango, jobs)
+    else:
+        all_files: list[NoteFile] = []
+        problems: list[Problem] = []
+        for instance, scanner in instances:
+            files, orphans = discover_files(scanner)
+            problems.extend(orphans)
+            problems.extend(validate_files(instance, scanner, files, jobs))
+            all_files.extend(files)
+        # UIDs must be unique across all instances, since change notes are looked up by UID
+        problems.extend(find_duplicates(all_files))
+        result = CheckResult(len(all_files), problems)
+
+    result.problems.sort(key=lambda problem: (str(problem.path), problem.kind))
+    return result
+
+
+def _get_version(scanner: DirectoryVersionScanner, path: Path) -> tuple[bool, str | None]:
+    """Whether the file is a change note file location and if so, the version it belongs to."""
+    if path.parent == scanner.unreleased_directory:
+        return True, None
+    if path.parent.parent == scanner.base_directory and (
+        match := scanner.directory_pattern.match(path.parent.name)
+    ):
+        return True, match.group("uid")
+    return False, None
+
+
+def _find_staged_files(
+    scanner: DirectoryVersionScanner, top_level: Path
+) -> tuple[list[NoteFile], list[Problem]]:
+    files: list[NoteFile] = []
+    orphans: list[Problem] = []
+    directories = {scanner.base_directory, scanner.unreleased_directory}
+    for path in list_staged_files(top_level, directories):
+        is_note_location, version = _get_version(scanner, path)
+        if not is_note_location or _is_hidden(path):
+            continue
+        try:
+            name = FileName.from_string(path.name)
+        except ValidationError:
+            orphans.append(
+                Problem(
+                    "orphan",
+                    path,
+                    "File name does not match '<slug>.<uid>.<extension>'.",
+                    version=version,
+                )
+            )
+        else:
+            files.append(NoteFile(path, version, name.slug, name.uid))
+    return files, orphans
+
+
+def _validate_staged_files(
+    chango: ChanGo[Any, Any, Any, Any], files: Sequence[NoteFile], top_level: Path, jobs: int
+) -> list[Problem]:
+    cat_file = CatFileBatch(top_level)
+    try:
+        items = [
+            (file.slug, file.uid, cat_file.read(f":{file.path.relative_to(top_level)}"))
+            for file in files
+        ]
+    finally:
+        cat_file.close()
+    errors = parse_all(get_change_note_type(chango), items, jobs)
+    return [
+        Problem("invalid", file.path, error, file.uid, file.version)
+        for file, error in zip(files, errors, strict=True)
+        if error is not None
+    ]
+
+
+def check_staged_change_notes(chango: ChanGo[Any, Any, Any, Any], jobs: int = 1) -> CheckResult:
+    """Validate the change notes that are staged in git. The contents are read from the index,
+    i.e. exactly what will be committed. UID collisions are checked against the change notes
+    listed by the scanners.
+
+    Raises:
+        ~chango.error.ChanGoError: If the scanner is not a
+            :class:`~chango.concrete.DirectoryVersionScanner` or a
+            :class:`~chango.concrete.BackwardCompatibleVersionScanner` combining those, or if the
+            change notes are not in a git repository.
+    """
+    if (instances := get_directory_instances(chango)) is None:
+        raise ChanGoError("Checking staged files requires a DirectoryVersionScanner.")
+
+    top_levels = []
+    for _, scanner in instances:
+        if (top_level := get_top_level(scanner.base_directory)) is None:
+            raise ChanGoError(f"'{scanner.base_directory}' is not part of a git repository.")
+        top_levels.append(top_level)
+
+    all_files: list[NoteFile] = []
+    problems: list[Problem] = []
+    for (instance, scanner), top_level in zip(instances, top_levels, strict=True):
+        files, orphans = _find_staged_files(scanner, top_level)
+        problems.extend(orphans)
+        if files:
+            problems.extend(_validate_staged_files(instance, files, top_level, jobs))
+            all_files.extend(files)
+
+    if all_files:
+        # UIDs must be unique across all instances, since change notes are looked up by UID
+        # The scanners already list the files of all versions, reading only the indices of the
+        # packs they cache, so neither the git index nor the packs are parsed a second time
+        uids: defaultdict[str, list[Path]] = defaultdict(list)
+        for _, scanner in instances:
+            for file in discover_files(scanner)[0]:
+                uids[file.uid].append(file.path)
+        problems.extend(
+            _duplicate(file, others)
+            for file in all_files
+            if (others := [other for other in uids.get(file.uid, ()) if other != file.path])
+        )
+
+    problems.sort(key=lambda problem: (str(problem.path), problem.kind))
+    return CheckResult(len(all_files), problems)
@@ -1,18 +1,79 @@
 #  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
 #
 #  SPDX-License-Identifier: MIT
+import functools
+import secrets
+import threading
+import time
 from dataclasses import dataclass, field
-from typing import ClassVar, Self
-
-import shortuuid
+from typing import TYPE_CHECKING, ClassVar, Self
 
 from ..error import ValidationError
 
-_short_uuid = shortuuid.ShortUUID()
+if TYPE_CHECKING:
+    import shortuuid
+
+
+@functools.cache
+def _short_uuid() -> "shortuuid.ShortUUID":
+    # Imported on first use, since parsing file names does not need it
+    import shortuuid  # noqa: PLC0415
+
+    return shortuuid.ShortUUID()
 
 
 def random_uid() -> str:
-    return _short_uuid.uuid()
+    return _short_uuid().uuid()
+
+
+# Crockford's base32 alphabet. Its characters are in ascending ASCII order, such that the
+# lexicographic order of the encoded strings matches the numeric order of the encoded values.
+_CROCKFORD_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+_TIMESTAMP_BITS = 48
+_RANDOM_BITS = 80
+
+
+def _encode_base32(value: int, length: int) -> str:
+    chars = []
+    for _ in range(length):
+        value, remainder = divmod(value, 32)
+        chars.append(_CROCKFORD_ALPHABET[remainder])
+    return "".join(reversed(chars))
+
+
+class _TimeOrderedUIDGenerator:
+    """Generates ULID-style UIDs, i.e. 26 characters that encode a 48-bit millisecond timestamp
+    followed by 80 random bits. Within the same millisecond, the random part is incremented
+    instead of drawn anew, such that UIDs generated by the same process are strictly increasing.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._last_timestamp = -1
+        self._last_random = 0
+
+    def __call__(self) -> str:
+        with self._lock:
+            timestamp = time.time_ns() // 1_000_000
+            if timestamp <= self._last_timestamp:
+                # Clock did not advance (or went backwards) - keep the last timestamp and
+                # increment the random part to stay monotonic
+                timestamp = self._last_timestamp
+                random_part = self._last_random + 1
+                if random_part >= 1 << _RANDOM_BITS:
+                    timestamp += 1
+                    random_part = secrets.randbits(_RANDOM_BITS)
+            else:
+                random_part = secrets.randbits(_RANDOM_BITS)
+
+            self._last_timestamp, self._last_random = timestamp, random_part
+
+        return _encode_base32(timestamp, _TIMESTAMP_BITS // 5 + 1) + _encode_base32(
+            random_part, _RANDOM_BITS // 5
+        )
+
+
+time_ordered_uid = _TimeOrderedUIDGenerator()
 
 
 @dataclass(frozen=True)
@@ -1,9 +1,19 @@
 #  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
 #
 #  SPDX-License-Identifier: MIT
+import contextlib
+import os
+import secrets
 import subprocess
+from collections.abc import Iterator
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    # fcntl is not available on Windows. Locking is a no-op there.
+    fcntl = None  # type: ignore[assignment]
+
 UTF8 = "utf-8"
 
 
@@ -24,6 +34,11 @@ class _GitHelper:
         """Add a file to the git index."""
         subprocess.check_call(["git", "add", str(path)])
 
+    @staticmethod
+    def _git_remove(path: Path) -> None:
+        """Remove a file from the git index. Untracked files are ignored."""
+        subprocess.check_call(["git", "rm", "--quiet", "--ignore-unmatch", "--", str(path)])
+
     @staticmethod
     def _pathlib_move(src: Path, dst: Path) -> None:
         src.rename(dst)
@@ -56,6 +71,17 @@ class _GitHelper:
             except subprocess.CalledProcessError:
                 self.git_available = False
 
+    def remove(self, path: Path) -> None:
+        if self.git_available is None:
+            try:
+                self._git_remove(path)
+                self.git_available = True
+            except subprocess.CalledProcessError:
+                self.git_available = False
+        elif self.git_available:
+            self._git_remove(path)
+        path.unlink(missing_ok=True)
+
 
 _GIT_HELPER = _GitHelper()
 
@@ -67,3 +93,65 @@ def move_file(src: Path, dst: Path) -> None:
 def try_git_add(path: Path) -> None:
     """Add a file to the git index if git is available."""
     _GIT_HELPER.add(path)
+
+
+def remove_file(path: Path) -> None:
+    """Remove a file from the file system and from the git index if git is available."""
+    _GIT_HELPER.remove(path)
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write data to a file such that concurrent readers either see the old or the new content,
+    but never a partially written file. This is achieved by writing to a temporary file in the
+    same directory and renaming it to the target path.
+    """
+    # The temporary file name contains more than two dots, so it is never mistaken for a change
+    # note file by a concurrent scanner.
+    tmp_path = path.with_name(f".{path.name}.{secrets.token_hex(4)}.tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        tmp_path.replace(path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+@contextlib.contextmanager
+def directory_lock(directory: Path) -> Iterator[None]:
+    """Hold an exclusive advisory lock on the given directory for the duration of the context.
+    The lock is not reentrant. On platforms without :mod:`fcntl`, this is a no-op.
+    """
+    if fcntl is None:  # pragma: no cover
+        yield
+        return
+
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        # Closing the file descriptor releases the lock
+        os.close(fd)
+
+
+@contextlib.contextmanager
+def file_lock(path: Path) -> Iterator[None]:
+    """Hold an exclusive advisory lock on the given lock file for the duration of the context.
+    The file is created if it does not exist. The lock is not reentrant. On platforms without
+    :mod:`fcntl`, this is a no-op.
+    """
+    if fcntl is None:  # pragma: no cover
+        yield
+        return
+
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o666)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        # Closing the file descriptor releases the lock
+        os.close(fd)
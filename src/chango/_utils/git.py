@@ -0,0 +1,224 @@
+#  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
+#
+#  SPDX-License-Identifier: MIT
+import subprocess
+import threading
+import weakref
+from collections.abc import Collection
+from pathlib import Path, PurePosixPath
+
+_COMMIT_MARKER = "chango-commit:"
+_CAT_FILE_HEADER_LENGTH = 3
+
+
+def _run_git(cwd: Path, *args: str) -> str | None:
+    """Run a git command and return its output. Returns :obj:`None` if git is not available or
+    the command fails, e.g. because the directory is not part of a git repository.
+    """
+    try:
+        return subprocess.run(
+            ["git", "-C", str(cwd), *args], capture_output=True, check=True, text=True
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def get_repository_state(directory: Path) -> tuple[Path, str] | None:
+    """Get the top level directory of the git repository containing the directory and the commit
+    hash of ``HEAD``. Returns :obj:`None` if not available, e.g. if there are no commits yet.
+    """
+    if (output := _run_git(directory, "rev-parse", "--show-toplevel", "HEAD")) is None:
+        return None
+    top_level, head = output.splitlines()
+    return Path(top_level), head
+
+
+def get_top_level(directory: Path) -> Path | None:
+    """Get the top level directory of the git repository containing the directory. Unlike
+    :func:`get_repository_state`, this works for repositories without commits.
+    """
+    if (output := _run_git(directory, "rev-parse", "--show-toplevel")) is None:
+        return None
+    return Path(output.strip())
+
+
+def _split_paths(top_level: Path, output: str | None) -> list[Path]:
+    return [top_level / path for path in (output or "").split("\0") if path]
+
+
+def list_staged_files(top_level: Path, directories: Collection[Path]) -> list[Path]:
+    """List the files below the given directories that are added, copied, modified or renamed in
+    the index compared to ``HEAD``.
+
+    Returns:
+        List[:class:`~pathlib.Path`]: The absolute paths of the files.
+    """
+    return _split_paths(
+        top_level,
+        _run_git(
+            top_level,
+            "diff",
+            "--cached",
+            "--name-only",
+            "-z",
+            "--diff-filter=ACMR",
+            "--",
+            *map(str, directories),
+        ),
+    )
+
+
+def resolve_commit(directory: Path, ref: str) -> str | None:
+    """Resolve a git reference to the hash of the commit it points to. Returns :obj:`None` if the
+    reference can not be resolved.
+    """
+    if (
+        output := _run_git(directory, "rev-parse", "--verify", "--quiet", f"{ref}^{{commit}}")
+    ) is None:
+        return None
+    return output.strip()
+
+
+def list_tree(top_level: Path, ref: str, path: PurePosixPath) -> list[tuple[PurePosixPath, str]]:
+    """Recursively list the blobs below the given path in the tree of the given reference.
+
+    Returns:
+        List[Tuple[:class:`~pathlib.PurePosixPath`, :obj:`str`]]: The paths of the blobs relative
+            to the repository root and the corresponding object hashes.
+    """
+    output = _run_git(top_level, "ls-tree", "-r", "-z", "--full-tree", ref, "--", str(path))
+    if output is None:
+        return []
+
+    out = []
+    for entry in output.split("\0"):
+        if not entry:
+            continue
+        info, blob_path = entry.split("\t", 1)
+        _, object_type, object_hash = info.split()
+        if object_type == "blob":
+            out.append((PurePosixPath(blob_path), object_hash))
+    return out
+
+
+def _terminate_process(process: "subprocess.Popen[bytes]") -> None:
+    if process.stdin:
+        process.stdin.close()
+    try:
+        process.wait(timeout=1)
+    except subprocess.TimeoutExpired:  # pragma: no cover
+        process.kill()
+        process.wait()
+    if process.stdout:
+        process.stdout.close()
+
+
+class CatFileBatch:
+    """Reads the content of git objects through a single long-running ``git cat-file --batch``
+    process instead of starting one process per object. The process is started on first use.
+    Thread-safe.
+    """
+
+    def __init__(self, top_level: Path) -> None:
+        self._top_level = top_level
+        self._lock = threading.Lock()
+        self._process: subprocess.Popen[bytes] | None = None
+        self._finalizer: weakref.finalize | None = None
+
+    def _get_process(self) -> "subprocess.Popen[bytes]":
+        if self._process is None or self._process.poll() is not None:
+            self._process = subprocess.Popen(
+                ["git", "-C", str(self._top_level), "cat-file", "--batch"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+            )
+            self._finalizer = weakref.finalize(self, _terminate_process, self._process)
+        return self._process
+
+    def read(self, object_name: str) -> bytes:
+        """Read the content of a git object.
+
+        Raises:
+            KeyError: If the object does not exist.
+        """
+        with self._lock:
+            process = self._get_process()
+            stdin, stdout = process.stdin, process.stdout
+            if stdin is None or stdout is None:  # pragma: no cover
+                raise RuntimeError("git cat-file process has no pipes")
+
+            stdin.write(f"{object_name}\n".encode())
+            stdin.flush()
+            # Header format: "<hash> <type> <size>" or "<name> missing"
+            header = stdout.readline().split()
+            if len(header) != _CAT_FILE_HEADER_LENGTH:
+                raise KeyError(object_name)
+            data = stdout.read(int(header[2]))
+            # Content is followed by a newline
+            stdout.read(1)
+            return data
+
+    def close(self) -> None:
+        """Terminate the ``git cat-file`` process if it is running."""
+        with self._lock:
+            if self._finalizer is not None:
+                self._finalizer()
+            self._process = None
+            self._finalizer = None
+
+
+def get_first_commit_times(
+    top_level: Path, directories: Collection[Path], ref: str = "HEAD"
+) -> dict[Path, int]:
+    """Map the files below the given directories to the commit time of the commit that first added
+    them. Renames are followed, i.e. a file that was moved keeps the commit time of the commit
+    that added it at its original location.
+    This uses a single call of ``git log``, which is much faster than querying each file
+    individually.
+
+    Returns:
+        Dict[:class:`~pathlib.Path`, :obj:`int`]: Maps absolute file paths to the commit time as
+            UNIX timestamp. Files that are not committed are not included.
+    """
+    output = _run_git(
+        top_level,
+        "log",
+        "--reverse",
+        "-M",
+        "--name-status",
+        "-z",
+        f"--format=%x00{_COMMIT_MARKER}%ct",
+        ref,
+        "--",
+        *map(str, directories),
+    )
+    if output is None:
+        return {}
+
+    commit_times: dict[str, int] = {}
+    timestamp = 0
+    tokens = iter(output.split("\0"))
+    for raw_token in tokens:
+        # The first status of each commit is preceded by a newline
+        if not (token := raw_token.lstrip("\n")):
+            continue
+        if token.startswith(_COMMIT_MARKER):
+            timestamp = int(token.removeprefix(_COMMIT_MARKER))
+            continue
+
+        # token is a status letter, optionally followed by a similarity score
+        match token[0]:
+            case "R":
+                source, destination = next(tokens), next(tokens)
+                commit_times[destination] = commit_times.pop(source, timestamp)
+            case "C":
+                next(tokens)
+                commit_times[next(tokens)] = timestamp
+            case "A":
+                commit_times[next(tokens)] = timestamp
+            case "D":
+                commit_times.pop(next(tokens), None)
+            case _:
+                commit_times.setdefault(next(tokens), timestamp)
+
+    return {top_level / path: timestamp for path, timestamp in commit_times.items()}
@@ -0,0 +1,131 @@
+#  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
+#
+#  SPDX-License-Identifier: MIT
+"""Minimal binding of the Linux inotify API via :mod:`ctypes`, such that watching directories
+does not require an additional dependency.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+from typing import NamedTuple
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = os.O_CLOEXEC
+_EVENT = struct.Struct("iIII")
+# Large enough for many events at once. Names are at most NAME_MAX + 1 bytes long.
+_BUFFER_SIZE = 64 * (_EVENT.size + 256)
+
+#: Watch for changes of the entries of a directory and of the contents of the files in it
+WATCH_MASK = (
+    IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_DELETE_SELF
+    | IN_MOVE_SELF
+    | IN_ONLYDIR
+)
+
+
+class InotifyEvent(NamedTuple):
+    # None for events that don't belong to a watch, e.g. IN_Q_OVERFLOW
+    directory: Path | None
+    # Empty for events concerning the watched directory itself
+    name: str
+    mask: int
+
+
+class InotifyUnavailableError(OSError):
+    """Raised if inotify is not supported on this platform."""
+
+
+def _load_libc() -> ctypes.CDLL:
+    if not sys.platform.startswith("linux"):
+        raise InotifyUnavailableError("inotify is only available on Linux.")
+    libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+    if not hasattr(libc, "inotify_init1"):
+        raise InotifyUnavailableError("The C library does not provide inotify.")
+    libc.inotify_init1.argtypes = [ctypes.c_int]
+    libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+    return libc
+
+
+def _check(result: int) -> int:
+    if result < 0:
+        errno = ctypes.get_errno()
+        raise OSError(errno, os.strerror(errno))
+    return result
+
+
+class Inotify:
+    """A non-blocking inotify instance that watches a set of directories.
+
+    Raises:
+        InotifyUnavailableError: If inotify is not supported on this platform.
+    """
+
+    def __init__(self) -> None:
+        self._libc = _load_libc()
+        self.fd = _check(self._libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC))
+        self._directories: dict[int, Path] = {}
+
+    @property
+    def directories(self) -> set[Path]:
+        return set(self._directories.values())
+
+    def add_watch(self, directory: Path, mask: int = WATCH_MASK) -> None:
+        wd = _check(self._libc.inotify_add_watch(self.fd, os.fsencode(directory), mask))
+        self._directories[wd] = directory
+
+    def remove_watch(self, directory: Path) -> None:
+        for wd, path in list(self._directories.items()):
+            if path == directory:
+                del self._directories[wd]
+                # Fails if the kernel already removed the watch, e.g. as the directory is gone
+                self._libc.inotify_rm_watch(self.fd, wd)
+
+    def read(self, timeout: float | None) -> Iterator[InotifyEvent]:
+        """Wait up to :paramref:`timeout` seconds for events and yield the available ones."""
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return
+        try:
+            buffer = os.read(self.fd, _BUFFER_SIZE)
+        except BlockingIOError:
+            return
+
+        offset = 0
+        while offset < len(buffer):
+            wd, mask, _, length = _EVENT.unpack_from(buffer, offset)
+            offset += _EVENT.size
+            name = os.fsdecode(buffer[offset : offset + length].rstrip(b"\0"))
+            offset += length
+
+            if mask & IN_IGNORED:
+                # The watch was removed, e.g. because the directory was deleted
+                self._directories.pop(wd, None)
+                continue
+            yield InotifyEvent(self._directories.get(wd), name, mask)
+
+    def close(self) -> None:
+        os.close(self.fd)
+        self._directories.clear()
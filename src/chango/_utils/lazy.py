@@ -0,0 +1,41 @@
+#  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
+#
+#  SPDX-License-Identifier: MIT
+import importlib
+import sys
+from collections.abc import Callable, Collection, Mapping
+from typing import Any
+
+
+def lazy_module_attributes(
+    package: str, submodules: Collection[str], attributes: Mapping[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build the module level ``__getattr__`` and ``__dir__`` functions (:pep:`562`) of a
+    package whose submodules and public attributes are imported on first access.
+
+    Args:
+        package (:obj:`str`): The name of the package.
+        submodules (Collection[:obj:`str`]): Names of the submodules to import lazily.
+        attributes (Mapping[:obj:`str`, :obj:`str`]): Maps the names of the attributes to import
+            lazily to the name of the submodule that defines them, relative to the package.
+
+    Returns:
+        Tuple[Callable, Callable]: The ``__getattr__`` and ``__dir__`` functions.
+    """
+    namespace = vars(sys.modules[package])
+
+    def __getattr__(name: str) -> Any:
+        if name in submodules:
+            value = importlib.import_module(f".{name}", package)
+        elif name in attributes:
+            value = getattr(importlib.import_module(attributes[name], package), name)
+        else:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        # Cache the value, such that __getattr__ is only called on first access
+        namespace[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*namespace, *submodules, *attributes})
+
+    return __getattr__, __dir__
@@ -0,0 +1,103 @@
+#  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
+#
+#  SPDX-License-Identifier: MIT
+"""Packed archive format for storing all change notes of a version in a single file.
+
+Layout::
+
+    MAGIC | index length (4 bytes, big endian) | index (JSON) | data
+
+The index is a JSON list of ``[file name, offset, length]`` entries, where the offset is relative
+to the start of the data section.
+"""
+
+import json
+import mmap
+import struct
+from collections.abc import Iterable
+from pathlib import Path
+
+from ..error import ValidationError
+from .files import UTF8, atomic_write_bytes
+
+MAGIC = b"CHANGOPACK\x00\x01"
+_LENGTH = struct.Struct(">I")
+
+
+def write_pack(path: Path, files: Iterable[tuple[str, bytes]]) -> None:
+    """Atomically write the given files to a pack at the given path."""
+    index = []
+    offset = 0
+    chunks = []
+    for file_name, data in files:
+        index.append([file_name, offset, len(data)])
+        chunks.append(data)
+        offset += len(data)
+
+    raw_index = json.dumps(index).encode(UTF8)
+    atomic_write_bytes(path, b"".join((MAGIC, _LENGTH.pack(len(raw_index)), raw_index, *chunks)))
+
+
+class PackReader:
+    """Reads files from a pack by memory-mapping it. Only the index is parsed on construction,
+    file contents are read on demand by offset. Use :meth:`from_bytes` for packs that are not
+    stored as files, e.g. blobs in the git object database.
+    """
+
+    def __init__(self, path: Path) -> None:
+        with path.open("rb") as file:
+            # mmap can't map empty files, but those are invalid packs anyway
+            if path.stat().st_size < len(MAGIC) + _LENGTH.size:
+                raise ValidationError(f"'{path}' is not a valid pack file.")
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            self._load(path, buffer)
+        except ValidationError:
+            buffer.close()
+            raise
+
+    @classmethod
+    def from_bytes(cls, path: Path, data: bytes) -> "PackReader":
+        """Read a pack from its contents. ``path`` is only used in error messages."""
+        reader = cls.__new__(cls)
+        reader._load(path, data)
+        return reader
+
+    def _load(self, path: Path, buffer: mmap.mmap | bytes) -> None:
+        self.path = path
+        self._buffer = buffer
+        if len(buffer) < len(MAGIC) + _LENGTH.size or buffer[: len(MAGIC)] != MAGIC:
+            raise ValidationError(f"'{path}' is not a valid pack file.")
+
+        (index_length,) = _LENGTH.unpack_from(buffer, len(MAGIC))
+        index_start = len(MAGIC) + _LENGTH.size
+        self._data_start = index_start + index_length
+        try:
+            self._index: dict[str, tuple[int, int]] = {
+                file_name: (offset, length)
+                for file_name, offset, length in json.loads(
+                    buffer[index_start : self._data_start].decode(UTF8)
+                )
+            }
+        except (ValueError, TypeError) as exc:
+            raise ValidationError(f"'{path}' is not a valid pack file.") from exc
+
+    @property
+    def file_names(self) -> tuple[str, ...]:
+        """The names of the files contained in the pack in the order they were written."""
+        return tuple(self._index)
+
+    def read(self, file_name: str) -> bytes:
+        """Read the content of a file.
+
+        Raises:
+            KeyError: If the pack does not contain the file.
+        """
+        offset, length = self._index[file_name]
+        start = self._data_start + offset
+        return self._buffer[start : start + length]
+
+    def close(self) -> None:
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
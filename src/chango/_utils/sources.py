@@ -0,0 +1,77 @@
+#  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
+#
+#  SPDX-License-Identifier: MIT
+import hashlib
+import os
+from collections.abc import Iterable
+from pathlib import Path
+
+from ..abc import VersionScanner
+from ..concrete import (
+    BackwardCompatibleVersionScanner,
+    DirectoryVersionScanner,
+    SQLiteVersionScanner,
+)
+
+
+def get_directory_scanners(scanner: VersionScanner) -> list[DirectoryVersionScanner]:
+    """Unwrap the scanner into the directory-based scanners it consists of."""
+    if isinstance(scanner, DirectoryVersionScanner):
+        return [scanner]
+    if isinstance(scanner, BackwardCompatibleVersionScanner):
+        return [
+            directory_scanner
+            for sub_scanner in scanner.scanners
+            for directory_scanner in get_directory_scanners(sub_scanner)
+        ]
+    return []
+
+
+def collect_source_paths(scanner: VersionScanner) -> set[Path]:
+    """Collect the files and directories that the change notes of a version scanner are read
+    from. Directories are included, such that added or removed change notes change their
+    modification time.
+    """
+    if isinstance(scanner, BackwardCompatibleVersionScanner):
+        return {
+            path for sub_scanner in scanner.scanners for path in collect_source_paths(sub_scanner)
+        }
+
+    if isinstance(scanner, DirectoryVersionScanner):
+        paths: set[Path] = set()
+        for directory in (scanner.base_directory, scanner.unreleased_directory):
+            for root, _, file_names in os.walk(directory):
+                paths.add(Path(root))
+                paths.update(Path(root) / file_name for file_name in file_names)
+        return paths
+
+    if isinstance(scanner, SQLiteVersionScanner):
+        return {scanner.database}
+
+    uids = [
+        uid
+        for version in (None, *scanner.get_available_versions())
+        if version is not None or scanner.has_unreleased_changes()
+        for uid in scanner.get_changes(version)
+    ]
+    paths = set()
+    for uid in uids:
+        file_path = scanner.lookup_change_note(uid).file_path
+        if file_path.exists():
+            paths.update((file_path, file_path.parent))
+        elif file_path.parent.is_file():
+            # Change notes of packed versions are read from the pack file
+            paths.add(file_path.parent)
+    return paths
+
+
+def compute_fingerprint(paths: Iterable[Path]) -> str:
+    """Compute a fingerprint of the paths and their modification times and sizes."""
+    digest = hashlib.sha256()
+    for path in sorted(paths):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        digest.update(f"{path}\0{stat.st_mtime_ns}\0{stat.st_size}\n".encode())
+    return digest.hexdigest()
@@ -0,0 +1,139 @@
+#  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
+#
+#  SPDX-License-Identifier: MIT
+import datetime as dtm
+import hashlib
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Self
+
+from ._utils.files import UTF8, atomic_write_bytes
+from ._utils.types import PathLike, VersionUID
+from .error import ValidationError
+
+
+@dataclass(frozen=True)
+class VersionHistoryFragment:
+    """Objects of this type represent the rendered output of a single version note of a
+    version history. Fragments can be rendered independently, e.g. in parallel CI jobs, and
+    merged later into the full output of :meth:`chango.abc.VersionHistory.render`.
+
+    See :meth:`chango.abc.VersionHistory.render_fragments` and
+    :meth:`chango.abc.VersionHistory.merge_fragments` for details.
+
+    Args:
+        uid (:obj:`str` | :obj:`None`): Unique identifier of the version. :obj:`None` for the
+            unreleased changes.
+        date (:class:`datetime.date` | :obj:`None`): Release date of the version. :obj:`None` for
+            the unreleased changes.
+        markup (:obj:`str`): The markup language the fragment was rendered in.
+        position (:obj:`int`): The position of the version note in the version history it was
+            rendered from. Used to order fragments that can't be ordered otherwise, e.g. versions
+            released on the same day.
+        content (:obj:`str`): The rendered content.
+
+    Attributes:
+        uid (:obj:`str` | :obj:`None`): Unique identifier of the version. :obj:`None` for the
+            unreleased changes.
+        date (:class:`datetime.date` | :obj:`None`): Release date of the version. :obj:`None` for
+            the unreleased changes.
+        markup (:obj:`str`): The markup language the fragment was rendered in.
+        position (:obj:`int`): The position of the version note in the version history it was
+            rendered from.
+        content (:obj:`str`): The rendered content.
+    """
+
+    uid: VersionUID
+    date: dtm.date | None
+    markup: str
+    position: int
+    content: str
+
+    @property
+    def content_hash(self) -> str:
+        """:obj:`str`: The SHA-256 hex digest of :attr:`content`."""
+        return hashlib.sha256(self.content.encode(UTF8)).hexdigest()
+
+    def to_string(self) -> str:
+        """Serialize the fragment to a JSON string, including :attr:`content_hash`.
+
+        Returns:
+            :obj:`str`: The JSON string.
+        """
+        return json.dumps(
+            {
+                "uid": self.uid,
+                "date": self.date.isoformat() if self.date else None,
+                "markup": self.markup,
+                "position": self.position,
+                "content_hash": self.content_hash,
+                "content": self.content,
+            },
+            ensure_ascii=False,
+            indent=2,
+        )
+
+    @classmethod
+    def from_string(cls, string: str) -> Self:
+        """Read a fragment from a string as written by :meth:`to_string`.
+
+        Args:
+            string (:obj:`str`): The string to read from.
+
+        Returns:
+            :class:`VersionHistoryFragment`: The fragment.
+
+        Raises:
+            :class:`chango.error.ValidationError`: If the string is not a valid fragment or the
+                content does not match the stored hash.
+        """
+        try:
+            data = json.loads(string)
+            fragment = cls(
+                uid=data["uid"],
+                date=dtm.date.fromisoformat(data["date"]) if data["date"] else None,
+                markup=data["markup"],
+                position=int(data["position"]),
+                content=data["content"],
+            )
+            expected_hash = data["content_hash"]
+        except (ValueError, TypeError, KeyError) as exc:
+            raise ValidationError(f"Invalid version history fragment: {exc}") from exc
+
+        if fragment.content_hash != expected_hash:
+            raise ValidationError(
+                f"Content of the fragment for version {fragment.uid or 'Unreleased'!r} does not "
+                "match its hash."
+            )
+        return fragment
+
+    def to_file(self, file_path: PathLike, encoding: str = UTF8) -> Path:
+        """Write the fragment to a file. The file is written atomically.
+
+        Args:
+            file_path (:class:`pathlib.Path` | :obj:`str`): The path to write to.
+            encoding (:obj:`str`): The encoding to use for writing.
+
+        Returns:
+            :class:`pathlib.Path`: The path to the file that was written.
+        """
+        path = Path(file_path)
+        atomic_write_bytes(path, self.to_string().encode(encoding))
+        return path
+
+    @classmethod
+    def from_file(cls, file_path: PathLike, encoding: str = UTF8) -> Self:
+        """Read a fragment from a file as written by :meth:`to_file`.
+
+        Args:
+            file_path (:class:`pathlib.Path` | :obj:`str`): The path to read from.
+            encoding (:obj:`str`): The encoding to use for reading.
+
+        Returns:
+            :class:`VersionHistoryFragment`: The fragment.
+
+        Raises:
+            :class:`chango.error.ValidationError`: If the file is not a valid fragment.
+        """
+        return cls.from_string(Path(file_path).read_text(encoding=encoding))
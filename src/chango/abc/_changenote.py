@@ -2,11 +2,12 @@
 #
 #  SPDX-License-Identifier: MIT
 import abc
+from collections.abc import Callable
 from pathlib import Path
-from typing import Any, Self
+from typing import Any, ClassVar, Self
 
 from .._utils.filename import FileName
-from .._utils.files import UTF8
+from .._utils.files import UTF8, atomic_write_bytes
 from .._utils.types import PathLike
 from ..action import ChanGoActionData
 
@@ -16,12 +17,25 @@ class ChangeNote(abc.ABC):
 
     Args:
         slug (:obj:`str`): A short, human-readable identifier for the change note.
-        uid (:obj:`str`): A unique identifier for the change note. If not provided, a
-            random identifier will be generated. Should be 8 characters long and consist of
-            lowercase letters and digits.
+        uid (:obj:`str`): A unique identifier for the change note. If not provided, an
+            identifier will be generated by :attr:`UID_FACTORY` or randomly if that is not set.
+            Must not contain a ``.``. Random UIDs consist of 22 letters and digits, while
+            :func:`chango.helpers.time_ordered_uid` generates 26 uppercase letters and digits.
+    """
+
+    UID_FACTORY: ClassVar[Callable[[], str] | None] = None
+    """Callable[[], :obj:`str`] | :obj:`None`: Factory used to generate the UID of new change
+    notes if no UID is passed explicitly. If :obj:`None`, a random UID is generated.
+
+    Tip:
+        Set this to :func:`chango.helpers.time_ordered_uid` to generate UIDs that are
+        lexicographically sortable by creation time. These consist of 26 uppercase characters
+        of Crockford's base32 alphabet.
     """
 
     def __init__(self, slug: str, uid: str | None = None):
+        if not uid and (uid_factory := type(self).UID_FACTORY) is not None:
+            uid = uid_factory()
         self._file_name = FileName(slug=slug, uid=uid) if uid else FileName(slug=slug)
 
     @property
@@ -31,7 +45,9 @@ class ChangeNote(abc.ABC):
 
     @property
     def uid(self) -> str:
-        """:obj:`str`: The unique identifier for the change note."""
+        """:obj:`str`: The unique identifier for the change note, e.g. 22 random letters and
+        digits or 26 uppercase characters generated by :func:`chango.helpers.time_ordered_uid`.
+        """
         return self._file_name.uid
 
     @property
@@ -206,6 +222,10 @@ class ChangeNote(abc.ABC):
         Hint:
             The file name will always be the :attr:`~chango.abc.ChangeNote.file_name`.
 
+        Tip:
+            The file is written atomically, i.e. concurrent readers will never see a partially
+            written file.
+
         Args:
             directory: Optional. The directory to write the file to. If not provided, the file
                 will be written to the current working directory.
@@ -216,5 +236,5 @@ class ChangeNote(abc.ABC):
         """
         path = Path(directory) if directory else Path.cwd()
         write_path = path / self.file_name
-        write_path.write_bytes(self.to_bytes(encoding=encoding))
+        atomic_write_bytes(write_path, self.to_bytes(encoding=encoding))
         return write_path
@@ -3,12 +3,17 @@
 #  SPDX-License-Identifier: MIT
 import abc
 import warnings
-from collections.abc import Iterator, MutableMapping
+from collections.abc import Callable, Collection, Iterable, Iterator, Mapping, MutableMapping
+from typing import TYPE_CHECKING
 
 from .._utils.types import VersionUID, VUIDInput
+from .._versionhistoryfragment import VersionHistoryFragment
 from ..abc._versionnote import VersionNote
 from ..helpers import ensure_uid
 
+if TYPE_CHECKING:
+    from docutils.nodes import Node
+
 
 class VersionHistory[VNT: VersionNote](MutableMapping[VersionUID, VNT], abc.ABC):
     """Abstract base class for a version history describing the versions in a software project over
@@ -81,3 +86,99 @@ class VersionHistory[VNT: VersionNote](MutableMapping[VersionUID, VNT], abc.ABC)
         Returns:
             :obj:`str`: The rendered version note.
         """
+
+    def render_fragments(
+        self,
+        markup: str,
+        uids: Collection[VersionUID] | None = None,
+        positions: Mapping[VersionUID, int] | None = None,
+    ) -> tuple[VersionHistoryFragment, ...]:
+        """Render the version notes one by one into fragments that can later be combined by
+        :meth:`merge_fragments`. This allows to split the rendering of large version histories,
+        e.g. across several CI jobs.
+
+        The content of each fragment is the output of :meth:`render` for a new version history
+        of the same type that contains only the respective version note. The new version history
+        is created by calling the class without arguments. Subclasses that require arguments must
+        override this method.
+
+        Args:
+            markup (:obj:`str`): The markup language to use for rendering.
+            uids (Collection[:obj:`str` | :obj:`None`], optional): The unique identifiers of the
+                versions to render. Defaults to all versions in this version history.
+            positions (Mapping[:obj:`str` | :obj:`None`, :obj:`int`], optional): The positions to
+                store in the fragments. Defaults to the position of the version notes in this
+                version history. Pass this if this version history contains only a subset of the
+                versions of the full version history, e.g. the position of the versions in
+                :meth:`chango.abc.ChanGo.load_version_history`.
+
+        Returns:
+            Tuple[:class:`~chango.VersionHistoryFragment`]: The fragments.
+        """
+        fragments = []
+        for position, (uid, version_note) in enumerate(self.items()):
+            if uids is not None and uid not in uids:
+                continue
+
+            history = type(self)()
+            history.add_version_note(version_note)
+            fragments.append(
+                VersionHistoryFragment(
+                    uid=uid,
+                    date=version_note.version.date if version_note.version else None,
+                    markup=markup,
+                    position=position if positions is None else positions[uid],
+                    content=history.render(markup),
+                )
+            )
+        return tuple(fragments)
+
+    def merge_fragments(self, fragments: Iterable[VersionHistoryFragment]) -> str:
+        """Combine fragments created by :meth:`render_fragments` into the output that
+        :meth:`render` produces for a version history that contains all the respective version
+        notes. The version notes contained in this version history are not taken into account.
+
+        Hint:
+            This method is not abstract. The default implementation raises
+            :exc:`NotImplementedError`. Implementations that support rendering in fragments
+            should override it.
+
+        Args:
+            fragments (Iterable[:class:`~chango.VersionHistoryFragment`]): The fragments to
+                combine.
+
+        Returns:
+            :obj:`str`: The combined output.
+
+        Raises:
+            :exc:`~chango.error.ValidationError`: If the fragments can't be combined, e.g. because
+                they were rendered in different markup languages or contain the same version
+                more than once.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support merging fragments.")
+
+    def build_nodes(
+        self,
+        build_version_note_nodes: "Callable[[VNT], list[Node]]",  # noqa: ARG002
+    ) -> "list[Node] | None":
+        """Build the `docutils <https://docutils.sourceforge.io/>`_ nodes that represent the
+        version history. This is used by the :ref:`Sphinx extension <sphinx_ext>` to skip
+        generating reStructuredText with :meth:`render` and parsing it again.
+
+        Hint:
+            This method is not abstract. The default implementation returns :obj:`None`, in which
+            case the output of :meth:`render` for reStructuredText is parsed instead.
+
+        Args:
+            build_version_note_nodes (Callable[[:class:`VNT <typing.TypeVar>`], \
+                List[:class:`docutils.nodes.Node`]]): Builds the nodes of a single version note.
+                Implementations should use this instead of calling
+                :meth:`chango.abc.VersionNote.build_nodes` directly. It takes care of falling back
+                to parsing the output of :meth:`chango.abc.VersionNote.render` and of caching.
+
+        Returns:
+            List[:class:`docutils.nodes.Node`] | :obj:`None`: The nodes or :obj:`None`, if
+            building nodes is not supported. Sections should have their ``names`` set, but no
+            ``ids``. The ids are assigned by the caller.
+        """
+        return None
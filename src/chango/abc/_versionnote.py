@@ -12,6 +12,8 @@ from ..abc._changenote import ChangeNote
 from ..error import ValidationError
 
 if TYPE_CHECKING:
+    from docutils.nodes import Node
+
     from chango import Version
 
 
@@ -139,3 +141,20 @@ class VersionNote[CNT: ChangeNote, V: (Version, None)](MutableMapping[str, CNT],
         Returns:
             :obj:`str`: The rendered version note.
         """
+
+    def build_nodes(self) -> "list[Node] | None":
+        """Build the `docutils <https://docutils.sourceforge.io/>`_ nodes that represent the
+        version note. This is used by the :ref:`Sphinx extension <sphinx_ext>` to skip
+        generating reStructuredText with :meth:`render` and parsing it again.
+
+        Hint:
+            This method is not abstract. The default implementation returns :obj:`None`, in which
+            case the output of :meth:`render` for reStructuredText is parsed instead.
+            Implementations may also return :obj:`None` for specific version notes, e.g. if the
+            change notes contain markup that can only be handled by the parser.
+
+        Returns:
+            List[:class:`docutils.nodes.Node`] | :obj:`None`: The nodes or :obj:`None`, if
+            building nodes is not supported.
+        """
+        return None
@@ -0,0 +1,153 @@
+#  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
+#
+#  SPDX-License-Identifier: MIT
+"""This module contains an :mod:`asyncio` interface for :class:`~chango.abc.ChanGo`
+instances."""
+
+__all__ = ["AsyncChanGo"]
+
+import asyncio
+import contextlib
+import functools
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import Executor
+from typing import TYPE_CHECKING, Any
+
+from ._utils.types import VUIDInput
+from .abc import ChangeNote, ChanGo, VersionHistory, VersionNote
+
+if TYPE_CHECKING:
+    from . import Version
+
+
+class AsyncChanGo[VHT: VersionHistory, VNT: VersionNote, CNT: ChangeNote]:
+    """Asynchronous facade for a :class:`~chango.abc.ChanGo` instance.
+
+    All calls to the wrapped instance and its :attr:`~chango.abc.ChanGo.scanner` are
+    blocking, as they read and parse files. This class runs them in an executor, such that the
+    event loop is not blocked, and loads the notes of different versions concurrently. The
+    number of calls that run at the same time is bounded by :paramref:`max_concurrency`.
+
+    Example:
+        .. code-block:: python
+
+            from chango.aio import AsyncChanGo
+            from chango.config import get_chango_instance
+
+
+            async def main():
+                async_chango = AsyncChanGo(get_chango_instance())
+                history = await async_chango.aload_version_history()
+                async for version_note in async_chango.aiter_version_notes():
+                    print(version_note.version)
+
+    Important:
+        When using a thread pool executor, the wrapped instance is called from multiple threads at
+        the same time and must hence support concurrent reads.
+
+    Args:
+        chango (:class:`~chango.abc.ChanGo`): The instance to wrap.
+        max_concurrency (:obj:`int`, optional): The maximum number of blocking calls that run at
+            the same time. Defaults to ``8``.
+        executor (:class:`concurrent.futures.Executor`, optional): The executor to run the
+            blocking calls in. Defaults to the default executor of the event loop.
+
+    Attributes:
+        chango (:class:`~chango.abc.ChanGo`): The wrapped instance.
+        max_concurrency (:obj:`int`): The maximum number of blocking calls that run at the
+            same time.
+        executor (:class:`concurrent.futures.Executor` | :obj:`None`): The executor to run the
+            blocking calls in.
+    """
+
+    def __init__(
+        self,
+        chango: "ChanGo[Any, VHT, VNT, CNT]",
+        max_concurrency: int = 8,
+        executor: Executor | None = None,
+    ):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
+        self.chango: ChanGo[Any, VHT, VNT, CNT] = chango
+        self.max_concurrency: int = max_concurrency
+        self.executor: Executor | None = executor
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _run[R](self, function: Callable[..., R], *args: Any) -> R:
+        async with self._semaphore:
+            return await asyncio.get_running_loop().run_in_executor(
+                self.executor, functools.partial(function, *args)
+            )
+
+    async def aload_change_note(self, uid: str) -> CNT:
+        """Asynchronous version of :meth:`chango.abc.ChanGo.load_change_note`."""
+        return await self._run(self.chango.load_change_note, uid)
+
+    async def aload_version_note(self, version: VUIDInput) -> VNT:
+        """Asynchronous version of :meth:`chango.abc.ChanGo.load_version_note`. Calls the method
+        of the wrapped instance, such that overrides like the caching of
+        :class:`~chango.concrete.CachingChanGo` apply.
+        """
+        return await self._run(self.chango.load_version_note, version)
+
+    async def _get_versions(
+        self, start_from: VUIDInput, end_at: VUIDInput
+    ) -> list["Version | None"]:
+        scanner = self.chango.scanner
+        versions: list[Version | None] = []
+        if not end_at and await self._run(scanner.has_unreleased_changes):
+            versions.append(None)
+        versions.extend(await self._run(scanner.get_available_versions, start_from, end_at))
+        return versions
+
+    async def aiter_version_notes(
+        self, start_from: VUIDInput = None, end_at: VUIDInput = None
+    ) -> AsyncIterator[VNT]:
+        """Load the version notes concurrently and yield each one as soon as it is ready.
+        The versions are selected as in :meth:`chango.abc.ChanGo.load_version_history`.
+
+        Important:
+            The version notes are yielded in the order in which loading them finishes, which is
+            not necessarily chronological.
+
+        Args:
+            start_from (:class:`~chango.Version` | :obj:`str`, optional): The version to start
+                from. If :obj:`None`, start from the earliest available version.
+            end_at (:class:`~chango.Version` | :obj:`str`, optional): The version to end at.
+                If :obj:`None`, end at the latest available version, *including* unreleased
+                changes.
+
+        Yields:
+            :class:`VNT <typing.TypeVar>`: The loaded version notes.
+        """
+        tasks = [
+            asyncio.ensure_future(self.aload_version_note(version))
+            for version in await self._get_versions(start_from, end_at)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Don't leave tasks behind if the consumer stops early or an error occurs
+            for task in tasks:
+                task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def aload_version_history(
+        self, start_from: VUIDInput = None, end_at: VUIDInput = None
+    ) -> VHT:
+        """Asynchronous version of :meth:`chango.abc.ChanGo.load_version_history`. The version
+        notes are loaded concurrently with :meth:`aload_version_note`, but added to the version
+        history in the same order as by the synchronous version.
+        """
+        version_notes = await asyncio.gather(
+            *(
+                self.aload_version_note(version)
+                for version in await self._get_versions(start_from, end_at)
+            )
+        )
+        version_history = self.chango.build_version_history()
+        for version_note in version_notes:
+            version_history.add_version_note(version_note)
+        return version_history
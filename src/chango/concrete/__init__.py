@@ -4,22 +4,67 @@
 """This module contains implementations of the interface classes defined in the
 :mod:`~chango.abc` module that are shipped with this package."""
 
+from typing import TYPE_CHECKING
+
 __all__ = [
     "BackwardCompatibleChanGo",
     "BackwardCompatibleVersionScanner",
+    "CachingChanGo",
     "CommentChangeNote",
     "CommentVersionNote",
     "DirectoryChanGo",
     "DirectoryVersionScanner",
+    "DirectoryVersionScannerWatcher",
+    "GitChanGo",
+    "GitVersionScanner",
     "HeaderVersionHistory",
+    "MemoryChanGo",
+    "MemoryVersionScanner",
+    "SQLiteChanGo",
+    "SQLiteVersionScanner",
     "sections",
 ]
 
-from . import sections
-from ._backwardcompatiblechango import BackwardCompatibleChanGo
-from ._backwardcompatibleversionscanner import BackwardCompatibleVersionScanner
-from ._commentchangenote import CommentChangeNote
-from ._commentversionnote import CommentVersionNote
-from ._directorychango import DirectoryChanGo
-from ._directoryversionscanner import DirectoryVersionScanner
-from ._headerversionhistory import HeaderVersionHistory
+from .._utils.lazy import lazy_module_attributes
+
+if TYPE_CHECKING:
+    from . import sections
+    from ._backwardcompatiblechango import BackwardCompatibleChanGo
+    from ._backwardcompatibleversionscanner import BackwardCompatibleVersionScanner
+    from ._cachingchango import CachingChanGo
+    from ._commentchangenote import CommentChangeNote
+    from ._commentversionnote import CommentVersionNote
+    from ._directorychango import DirectoryChanGo
+    from ._directoryversionscanner import DirectoryVersionScanner
+    from ._directoryversionscannerwatcher import DirectoryVersionScannerWatcher
+    from ._gitchango import GitChanGo
+    from ._gitversionscanner import GitVersionScanner
+    from ._headerversionhistory import HeaderVersionHistory
+    from ._memorychango import MemoryChanGo
+    from ._memoryversionscanner import MemoryVersionScanner
+    from ._sqlitechango import SQLiteChanGo
+    from ._sqliteversionscanner import SQLiteVersionScanner
+
+# The implementations are imported on first access, such that only the dependencies of the
+# classes in use are imported
+__getattr__, __dir__ = lazy_module_attributes(
+    __name__,
+    submodules=("sections",),
+    attributes={
+        "BackwardCompatibleChanGo": "._backwardcompatiblechango",
+        "BackwardCompatibleVersionScanner": "._backwardcompatibleversionscanner",
+        "CachingChanGo": "._cachingchango",
+        "CommentChangeNote": "._commentchangenote",
+        "CommentVersionNote": "._commentversionnote",
+        "DirectoryChanGo": "._directorychango",
+        "DirectoryVersionScanner": "._directoryversionscanner",
+        "DirectoryVersionScannerWatcher": "._directoryversionscannerwatcher",
+        "GitChanGo": "._gitchango",
+        "GitVersionScanner": "._gitversionscanner",
+        "HeaderVersionHistory": "._headerversionhistory",
+        "MemoryChanGo": "._memorychango",
+        "MemoryVersionScanner": "._memoryversionscanner",
+        "SQLiteChanGo": "._sqlitechango",
+        "SQLiteVersionScanner": "._sqliteversionscanner",
+    },
+)
@@ -56,6 +56,14 @@ class BackwardCompatibleChanGo[VHT: VersionHistory, VNT: VersionNote, CNT: Chang
         """
         return self._scanner
 
+    @property
+    def instances(self) -> tuple[ChanGo[Any, Any, Any, Any], ...]:
+        """tuple[:class:`~chango.abc.ChanGo`]: The wrapped instances, starting with
+        :paramref:`~BackwardCompatibleChanGo.main_instance` followed by
+        :paramref:`~BackwardCompatibleChanGo.legacy_instances`.
+        """
+        return (self._main_instance, *self._legacy_instances)
+
     @override
     def build_template_change_note(self, slug: str, uid: str | None = None) -> CNT:
         """Calls :meth:`~chango.abc.ChanGo.build_template_change_note` on
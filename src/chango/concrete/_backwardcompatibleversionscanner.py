@@ -36,6 +36,11 @@ class BackwardCompatibleVersionScanner(VersionScanner):
     def __init__(self, scanners: Collection[VersionScanner]):
         self._scanners = tuple(scanners)
 
+    @property
+    def scanners(self) -> tuple[VersionScanner, ...]:
+        """tuple[:class:`~chango.abc.VersionScanner`]: The wrapped scanners."""
+        return self._scanners
+
     @override
     def is_available(self, uid: VUIDInput) -> bool:
         return any(scanner.is_available(uid) for scanner in self._scanners)
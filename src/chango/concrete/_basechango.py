@@ -0,0 +1,130 @@
+#  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
+#
+#  SPDX-License-Identifier: MIT
+import abc
+import contextlib
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any, Optional, override
+
+from ..abc import ChangeNote, ChanGo, VersionHistory, VersionNote, VersionScanner
+from .sections import SectionVersionNote
+
+if TYPE_CHECKING:
+    from chango import Version
+
+
+class _BaseChanGo[VST: VersionScanner, VHT: VersionHistory, VNT: VersionNote, CNT: ChangeNote](
+    ChanGo[VST, VHT, VNT, CNT]
+):
+    """Common base of the implementations of :class:`~chango.abc.ChanGo` that are configured by
+    the types of change notes, version notes and version histories to use.
+    """
+
+    def __init__(
+        self: "_BaseChanGo[VST, VHT, VNT, CNT]",
+        change_note_type: type[CNT],
+        version_note_type: type[VNT],
+        version_history_type: type[VHT],
+        scanner: VST,
+    ):
+        self._scanner: VST = scanner
+        self.change_note_type: type[CNT] = change_note_type
+        self.version_note_type: type[VNT] = version_note_type
+        self.version_history_type: type[VHT] = version_history_type
+
+    @property
+    @override
+    def scanner(self) -> VST:
+        return self._scanner
+
+    @override
+    def build_template_change_note(self, slug: str, uid: str | None = None) -> CNT:
+        return self.change_note_type.build_template(slug=slug, uid=uid)
+
+    @override
+    def build_version_note(self, version: Optional["Version"]) -> VNT:
+        """Implementation of :meth:`~chango.abc.ChanGo.build_version_note`.
+        Includes special handling for :class:`~chango.concrete.sections.SectionVersionNote`, which
+        has the required argument
+        :paramref:`~chango.concrete.sections.SectionVersionNote.section_change_note_type`.
+        """
+        if issubclass(self.version_note_type, SectionVersionNote):
+            return self.version_note_type(
+                section_change_note_type=self.change_note_type, version=version
+            )
+        return self.version_note_type(version=version)
+
+    @override
+    def build_version_history(self) -> VHT:
+        return self.version_history_type()
+
+
+class _ImportExportChanGo[
+    VST: VersionScanner,
+    VHT: VersionHistory,
+    VNT: VersionNote,
+    CNT: ChangeNote,
+](_BaseChanGo[VST, VHT, VNT, CNT]):
+    """Common base of the implementations of :class:`~chango.abc.ChanGo` that don't store the
+    change notes as files and hence provide :meth:`import_from` and :meth:`export_to`.
+
+    Subclasses implement :meth:`_import_version` and :meth:`_import_change_note`. The object
+    yielded by :meth:`_import_session` is passed to both.
+    """
+
+    @contextlib.contextmanager
+    def _import_session(self) -> Iterator[Any]:
+        yield None
+
+    @abc.abstractmethod
+    def _import_version(self, session: Any, version: "Version") -> None: ...
+
+    @abc.abstractmethod
+    def _import_change_note(
+        self, session: Any, change_note: ChangeNote, version: Optional["Version"]
+    ) -> None: ...
+
+    def import_from(self, chango: ChanGo) -> int:
+        """Import all versions and change notes from another :class:`~chango.abc.ChanGo`
+        instance, e.g. a :class:`~chango.concrete.DirectoryChanGo`.
+        Existing change notes with the same uid are replaced.
+
+        Args:
+            chango (:class:`~chango.abc.ChanGo`): The instance to import from. Its change notes
+                must be compatible with :attr:`change_note_type`.
+
+        Returns:
+            :obj:`int`: The number of imported change notes.
+        """
+        source = chango.scanner
+        versions: list[Version | None] = [*source.get_available_versions(), None]
+        count = 0
+        with self._import_session() as session:
+            for version in versions:
+                if version is not None:
+                    # Also import versions without change notes
+                    self._import_version(session, version)
+                for uid in source.get_changes(version):
+                    self._import_change_note(session, chango.load_change_note(uid), version)
+                    count += 1
+        return count
+
+    def export_to(self, chango: ChanGo) -> int:
+        """Export all versions and change notes to another :class:`~chango.abc.ChanGo` instance,
+        e.g. a :class:`~chango.concrete.DirectoryChanGo`, by calling its
+        :meth:`~chango.abc.ChanGo.write_change_note` method.
+
+        Args:
+            chango (:class:`~chango.abc.ChanGo`): The instance to export to. Its change notes
+                must be compatible with :attr:`change_note_type`.
+
+        Returns:
+            :obj:`int`: The number of exported change notes.
+        """
+        versions: list[Version | None] = [*self.scanner.get_available_versions(), None]
+        count = 0
+        for version in versions:
+            for uid in self.scanner.get_changes(version):
+                chango.write_change_note(self.load_change_note(uid), version)
+                count += 1
+        return count
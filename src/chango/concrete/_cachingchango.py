@@ -0,0 +1,220 @@
+#  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
+#
+#  SPDX-License-Identifier: MIT
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional, override
+
+from .._utils.files import UTF8
+from .._utils.types import VUIDInput
+from ..abc import ChangeNote, ChanGo, VersionHistory, VersionNote, VersionScanner
+from ..action import ChanGoActionData
+from ..error import ChanGoError
+from ..helpers import ensure_uid
+
+if TYPE_CHECKING:
+    from .. import Version
+
+
+class _LRUCache[K: Hashable, V]:
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._data: OrderedDict[K, V] = OrderedDict()
+        self._lock = threading.Lock()
+        # Incremented on every invalidation. Values that were computed while an invalidation
+        # happened may be stale and are hence not inserted.
+        self._generation = 0
+
+    def get_or_compute(self, key: K, compute: Callable[[], V]) -> V:
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                return self._data[key]
+            generation = self._generation
+
+        # Computed outside the lock, such that slow loads don't block other keys
+        value = compute()
+        with self._lock:
+            if generation != self._generation:
+                return value
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        return value
+
+    def discard(self, key: K) -> None:
+        with self._lock:
+            self._generation += 1
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._data.clear()
+
+
+class CachingChanGo[VST: VersionScanner, VHT: VersionHistory, VNT: VersionNote, CNT: ChangeNote](
+    ChanGo[VST, VHT, VNT, CNT]
+):
+    """An implementation of the :class:`~chango.abc.ChanGo` interface that wraps another
+    implementation and memoizes the results of :meth:`load_change_note`,
+    :meth:`load_version_note` and rendered output in bounded LRU caches.
+    All other methods are delegated to the wrapped instance.
+
+    The caches are updated by :meth:`write_change_note` and :meth:`release`. Changes that are
+    made to the change notes without going through this instance, e.g. by editing files, are not
+    detected. Call :meth:`clear_cache` in that case.
+
+    Important:
+        The cached objects are returned as is. Modifying a loaded change note or version note
+        modifies the cached object.
+
+    Example:
+        .. code-block:: python
+
+            from chango.concrete import CachingChanGo
+
+            chango_instance = CachingChanGo(DirectoryChanGo(...), maxsize=512)
+
+    Args:
+        instance (:class:`~chango.abc.ChanGo`): The instance to wrap.
+        maxsize (:obj:`int`, optional): The maximum number of entries of each of the caches.
+            Defaults to ``256``.
+
+    Attributes:
+        maxsize (:obj:`int`): The maximum number of entries of each of the caches.
+    """
+
+    def __init__(self, instance: "ChanGo[VST, VHT, VNT, CNT]", maxsize: int = 256):
+        self._instance = instance
+        self.maxsize: int = maxsize
+        self._change_notes: _LRUCache[str, CNT] = _LRUCache(maxsize)
+        self._version_notes: _LRUCache[str | None, VNT] = _LRUCache(maxsize)
+        self._renders: _LRUCache[tuple, str] = _LRUCache(maxsize)
+
+    @property
+    def instance(self) -> "ChanGo[VST, VHT, VNT, CNT]":
+        """:class:`~chango.abc.ChanGo`: The wrapped instance."""
+        return self._instance
+
+    @property
+    @override
+    def scanner(self) -> VST:
+        """The scanner of the wrapped instance."""
+        return self._instance.scanner
+
+    def clear_cache(self) -> None:
+        """Clear all caches. This also calls :meth:`~chango.abc.VersionScanner.invalidate_caches`
+        on :attr:`scanner`.
+        """
+        self._change_notes.clear()
+        self._version_notes.clear()
+        self._renders.clear()
+        self.scanner.invalidate_caches()
+
+    @override
+    def build_template_change_note(self, slug: str, uid: str | None = None) -> CNT:
+        return self._instance.build_template_change_note(slug, uid)
+
+    @override
+    def build_version_note(self, version: Optional["Version"]) -> VNT:
+        return self._instance.build_version_note(version)
+
+    @override
+    def build_version_history(self) -> VHT:
+        return self._instance.build_version_history()
+
+    @override
+    def load_change_note(self, uid: str) -> CNT:
+        """Calls :meth:`~chango.abc.ChanGo.load_change_note` on the wrapped instance, if the
+        change note is not cached yet.
+        """
+        return self._change_notes.get_or_compute(uid, lambda: self._instance.load_change_note(uid))
+
+    @override
+    def load_version_note(self, version: VUIDInput) -> VNT:
+        """Loads the version note as described in :meth:`chango.abc.ChanGo.load_version_note`,
+        if it is not cached yet. The change notes are loaded via :meth:`load_change_note` and
+        hence cached as well.
+        """
+        return self._version_notes.get_or_compute(
+            ensure_uid(version), lambda: super(CachingChanGo, self).load_version_note(version)
+        )
+
+    def render_version_note(self, version: VUIDInput, markup: str) -> str:
+        """Render a version note. The result is cached.
+
+        Args:
+            version (:class:`~chango.Version` | :obj:`str` | :obj:`None`): The version of the
+                version note to render. May be :obj:`None` for the unreleased changes.
+            markup (:obj:`str`): The markup language to use for rendering.
+
+        Returns:
+            :obj:`str`: The rendered version note.
+        """
+        return self._renders.get_or_compute(
+            ("version_note", ensure_uid(version), markup),
+            lambda: self.load_version_note(version).render(markup),
+        )
+
+    def render_version_history(
+        self, markup: str, start_from: VUIDInput = None, end_at: VUIDInput = None
+    ) -> str:
+        """Render the version history. The result is cached.
+
+        Args:
+            markup (:obj:`str`): The markup language to use for rendering.
+            start_from (:class:`~chango.Version` | :obj:`str`, optional): Passed to
+                :meth:`~chango.abc.ChanGo.load_version_history`.
+            end_at (:class:`~chango.Version` | :obj:`str`, optional): Passed to
+                :meth:`~chango.abc.ChanGo.load_version_history`.
+
+        Returns:
+            :obj:`str`: The rendered version history.
+        """
+        return self._renders.get_or_compute(
+            ("version_history", ensure_uid(start_from), ensure_uid(end_at), markup),
+            lambda: self.load_version_history(start_from=start_from, end_at=end_at).render(markup),
+        )
+
+    @override
+    def get_write_directory(self, change_note: CNT | str, version: VUIDInput) -> Path:
+        return self._instance.get_write_directory(change_note, version)
+
+    @override
+    def write_change_note(
+        self, change_note: CNT, version: VUIDInput, encoding: str = UTF8
+    ) -> Path:
+        """Calls :meth:`~chango.abc.ChanGo.write_change_note` on the wrapped instance and
+        evicts the affected entries from the caches.
+        """
+        try:
+            # The change note may have been moved from a different version
+            previous = ensure_uid(self.scanner.lookup_change_note(change_note.uid).version)
+        except ChanGoError:
+            previous = None
+
+        path = self._instance.write_change_note(change_note, version, encoding=encoding)
+        self._change_notes.discard(change_note.uid)
+        self._version_notes.discard(ensure_uid(version))
+        self._version_notes.discard(previous)
+        self._renders.clear()
+        return path
+
+    @override
+    def release(self, version: "Version") -> bool:
+        """Calls :meth:`~chango.abc.ChanGo.release` on the wrapped instance and clears the
+        caches.
+        """
+        released = self._instance.release(version)
+        self.clear_cache()
+        return released
+
+    @override
+    def build_github_event_change_note(
+        self, event: dict[str, Any], data: dict[str, Any] | ChanGoActionData | None = None
+    ) -> CNT | None:
+        return self._instance.build_github_event_change_note(event, data)
@@ -1,6 +1,7 @@
 #  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
 #
 #  SPDX-License-Identifier: MIT
+import re
 from typing import TYPE_CHECKING, override
 
 from .._utils.strings import indent_multiline
@@ -10,8 +11,21 @@ from ..constants import MarkupLanguage
 from ..error import UnsupportedMarkupError
 
 if TYPE_CHECKING:
+    from docutils.nodes import Node
+
     from chango import Version
 
+# Lines of comments that reStructuredText parses as plain paragraphs. This is deliberately
+# conservative, anything else is left to the parser.
+_PLAIN_TEXT_LINE = re.compile(
+    # No indentation, lists, quotes, field lists, comments or directives
+    r"(?![\s:>+-]|\(?[\w#]{1,5}[.)](?:\s|$)|\.\.)"
+    # No literal blocks or standalone hyperlinks and not only punctuation, e.g. transitions
+    r"(?!.*(?:::|://))(?=.*\w)"
+    # No inline markup characters
+    r"(?:[^\W_]|[ .,;:!?'\"()/+=%&#$~^{}-])*"
+)
+
 
 class CommentVersionNote[V: (Version, None)](VersionNote[CommentChangeNote, V]):
     """A simple version note implementation that works with
@@ -60,3 +74,26 @@ class CommentVersionNote[V: (Version, None)](VersionNote[CommentChangeNote, V]):
                 )
             case _:
                 return "\n\n".join(note.comment for note in self.values())
+
+    @override
+    def build_nodes(self) -> "list[Node] | None":
+        """Implementation of :meth:`~chango.abc.VersionNote.build_nodes`. Builds the same bullet
+        list as :meth:`render` does for reStructuredText, where each line of a comment is a
+        paragraph.
+
+        Returns:
+            List[:class:`docutils.nodes.Node`] | :obj:`None`: The nodes or :obj:`None` if any
+            comment may contain reStructuredText markup.
+        """
+        lines = [[line for line in note.comment.splitlines() if line] for note in self.values()]
+        if not all(_PLAIN_TEXT_LINE.fullmatch(line) for item in lines for line in item):
+            return None
+        if not lines:
+            return []
+
+        from docutils import nodes  # noqa: PLC0415
+
+        bullet_list = nodes.bullet_list(bullet="-")
+        for item in lines:
+            bullet_list += nodes.list_item("", *(nodes.paragraph(line, line) for line in item))
+        return [bullet_list]
@@ -1,22 +1,27 @@
 #  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
 #
 #  SPDX-License-Identifier: MIT
+import json
+import os
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Optional, override
+from typing import TYPE_CHECKING, Any, override
 
+from .._utils.filename import FileName
+from .._utils.files import UTF8, atomic_write_bytes, directory_lock, move_file
 from .._utils.types import VUIDInput
-from ..abc import ChangeNote, ChanGo, VersionHistory, VersionNote
+from ..abc import ChangeNote, VersionHistory, VersionNote
 from ..action import ChanGoActionData
 from ..error import ChanGoError
+from ._basechango import _BaseChanGo
 from ._directoryversionscanner import DirectoryVersionScanner
-from .sections import SectionChangeNote, SectionVersionNote
+from .sections import SectionChangeNote
 
 if TYPE_CHECKING:
     from chango import Version
 
 
 class DirectoryChanGo[VHT: VersionHistory, VNT: VersionNote, CNT: ChangeNote](
-    ChanGo[DirectoryVersionScanner, VHT, VNT, CNT]
+    _BaseChanGo[DirectoryVersionScanner, VHT, VNT, CNT]
 ):
     """Implementation of the :class:`~chango.abc.ChanGo` interface that works with
     :class:`~chango.concrete.DirectoryVersionScanner` and assumes that change notes are stored in
@@ -38,10 +43,23 @@ class DirectoryChanGo[VHT: VersionHistory, VNT: VersionNote, CNT: ChangeNote](
             release in ISO format. The default value is compatible with the default value of
             :paramref:`~chango.concrete.DirectoryVersionScannerdirectory_pattern`.
 
+    Important:
+        The mutating operations :meth:`write_change_note` and :meth:`release` hold an exclusive
+        advisory lock (via :func:`fcntl.flock`) on
+        :attr:`~chango.concrete.DirectoryVersionScanner.base_directory` while they run, such that
+        multiple processes can safely operate on the same directory tree. On platforms without
+        :mod:`fcntl`, no locking is performed.
+
     Attributes:
         directory_format (:obj:`str`): The format string used to create version directories.
     """
 
+    RELEASE_JOURNAL_NAME: str = ".chango-release.json"
+    """:obj:`str`: The name of the journal file that :meth:`release` writes to
+    :attr:`~chango.concrete.DirectoryVersionScanner.base_directory` while moving files. See
+    :meth:`recover_release` for details.
+    """
+
     def __init__(
         self: "DirectoryChanGo[VHT, VNT, CNT]",
         change_note_type: type[CNT],
@@ -50,41 +68,22 @@ class DirectoryChanGo[VHT: VersionHistory, VNT: VersionNote, CNT: ChangeNote](
         scanner: DirectoryVersionScanner,
         directory_format: str = "{uid}_{date}",
     ):
-        self._scanner: DirectoryVersionScanner = scanner
+        super().__init__(change_note_type, version_note_type, version_history_type, scanner)
         self.directory_format: str = directory_format
-        self.change_note_type: type[CNT] = change_note_type
-        self.version_note_type: type[VNT] = version_note_type
-        self.version_history_type: type[VHT] = version_history_type
-
-    @property
-    @override
-    def scanner(self) -> DirectoryVersionScanner:
-        return self._scanner
-
-    @override
-    def build_template_change_note(self, slug: str, uid: str | None = None) -> CNT:
-        return self.change_note_type.build_template(slug=slug, uid=uid)
 
     @override
-    def build_version_note(self, version: Optional["Version"]) -> VNT:
-        """Implementation of :meth:`~chango.abc.ChanGo.build_version_note`.
-        Includes special handling for :class:`~chango.concrete.sections.SectionVersionNote`, which
-        has the required argument
-        :paramref:`~chango.concrete.sections.SectionVersionNote.section_change_note_type`.
+    def load_change_note(self, uid: str) -> CNT:
+        """Implementation of :meth:`~chango.abc.ChanGo.load_change_note`. Change notes of
+        :ref:`packed versions <packed-versions>` are read from the pack file.
         """
-        if issubclass(self.version_note_type, SectionVersionNote):
-            return self.version_note_type(
-                section_change_note_type=self.change_note_type, version=version
-            )
-        return self.version_note_type(version=version)
+        info = self.scanner.lookup_change_note(uid)
+        if not self.scanner.is_packed(info.version):
+            return self.change_note_type.from_file(info.file_path)
 
-    @override
-    def build_version_history(self) -> VHT:
-        return self.version_history_type()
-
-    @override
-    def load_change_note(self, uid: str) -> CNT:
-        return self.change_note_type.from_file(self.scanner.lookup_change_note(uid).file_path)
+        file_name = FileName.from_string(info.file_path.name)
+        return self.change_note_type.from_bytes(
+            slug=file_name.slug, uid=file_name.uid, data=self.scanner.read_change_note_bytes(info)
+        )
 
     @override
     def get_write_directory(self, change_note: CNT | str, version: VUIDInput) -> Path:
@@ -102,6 +101,11 @@ class DirectoryChanGo[VHT: VersionHistory, VNT: VersionNote, CNT: ChangeNote](
             else:
                 version_obj = version
 
+            if self.scanner.is_packed(version_obj):
+                raise ChanGoError(
+                    f"Version '{version_obj.uid}' is packed. Unpack it before writing to it."
+                )
+
             directory = self.scanner.base_directory / self.directory_format.format(
                 uid=version_obj.uid, date=version_obj.date.isoformat()
             )
@@ -109,6 +113,116 @@ class DirectoryChanGo[VHT: VersionHistory, VNT: VersionNote, CNT: ChangeNote](
         directory.mkdir(parents=True, exist_ok=True)
         return directory
 
+    @property
+    def _release_journal(self) -> Path:
+        return self.scanner.base_directory / self.RELEASE_JOURNAL_NAME
+
+    @override
+    def write_change_note(
+        self, change_note: CNT, version: VUIDInput, encoding: str = UTF8
+    ) -> Path:
+        with directory_lock(self.scanner.base_directory):
+            return super().write_change_note(change_note, version, encoding)
+
+    @override
+    def release(self, version: "Version") -> bool:
+        """Implementation of :meth:`~chango.abc.ChanGo.release`.
+
+        Before :meth:`chango.abc.ChanGo.release` moves the files, the planned moves are
+        recorded in a journal file with paths relative to
+        :attr:`~chango.concrete.DirectoryVersionScanner.base_directory`. The journal is removed
+        once all files have been moved. If the release is interrupted, e.g. because the
+        process crashed, the journal remains and :meth:`recover_release` can be used to complete
+        or undo the release.
+
+        Important:
+            If an interrupted release is detected, it is automatically rolled forward before
+            releasing the given version.
+        """
+        with directory_lock(self.scanner.base_directory):
+            self._recover_release(roll_back=False)
+            if not self.scanner.has_unreleased_changes():
+                return False
+
+            # Paths are stored relative to the base directory, such that an interrupted release
+            # can still be recovered after the repository was moved
+            base_directory = self.scanner.base_directory
+            moves = []
+            for uid in self.scanner.get_changes(None):
+                file_path = self.scanner.lookup_change_note(uid).file_path
+                write_dir = self.get_write_directory(uid, version)
+                if file_path.parent != write_dir:
+                    moves.append(
+                        [
+                            os.path.relpath(path, base_directory)
+                            for path in (file_path, write_dir / file_path.name)
+                        ]
+                    )
+
+            # Written atomically such that a crash can't leave a truncated journal behind
+            atomic_write_bytes(
+                self._release_journal,
+                json.dumps(
+                    {
+                        "version": {"uid": version.uid, "date": version.date.isoformat()},
+                        "moves": moves,
+                    }
+                ).encode(UTF8),
+            )
+            released = super().release(version)
+            self._release_journal.unlink()
+            return released
+
+    def recover_release(self, roll_back: bool = False) -> bool:
+        """Recover from an interrupted call of :meth:`release` by either completing the pending
+        file moves or by reverting the moves that were already performed.
+
+        Args:
+            roll_back (:obj:`bool`, optional): Whether to revert the interrupted release instead
+                of completing it. Defaults to :obj:`False`.
+
+        Returns:
+            :obj:`bool`: Whether an interrupted release was found.
+        """
+        with directory_lock(self.scanner.base_directory):
+            return self._recover_release(roll_back=roll_back)
+
+    def _recover_release(self, roll_back: bool) -> bool:
+        if not self._release_journal.is_file():
+            return False
+
+        try:
+            moves = [
+                (str(raw_src), str(raw_dst))
+                for raw_src, raw_dst in json.loads(self._release_journal.read_text(encoding=UTF8))[
+                    "moves"
+                ]
+            ]
+        except (ValueError, KeyError, TypeError):
+            # No file was moved before the journal was complete, so there is nothing to recover
+            self._release_journal.unlink()
+            return False
+
+        base_directory = self.scanner.base_directory
+        for raw_src, raw_dst in moves:
+            # Journals of older versions contain absolute paths, which take precedence
+            src, dst = base_directory / raw_src, base_directory / raw_dst
+            if roll_back:
+                src, dst = dst, src
+            if src.is_file() and not dst.exists():
+                dst.parent.mkdir(parents=True, exist_ok=True)
+                move_file(src, dst)
+
+        if roll_back:
+            # Remove the version directories that were created by the interrupted release
+            for directory in {(base_directory / raw_dst).parent for _, raw_dst in moves}:
+                if directory.is_dir() and not any(directory.iterdir()):
+                    directory.rmdir()
+
+        self._release_journal.unlink()
+        self.scanner.invalidate_caches()
+        return True
+
     @override
     def build_github_event_change_note(
         self, event: dict[str, Any], data: dict[str, Any] | ChanGoActionData | None = None
@@ -7,13 +7,18 @@ import inspect
 import itertools
 import re
 from pathlib import Path
-from typing import NamedTuple, override
+from typing import ClassVar, NamedTuple, override
 
 from .._changenoteinfo import ChangeNoteInfo
+from .._utils.cache import SnapshotCache
 from .._utils.filename import FileName
+from .._utils.files import atomic_write_bytes, directory_lock, remove_file, try_git_add
+from .._utils.git import get_first_commit_times, get_repository_state
+from .._utils.pack import PackReader, write_pack
 from .._utils.types import PathLike, VUIDInput
 from .._version import Version
 from ..abc import VersionScanner
+from ..constants import ChangeNoteOrder
 from ..error import ChanGoError, ValidationError
 from ..helpers import ensure_uid
 
@@ -22,7 +27,9 @@ _DEFAULT_PATTERN = re.compile(r"(?P<uid>[^_]+)_(?P<date>[\d-]+)")
 
 class _VersionInfo(NamedTuple):
     date: dtm.date
+    # For packed versions, this is the path of the pack file
     directory: Path
+    packed: bool = False
 
 
 class _FileInfo(NamedTuple):
@@ -65,6 +72,9 @@ class DirectoryVersionScanner(VersionScanner):
             directories against. Must contain one named group ``uid`` for the version identifier
             and a second named group for the ``date`` for the date of the version release in ISO
             format.
+        change_order (:class:`~chango.constants.ChangeNoteOrder` | :obj:`str`, optional): The
+            strategy for ordering the change notes returned by :meth:`get_changes`. Defaults to
+            :attr:`~chango.constants.ChangeNoteOrder.FILE_NAME`.
 
     Attributes:
         base_directory (:class:`~pathlib.Path`): The base directory to scan for version
@@ -72,16 +82,32 @@ class DirectoryVersionScanner(VersionScanner):
         directory_pattern (:obj:`re.Pattern`): The pattern to match version directories against.
         unreleased_directory (:class:`~pathlib.Path`): The directory that contains unreleased
             changes.
-
+        change_order (:class:`~chango.constants.ChangeNoteOrder`): The strategy for ordering the
+            change notes returned by :meth:`get_changes`.
+
+    .. _packed-versions:
+
+    Tip:
+        To reduce the number of files in the repository, the change notes of a released version
+        can be compacted into a single *pack* file via :meth:`pack_version`.
+        Packed versions are handled transparently by all methods of this class. The pack file
+        is stored next to the version directories and is named like the version directory with
+        the suffix :attr:`PACK_SUFFIX`. Use :meth:`read_change_note_bytes` to read the contents
+        of a change note regardless of whether the version is packed.
     """
 
+    PACK_SUFFIX: ClassVar[str] = ".chango-pack"
+    """:obj:`str`: The suffix of pack files created by :meth:`pack_version`."""
+
     def __init__(
         self,
         base_directory: PathLike,
         unreleased_directory: PathLike,
         directory_pattern: str | re.Pattern[str] = _DEFAULT_PATTERN,
+        change_order: ChangeNoteOrder | str = ChangeNoteOrder.FILE_NAME,
     ):
         self.directory_pattern: re.Pattern[str] = re.compile(directory_pattern)
+        self.change_order: ChangeNoteOrder = ChangeNoteOrder(change_order)
 
         caller_dir = Path(inspect.stack()[1].filename).resolve().absolute().parent
         self.base_directory: Path = _make_relative_to(caller_dir, Path(base_directory))
@@ -97,26 +123,105 @@ class DirectoryVersionScanner(VersionScanner):
                     f"Unreleased directory '{self.unreleased_directory}' does not exist."
                 )
 
-        self.__available_versions: dict[str, _VersionInfo] | None = None
+        # The caches are shared between threads. See SnapshotCache for the details.
+        self.__available_versions = SnapshotCache(self._scan_available_versions)
+        # Commit times are cached keyed on the HEAD commit. Invalidating the caches only enforces
+        # re-checking HEAD, as rebuilding is expensive.
+        self.__commit_times_by_head: tuple[str, dict[Path, int]] | None = None
+        self.__commit_times = SnapshotCache(self._load_commit_times)
+        self.__packs: dict[Path, PackReader] = {}
 
     @property
     def _available_versions(self) -> dict[str, _VersionInfo]:
-        # Simple Cache for the available versions
-        if self.__available_versions is not None:
-            return self.__available_versions
-
-        self.__available_versions = {}
-        for directory in self.base_directory.iterdir():
-            if not directory.is_dir() or not (
-                match := self.directory_pattern.match(directory.name)
-            ):
+        # Callers that access this more than once should keep a reference to one snapshot, as
+        # the caches may be invalidated by another thread in the meantime
+        return self.__available_versions.get()
+
+    def _parse_version_path(self, path: Path) -> tuple[str, _VersionInfo] | None:
+        if path.is_dir():
+            name, packed = path.name, False
+        elif path.name.endswith(self.PACK_SUFFIX) and path.is_file():
+            name, packed = path.name.removesuffix(self.PACK_SUFFIX), True
+        else:
+            return None
+
+        if not (match := self.directory_pattern.match(name)):
+            return None
+        date = dtm.date.fromisoformat(match.group("date"))
+        return match.group("uid"), _VersionInfo(date, path, packed)
+
+    def _scan_available_versions(self) -> dict[str, _VersionInfo]:
+        versions: dict[str, _VersionInfo] = {}
+        for path in self.base_directory.iterdir():
+            if (parsed := self._parse_version_path(path)) is None:
                 continue
 
-            uid = match.group("uid")
-            date = dtm.date.fromisoformat(match.group("date"))
-            self.__available_versions[uid] = _VersionInfo(date, directory)
+            uid, version_info = parsed
+            # A pack takes precedence over a directory of the same version. Both can exist if
+            # packing or unpacking was interrupted, in which case the pack is complete.
+            if (existing := versions.get(uid)) and existing.packed:
+                continue
+            versions[uid] = version_info
+
+        return versions
 
-        return self.__available_versions
+    def _refresh_version(self, name: str) -> str | None:
+        """Apply a change of the entry ``name`` of :attr:`base_directory` to the cached versions
+        instead of rescanning the directory.
+
+        Returns:
+            :obj:`str` | :obj:`None`: The UID of the version or :obj:`None` if the entry does not
+                belong to a version.
+        """
+        stem = name.removesuffix(self.PACK_SUFFIX)
+        if not (match := self.directory_pattern.match(stem)):
+            return None
+
+        uid = match.group("uid")
+        directory = self.base_directory / stem
+        pack_path = self.base_directory / (stem + self.PACK_SUFFIX)
+        # Checked in order of precedence, see _scan_available_versions
+        parsed = next(
+            (
+                parsed
+                for path in (pack_path, directory)
+                if (parsed := self._parse_version_path(path)) is not None
+            ),
+            None,
+        )
+
+        def transform(versions: dict[str, _VersionInfo]) -> dict[str, _VersionInfo]:
+            versions = dict(versions)
+            if parsed is not None:
+                versions[parsed[0]] = parsed[1]
+            elif (existing := versions.get(uid)) and existing.directory in (directory, pack_path):
+                del versions[uid]
+            return versions
+
+        self.__available_versions.update(transform)
+        # Readers that are still in use are closed once they are garbage collected
+        self.__packs.pop(pack_path, None)
+        return uid
+
+    def _get_version_directories(self) -> dict[Path, str]:
+        """The directories of the versions that are not packed, mapped to the version UIDs."""
+        return {
+            version_info.directory: uid
+            for uid, version_info in self._available_versions.items()
+            if not version_info.packed
+        }
+
+    def _invalidate_commit_times(self) -> None:
+        self.__commit_times.invalidate()
+
+    def _get_pack(self, path: Path) -> PackReader:
+        packs = self.__packs
+        if (pack := packs.get(path)) is None:
+            reader = PackReader(path)
+            # If another thread was faster, use its reader instead
+            if (pack := packs.setdefault(path, reader)) is not reader:
+                reader.close()
+        return pack
 
     def _get_available_version(self, uid: str) -> Version:
         try:
@@ -124,8 +229,41 @@ class DirectoryVersionScanner(VersionScanner):
         except KeyError as exc:
             raise ChanGoError(f"Version '{uid}' not available.") from exc
 
+    @property
+    def _commit_times(self) -> dict[Path, int]:
+        return self.__commit_times.get()
+
+    def _load_commit_times(self) -> dict[Path, int]:
+        if (state := get_repository_state(self.base_directory)) is None:
+            self.__commit_times_by_head = None
+            return {}
+
+        top_level, head = state
+        if (cached := self.__commit_times_by_head) is None or cached[0] != head:
+            cached = self.__commit_times_by_head = (
+                head,
+                get_first_commit_times(
+                    top_level, (self.base_directory, self.unreleased_directory)
+                ),
+            )
+        return cached[1]
+
     def invalidate_caches(self) -> None:
-        self.__available_versions = None
+        """Implementation of :meth:`chango.abc.VersionScanner.invalidate_caches`.
+
+        Note:
+            The caches are safe to use from multiple threads. Invalidating them while another
+            thread reads from them does not interrupt the reading thread, which continues to
+            use the snapshot it started with.
+
+        Tip:
+            Long-running processes can use :class:`~chango.concrete.DirectoryVersionScannerWatcher`
+            to keep the caches up to date instead.
+        """
+        self.__available_versions.invalidate()
+        self.__commit_times.invalidate()
+        # Readers that are still in use are closed once they are garbage collected
+        self.__packs = {}
 
     @override
     def is_available(self, uid: VUIDInput) -> bool:
@@ -161,13 +299,10 @@ class DirectoryVersionScanner(VersionScanner):
         Returns:
             :class:`~chango.Version`: The latest version
         """
-        if not self._available_versions:
+        if not (versions := self._available_versions):
             raise ChanGoError("No versions available.")
-        return self._get_available_version(
-            max(
-                self._available_versions, key=lambda uid: (self._available_versions[uid].date, uid)
-            )
-        )
+        uid = max(versions, key=lambda uid: (versions[uid].date, uid))
+        return Version(uid=uid, date=versions[uid].date)
 
     @override
     def get_available_versions(
@@ -187,54 +322,80 @@ class DirectoryVersionScanner(VersionScanner):
         start = ensure_uid(start_from)
         end = ensure_uid(end_at)
         return tuple(
-            self._get_available_version(uid)
-            for uid in self._available_versions
+            Version(uid=uid, date=version_info.date)
+            for uid, version_info in self._available_versions.items()
             if (start is None or uid >= start) and (end is None or uid <= end)
         )
 
-    def _get_file_names(self, uid: VUIDInput) -> tuple[_FileInfo, ...]:
+    def _get_version_info(self, uid: str) -> _VersionInfo:
         try:
-            directory = (
-                self._available_versions[ensure_uid(uid)].directory
-                if uid
-                else self.unreleased_directory
-            )
+            return self._available_versions[uid]
         except KeyError as exc:
             raise ChanGoError(f"Version '{uid}' not available.") from exc
 
-        out = []
-        # Sorting is an undocumented implementation detail for now!
-        for change in sorted(directory.iterdir()):
-            if not change.is_file():
-                continue
+    def list_files(self, uid: VUIDInput) -> list[Path]:
+        """List all files of a version, including those that are not change notes, e.g. files
+        with invalid names.
 
+        Args:
+            uid (:class:`~chango.Version` | :obj:`str` | :obj:`None`): The version identifier.
+                If :obj:`None`, list the files of :attr:`unreleased_directory`.
+
+        Returns:
+            List[:class:`pathlib.Path`]: The paths of the files. For
+            :ref:`packed versions <packed-versions>`, the paths are the path of the pack file
+            joined with the file names and don't exist on disk.
+
+        Raises:
+            ~chango.error.ChanGoError: If the version is not available.
+        """
+        if uid:
+            version_info = self._get_version_info(ensure_uid(uid))
+            if version_info.packed:
+                return [
+                    version_info.directory / file_name
+                    for file_name in self._get_pack(version_info.directory).file_names
+                ]
+            return [path for path in version_info.directory.iterdir() if path.is_file()]
+        return [path for path in self.unreleased_directory.iterdir() if path.is_file()]
+
+    def _get_file_names(self, uid: VUIDInput) -> tuple[_FileInfo, ...]:
+        out = []
+        for change in sorted(self.list_files(uid)):
             with contextlib.suppress(ValidationError):
                 name = FileName.from_string(change.name)
                 out.append(_FileInfo(name.uid, change))
 
+        if self.change_order == ChangeNoteOrder.UID:
+            out.sort(key=lambda file_info: (file_info.uid, file_info.file.name))
+        elif self.change_order == ChangeNoteOrder.COMMIT_TIME:
+            commit_times = self._commit_times
+            # Uncommitted files go last, keeping the file name order
+            out.sort(
+                key=lambda file_info: (
+                    file_info.file not in commit_times,
+                    commit_times.get(file_info.file, 0),
+                )
+            )
         return tuple(out)
 
     @override
     def lookup_change_note(self, uid: str) -> ChangeNoteInfo:
+        versions = self._available_versions
         try:
-            version, file_name = next(
-                (
-                    self._get_available_version(version_uid) if version_uid else None,
-                    file_info.file.name,
-                )
-                for version_uid in itertools.chain(self._available_versions, (None,))
+            version_uid, file_path = next(
+                (version_uid, file_info.file)
+                for version_uid in itertools.chain(versions, (None,))
                 for file_info in self._get_file_names(version_uid)
                 if uid == file_info.uid
             )
-            directory = (
-                self._available_versions[version.uid].directory
-                if version
-                else self.unreleased_directory
-            )
         except StopIteration as exc:
             raise ChanGoError(f"Change note '{uid}' not found in any version.") from exc
 
-        return ChangeNoteInfo(uid, version, directory / file_name)
+        version = (
+            Version(uid=version_uid, date=versions[version_uid].date) if version_uid else None
+        )
+        return ChangeNoteInfo(uid, version, file_path)
 
     @override
     def get_version(self, uid: str) -> Version:
@@ -242,4 +403,117 @@ class DirectoryVersionScanner(VersionScanner):
 
     @override
     def get_changes(self, uid: VUIDInput) -> tuple[str, ...]:
+        """Implementation of :meth:`chango.abc.VersionScanner.get_changes`.
+
+        Important:
+            The order of the returned UIDs is determined by :attr:`change_order`.
+        """
         return tuple(file_info.uid for file_info in self._get_file_names(uid))
+
+    def is_packed(self, uid: VUIDInput) -> bool:
+        """Check whether the change notes of the given version are stored in a pack file.
+        See :ref:`packed versions <packed-versions>`.
+
+        Args:
+            uid (:class:`~chango.Version` | :obj:`str` | :obj:`None`): The version identifier.
+
+        Returns:
+            :obj:`bool`: :obj:`True` if the version is available and packed, :obj:`False`
+                otherwise.
+        """
+        if uid is None or (version_info := self._available_versions.get(ensure_uid(uid))) is None:
+            return False
+        return version_info.packed
+
+    def read_change_note_bytes(self, change_note: str | ChangeNoteInfo) -> bytes:
+        """Read the raw contents of a change note. For packed versions, the contents are read
+        from the pack file without extracting it.
+
+        Args:
+            change_note (:obj:`str` | :class:`~chango.ChangeNoteInfo`): The unique identifier of
+                the change note or the information returned by :meth:`lookup_change_note`.
+
+        Returns:
+            :obj:`bytes`: The contents of the change note file.
+
+        Raises:
+            ~chango.error.ChanGoError: If the change note with the given identifier is not
+                available.
+        """
+        info = (
+            change_note
+            if isinstance(change_note, ChangeNoteInfo)
+            else self.lookup_change_note(change_note)
+        )
+        if not self.is_packed(info.version):
+            return info.file_path.read_bytes()
+        return self._get_pack(info.file_path.parent).read(info.file_path.name)
+
+    def pack_version(self, uid: str) -> Path:
+        """Compact the change notes of a released version into a single pack file.
+        The change note files are removed afterwards. If git is available, the pack file is
+        added to and the change note files are removed from the git index.
+        See :ref:`packed versions <packed-versions>`.
+
+        Args:
+            uid (:obj:`str`): The identifier of the version to pack.
+
+        Returns:
+            :class:`pathlib.Path`: The path of the pack file.
+
+        Raises:
+            ~chango.error.ChanGoError: If the version is not available or already packed.
+        """
+        with directory_lock(self.base_directory):
+            self.invalidate_caches()
+            version_info = self._get_version_info(uid)
+            if version_info.packed:
+                raise ChanGoError(f"Version '{uid}' is already packed.")
+
+            files = self._get_file_names(uid)
+            directory = version_info.directory
+            pack_path = directory.with_name(directory.name + self.PACK_SUFFIX)
+            write_pack(pack_path, ((info.file.name, info.file.read_bytes()) for info in files))
+            try_git_add(pack_path)
+
+            for info in files:
+                remove_file(info.file)
+            if not any(directory.iterdir()):
+                directory.rmdir()
+
+            self.invalidate_caches()
+            return pack_path
+
+    def unpack_version(self, uid: str) -> Path:
+        """Extract the change notes of a packed version into a version directory and remove the
+        pack file. This reverses :meth:`pack_version`.
+
+        Args:
+            uid (:obj:`str`): The identifier of the version to unpack.
+
+        Returns:
+            :class:`pathlib.Path`: The path of the version directory.
+
+        Raises:
+            ~chango.error.ChanGoError: If the version is not available or not packed.
+        """
+        with directory_lock(self.base_directory):
+            self.invalidate_caches()
+            version_info = self._get_version_info(uid)
+            if not version_info.packed:
+                raise ChanGoError(f"Version '{uid}' is not packed.")
+
+            pack_path = version_info.directory
+            directory = pack_path.with_name(pack_path.name.removesuffix(self.PACK_SUFFIX))
+            directory.mkdir(exist_ok=True)
+            pack = self._get_pack(pack_path)
+            for file_name in pack.file_names:
+                # An interrupted unpack must not leave truncated change notes behind
+                atomic_write_bytes(directory / file_name, pack.read(file_name))
+                try_git_add(directory / file_name)
+
+            # Close the pack before removing it
+            self.invalidate_caches()
+            pack.close()
+            remove_file(pack_path)
+            return directory
@@ -0,0 +1,298 @@
+#  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
+#
+#  SPDX-License-Identifier: MIT
+import contextlib
+import os
+import threading
+import time
+from collections.abc import Callable, Iterable
+from collections.abc import Set as AbstractSet
+from pathlib import Path
+from types import TracebackType
+from typing import Literal, Self
+
+from .._utils.inotify import IN_Q_OVERFLOW, Inotify
+from ..error import ChanGoError
+from ._directoryversionscanner import DirectoryVersionScanner
+
+type _Snapshot = dict[Path, dict[str, tuple[int, int]]]
+
+
+class DirectoryVersionScannerWatcher:
+    """Keeps the caches of a :class:`~chango.concrete.DirectoryVersionScanner` up to date by
+    watching the change note directories. This is intended for long-running processes, which
+    would otherwise have to call :meth:`~DirectoryVersionScanner.invalidate_caches` before
+    every access.
+
+    On Linux, the directories are watched via inotify. Otherwise, or if inotify can not be
+    used, e.g. because the limit of watches is reached, the directories are polled for changes
+    of the modification times and sizes of their entries. Creating, removing or renaming a
+    version directory or pack file only updates the affected entry of the cached versions
+    instead of rescanning the base directory.
+
+    Changes are reported in batches: after the first change is detected, the watcher waits until
+    no further changes occurred for :paramref:`batch_delay` seconds, such that e.g. a release
+    that moves many files is reported once.
+
+    Example:
+        .. code-block:: python
+
+            from chango.concrete import DirectoryVersionScannerWatcher
+
+
+            def on_change(versions):
+                print("Changed versions:", versions)
+
+
+            with DirectoryVersionScannerWatcher(scanner, callback=on_change):
+                run_server()
+
+    Args:
+        scanner (:class:`~chango.concrete.DirectoryVersionScanner`): The scanner to keep up to
+            date.
+        callback (Callable[[Set[:obj:`str` | :obj:`None`]], :obj:`object`], optional): Called
+            from the background thread started by :meth:`start` with the UIDs of the versions
+            whose change notes changed. :obj:`None` stands for the unreleased changes.
+        batch_delay (:obj:`float`, optional): The number of seconds without changes after which
+            a batch of changes is reported. Defaults to ``0.05``.
+        poll_interval (:obj:`float`, optional): The number of seconds between two checks for
+            changes if the directories are polled. Defaults to ``1``.
+        use_inotify (:obj:`bool`, optional): Whether to use inotify if available. Defaults to
+            :obj:`True`.
+
+    Attributes:
+        scanner (:class:`~chango.concrete.DirectoryVersionScanner`): The scanner to keep up to
+            date.
+        callback (Callable[[Set[:obj:`str` | :obj:`None`]], :obj:`object`] | :obj:`None`): The
+            callback for changes.
+        batch_delay (:obj:`float`): The number of seconds without changes after which a batch
+            of changes is reported.
+        poll_interval (:obj:`float`): The number of seconds between two checks for changes if
+            the directories are polled.
+        backend (:obj:`str`): Either ``"inotify"`` or ``"polling"``.
+    """
+
+    # Bursts of events that never calm down are still reported after this many batch delays
+    _MAX_BATCH_DELAYS = 20
+    # The background thread checks for stop requests at least this often
+    _STOP_INTERVAL = 0.1
+
+    def __init__(
+        self,
+        scanner: DirectoryVersionScanner,
+        callback: Callable[[AbstractSet[str | None]], object] | None = None,
+        batch_delay: float = 0.05,
+        poll_interval: float = 1,
+        use_inotify: bool = True,
+    ) -> None:
+        self.scanner = scanner
+        self.callback = callback
+        self.batch_delay = batch_delay
+        self.poll_interval = poll_interval
+
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._inotify: Inotify | None = None
+        self._snapshot: _Snapshot = {}
+        self._stopped = False
+
+        if use_inotify:
+            # Also covers InotifyUnavailableError, i.e. platforms without inotify
+            with contextlib.suppress(OSError):
+                self._inotify = Inotify()
+        self._sync_watches()
+
+    @property
+    def backend(self) -> Literal["inotify", "polling"]:
+        return "polling" if self._inotify is None else "inotify"
+
+    def _ensure_not_stopped(self) -> None:
+        # Silently falling back to polling would hide the programming error
+        if self._stopped:
+            raise ChanGoError("The watcher was stopped and can not be used anymore.")
+
+    def _get_directories(self) -> set[Path]:
+        return {
+            self.scanner.base_directory,
+            self.scanner.unreleased_directory,
+            *self.scanner._get_version_directories(),
+        }
+
+    def _sync_watches(self) -> None:
+        directories = self._get_directories()
+        if (inotify := self._inotify) is None:
+            self._snapshot = self._take_snapshot(directories)
+            return
+
+        try:
+            # Renamed directories keep their watch, so the stale paths are removed first
+            for directory in inotify.directories - directories:
+                inotify.remove_watch(directory)
+            for directory in directories - inotify.directories:
+                with contextlib.suppress(FileNotFoundError, NotADirectoryError):
+                    inotify.add_watch(directory)
+        except OSError:
+            # E.g. the limit of watches is reached
+            inotify.close()
+            self._inotify = None
+            self._snapshot = self._take_snapshot(directories)
+
+    @staticmethod
+    def _take_snapshot(directories: Iterable[Path]) -> _Snapshot:
+        snapshot: _Snapshot = {}
+        for directory in directories:
+            entries = snapshot[directory] = {}
+            with contextlib.suppress(FileNotFoundError, NotADirectoryError):
+                for entry in os.scandir(directory):
+                    with contextlib.suppress(FileNotFoundError):
+                        stat = entry.stat()
+                        entries[entry.name] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def _diff_snapshot(self) -> list[tuple[Path, str]]:
+        previous, self._snapshot = self._snapshot, self._take_snapshot(self._snapshot)
+        events: list[tuple[Path, str]] = []
+        for directory, entries in self._snapshot.items():
+            old_entries = previous.get(directory, {})
+            events.extend(
+                (directory, name)
+                for name in entries.keys() | old_entries.keys()
+                if entries.get(name) != old_entries.get(name)
+            )
+        return events
+
+    def _poll(self, timeout: float | None) -> list[tuple[Path, str]]:
+        if self._stop.wait(
+            self.poll_interval if timeout is None else min(timeout, self.poll_interval)
+        ):
+            return []
+
+        events = self._diff_snapshot()
+        deadline = time.monotonic() + self.batch_delay * self._MAX_BATCH_DELAYS
+        # Collect changes until there was no change for batch_delay seconds
+        while events and time.monotonic() < deadline and not self._stop.wait(self.batch_delay):
+            if not (new_events := self._diff_snapshot()):
+                break
+            events.extend(new_events)
+        return events
+
+    def _read(
+        self, inotify: Inotify, timeout: float | None
+    ) -> tuple[list[tuple[Path, str]], bool]:
+        events: list[tuple[Path, str]] = []
+        overflow = False
+        deadline = time.monotonic() + self.batch_delay * self._MAX_BATCH_DELAYS
+        # Collect events until there was no event for batch_delay seconds
+        while read := list(inotify.read(timeout)):
+            for event in read:
+                overflow = overflow or bool(event.mask & IN_Q_OVERFLOW)
+                if event.directory is not None:
+                    events.append((event.directory, event.name))
+            if time.monotonic() >= deadline:
+                break
+            timeout = self.batch_delay
+        return events, overflow
+
+    def _apply(self, events: Iterable[tuple[Path, str]], overflow: bool) -> frozenset[str | None]:
+        scanner = self.scanner
+        if overflow:
+            scanner.invalidate_caches()
+            self._sync_watches()
+            return frozenset(
+                {None, *(version.uid for version in scanner.get_available_versions())}
+            )
+
+        affected: set[str | None] = set()
+        versions_changed = False
+        version_directories = scanner._get_version_directories()
+        for directory, name in events:
+            if directory == scanner.unreleased_directory:
+                affected.add(None)
+            elif directory == scanner.base_directory:
+                if (uid := scanner._refresh_version(name)) is not None:
+                    affected.add(uid)
+                    versions_changed = True
+            elif (uid := version_directories.get(directory)) is not None:
+                affected.add(uid)
+
+        if affected:
+            scanner._invalidate_commit_times()
+        if versions_changed:
+            self._sync_watches()
+        return frozenset(affected)
+
+    def wait_for_changes(self, timeout: float | None = None) -> frozenset[str | None]:
+        """Wait for the next batch of changes and apply it to the caches of the scanner.
+        Use this instead of :meth:`start` to process changes synchronously.
+
+        Args:
+            timeout (:obj:`float` | :obj:`None`, optional): The maximum number of seconds to
+                wait. Defaults to waiting until a change is detected.
+
+        Returns:
+            Set[:obj:`str` | :obj:`None`]: The UIDs of the versions whose change notes changed.
+            :obj:`None` stands for the unreleased changes. Empty if no change was detected
+            within :paramref:`timeout`.
+
+        Raises:
+            ~chango.error.ChanGoError: If the watcher was stopped.
+        """
+        self._ensure_not_stopped()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+            if (inotify := self._inotify) is None:
+                events, overflow = self._poll(remaining), False
+            else:
+                events, overflow = self._read(inotify, remaining)
+
+            if affected := self._apply(events, overflow):
+                return affected
+            if self._stop.is_set() or (deadline is not None and time.monotonic() >= deadline):
+                return frozenset()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            affected = self.wait_for_changes(timeout=self._STOP_INTERVAL)
+            if affected and self.callback is not None:
+                self.callback(affected)
+
+    def start(self) -> None:
+        """Start watching in a background thread, which calls :attr:`callback` for each batch
+        of changes.
+
+        Raises:
+            ~chango.error.ChanGoError: If the watcher was stopped.
+        """
+        self._ensure_not_stopped()
+        if self._thread is not None:
+            raise RuntimeError("The watcher is already running.")
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="chango-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread, if running, and release the inotify instance. The
+        watcher can not be used afterwards, i.e. :meth:`start` and :meth:`wait_for_changes`
+        raise an exception.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+        self._stopped = True
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.stop()
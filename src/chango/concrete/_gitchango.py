@@ -0,0 +1,102 @@
+#  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
+#
+#  SPDX-License-Identifier: MIT
+from pathlib import Path
+from typing import TYPE_CHECKING, NoReturn, override
+
+from .._utils.filename import FileName
+from .._utils.files import UTF8
+from .._utils.types import VUIDInput
+from ..abc import ChangeNote, VersionHistory, VersionNote
+from ..error import ChanGoError
+from ._basechango import _BaseChanGo
+from ._gitversionscanner import GitVersionScanner
+
+if TYPE_CHECKING:
+    from chango import Version
+
+
+class GitChanGo[VHT: VersionHistory, VNT: VersionNote, CNT: ChangeNote](
+    _BaseChanGo[GitVersionScanner, VHT, VNT, CNT]
+):
+    """Implementation of the :class:`~chango.abc.ChanGo` interface that works with
+    :class:`~chango.concrete.GitVersionScanner` to load change notes directly from the git object
+    database at a given reference, without checking it out.
+
+    Important:
+        This implementation is read-only. :meth:`get_write_directory`,
+        :meth:`write_change_note` and :meth:`release` raise a :exc:`~chango.error.ChanGoError`.
+
+    Example:
+        To render the version history as of the tag ``v1.0``, use
+
+        .. code-block:: python
+
+            from chango.concrete import GitChanGo, GitVersionScanner
+
+            chango_instance = GitChanGo(
+                change_note_type=MyChangeNote,
+                version_note_type=MyVersionNote,
+                version_history_type=MyVersionHistory,
+                scanner=GitVersionScanner("changes", "unreleased", ref="v1.0"),
+            )
+            chango_instance.load_version_history().render("markdown")
+
+    Args:
+        change_note_type (:class:`type`): The type of change notes to load. Must be a subclass of
+            :class:`~chango.abc.ChangeNote`.
+        version_note_type (:class:`type`): The type of version notes to load. Must be a subclass of
+            :class:`~chango.abc.VersionNote`.
+        version_history_type (:class:`type`): The type of version histories to load. Must be a
+            subclass of :class:`~chango.abc.VersionHistory`.
+        scanner (:class:`~chango.concrete.GitVersionScanner`): The version scanner to use.
+        encoding (:obj:`str`, optional): The encoding of the change note files. Defaults to
+            ``"utf-8"``.
+
+    Attributes:
+        encoding (:obj:`str`): The encoding of the change note files.
+    """
+
+    def __init__(
+        self: "GitChanGo[VHT, VNT, CNT]",
+        change_note_type: type[CNT],
+        version_note_type: type[VNT],
+        version_history_type: type[VHT],
+        scanner: GitVersionScanner,
+        encoding: str = UTF8,
+    ):
+        super().__init__(change_note_type, version_note_type, version_history_type, scanner)
+        self.encoding: str = encoding
+
+    @override
+    def load_change_note(self, uid: str) -> CNT:
+        """Implementation of :meth:`~chango.abc.ChanGo.load_change_note`.
+        Reads the contents via :meth:`~chango.concrete.GitVersionScanner.read_change_note_bytes`
+        and passes them to :meth:`~chango.abc.ChangeNote.from_bytes`.
+        """
+        file_name = FileName.from_string(self.scanner.lookup_change_note(uid).file_path.name)
+        return self.change_note_type.from_bytes(
+            slug=file_name.slug,
+            uid=file_name.uid,
+            data=self.scanner.read_change_note_bytes(file_name.uid),
+            encoding=self.encoding,
+        )
+
+    def _read_only(self) -> NoReturn:
+        raise ChanGoError(
+            f"{type(self).__name__} is read-only. Change notes can not be written or released."
+        )
+
+    @override
+    def get_write_directory(self, change_note: CNT | str, version: VUIDInput) -> Path:
+        self._read_only()
+
+    @override
+    def write_change_note(
+        self, change_note: CNT, version: VUIDInput, encoding: str = UTF8
+    ) -> Path:
+        self._read_only()
+
+    @override
+    def release(self, version: "Version") -> bool:
+        self._read_only()
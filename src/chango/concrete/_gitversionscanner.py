@@ -0,0 +1,343 @@
+#  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
+#
+#  SPDX-License-Identifier: MIT
+import contextlib
+import datetime as dtm
+import inspect
+import re
+from pathlib import Path, PurePosixPath
+from typing import NamedTuple, override
+
+from .._changenoteinfo import ChangeNoteInfo
+from .._utils.cache import SnapshotCache
+from .._utils.filename import FileName
+from .._utils.git import (
+    CatFileBatch,
+    get_first_commit_times,
+    get_repository_state,
+    list_tree,
+    resolve_commit,
+)
+from .._utils.pack import PackReader
+from .._utils.types import PathLike, VUIDInput
+from .._version import Version
+from ..abc import VersionScanner
+from ..constants import ChangeNoteOrder
+from ..error import ChanGoError, ValidationError
+from ..helpers import ensure_uid
+from ._directoryversionscanner import _DEFAULT_PATTERN, DirectoryVersionScanner, _make_relative_to
+
+
+class _BlobInfo(NamedTuple):
+    uid: str
+    # For change notes of packed versions, this is the path of the pack file joined with the
+    # file name and object_hash is the hash of the pack
+    path: PurePosixPath
+    object_hash: str
+    packed: bool = False
+
+
+class _TreeIndex(NamedTuple):
+    versions: dict[str, Version]
+    changes: dict[str | None, tuple[_BlobInfo, ...]]
+    lookup: dict[str, tuple[str | None, _BlobInfo]]
+    packs: dict[str, PackReader]
+
+
+class GitVersionScanner(VersionScanner):
+    """Implementation of a version scanner that reads the change notes directly from the git
+    object database at a given reference instead of from the working tree. The directory layout
+    is expected to be the same as for :class:`~chango.concrete.DirectoryVersionScanner`.
+
+    This allows to e.g. render the changelog as of a tag or branch head without checking it out.
+    The tree is listed with a single call of ``git ls-tree`` and the contents of the change notes
+    are streamed through a single long-running ``git cat-file --batch`` process.
+
+    Tip:
+        Use together with :class:`~chango.concrete.GitChanGo`.
+
+    Important:
+        The paths in the :class:`~chango.ChangeNoteInfo` objects returned by
+        :meth:`lookup_change_note` point to where the change note would be located in the
+        working tree. The files do not necessarily exist on disk. Use
+        :meth:`read_change_note_bytes` to get the contents.
+
+    Tip:
+        :ref:`Packed versions <packed-versions>` are supported. As for
+        :class:`~chango.concrete.DirectoryVersionScanner`, the paths of their change notes are
+        relative to the pack file.
+
+    Args:
+        base_directory (:obj:`str` | :class:`~pathlib.Path`): The base directory to scan for
+            version directories. Must be located within a git repository.
+
+            Important:
+                If the path is relative, it will be resolved relative to the directory of the
+                calling module. See also
+                :paramref:`~chango.concrete.DirectoryVersionScanner.base_directory`.
+        unreleased_directory (:obj:`str`): The directory that contains unreleased changes,
+            relative to :paramref:`base_directory`.
+        ref (:obj:`str`, optional): The git reference to read from, e.g. a tag name, a branch name
+            or a commit hash. Defaults to ``"HEAD"``.
+        directory_pattern (:obj:`str` | :obj:`re.Pattern`, optional): The pattern to match version
+            directories against. Same as
+            :paramref:`~chango.concrete.DirectoryVersionScanner.directory_pattern`.
+        change_order (:class:`~chango.constants.ChangeNoteOrder` | :obj:`str`, optional): The
+            strategy for ordering the change notes returned by :meth:`get_changes`. Defaults to
+            :attr:`~chango.constants.ChangeNoteOrder.FILE_NAME`. For
+            :attr:`~chango.constants.ChangeNoteOrder.COMMIT_TIME`, the history of :attr:`ref` is
+            considered.
+
+    Attributes:
+        base_directory (:class:`~pathlib.Path`): The base directory to scan for version
+            directories.
+        unreleased_directory (:class:`~pathlib.Path`): The directory that contains unreleased
+            changes.
+        ref (:obj:`str`): The git reference to read from.
+        directory_pattern (:obj:`re.Pattern`): The pattern to match version directories against.
+        change_order (:class:`~chango.constants.ChangeNoteOrder`): The strategy for ordering the
+            change notes returned by :meth:`get_changes`.
+    """
+
+    def __init__(
+        self,
+        base_directory: PathLike,
+        unreleased_directory: str,
+        ref: str = "HEAD",
+        directory_pattern: str | re.Pattern[str] = _DEFAULT_PATTERN,
+        change_order: ChangeNoteOrder | str = ChangeNoteOrder.FILE_NAME,
+    ):
+        caller_dir = Path(inspect.stack()[1].filename).resolve().absolute().parent
+        self.base_directory: Path = _make_relative_to(caller_dir, Path(base_directory))
+        if not self.base_directory.is_dir():
+            raise ValueError(f"Base directory '{self.base_directory}' does not exist.")
+        if (state := get_repository_state(self.base_directory)) is None:
+            raise ValueError(
+                f"Base directory '{self.base_directory}' is not part of a git repository with "
+                "commits."
+            )
+
+        self.unreleased_directory: Path = self.base_directory / unreleased_directory
+        self.ref: str = ref
+        self.directory_pattern: re.Pattern[str] = re.compile(directory_pattern)
+        self.change_order: ChangeNoteOrder = ChangeNoteOrder(change_order)
+
+        self._repository: Path = state[0]
+        self._tree_base = PurePosixPath(self.base_directory.relative_to(self._repository))
+        self._tree_unreleased = PurePosixPath(
+            self.unreleased_directory.relative_to(self._repository)
+        )
+        self._cat_file = CatFileBatch(self._repository)
+        self.__index = SnapshotCache(self._build_index)
+
+    def close(self) -> None:
+        """Terminate the ``git cat-file`` process used for reading change notes. It will be
+        restarted if required.
+        """
+        self._cat_file.close()
+
+    def _build_index(self) -> _TreeIndex:
+        if (commit := resolve_commit(self._repository, self.ref)) is None:
+            raise ChanGoError(f"Reference '{self.ref}' can not be resolved to a commit.")
+
+        versions: dict[str, Version] = {}
+        directories: dict[PurePosixPath, list[_BlobInfo]] = {}
+        pack_blobs: dict[PurePosixPath, str] = {}
+        for path, object_hash in list_tree(self._repository, commit, self._tree_base):
+            if path.parent == self._tree_base and path.name.endswith(
+                DirectoryVersionScanner.PACK_SUFFIX
+            ):
+                pack_blobs[path] = object_hash
+                continue
+            with contextlib.suppress(ValidationError):
+                file_name = FileName.from_string(path.name)
+                directories.setdefault(path.parent, []).append(
+                    _BlobInfo(file_name.uid, path, object_hash)
+                )
+
+        commit_times = (
+            get_first_commit_times(self._repository, (self.base_directory,), ref=commit)
+            if self.change_order == ChangeNoteOrder.COMMIT_TIME
+            else {}
+        )
+        changes: dict[str | None, tuple[_BlobInfo, ...]] = {}
+        for directory, blobs in directories.items():
+            if directory == self._tree_unreleased:
+                version_uid = None
+            elif directory.parent == self._tree_base and (
+                match := self.directory_pattern.match(directory.name)
+            ):
+                version_uid = match.group("uid")
+                versions[version_uid] = Version(
+                    version_uid, dtm.date.fromisoformat(match.group("date"))
+                )
+            else:
+                continue
+            changes[version_uid] = tuple(self._sort(blobs, commit_times))
+
+        # A pack takes precedence over a directory of the same version, see
+        # DirectoryVersionScanner
+        packs: dict[str, PackReader] = {}
+        for path, object_hash in pack_blobs.items():
+            if not (
+                match := self.directory_pattern.match(
+                    path.name.removesuffix(DirectoryVersionScanner.PACK_SUFFIX)
+                )
+            ):
+                continue
+            pack = packs[object_hash] = PackReader.from_bytes(
+                self._repository / path, self._cat_file.read(object_hash)
+            )
+            version_uid = match.group("uid")
+            versions[version_uid] = Version(
+                version_uid, dtm.date.fromisoformat(match.group("date"))
+            )
+            blobs = []
+            for name in pack.file_names:
+                with contextlib.suppress(ValidationError):
+                    blobs.append(
+                        _BlobInfo(
+                            FileName.from_string(name).uid, path / name, object_hash, packed=True
+                        )
+                    )
+            changes[version_uid] = tuple(self._sort(blobs, commit_times))
+
+        lookup = {
+            blob.uid: (version_uid, blob)
+            for version_uid, blobs in changes.items()
+            for blob in blobs
+        }
+        return _TreeIndex(versions, changes, lookup, packs)
+
+    def _sort(self, blobs: list[_BlobInfo], commit_times: dict[Path, int]) -> list[_BlobInfo]:
+        blobs.sort(key=lambda blob: blob.path.name)
+        if self.change_order == ChangeNoteOrder.UID:
+            blobs.sort(key=lambda blob: blob.uid)
+        elif self.change_order == ChangeNoteOrder.COMMIT_TIME:
+            # The change notes of a pack share the commit time of the pack
+            blobs.sort(
+                key=lambda blob: commit_times.get(
+                    self._repository / (blob.path.parent if blob.packed else blob.path), 0
+                )
+            )
+        return blobs
+
+    @property
+    def _index(self) -> _TreeIndex:
+        return self.__index.get()
+
+    @override
+    def invalidate_caches(self) -> None:
+        """Implementation of :meth:`chango.abc.VersionScanner.invalidate_caches`.
+        Re-resolves :attr:`ref` on the next access, which is useful if :attr:`ref` is a branch
+        name.
+        """
+        self.__index.invalidate()
+
+    @override
+    def is_available(self, uid: VUIDInput) -> bool:
+        if uid is None:
+            return self.has_unreleased_changes()
+        if (version := self._index.versions.get(ensure_uid(uid))) is None:
+            return False
+        if isinstance(uid, Version):
+            return version.date == uid.date
+        return True
+
+    @override
+    def has_unreleased_changes(self) -> bool:
+        return bool(self._index.changes.get(None))
+
+    @override
+    def get_latest_version(self) -> Version:
+        """Implementation of :meth:`chango.abc.VersionScanner.get_latest_version`.
+
+        Important:
+            In case of multiple releases on the same day,
+            lexicographical comparison of the version identifiers is employed.
+
+        Returns:
+            :class:`~chango.Version`: The latest version
+        """
+        if not (versions := self._index.versions):
+            raise ChanGoError("No versions available.")
+        return max(versions.values(), key=lambda version: (version.date, version.uid))
+
+    @override
+    def get_available_versions(
+        self, start_from: VUIDInput = None, end_at: VUIDInput = None
+    ) -> tuple[Version, ...]:
+        """Implementation of :meth:`chango.abc.VersionScanner.get_available_versions`.
+
+        Important:
+            Limiting the version range by
+            :paramref:`~chango.abc.VersionScanner.get_available_versions.start_from` and
+            :paramref:`~chango.abc.VersionScanner.get_available_versions.end_at` is based on
+            lexicographical comparison of the version identifiers.
+
+        Returns:
+            Tuple[:class:`~chango.Version`]: The available versions within the specified range.
+        """
+        start = ensure_uid(start_from)
+        end = ensure_uid(end_at)
+        return tuple(
+            version
+            for uid, version in self._index.versions.items()
+            if (start is None or uid >= start) and (end is None or uid <= end)
+        )
+
+    @override
+    def get_version(self, uid: str) -> Version:
+        try:
+            return self._index.versions[uid]
+        except KeyError as exc:
+            raise ChanGoError(f"Version '{uid}' not available.") from exc
+
+    @override
+    def lookup_change_note(self, uid: str) -> ChangeNoteInfo:
+        index = self._index
+        try:
+            version_uid, blob = index.lookup[uid]
+        except KeyError as exc:
+            raise ChanGoError(f"Change note '{uid}' not found in any version.") from exc
+        return ChangeNoteInfo(
+            uid,
+            None if version_uid is None else index.versions[version_uid],
+            self._repository / blob.path,
+        )
+
+    @override
+    def get_changes(self, uid: VUIDInput) -> tuple[str, ...]:
+        """Implementation of :meth:`chango.abc.VersionScanner.get_changes`.
+
+        Important:
+            The order of the returned UIDs is determined by :attr:`change_order`.
+        """
+        index = self._index
+        version_uid = ensure_uid(uid)
+        if version_uid is not None and version_uid not in index.versions:
+            raise ChanGoError(f"Version '{uid}' not available.")
+        return tuple(blob.uid for blob in index.changes.get(version_uid, ()))
+
+    def read_change_note_bytes(self, uid: str) -> bytes:
+        """Read the raw contents of a change note from the git object database. For packed
+        versions, the contents are read from the pack.
+
+        Args:
+            uid (:obj:`str`): The unique identifier of the change note.
+
+        Returns:
+            :obj:`bytes`: The contents of the change note file.
+
+        Raises:
+            ~chango.error.ChanGoError: If the change note with the given identifier is not
+                available.
+        """
+        index = self._index
+        try:
+            _, blob = index.lookup[uid]
+        except KeyError as exc:
+            raise ChanGoError(f"Change note '{uid}' not found in any version.") from exc
+        if blob.packed:
+            return index.packs[blob.object_hash].read(blob.path.name)
+        return self._cat_file.read(blob.object_hash)
@@ -2,11 +2,16 @@
 #
 #  SPDX-License-Identifier: MIT
 import string
-from typing import override
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING, override
 
+from .._versionhistoryfragment import VersionHistoryFragment
 from ..abc import VersionHistory, VersionNote
 from ..constants import MarkupLanguage
-from ..error import UnsupportedMarkupError
+from ..error import UnsupportedMarkupError, ValidationError
+
+if TYPE_CHECKING:
+    from docutils.nodes import Node
 
 
 class HeaderVersionHistory[VNT: VersionNote](VersionHistory[VNT]):
@@ -37,12 +42,6 @@ class HeaderVersionHistory[VNT: VersionNote](VersionHistory[VNT]):
                 :attr:`~chango.constants.MarkupLanguage.HTML`, or
                 :attr:`~chango.constants.MarkupLanguage.RESTRUCTUREDTEXT`
         """
-        released_notes = list(filter(lambda note: note.version, self.values()))
-        changes = sorted(
-            released_notes,
-            key=lambda note: note.date,  # type: ignore[arg-type,return-value]
-            reverse=True,
-        )
         match markup:
             case MarkupLanguage.MARKDOWN:
                 tpl_str = "# $uid\n*$date*\n\n$comment"
@@ -56,9 +55,6 @@ class HeaderVersionHistory[VNT: VersionNote](VersionHistory[VNT]):
                     f"and reStructuredText"
                 )
 
-        if None in self:
-            changes.insert(0, self[None])
-
         template = string.Template(tpl_str)
         return "\n\n".join(
             template.substitute(
@@ -69,5 +65,73 @@ class HeaderVersionHistory[VNT: VersionNote](VersionHistory[VNT]):
                 ),
                 comment=note.render(markup),
             )
-            for note in changes
+            for note in self._sorted_notes()
         )
+
+    def _sorted_notes(self) -> list[VNT]:
+        released_notes = list(filter(lambda note: note.version, self.values()))
+        notes = sorted(
+            released_notes,
+            key=lambda note: note.date,  # type: ignore[arg-type,return-value]
+            reverse=True,
+        )
+        if None in self:
+            notes.insert(0, self[None])
+        return notes
+
+    @override
+    def build_nodes(self, build_version_note_nodes: Callable[[VNT], "list[Node]"]) -> "list[Node]":
+        """Implementation of :meth:`~chango.abc.VersionHistory.build_nodes`. Builds one section
+        per version note in the same order and with the same structure as :meth:`render` for
+        reStructuredText.
+        """
+        from docutils import nodes  # noqa: PLC0415
+
+        sections: list[Node] = []
+        for note in self._sorted_notes():
+            title: str = note.uid or "Unreleased"  # type: ignore[truthy-function,assignment]
+            date = "unknown" if note.date is None else note.date.isoformat()  # type: ignore[attr-defined]
+            section = nodes.section("", names=[nodes.fully_normalize_name(title)])
+            section += nodes.title(title, title)
+            section += nodes.paragraph("", "", nodes.emphasis(date, date))
+            section.extend(build_version_note_nodes(note))
+            sections.append(section)
+        return sections
+
+    @override
+    def merge_fragments(self, fragments: Iterable[VersionHistoryFragment]) -> str:
+        """Implementation of :meth:`~chango.abc.VersionHistory.merge_fragments`. The fragments are
+        ordered like the version notes in :meth:`render`, i.e. unreleased changes first, followed
+        by the released versions sorted by release date. Versions with the same release date are
+        ordered by :attr:`~chango.VersionHistoryFragment.position`.
+
+        Raises:
+            :exc:`~chango.error.ValidationError`: If the fragments were rendered in different
+                markup languages or contain the same version more than once.
+        """
+        by_uid: dict[str | None, VersionHistoryFragment] = {}
+        for fragment in fragments:
+            if fragment.uid in by_uid:
+                raise ValidationError(
+                    f"Got more than one fragment for version {fragment.uid or 'Unreleased'!r}."
+                )
+            by_uid[fragment.uid] = fragment
+
+        if len({fragment.markup for fragment in by_uid.values()}) > 1:
+            raise ValidationError("Can't merge fragments rendered in different markup languages.")
+
+        # Sorting by position first makes the stable sort by date reproduce the insertion order
+        # that render() relies on for versions released on the same day
+        released = sorted(
+            (fragment for uid, fragment in by_uid.items() if uid is not None),
+            key=lambda fragment: fragment.position,
+        )
+        ordered = sorted(
+            released,
+            key=lambda fragment: fragment.date,  # type: ignore[arg-type,return-value]
+            reverse=True,
+        )
+        if None in by_uid:
+            ordered.insert(0, by_uid[None])
+
+        return "\n\n".join(fragment.content for fragment in ordered)
@@ -0,0 +1,96 @@
+#  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
+#
+#  SPDX-License-Identifier: MIT
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional, cast, override
+
+from .._utils.files import UTF8
+from .._utils.types import VUIDInput
+from ..abc import ChangeNote, VersionHistory, VersionNote
+from ..error import ChanGoError
+from ._basechango import _ImportExportChanGo
+from ._memoryversionscanner import MemoryVersionScanner
+
+if TYPE_CHECKING:
+    from chango import Version
+
+
+class MemoryChanGo[VHT: VersionHistory, VNT: VersionNote, CNT: ChangeNote](
+    _ImportExportChanGo[MemoryVersionScanner, VHT, VNT, CNT]
+):
+    """Implementation of the :class:`~chango.abc.ChanGo` interface that works with
+    :class:`~chango.concrete.MemoryVersionScanner` and keeps all change notes in memory.
+    The file system is never accessed.
+
+    Use :meth:`import_from` and :meth:`export_to` to take a snapshot of e.g. a
+    :class:`~chango.concrete.DirectoryChanGo` or to write the change notes back to one.
+
+    Important:
+        :meth:`load_change_note` returns the stored change note objects. Modifying them modifies
+        the stored data.
+
+    Example:
+        .. code-block:: python
+
+            from chango.concrete import MemoryChanGo, MemoryVersionScanner
+
+            chango_instance = MemoryChanGo(
+                change_note_type=MyChangeNote,
+                version_note_type=MyVersionNote,
+                version_history_type=MyVersionHistory,
+                scanner=MemoryVersionScanner(),
+            )
+            chango_instance.import_from(directory_chango_instance)
+            chango_instance.load_version_history().render("markdown")
+
+    Args:
+        change_note_type (:class:`type`): The type of change notes to load. Must be a subclass of
+            :class:`~chango.abc.ChangeNote`.
+        version_note_type (:class:`type`): The type of version notes to load. Must be a subclass of
+            :class:`~chango.abc.VersionNote`.
+        version_history_type (:class:`type`): The type of version histories to load. Must be a
+            subclass of :class:`~chango.abc.VersionHistory`.
+        scanner (:class:`~chango.concrete.MemoryVersionScanner`): The version scanner to use.
+    """
+
+    @override
+    def load_change_note(self, uid: str) -> CNT:
+        return cast("CNT", self.scanner.get_change_note(uid))
+
+    @override
+    def get_write_directory(self, change_note: CNT | str, version: VUIDInput) -> Path:
+        raise ChanGoError(
+            f"{type(self).__name__} keeps change notes in memory. There is no write directory."
+        )
+
+    @override
+    def write_change_note(
+        self, change_note: CNT, version: VUIDInput, encoding: str = UTF8
+    ) -> Path:
+        """Implementation of :meth:`~chango.abc.ChanGo.write_change_note`. Stores the change note
+        via :meth:`~chango.concrete.MemoryVersionScanner.add_change_note`. The
+        :paramref:`encoding` argument is ignored.
+
+        Returns:
+            :class:`pathlib.Path`: The path of the change note as returned by
+            :meth:`~chango.concrete.MemoryVersionScanner.lookup_change_note`.
+        """
+        self.scanner.add_change_note(change_note, version)
+        return Path(change_note.file_name)
+
+    @override
+    def release(self, version: "Version") -> bool:
+        """Implementation of :meth:`~chango.abc.ChanGo.release`. Moves all unreleased change
+        notes via :meth:`~chango.concrete.MemoryVersionScanner.release_changes`.
+        """
+        return self.scanner.release_changes(version)
+
+    @override
+    def _import_version(self, session: Any, version: "Version") -> None:
+        self.scanner.add_version(version)
+
+    @override
+    def _import_change_note(
+        self, session: Any, change_note: ChangeNote, version: Optional["Version"]
+    ) -> None:
+        self.scanner.add_change_note(change_note, version)
@@ -0,0 +1,214 @@
+#  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
+#
+#  SPDX-License-Identifier: MIT
+from pathlib import Path
+from typing import override
+
+from .._changenoteinfo import ChangeNoteInfo
+from .._utils.types import VUIDInput
+from .._version import Version
+from ..abc import ChangeNote, VersionScanner
+from ..error import ChanGoError
+from ..helpers import ensure_uid
+
+
+class MemoryVersionScanner(VersionScanner):
+    """Implementation of a version scanner that keeps versions and change notes in dictionaries
+    instead of reading them from the file system. All lookups are dictionary lookups.
+
+    This is useful for rendering changelogs in applications that already hold the data and for
+    measuring the CPU costs of chango without any I/O.
+
+    Tip:
+        Use together with :class:`~chango.concrete.MemoryChanGo`, which also provides
+        conversion from and to other :class:`~chango.abc.ChanGo` implementations.
+
+    Important:
+        The change notes are not stored as files. The paths in the
+        :class:`~chango.ChangeNoteInfo` objects returned by :meth:`lookup_change_note` consist
+        only of the file name of the change note.
+    """
+
+    def __init__(self) -> None:
+        self._versions: dict[str, Version] = {}
+        self._changes: dict[str | None, dict[str, None]] = {None: {}}
+        self._change_notes: dict[str, tuple[str | None, ChangeNote]] = {}
+
+    @override
+    def is_available(self, uid: VUIDInput) -> bool:
+        if uid is None:
+            return self.has_unreleased_changes()
+
+        if (version := self._versions.get(ensure_uid(uid))) is None:
+            return False
+        if isinstance(uid, Version):
+            return version.date == uid.date
+        return True
+
+    @override
+    def has_unreleased_changes(self) -> bool:
+        return bool(self._changes[None])
+
+    @override
+    def get_latest_version(self) -> Version:
+        """Implementation of :meth:`chango.abc.VersionScanner.get_latest_version`.
+
+        Important:
+            In case of multiple releases on the same day,
+            lexicographical comparison of the version identifiers is employed.
+
+        Returns:
+            :class:`~chango.Version`: The latest version
+        """
+        if not self._versions:
+            raise ChanGoError("No versions available.")
+        return max(self._versions.values(), key=lambda version: (version.date, version.uid))
+
+    @override
+    def get_available_versions(
+        self, start_from: VUIDInput = None, end_at: VUIDInput = None
+    ) -> tuple[Version, ...]:
+        """Implementation of :meth:`chango.abc.VersionScanner.get_available_versions`.
+
+        Important:
+            Limiting the version range by
+            :paramref:`~chango.abc.VersionScanner.get_available_versions.start_from` and
+            :paramref:`~chango.abc.VersionScanner.get_available_versions.end_at` is based on
+            lexicographical comparison of the version identifiers.
+
+        Returns:
+            Tuple[:class:`~chango.Version`]: The available versions within the specified range
+            ordered by date.
+        """
+        start = ensure_uid(start_from)
+        end = ensure_uid(end_at)
+        return tuple(
+            sorted(
+                (
+                    version
+                    for uid, version in self._versions.items()
+                    if (start is None or uid >= start) and (end is None or uid <= end)
+                ),
+                key=lambda version: (version.date, version.uid),
+            )
+        )
+
+    @override
+    def lookup_change_note(self, uid: str) -> ChangeNoteInfo:
+        try:
+            version_uid, change_note = self._change_notes[uid]
+        except KeyError as exc:
+            raise ChanGoError(f"Change note '{uid}' not found in any version.") from exc
+        return ChangeNoteInfo(
+            uid, self._versions[version_uid] if version_uid else None, Path(change_note.file_name)
+        )
+
+    @override
+    def get_version(self, uid: str) -> Version:
+        try:
+            return self._versions[uid]
+        except KeyError as exc:
+            raise ChanGoError(f"Version '{uid}' not available.") from exc
+
+    @override
+    def get_changes(self, uid: VUIDInput) -> tuple[str, ...]:
+        """Implementation of :meth:`chango.abc.VersionScanner.get_changes`.
+
+        Important:
+            The change notes are returned in the order in which they were first added.
+
+        Args:
+            uid (:class:`~chango.Version` | :obj:`str` | :obj:`None`): The version identifier to
+                get the change notes for. If :obj:`None`, get the unreleased change notes.
+
+        Returns:
+            Tuple[:obj:`str`]: UIDs of the change notes for the given version.
+        """
+        if uid is not None and not self.is_available(uid):
+            raise ChanGoError(f"Version '{ensure_uid(uid)}' not available.")
+        return tuple(self._changes[ensure_uid(uid)])
+
+    def get_change_note(self, uid: str) -> ChangeNote:
+        """Get the stored change note object.
+
+        Args:
+            uid (:obj:`str`): The unique identifier of the change note.
+
+        Returns:
+            :class:`~chango.abc.ChangeNote`: The change note.
+
+        Raises:
+            ~chango.error.ChanGoError: If the change note with the given identifier is not
+                available.
+        """
+        try:
+            return self._change_notes[uid][1]
+        except KeyError as exc:
+            raise ChanGoError(f"Change note '{uid}' not found in any version.") from exc
+
+    def add_version(self, version: Version) -> None:
+        """Add a version, even if no change notes belong to it.
+
+        Args:
+            version (:class:`~chango.Version`): The version to add.
+
+        Raises:
+            ~chango.error.ChanGoError: If a version with the same uid but a different date is
+                already available.
+        """
+        if (existing := self._versions.get(version.uid)) is None:
+            self._versions[version.uid] = version
+            self._changes[version.uid] = {}
+        elif existing.date != version.date:
+            raise ChanGoError(
+                f"Version '{version.uid}' is already available with date {existing.date}."
+            )
+
+    def add_change_note(self, change_note: ChangeNote, version: VUIDInput) -> None:
+        """Store a change note. If a change note with the same uid is already stored, it is
+        replaced and moved to the given version.
+
+        Args:
+            change_note (:class:`~chango.abc.ChangeNote`): The change note to store.
+            version (:class:`~chango.Version` | :obj:`str` | :obj:`None`): The version the change
+                note belongs to. If a :class:`~chango.Version` is passed, it is added if not yet
+                available. May be :obj:`None` if the change note is not yet released.
+
+        Raises:
+            ~chango.error.ChanGoError: If :paramref:`version` is a :obj:`str` but not yet
+                available or a :class:`~chango.Version` with a different date than the available
+                version of the same uid.
+        """
+        if isinstance(version, Version):
+            self.add_version(version)
+        elif isinstance(version, str) and version not in self._versions:
+            raise ChanGoError(
+                f"Version '{version}' not available yet. To add to a new version, pass the "
+                "version as `change.Version` object."
+            )
+
+        version_uid = ensure_uid(version)
+        if (existing := self._change_notes.get(change_note.uid)) and existing[0] != version_uid:
+            del self._changes[existing[0]][change_note.uid]
+        self._changes[version_uid][change_note.uid] = None
+        self._change_notes[change_note.uid] = (version_uid, change_note)
+
+    def release_changes(self, version: Version) -> bool:
+        """Move all unreleased change notes to the given version.
+
+        Args:
+            version (:class:`~chango.Version`): The version to release.
+
+        Returns:
+            :obj:`bool`: Whether a release was performed. If no unreleased changes are available,
+            this method returns :obj:`False`.
+        """
+        if not self._changes[None]:
+            return False
+
+        self.add_version(version)
+        for uid in self._changes[None]:
+            self._changes[version.uid][uid] = None
+            self._change_notes[uid] = (version.uid, self._change_notes[uid][1])
+        self._changes[None] = {}
+        return True
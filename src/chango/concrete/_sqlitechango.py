@@ -0,0 +1,192 @@
+#  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
+#
+#  SPDX-License-Identifier: MIT
+import contextlib
+import sqlite3
+from collections.abc import Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional, override
+
+from .._utils.filename import FileName
+from .._utils.files import UTF8
+from .._utils.types import VUIDInput
+from ..abc import ChangeNote, VersionHistory, VersionNote
+from ..error import ChanGoError
+from ..helpers import ensure_uid
+from ._basechango import _ImportExportChanGo
+from ._sqliteversionscanner import SQLiteVersionScanner
+
+if TYPE_CHECKING:
+    from chango import Version
+
+
+class SQLiteChanGo[VHT: VersionHistory, VNT: VersionNote, CNT: ChangeNote](
+    _ImportExportChanGo[SQLiteVersionScanner, VHT, VNT, CNT]
+):
+    """Implementation of the :class:`~chango.abc.ChanGo` interface that works with
+    :class:`~chango.concrete.SQLiteVersionScanner` and stores the change notes in a SQLite
+    database. :meth:`write_change_note`, :meth:`release` and :meth:`import_from` are executed as
+    single transactions.
+
+    Use :meth:`import_from` and :meth:`export_to` to move change notes between the database and
+    e.g. a :class:`~chango.concrete.DirectoryChanGo`.
+
+    Important:
+        Since change notes are not stored as files, :meth:`get_write_directory` is not supported
+        and the CLI commands that open change notes in an editor can not be used with this
+        implementation.
+
+    Args:
+        change_note_type (:class:`type`): The type of change notes to load. Must be a subclass of
+            :class:`~chango.abc.ChangeNote`.
+        version_note_type (:class:`type`): The type of version notes to load. Must be a subclass of
+            :class:`~chango.abc.VersionNote`.
+        version_history_type (:class:`type`): The type of version histories to load. Must be a
+            subclass of :class:`~chango.abc.VersionHistory`.
+        scanner (:class:`~chango.concrete.SQLiteVersionScanner`): The version scanner to use.
+        encoding (:obj:`str`, optional): The encoding of the stored change notes. Defaults to
+            ``"utf-8"``.
+
+    Attributes:
+        encoding (:obj:`str`): The encoding of the stored change notes.
+    """
+
+    def __init__(
+        self: "SQLiteChanGo[VHT, VNT, CNT]",
+        change_note_type: type[CNT],
+        version_note_type: type[VNT],
+        version_history_type: type[VHT],
+        scanner: SQLiteVersionScanner,
+        encoding: str = UTF8,
+    ):
+        super().__init__(change_note_type, version_note_type, version_history_type, scanner)
+        self.encoding: str = encoding
+
+    @override
+    def load_change_note(self, uid: str) -> CNT:
+        """Implementation of :meth:`~chango.abc.ChanGo.load_change_note`.
+        Reads the contents via :meth:`~chango.concrete.SQLiteVersionScanner.read_change_note_bytes`
+        and passes them to :meth:`~chango.abc.ChangeNote.from_bytes`.
+        """
+        file_name = FileName.from_string(self.scanner.lookup_change_note(uid).file_path.name)
+        return self.change_note_type.from_bytes(
+            slug=file_name.slug,
+            uid=file_name.uid,
+            data=self.scanner.read_change_note_bytes(file_name.uid),
+            encoding=self.encoding,
+        )
+
+    @override
+    def get_write_directory(self, change_note: CNT | str, version: VUIDInput) -> Path:
+        raise ChanGoError(
+            f"{type(self).__name__} stores change notes in a database. There is no write "
+            "directory."
+        )
+
+    @staticmethod
+    def _ensure_version(connection: sqlite3.Connection, version: "Version") -> None:
+        rows = connection.execute(
+            "SELECT date FROM versions WHERE uid = ?", (version.uid,)
+        ).fetchall()
+        if not rows:
+            connection.execute(
+                "INSERT INTO versions (uid, date) VALUES (?, ?)",
+                (version.uid, version.date.isoformat()),
+            )
+        elif rows[0][0] != version.date.isoformat():
+            raise ChanGoError(
+                f"Version '{version.uid}' is already available with date {rows[0][0]}."
+            )
+
+    def _insert_change_note(
+        self, connection: sqlite3.Connection, change_note: ChangeNote, version: VUIDInput
+    ) -> None:
+        if isinstance(version, str):
+            if not connection.execute(
+                "SELECT 1 FROM versions WHERE uid = ?", (version,)
+            ).fetchall():
+                raise ChanGoError(
+                    f"Version '{version}' not available yet. To write to a new version, pass "
+                    "the version as `change.Version` object."
+                )
+        elif version is not None:
+            self._ensure_version(connection, version)
+
+        # Upsert instead of replace to keep the original position of the change note
+        connection.execute(
+            "INSERT INTO change_notes (uid, slug, file_extension, version_uid, content) "
+            "VALUES (?, ?, ?, ?, ?) ON CONFLICT (uid) DO UPDATE SET slug = excluded.slug, "
+            "file_extension = excluded.file_extension, version_uid = excluded.version_uid, "
+            "content = excluded.content",
+            (
+                change_note.uid,
+                change_note.slug,
+                change_note.file_extension,
+                ensure_uid(version),
+                change_note.to_bytes(encoding=self.encoding),
+            ),
+        )
+        connection.execute(
+            "DELETE FROM pull_requests WHERE change_note_uid = ?", (change_note.uid,)
+        )
+        pull_requests: Any = getattr(change_note, "pull_requests", ())
+        connection.executemany(
+            "INSERT OR IGNORE INTO pull_requests (change_note_uid, pull_request_uid) "
+            "VALUES (?, ?)",
+            ((change_note.uid, pull_request.uid) for pull_request in pull_requests),
+        )
+
+    @override
+    def write_change_note(
+        self, change_note: CNT, version: VUIDInput, encoding: str = UTF8
+    ) -> Path:
+        """Implementation of :meth:`~chango.abc.ChanGo.write_change_note`. Stores the change note
+        in the database in a single transaction. If the change note has an attribute
+        ``pull_requests`` (e.g. :class:`~chango.concrete.sections.SectionChangeNote`), the related
+        pull requests are indexed as well.
+
+        Note:
+            The change note is encoded with :attr:`encoding`. The :paramref:`encoding` argument
+            is ignored.
+
+        Returns:
+            :class:`pathlib.Path`: The path of the change note as returned by
+            :meth:`~chango.concrete.SQLiteVersionScanner.lookup_change_note`.
+        """
+        with self.scanner.transaction() as connection:
+            self._insert_change_note(connection, change_note, version)
+        return self.scanner.database / change_note.file_name
+
+    @override
+    def release(self, version: "Version") -> bool:
+        """Implementation of :meth:`~chango.abc.ChanGo.release`. Assigns all unreleased change
+        notes to the version in a single transaction.
+        """
+        with self.scanner.transaction() as connection:
+            if not connection.execute(
+                "SELECT 1 FROM change_notes WHERE version_uid IS NULL LIMIT 1"
+            ).fetchall():
+                return False
+
+            self._ensure_version(connection, version)
+            connection.execute(
+                "UPDATE change_notes SET version_uid = ? WHERE version_uid IS NULL", (version.uid,)
+            )
+        return True
+
+    @contextlib.contextmanager
+    @override
+    def _import_session(self) -> Iterator[sqlite3.Connection]:
+        # The import is executed as a single transaction
+        with self.scanner.transaction() as connection:
+            yield connection
+
+    @override
+    def _import_version(self, session: sqlite3.Connection, version: "Version") -> None:
+        self._ensure_version(session, version)
+
+    @override
+    def _import_change_note(
+        self, session: sqlite3.Connection, change_note: ChangeNote, version: Optional["Version"]
+    ) -> None:
+        self._insert_change_note(session, change_note, version)
@@ -0,0 +1,285 @@
+#  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
+#
+#  SPDX-License-Identifier: MIT
+import contextlib
+import datetime as dtm
+import inspect
+import sqlite3
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, override
+
+from .._changenoteinfo import ChangeNoteInfo
+from .._utils.filename import FileName
+from .._utils.types import PathLike, VUIDInput
+from .._version import Version
+from ..abc import VersionScanner
+from ..error import ChanGoError
+from ..helpers import ensure_uid
+from ._directoryversionscanner import _make_relative_to
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS versions (
+    uid TEXT PRIMARY KEY,
+    date TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS versions_date ON versions (date, uid);
+
+CREATE TABLE IF NOT EXISTS change_notes (
+    id INTEGER PRIMARY KEY,
+    uid TEXT NOT NULL UNIQUE,
+    slug TEXT NOT NULL,
+    file_extension TEXT NOT NULL,
+    version_uid TEXT REFERENCES versions (uid),
+    content BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS change_notes_version ON change_notes (version_uid, id);
+
+CREATE TABLE IF NOT EXISTS pull_requests (
+    change_note_uid TEXT NOT NULL REFERENCES change_notes (uid) ON DELETE CASCADE,
+    pull_request_uid TEXT NOT NULL,
+    PRIMARY KEY (change_note_uid, pull_request_uid)
+);
+CREATE INDEX IF NOT EXISTS pull_requests_uid ON pull_requests (pull_request_uid);
+"""
+
+
+class SQLiteVersionScanner(VersionScanner):
+    """Implementation of a version scanner that reads versions and change notes from a SQLite
+    database instead of from one file per change note. All queries are answered from indexed
+    tables, such that no tree walks are required.
+
+    The database is created on first use. The ``versions`` table is indexed by date and uid, the
+    ``change_notes`` table by uid and version and the ``pull_requests`` table maps change notes
+    to the uids of related pull requests.
+
+    Tip:
+        Use together with :class:`~chango.concrete.SQLiteChanGo`, which also handles writing
+        change notes and releasing versions.
+
+    Important:
+        The change notes are not stored as files. The paths in the
+        :class:`~chango.ChangeNoteInfo` objects returned by :meth:`lookup_change_note` are
+        formed by the :attr:`database` path and the file name of the change note and do not
+        exist on disk. Use :meth:`read_change_note_bytes` to get the contents.
+
+    Args:
+        database (:obj:`str` | :class:`~pathlib.Path`): The path of the SQLite database file.
+
+            Important:
+                If the path is relative, it will be resolved relative to the directory of the
+                calling module. See also
+                :paramref:`~chango.concrete.DirectoryVersionScanner.base_directory`.
+
+    Attributes:
+        database (:class:`~pathlib.Path`): The path of the SQLite database file.
+    """
+
+    def __init__(self, database: PathLike):
+        caller_dir = Path(inspect.stack()[1].filename).resolve().absolute().parent
+        self.database: Path = _make_relative_to(caller_dir, Path(database))
+        if not self.database.parent.is_dir():
+            raise ValueError(f"Directory '{self.database.parent}' does not exist.")
+
+        self._lock = threading.RLock()
+        self.__connection: sqlite3.Connection | None = None
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        if self.__connection is None:
+            # Transactions are managed explicitly in `transaction`
+            connection = sqlite3.connect(
+                self.database, isolation_level=None, check_same_thread=False
+            )
+            connection.execute("PRAGMA foreign_keys = ON")
+            connection.executescript(_SCHEMA)
+            self.__connection = connection
+        return self.__connection
+
+    def close(self) -> None:
+        """Close the connection to the database. It will be reopened if required."""
+        with self._lock:
+            if self.__connection is not None:
+                self.__connection.close()
+                self.__connection = None
+
+    @contextlib.contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Context manager that runs the enclosed statements in a single write transaction.
+        The transaction is committed on success and rolled back if an exception is raised.
+
+        Example:
+            .. code-block:: python
+
+                with scanner.transaction() as connection:
+                    connection.execute("DELETE FROM change_notes WHERE uid = ?", (uid,))
+
+        Yields:
+            :class:`sqlite3.Connection`: The connection to execute statements on.
+        """
+        with self._lock:
+            connection = self._connection
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield connection
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+
+    def _fetch_all(self, query: str, parameters: tuple | dict[str, Any] = ()) -> list[tuple]:
+        with self._lock:
+            return self._connection.execute(query, parameters).fetchall()
+
+    @staticmethod
+    def _to_version(uid: str, date: str) -> Version:
+        return Version(uid, dtm.date.fromisoformat(date))
+
+    @override
+    def is_available(self, uid: VUIDInput) -> bool:
+        if uid is None:
+            return self.has_unreleased_changes()
+
+        rows = self._fetch_all("SELECT date FROM versions WHERE uid = ?", (ensure_uid(uid),))
+        if not rows:
+            return False
+        if isinstance(uid, Version):
+            return rows[0][0] == uid.date.isoformat()
+        return True
+
+    @override
+    def has_unreleased_changes(self) -> bool:
+        return bool(
+            self._fetch_all("SELECT 1 FROM change_notes WHERE version_uid IS NULL LIMIT 1")
+        )
+
+    @override
+    def get_latest_version(self) -> Version:
+        """Implementation of :meth:`chango.abc.VersionScanner.get_latest_version`.
+
+        Important:
+            In case of multiple releases on the same day,
+            lexicographical comparison of the version identifiers is employed.
+
+        Returns:
+            :class:`~chango.Version`: The latest version
+        """
+        rows = self._fetch_all(
+            "SELECT uid, date FROM versions ORDER BY date DESC, uid DESC LIMIT 1"
+        )
+        if not rows:
+            raise ChanGoError("No versions available.")
+        return self._to_version(*rows[0])
+
+    @override
+    def get_available_versions(
+        self, start_from: VUIDInput = None, end_at: VUIDInput = None
+    ) -> tuple[Version, ...]:
+        """Implementation of :meth:`chango.abc.VersionScanner.get_available_versions`.
+
+        Important:
+            Limiting the version range by
+            :paramref:`~chango.abc.VersionScanner.get_available_versions.start_from` and
+            :paramref:`~chango.abc.VersionScanner.get_available_versions.end_at` is based on
+            lexicographical comparison of the version identifiers.
+
+        Returns:
+            Tuple[:class:`~chango.Version`]: The available versions within the specified range
+            ordered by date.
+        """
+        rows = self._fetch_all(
+            "SELECT uid, date FROM versions WHERE (:start_from IS NULL OR uid >= :start_from) "
+            "AND (:end_at IS NULL OR uid <= :end_at) ORDER BY date, uid",
+            {"start_from": ensure_uid(start_from), "end_at": ensure_uid(end_at)},
+        )
+        return tuple(self._to_version(*row) for row in rows)
+
+    @override
+    def lookup_change_note(self, uid: str) -> ChangeNoteInfo:
+        rows = self._fetch_all(
+            "SELECT change_notes.slug, change_notes.file_extension, versions.uid, versions.date "
+            "FROM change_notes LEFT JOIN versions ON change_notes.version_uid = versions.uid "
+            "WHERE change_notes.uid = ?",
+            (uid,),
+        )
+        if not rows:
+            raise ChanGoError(f"Change note '{uid}' not found in any version.")
+
+        slug, file_extension, version_uid, date = rows[0]
+        return ChangeNoteInfo(
+            uid,
+            self._to_version(version_uid, date) if version_uid else None,
+            self.database / FileName(slug, uid).to_string(file_extension),
+        )
+
+    @override
+    def get_version(self, uid: str) -> Version:
+        rows = self._fetch_all("SELECT uid, date FROM versions WHERE uid = ?", (uid,))
+        if not rows:
+            raise ChanGoError(f"Version '{uid}' not available.")
+        return self._to_version(*rows[0])
+
+    @override
+    def get_changes(self, uid: VUIDInput) -> tuple[str, ...]:
+        """Implementation of :meth:`chango.abc.VersionScanner.get_changes`.
+
+        Important:
+            The change notes are returned in the order in which they were first written to the
+            database.
+
+        Args:
+            uid (:class:`~chango.Version` | :obj:`str` | :obj:`None`): The version identifier to
+                get the change notes for. If :obj:`None`, get the unreleased change notes.
+
+        Returns:
+            Tuple[:obj:`str`]: UIDs of the change notes for the given version.
+        """
+        if uid is None:
+            rows = self._fetch_all(
+                "SELECT uid FROM change_notes WHERE version_uid IS NULL ORDER BY id"
+            )
+        elif not self.is_available(uid):
+            raise ChanGoError(f"Version '{ensure_uid(uid)}' not available.")
+        else:
+            rows = self._fetch_all(
+                "SELECT uid FROM change_notes WHERE version_uid = ? ORDER BY id",
+                (ensure_uid(uid),),
+            )
+        return tuple(row[0] for row in rows)
+
+    def get_changes_by_pull_request(self, uid: str) -> tuple[str, ...]:
+        """Get the change notes that are related to a pull request.
+
+        Args:
+            uid (:obj:`str`): The unique identifier of the pull request.
+
+        Returns:
+            Tuple[:obj:`str`]: UIDs of the change notes related to the pull request in the order
+            in which they were first written to the database.
+        """
+        rows = self._fetch_all(
+            "SELECT change_notes.uid FROM pull_requests JOIN change_notes "
+            "ON pull_requests.change_note_uid = change_notes.uid "
+            "WHERE pull_requests.pull_request_uid = ? ORDER BY change_notes.id",
+            (uid,),
+        )
+        return tuple(row[0] for row in rows)
+
+    def read_change_note_bytes(self, uid: str) -> bytes:
+        """Read the raw contents of a change note.
+
+        Args:
+            uid (:obj:`str`): The unique identifier of the change note.
+
+        Returns:
+            :obj:`bytes`: The contents of the change note as they would be written to a file.
+
+        Raises:
+            ~chango.error.ChanGoError: If the change note with the given identifier is not
+                available.
+        """
+        rows = self._fetch_all("SELECT content FROM change_notes WHERE uid = ?", (uid,))
+        if not rows:
+            raise ChanGoError(f"Change note '{uid}' not found in any version.")
+        return rows[0][0]
@@ -3,21 +3,61 @@
 #  SPDX-License-Identifier: MIT
 """This module provides the functionality to load the configuration for the ChanGo CLI."""
 
-__all__ = ["ChanGoConfig", "ChanGoInstanceConfig", "get_chango_instance"]
+__all__ = [
+    "CONFIG_CACHE_DIR_ENV_VAR",
+    "ChanGoConfig",
+    "ChanGoInstanceConfig",
+    "ConfigCache",
+    "clear_chango_instances",
+    "get_chango_instance",
+]
 
-import functools
+import os
+from pathlib import Path
 from typing import Any
 
 from chango.abc import ChanGo
 
+from .._utils.config import get_pyproject_toml_path
 from .._utils.types import PathLike
+from ._cache import ConfigCache
 from ._models import ChanGoConfig, ChanGoInstanceConfig
 
+#: :obj:`str`: Name of the environment variable that enables the persistent
+#: :class:`~chango.config.ConfigCache` for :func:`get_chango_instance`. The value is used as
+#: cache directory.
+CONFIG_CACHE_DIR_ENV_VAR = "CHANGO_CONFIG_CACHE_DIR"
+
+_INSTANCES: dict[Path, ChanGo[Any, Any, Any, Any]] = {}
+
+
+def _import_chango_instance(
+    path: PathLike | None, pyproject_toml_path: Path
+) -> ChanGo[Any, Any, Any, Any]:
+    if not (cache_directory := os.environ.get(CONFIG_CACHE_DIR_ENV_VAR)):
+        return ChanGoConfig.load(path).import_chango_instance()
+    cache = ConfigCache(cache_directory)
+    if (config := cache.get(pyproject_toml_path)) is not None:
+        return config.import_chango_instance()
+
+    config = ChanGoConfig.load(path)
+    # The entry records the module file, which is only known after the import
+    instance = config.import_chango_instance()
+    cache.set(pyproject_toml_path, config)
+    return instance
+
 
-@functools.lru_cache(maxsize=256)
 def get_chango_instance(path: PathLike | None = None) -> ChanGo[Any, Any, Any, Any]:
     """Get the :class:`~chango.abc.ChanGo` instance specified in the configuration file.
-    Uses LRU caching to avoid reloading the configuration file multiple times.
+    Instances are cached by the resolved path of the configuration file, such that e.g. the
+    current working directory and its absolute path share one instance. Use
+    :func:`clear_chango_instances` or ``get_chango_instance.cache_clear()`` to clear the cache.
+
+    Tip:
+        Set the environment variable :data:`CONFIG_CACHE_DIR_ENV_VAR` to a directory to
+        additionally cache the resolved configuration across processes, see
+        :class:`~chango.config.ConfigCache`. This allows repeated invocations of the CLI to skip
+        parsing the ``pyproject.toml`` file.
 
     Args:
         path (:class:`~pathlib.Path` | :obj:`str` | :obj:`None`, optional): The path to the
@@ -27,4 +67,19 @@ def get_chango_instance(path: PathLike | None = None) -> ChanGo[Any, Any, Any, A
         :class:`~chango.abc.ChanGo`: The instance of the :class:`~chango.abc.ChanGo` class
             specified in the configuration file.
     """
-    return ChanGoConfig.load(path).import_chango_instance()
+    pyproject_toml_path = get_pyproject_toml_path(path)
+    if (instance := _INSTANCES.get(pyproject_toml_path)) is None:
+        instance = _import_chango_instance(path, pyproject_toml_path)
+        _INSTANCES[pyproject_toml_path] = instance
+    return instance
+
+
+def clear_chango_instances() -> None:
+    """Clear the cache of :func:`get_chango_instance`, such that the next call loads the
+    configuration again. The persistent :class:`~chango.config.ConfigCache` is not affected.
+    """
+    _INSTANCES.clear()
+
+
+# Kept for compatibility with the `functools.lru_cache` based implementation
+get_chango_instance.cache_clear = clear_chango_instances  # type: ignore[attr-defined]
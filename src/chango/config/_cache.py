@@ -0,0 +1,114 @@
+#  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
+#
+#  SPDX-License-Identifier: MIT
+import hashlib
+import importlib.util
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+from pydantic import ValidationError
+
+from .. import __version__
+from .._utils.files import UTF8, atomic_write_bytes
+from .._utils.types import PathLike
+from ._models import ChanGoConfig, ChanGoInstanceConfig
+
+__all__ = ["ConfigCache"]
+
+
+def _stat(path: Path) -> list[int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def get_module_file(config: ChanGoConfig) -> Path | None:
+    """Get the file of the module that the chango instance is imported from. The module must
+    already be imported.
+    """
+    instance = config.chango_instance
+    try:
+        name = importlib.util.resolve_name(instance.module, instance.package)
+    except ImportError:
+        return None
+    module_file = getattr(sys.modules.get(name), "__file__", None)
+    return None if module_file is None else Path(module_file)
+
+
+class ConfigCache:
+    """Persistent cache for resolved :class:`~chango.config.ChanGoConfig` instances, which allows
+    repeated invocations of the CLI to skip parsing the ``pyproject.toml`` file.
+
+    Each entry is stored as JSON file in :paramref:`directory` and is valid as long as the
+    modification time and size of the ``pyproject.toml`` file and the modification time of the
+    module that the :class:`~chango.abc.ChanGo` instance is imported from do not change. Entries
+    written by other versions of ``chango`` are ignored.
+
+    Args:
+        directory (:class:`~pathlib.Path` | :obj:`str`): The directory to store the entries in.
+    """
+
+    def __init__(self, directory: PathLike) -> None:
+        self.directory = Path(directory)
+
+    def _entry_path(self, pyproject_toml_path: Path) -> Path:
+        name = hashlib.sha256(str(pyproject_toml_path).encode()).hexdigest()
+        return self.directory / f"{name}.json"
+
+    def get(self, pyproject_toml_path: Path) -> ChanGoConfig | None:
+        """Get the cached configuration for the ``pyproject.toml`` file.
+
+        Args:
+            pyproject_toml_path (:class:`~pathlib.Path`): The resolved path of the file.
+
+        Returns:
+            :class:`~chango.config.ChanGoConfig` | :obj:`None`: The configuration or :obj:`None`
+                if there is no valid entry.
+        """
+        try:
+            entry = json.loads(self._entry_path(pyproject_toml_path).read_text(encoding=UTF8))
+        except (OSError, ValueError):
+            return None
+
+        if (
+            not isinstance(entry, dict)
+            or entry.get("chango_version") != __version__
+            or entry.get("pyproject_toml")
+            != [str(pyproject_toml_path), _stat(pyproject_toml_path)]
+        ):
+            return None
+        module = entry.get("module")
+        if module is not None and module != [module[0], _stat(Path(module[0]))]:
+            return None
+
+        data: dict[str, Any] = entry.get("config", {})
+        try:
+            # Constructing the model directly skips the settings sources, i.e. parsing the file
+            return ChanGoConfig.model_construct(
+                sys_path=None if data.get("sys_path") is None else Path(data["sys_path"]),
+                chango_instance=ChanGoInstanceConfig.model_validate(data.get("chango_instance")),
+            )
+        except ValidationError:
+            return None
+
+    def set(self, pyproject_toml_path: Path, config: ChanGoConfig) -> None:
+        """Store the configuration for the ``pyproject.toml`` file. Should be called after
+        importing the :class:`~chango.abc.ChanGo` instance, such that the module file is known.
+
+        Args:
+            pyproject_toml_path (:class:`~pathlib.Path`): The resolved path of the file.
+            config (:class:`~chango.config.ChanGoConfig`): The configuration loaded from the file.
+        """
+        module_file = get_module_file(config)
+        entry = {
+            "chango_version": __version__,
+            "pyproject_toml": [str(pyproject_toml_path), _stat(pyproject_toml_path)],
+            "module": None if module_file is None else [str(module_file), _stat(module_file)],
+            "config": config.model_dump(mode="json"),
+        }
+        self.directory.mkdir(parents=True, exist_ok=True)
+        atomic_write_bytes(self._entry_path(pyproject_toml_path), json.dumps(entry).encode(UTF8))
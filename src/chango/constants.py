@@ -3,7 +3,7 @@
 #  SPDX-License-Identifier: MIT
 """This module contains constants used throughout the :mod:`chango` package."""
 
-__all__ = ["MarkupLanguage"]
+__all__ = ["ChangeNoteOrder", "MarkupLanguage"]
 
 import contextlib
 from collections.abc import Mapping
@@ -84,3 +84,21 @@ class MarkupLanguage(StrEnum):
             return effective_mapping[lookup]
 
         raise ValueError(f"File extension `{string}` not found in mapping.")
+
+
+class ChangeNoteOrder(StrEnum):
+    """Strategies for ordering the change notes of a version as used by
+    :class:`~chango.concrete.DirectoryVersionScanner`.
+    """
+
+    FILE_NAME = "file_name"
+    """Order by the full file name of the change notes. Since the file name starts with the
+    slug, this is the order of the slugs."""
+    UID = "uid"
+    """Order by the :attr:`~chango.abc.ChangeNote.uid` of the change notes. Reflects the order of
+    creation for time-ordered UIDs as generated by :func:`chango.helpers.time_ordered_uid`."""
+    COMMIT_TIME = "commit_time"
+    """Order by the time of the git commit that added the change notes. Renames are followed,
+    i.e. releasing a version does not change the order. Change notes that are not yet committed
+    are placed last, ordered by file name. If git is not available, this is equivalent to
+    :attr:`FILE_NAME`."""
@@ -0,0 +1,197 @@
+#  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
+#
+#  SPDX-License-Identifier: MIT
+"""This module contains functionality for exporting the change notes in a machine-readable
+format, e.g. for release dashboards or search indices."""
+
+__all__ = ["ChangeNoteRecord", "iter_change_note_records"]
+
+import datetime as dtm
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Executor, Future
+from typing import Any, NamedTuple, Self
+
+import pydantic as pydt
+
+from ._utils.types import VUIDInput
+from ._version import Version
+from .abc import ChangeNote, ChanGo
+
+
+def _to_json(value: Any) -> Any:
+    """Convert the known types of change note contents to JSON-compatible values."""
+    if value is None or isinstance(value, str | int | float | bool):
+        return value
+    # datetime.datetime is a subclass of datetime.date
+    if isinstance(value, dtm.date | dtm.time):
+        return value.isoformat()
+    if isinstance(value, pydt.BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, tuple | list):
+        return [_to_json(item) for item in value]
+    if isinstance(value, dict) and all(isinstance(key, str) for key in value):
+        return {key: _to_json(item) for key, item in value.items()}
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _get_fields(change_note: ChangeNote) -> dict[str, Any]:
+    if isinstance(change_note, pydt.BaseModel):
+        return change_note.model_dump(mode="json", exclude={"pull_requests"})
+    # Plain change notes like CommentChangeNote store their content in public attributes
+    return {key: value for key, value in vars(change_note).items() if not key.startswith("_")}
+
+
+def _get_pull_requests(change_note: ChangeNote) -> tuple[dict[str, Any], ...]:
+    return tuple(
+        pull_request.model_dump(mode="json")
+        if isinstance(pull_request, pydt.BaseModel)
+        else dict(vars(pull_request))
+        for pull_request in getattr(change_note, "pull_requests", ())
+    )
+
+
+class ChangeNoteRecord(NamedTuple):
+    """A flat representation of a change note together with the version it belongs to, as
+    returned by :func:`iter_change_note_records`.
+    """
+
+    version_uid: str | None
+    """:obj:`str` | :obj:`None`: The unique identifier of the version. :obj:`None` for unreleased
+    changes."""
+    version_date: dtm.date | None
+    """:class:`datetime.date` | :obj:`None`: The release date of the version. :obj:`None` for
+    unreleased changes."""
+    uid: str
+    """:obj:`str`: The unique identifier of the change note."""
+    slug: str
+    """:obj:`str`: The slug of the change note."""
+    fields: dict[str, Any]
+    """Dict[:obj:`str`, Any]: The content of the change note. For
+    :class:`~chango.concrete.sections.SectionChangeNote`, these are the sections."""
+    pull_requests: tuple[dict[str, Any], ...]
+    """Tuple[Dict[:obj:`str`, Any]]: The pull requests related to the change, if the change note
+    type has the attribute ``pull_requests``. Empty otherwise."""
+
+    @classmethod
+    def from_change_note(cls, change_note: ChangeNote, version: Version | None) -> Self:
+        """Build a record from a change note.
+
+        Args:
+            change_note (:class:`~chango.abc.ChangeNote`): The change note.
+            version (:class:`~chango.Version` | :obj:`None`): The version the change note belongs
+                to. :obj:`None` for unreleased changes.
+
+        Returns:
+            :class:`ChangeNoteRecord`: The record.
+        """
+        return cls(
+            version_uid=version.uid if version else None,
+            version_date=version.date if version else None,
+            uid=change_note.uid,
+            slug=change_note.slug,
+            fields=_get_fields(change_note),
+            pull_requests=_get_pull_requests(change_note),
+        )
+
+    def to_json(self) -> dict[str, Any]:
+        """Convert the record to a dictionary that can be serialized with :func:`json.dumps`.
+        Dates are converted to ISO format, tuples to lists and :class:`pydantic.BaseModel`
+        instances to dictionaries.
+
+        Returns:
+            Dict[:obj:`str`, Any]: The record with the date in ISO format.
+
+        Raises:
+            TypeError: If the fields or pull requests contain values of other types.
+        """
+        return {
+            "version_uid": self.version_uid,
+            "version_date": self.version_date.isoformat() if self.version_date else None,
+            "uid": self.uid,
+            "slug": self.slug,
+            "fields": _to_json(self.fields),
+            "pull_requests": _to_json(self.pull_requests),
+        }
+
+
+def _load_records(
+    chango: ChanGo[Any, Any, Any, Any], version: Version | None
+) -> list[ChangeNoteRecord]:
+    return [
+        ChangeNoteRecord.from_change_note(chango.load_change_note(uid), version)
+        for uid in chango.scanner.get_changes(version)
+    ]
+
+
+def iter_change_note_records(
+    chango: ChanGo[Any, Any, Any, Any],
+    start_from: VUIDInput = None,
+    end_at: VUIDInput = None,
+    executor: Executor | None = None,
+    prefetch: int = 4,
+) -> Iterator[ChangeNoteRecord]:
+    """Iterate over the change notes of all versions, one record per change note.
+
+    The versions are loaded lazily, one at a time, such that only the change notes of a few
+    versions are held in memory at once. The released versions are yielded sorted by release
+    date and version identifier, such that the export is deterministic, followed by the
+    unreleased changes. Within a version, the change notes are in the order of
+    :meth:`~chango.abc.VersionScanner.get_changes`.
+
+    Example:
+        .. code-block:: python
+
+            import json
+
+            from chango.config import get_chango_instance
+            from chango.export import iter_change_note_records
+
+            for record in iter_change_note_records(get_chango_instance()):
+                print(json.dumps(record.to_json()))
+
+    Args:
+        chango (:class:`~chango.abc.ChanGo`): The instance to export.
+        start_from (:class:`~chango.Version` | :obj:`str`, optional): The version to start
+            from. If :obj:`None`, start from the earliest available version.
+        end_at (:class:`~chango.Version` | :obj:`str`, optional): The version to end at.
+            If :obj:`None`, end at the latest available version, *including* unreleased
+            changes.
+        executor (:class:`concurrent.futures.Executor`, optional): The executor to load the
+            versions with. The order of the records is the same as without an executor. Since
+            the change notes are loaded via :paramref:`chango`, this should be a
+            :class:`~concurrent.futures.ThreadPoolExecutor`.
+        prefetch (:obj:`int`, optional): The maximum number of versions that are loaded ahead of
+            the consumer if :paramref:`executor` is passed. Bounds the memory usage. Defaults to
+            ``4``.
+
+    Yields:
+        :class:`ChangeNoteRecord`: The records.
+    """
+    scanner = chango.scanner
+    versions: list[Version | None] = [
+        *sorted(
+            scanner.get_available_versions(start_from=start_from, end_at=end_at),
+            key=lambda version: (version.date, version.uid),
+        )
+    ]
+    if not end_at and scanner.has_unreleased_changes():
+        versions.append(None)
+
+    if executor is None:
+        for version in versions:
+            yield from _load_records(chango, version)
+        return
+
+    pending: deque[Future[list[ChangeNoteRecord]]] = deque()
+    try:
+        for version in versions:
+            pending.append(executor.submit(_load_records, chango, version))
+            if len(pending) >= max(prefetch, 1):
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        # Don't load versions that won't be consumed if the iteration is stopped early
+        for future in pending:
+            future.cancel()
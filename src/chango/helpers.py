@@ -4,10 +4,11 @@
 from pathlib import Path
 from typing import Protocol, overload
 
+from ._utils import filename as _filename
 from ._utils.filename import FileName
 from ._utils.types import PathLike
 
-__all__ = ["change_uid_from_file", "ensure_uid"]
+__all__ = ["change_uid_from_file", "ensure_uid", "time_ordered_uid"]
 
 
 def change_uid_from_file(file: PathLike) -> str:
@@ -63,3 +64,23 @@ def ensure_uid(obj: _UIDProtocol | _UIDPropProtocol | str | None) -> str | None:
     if isinstance(obj, str):
         return obj
     return obj.uid
+
+
+def time_ordered_uid() -> str:
+    """Generate a unique identifier for a change note that is lexicographically sortable by
+    creation time. The format follows the `ULID <https://github.com/ulid/spec>`_ specification:
+    26 characters encoding a millisecond timestamp followed by random data.
+    UIDs generated within the same millisecond by the same process are still unique and strictly
+    increasing.
+
+    Tip:
+        Set :attr:`chango.abc.ChangeNote.UID_FACTORY` to this function to use time-ordered UIDs
+        for new change notes and pass
+        :attr:`~chango.constants.ChangeNoteOrder.UID` to
+        :class:`~chango.concrete.DirectoryVersionScanner` such that change notes are returned in
+        the order in which they were created.
+
+    Returns:
+        :obj:`str`: The generated UID.
+    """
+    return _filename.time_ordered_uid()
@@ -0,0 +1,300 @@
+#  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
+#
+#  SPDX-License-Identifier: MIT
+"""This module contains functionality for combining the changelogs of multiple projects, e.g.
+the packages of a monorepo, into a single report."""
+
+__all__ = ["MonorepoChanGo", "PackageVersionNote", "discover_chango_configs"]
+
+import contextlib
+import datetime as dtm
+import importlib.util
+import itertools
+import os
+import string
+import sys
+import tomllib
+from collections.abc import Iterator, Mapping
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Any, NamedTuple, Self
+
+from ._utils.files import UTF8
+from ._utils.types import PathLike
+from .abc import ChanGo, VersionNote
+from .config import ChanGoConfig, get_chango_instance
+from .constants import MarkupLanguage
+from .error import UnsupportedMarkupError
+
+_SKIPPED_DIRECTORIES = frozenset({"__pycache__", "node_modules"})
+
+
+def discover_chango_configs(root: PathLike) -> dict[str, Path]:
+    """Find all ``pyproject.toml`` files below a directory that contain a ``[tool.chango]``
+    table. Hidden directories as well as ``__pycache__`` and ``node_modules`` directories are
+    skipped.
+
+    Args:
+        root (:obj:`str` | :class:`~pathlib.Path`): The directory to search.
+
+    Returns:
+        Dict[:obj:`str`, :class:`~pathlib.Path`]: The paths of the ``pyproject.toml`` files keyed
+        by the POSIX path of their directory relative to :paramref:`root`, sorted by key. The
+        configuration in :paramref:`root` itself has the key ``"."``.
+    """
+    root_path = Path(root).resolve()
+    configs: dict[str, Path] = {}
+    for directory, directory_names, file_names in os.walk(root_path):
+        directory_names[:] = sorted(
+            name
+            for name in directory_names
+            if not name.startswith(".") and name not in _SKIPPED_DIRECTORIES
+        )
+        if "pyproject.toml" not in file_names:
+            continue
+
+        path = Path(directory) / "pyproject.toml"
+        with path.open("rb") as file:
+            if "chango" not in tomllib.load(file).get("tool", {}):
+                continue
+        configs[Path(directory).relative_to(root_path).as_posix()] = path
+
+    return dict(sorted(configs.items()))
+
+
+@contextlib.contextmanager
+def _isolated_modules(name: str) -> Iterator[None]:
+    """Temporarily remove the top-level module ``name`` and its submodules from
+    :data:`sys.modules`, such that they are imported anew, and restore them afterwards.
+    """
+
+    def matches(module_name: str) -> bool:
+        return module_name == name or module_name.startswith(f"{name}.")
+
+    previous = {key: module for key, module in sys.modules.items() if matches(key)}
+    for key in previous:
+        del sys.modules[key]
+    try:
+        yield
+    finally:
+        for key in [key for key in sys.modules if matches(key)]:
+            del sys.modules[key]
+        sys.modules.update(previous)
+
+
+def _import_chango_instance(pyproject_toml_path: Path) -> ChanGo[Any, Any, Any, Any]:
+    """Import the instance configured in the file via :func:`~chango.config.get_chango_instance`.
+    The config modules of different packages commonly share their name, so the module is
+    imported in isolation from modules of the same name that were imported before.
+    """
+    instance_config = ChanGoConfig.load(pyproject_toml_path).chango_instance
+    module_name = importlib.util.resolve_name(instance_config.module, instance_config.package)
+    with _isolated_modules(module_name.partition(".")[0]):
+        return get_chango_instance(pyproject_toml_path)
+
+
+class PackageVersionNote(NamedTuple):
+    """A version note together with the name of the package it belongs to, as returned by
+    :meth:`MonorepoChanGo.load_version_notes`.
+    """
+
+    package: str
+    """:obj:`str`: The name of the package."""
+    version_note: VersionNote
+    """:class:`~chango.abc.VersionNote`: The version note."""
+
+
+class MonorepoChanGo:
+    """Combines the changelogs of multiple named :class:`~chango.abc.ChanGo` instances, e.g. one
+    per package of a monorepo, into a single report.
+
+    The version notes of all packages are loaded concurrently using one shared executor. In the
+    report, the version notes are grouped by release date and then by package.
+
+    Note:
+        This class is not a :class:`~chango.abc.ChanGo` itself, since version identifiers are
+        only unique per package. To write change notes or to release a version, use the
+        respective instance in :attr:`instances`.
+
+    Example:
+        .. code-block:: python
+
+            from chango.monorepo import MonorepoChanGo
+
+            monorepo = MonorepoChanGo.from_root("path/to/monorepo")
+            print(monorepo.render("markdown", since=datetime.date(2024, 1, 1)))
+
+    Args:
+        instances (Mapping[:obj:`str`, :class:`~chango.abc.ChanGo`]): The instances to combine,
+            keyed by package name.
+        executor (:class:`concurrent.futures.Executor`, optional): The executor to load the
+            version notes with. If not passed, a :class:`~concurrent.futures.ThreadPoolExecutor`
+            is created for each call of :meth:`load_version_notes`.
+
+    Attributes:
+        instances (Dict[:obj:`str`, :class:`~chango.abc.ChanGo`]): The combined instances.
+        executor (:class:`concurrent.futures.Executor` | :obj:`None`): The executor to load the
+            version notes with.
+    """
+
+    def __init__(
+        self, instances: Mapping[str, ChanGo[Any, Any, Any, Any]], executor: Executor | None = None
+    ):
+        self.instances: dict[str, ChanGo[Any, Any, Any, Any]] = dict(instances)
+        self.executor: Executor | None = executor
+
+    @classmethod
+    def from_root(cls, root: PathLike, executor: Executor | None = None) -> Self:
+        """Build an instance from all configurations found by :func:`discover_chango_configs`.
+        The package names are the relative directory paths of the configurations.
+
+        Important:
+            The instances are imported one after another via
+            :func:`~chango.config.get_chango_instance`, since importing temporarily modifies the
+            global :data:`sys.path`. Modules that were imported before under the same name are
+            hidden during the import, such that packages may use the same module name, e.g.
+            ``config``.
+
+        Args:
+            root (:obj:`str` | :class:`~pathlib.Path`): The directory to search.
+            executor (:class:`concurrent.futures.Executor`, optional): Passed to the constructor.
+
+        Returns:
+            :class:`MonorepoChanGo`: The new instance.
+        """
+        return cls(
+            {
+                name: _import_chango_instance(path)
+                for name, path in discover_chango_configs(root).items()
+            },
+            executor=executor,
+        )
+
+    def _tasks(
+        self, since: dtm.date | None, include_unreleased: bool
+    ) -> Iterator[tuple[str, ChanGo[Any, Any, Any, Any], Any]]:
+        for package, chango in self.instances.items():
+            if include_unreleased and chango.scanner.has_unreleased_changes():
+                yield package, chango, None
+            for version in chango.scanner.get_available_versions():
+                if since is None or version.date >= since:
+                    yield package, chango, version
+
+    def load_version_notes(
+        self, since: dtm.date | None = None, include_unreleased: bool = True
+    ) -> tuple[PackageVersionNote, ...]:
+        """Load the version notes of all packages concurrently.
+
+        Args:
+            since (:obj:`datetime.date`, optional): Only load versions released on or after this
+                date.
+            include_unreleased (:obj:`bool`, optional): Whether to include unreleased changes.
+                Defaults to :obj:`True`.
+
+        Returns:
+            Tuple[:class:`PackageVersionNote`]: The version notes. Unreleased changes come first,
+            followed by the released versions with the newest first. Ties are ordered by
+            package name and version identifier.
+        """
+        tasks = list(self._tasks(since, include_unreleased))
+        context = nullcontext(self.executor) if self.executor else ThreadPoolExecutor()
+        with context as executor:
+            futures = [
+                (package, executor.submit(chango.load_version_note, version))
+                for package, chango, version in tasks
+            ]
+            notes = [PackageVersionNote(package, future.result()) for package, future in futures]
+
+        def sort_key(note: PackageVersionNote) -> tuple:
+            version = note.version_note.version
+            if version is None:
+                return (0, 0, note.package, "")
+            return (1, -version.date.toordinal(), note.package, version.uid)
+
+        return tuple(sorted(notes, key=sort_key))
+
+    def render(
+        self, markup: str, since: dtm.date | None = None, include_unreleased: bool = True
+    ) -> str:
+        """Render a combined report of the version notes loaded by :meth:`load_version_notes`.
+        The version notes are grouped by release date. Within each date, each version note is
+        prefixed with the package name and version identifier.
+
+        Important:
+            Currently, only Markdown, HTML and reStructuredText are supported as markup languages.
+
+        Args:
+            markup (:obj:`str`): The markup language to use for rendering.
+            since (:obj:`datetime.date`, optional): Passed to :meth:`load_version_notes`.
+            include_unreleased (:obj:`bool`, optional): Passed to :meth:`load_version_notes`.
+
+        Returns:
+            :obj:`str`: The rendered report.
+
+        Raises:
+            :exc:`~chango.error.UnsupportedMarkupError`: If the ``markup`` parameter does not
+                coincide with :attr:`~chango.constants.MarkupLanguage.MARKDOWN`,
+                :attr:`~chango.constants.MarkupLanguage.HTML`, or
+                :attr:`~chango.constants.MarkupLanguage.RESTRUCTUREDTEXT`
+        """
+        match markup:
+            case MarkupLanguage.MARKDOWN:
+                date_template, package_template = "# $title", "## $title\n\n$content"
+            case MarkupLanguage.HTML:
+                date_template, package_template = "<h1>$title</h1>", "<h2>$title</h2>\n\n$content"
+            case MarkupLanguage.RESTRUCTUREDTEXT:
+                date_template = "$title\n$underline"
+                package_template = "$title\n$underline\n\n$content"
+            case _:
+                raise UnsupportedMarkupError(
+                    f"Got unsupported markup '{markup}', can only render Markdown, HTML, "
+                    f"and reStructuredText"
+                )
+
+        def get_date(note: PackageVersionNote) -> str:
+            version = note.version_note.version
+            return "Unreleased" if version is None else version.date.isoformat()
+
+        sections = []
+        for title, group in itertools.groupby(
+            self.load_version_notes(since=since, include_unreleased=include_unreleased),
+            key=get_date,
+        ):
+            sections.append(
+                string.Template(date_template).substitute(title=title, underline="=" * len(title))
+            )
+            for package, version_note in group:
+                package_title = (
+                    package if version_note.version is None else f"{package} {version_note.uid}"
+                )
+                sections.append(
+                    string.Template(package_template).substitute(
+                        title=package_title,
+                        underline="-" * len(package_title),
+                        content=version_note.render(markup),
+                    )
+                )
+        return "\n\n".join(sections)
+
+    def write_report(
+        self,
+        path: PathLike,
+        markup: str,
+        since: dtm.date | None = None,
+        include_unreleased: bool = True,
+        encoding: str = UTF8,
+    ) -> None:
+        """Write the output of :meth:`render` to a file.
+
+        Args:
+            path (:obj:`str` | :class:`~pathlib.Path`): The file to write to.
+            markup (:obj:`str`): Passed to :meth:`render`.
+            since (:obj:`datetime.date`, optional): Passed to :meth:`render`.
+            include_unreleased (:obj:`bool`, optional): Passed to :meth:`render`.
+            encoding (:obj:`str`, optional): The encoding to use. Defaults to ``"utf-8"``.
+        """
+        Path(path).write_text(
+            self.render(markup, since=since, include_unreleased=include_unreleased),
+            encoding=encoding,
+        )
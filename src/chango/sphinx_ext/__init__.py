@@ -17,18 +17,25 @@ from chango import __version__
 
 __all__ = ["setup"]
 
-from ._util import directive_factory
+from ._pages import on_builder_inited
+from ._util import directive_factory, on_env_get_outdated, on_env_merge_info, on_env_purge_doc
 
 
 def setup(app: Sphinx) -> dict[str, typing.Any]:
     """Sets up the ``chango`` Sphinx extension.
-    This currently does two things:
+    This currently does four things:
 
     1. Adds the ``chango`` directive to Sphinx, which allows you to include changelogs in your
        documentation.
     2. Adds a configuration value ``chango_pyproject_toml_path`` to the Sphinx configuration, which
        allows you to specify the path to the ``pyproject.toml`` file that contains the chango
        configuration.
+    3. Caches the rendered changelogs on the build environment and registers the change note
+       files as dependencies of the documents using the directive. Documents are hence only
+       rebuilt on incremental builds if the change notes changed.
+    4. Optionally generates a paginated changelog with one document per version or per year,
+       see the configuration values ``chango_pagination``, ``chango_pagination_directory`` and
+       ``chango_pagination_title``.
 
     Args:
         app (:class:`sphinx.application.Sphinx`): The Sphinx application object.
@@ -48,6 +55,33 @@ def setup(app: Sphinx) -> dict[str, typing.Any]:
             "the same inputs as `chango.config.ChanGoConfig.load`."
         ),
     )
+    app.add_config_value(
+        "chango_pagination",
+        None,
+        rebuild="env",
+        types=(str, NoneType),
+        description=(
+            "Generate one changelog page per 'version' or per 'year'. Disabled if set to None."
+        ),
+    )
+    app.add_config_value(
+        "chango_pagination_directory",
+        "changelog",
+        rebuild="env",
+        types=(str,),
+        description="Directory relative to the source directory to write the pages to.",
+    )
+    app.add_config_value(
+        "chango_pagination_title",
+        "Changelog",
+        rebuild="env",
+        types=(str,),
+        description="Title of the index page of the paginated changelog.",
+    )
     app.add_directive("chango", directive_factory(app))
+    app.connect("builder-inited", on_builder_inited)
+    app.connect("env-get-outdated", on_env_get_outdated)
+    app.connect("env-purge-doc", on_env_purge_doc)
+    app.connect("env-merge-info", on_env_merge_info)
 
     return {"version": __version__, "parallel_read_safe": True, "parallel_write_safe": True}
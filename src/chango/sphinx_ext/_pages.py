@@ -0,0 +1,196 @@
+#  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
+#
+#  SPDX-License-Identifier: MIT
+import contextlib
+import hashlib
+import json
+from collections.abc import Iterable
+from pathlib import Path
+
+from sphinx.application import Sphinx
+from sphinx.util import logging
+
+from chango import Version, __version__
+from chango._utils.filename import FileName
+from chango._utils.files import UTF8, atomic_write_bytes
+from chango._utils.sources import collect_source_paths, get_directory_scanners
+from chango.abc import ChanGo, VersionScanner
+from chango.concrete import BackwardCompatibleVersionScanner, DirectoryVersionScanner
+from chango.config import get_chango_instance
+from chango.constants import MarkupLanguage
+from chango.error import ValidationError
+
+logger = logging.getLogger(__name__)
+
+PAGINATION_VALUES = (None, "version", "year")
+MANIFEST_FILE_NAME = ".chango-pages.json"
+UNRELEASED_PAGE = "unreleased"
+
+
+def _heading(title: str) -> str:
+    decoration = len(title) * "="
+    return f"{decoration}\n{title}\n{decoration}"
+
+
+def _map_change_note_paths(scanner: VersionScanner, uids: Iterable[str]) -> dict[str, Path]:
+    paths = {}
+    if isinstance(scanner, DirectoryVersionScanner | BackwardCompatibleVersionScanner):
+        # Walking the directories once is much cheaper than looking up each change note
+        for path in collect_source_paths(scanner):
+            try:
+                paths[FileName.from_string(path.name).uid] = path
+            except ValidationError:
+                continue
+
+        # The change notes of packed versions are not stored as files. The pack file is modified
+        # whenever its content changes.
+        for directory_scanner in get_directory_scanners(scanner):
+            for version in directory_scanner.get_available_versions():
+                if not directory_scanner.is_packed(version):
+                    continue
+                for path in directory_scanner.list_files(version):
+                    with contextlib.suppress(ValidationError):
+                        paths[FileName.from_string(path.name).uid] = path.parent
+
+    for uid in uids:
+        if uid not in paths:
+            file_path = scanner.lookup_change_note(uid).file_path
+            # Packed change notes of other scanners, e.g. GitVersionScanner
+            packed = not file_path.exists() and file_path.parent.is_file()
+            paths[uid] = file_path.parent if packed else file_path
+    return paths
+
+
+def group_versions(scanner: VersionScanner, pagination: str) -> dict[str, list[Version | None]]:
+    """Group the versions into pages, newest first. The unreleased changes always get their own
+    page.
+    """
+    groups: dict[str, list[Version | None]] = {}
+    if scanner.has_unreleased_changes():
+        groups[UNRELEASED_PAGE] = [None]
+
+    versions = sorted(
+        scanner.get_available_versions(), key=lambda version: version.date, reverse=True
+    )
+    for version in versions:
+        page = version.uid if pagination == "version" else str(version.date.year)
+        groups.setdefault(page, []).append(version)
+    return groups
+
+
+def compute_page_fingerprints(
+    scanner: VersionScanner, groups: dict[str, list[Version | None]], pagination: str
+) -> dict[str, str]:
+    """Compute a fingerprint for each page from the versions on the page and the modification
+    times and sizes of their change note files.
+    """
+    changes = {
+        (version.uid if version else None): scanner.get_changes(version)
+        for versions in groups.values()
+        for version in versions
+    }
+    paths = _map_change_note_paths(scanner, (uid for uids in changes.values() for uid in uids))
+
+    def stat(uid: str) -> tuple[int, int] | None:
+        try:
+            result = paths[uid].stat()
+        except (KeyError, OSError):
+            return None
+        return result.st_mtime_ns, result.st_size
+
+    fingerprints = {}
+    for page, versions in groups.items():
+        data = [
+            __version__,
+            pagination,
+            [
+                [
+                    version.uid if version else None,
+                    version.date.isoformat() if version else None,
+                    [[uid, stat(uid)] for uid in changes[version.uid if version else None]],
+                ]
+                for version in versions
+            ],
+        ]
+        fingerprints[page] = hashlib.sha256(json.dumps(data).encode()).hexdigest()
+    return fingerprints
+
+
+def render_page(chango: ChanGo, page: str, versions: list[Version | None], pagination: str) -> str:
+    version_history = chango.build_version_history()
+    for version in versions:
+        version_history.add_version_note(chango.load_version_note(version))
+    text = version_history.render(MarkupLanguage.RESTRUCTUREDTEXT)
+
+    # In "version" mode, the header of the version is the page title
+    if pagination == "year" and page != UNRELEASED_PAGE:
+        text = f"{_heading(page)}\n\n{text}"
+    return f"{text}\n"
+
+
+def render_index(title: str, pages: Iterable[str]) -> str:
+    entries = "\n".join(f"    {page}" for page in pages)
+    return f"{_heading(title)}\n\n.. toctree::\n    :maxdepth: 1\n\n{entries}\n"
+
+
+def _write_if_changed(path: Path, text: str) -> bool:
+    data = text.encode(UTF8)
+    if path.is_file() and path.read_bytes() == data:
+        return False
+    atomic_write_bytes(path, data)
+    return True
+
+
+def generate_pages(chango: ChanGo, directory: Path, pagination: str, title: str) -> list[str]:
+    """Generate one reStructuredText document per page and an index document containing a
+    toctree of all pages.
+    Pages whose fingerprint did not change are not written again, such that Sphinx does not
+    read them again on incremental builds. Pages that are no longer needed are removed.
+
+    Returns:
+        List[:obj:`str`]: The names of the pages that were written.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    manifest_path = directory / MANIFEST_FILE_NAME
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding=UTF8))
+    except (OSError, ValueError):
+        manifest = {}
+
+    groups = group_versions(chango.scanner, pagination)
+    fingerprints = compute_page_fingerprints(chango.scanner, groups, pagination)
+
+    written = []
+    for page, versions in groups.items():
+        path = directory / f"{page}.rst"
+        if manifest.get(page) == fingerprints[page] and path.is_file():
+            continue
+        if _write_if_changed(path, render_page(chango, page, versions, pagination)):
+            written.append(page)
+
+    # Only remove pages that we generated before, not files added by the user
+    for page in set(manifest) - set(groups):
+        (directory / f"{page}.rst").unlink(missing_ok=True)
+
+    _write_if_changed(directory / "index.rst", render_index(title, groups))
+    _write_if_changed(manifest_path, json.dumps(fingerprints, indent=2, sort_keys=True))
+    return written
+
+
+def on_builder_inited(app: Sphinx) -> None:
+    pagination = app.config.chango_pagination
+    if pagination not in PAGINATION_VALUES:
+        raise ValueError(
+            f"Expected 'chango_pagination' to be one of {PAGINATION_VALUES}, but got "
+            f"{pagination!r}"
+        )
+    if pagination is None:
+        return
+
+    written = generate_pages(
+        chango=get_chango_instance(app.config.chango_pyproject_toml_path),
+        directory=Path(app.srcdir) / app.config.chango_pagination_directory,
+        pagination=pagination,
+        title=app.config.chango_pagination_title,
+    )
+    logger.info("chango: wrote %d changelog page(s)", len(written))
@@ -1,14 +1,24 @@
 #  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
 #
 #  SPDX-License-Identifier: MIT
+import contextlib
+import hashlib
 import json
+import pickle
+import shutil
 import typing
+from pathlib import Path
 
+from docutils import nodes
 from docutils.nodes import Node
 from sphinx.application import Sphinx
+from sphinx.environment import BuildEnvironment
 from sphinx.util.docutils import SphinxDirective
 
+from chango._utils.files import atomic_write_bytes, file_lock
+from chango._utils.sources import collect_source_paths, compute_fingerprint
 from chango._utils.types import PathLike
+from chango.abc import ChanGo, VersionNote
 from chango.config import get_chango_instance
 from chango.constants import MarkupLanguage
 
@@ -75,6 +85,158 @@ def parse_function(func: typing.Callable) -> dict[str, typing.Callable[[str | No
     }
 
 
+def _copy_nodes(node_list: list[Node]) -> list[Node]:
+    return [node.deepcopy() for node in node_list]
+
+
+class HistoryCache:
+    """Cache for rendered version histories that is stored on the Sphinx build environment.
+    Entries are keyed by the directive options and are only valid for the fingerprint of the
+    change note files they were rendered from. The fingerprint is computed once per build.
+
+    Version histories are either cached as reStructuredText or as node trees, depending on whether
+    the implementations support :meth:`chango.abc.VersionHistory.build_nodes`. Additionally,
+    the node trees of released versions are cached by version, such that they can be reused by
+    directives with different options.
+    Node trees are only cached if they were built without parsing, since parsed nodes may be
+    registered with the document they were parsed for. Cached node trees are copied on access.
+    """
+
+    def __init__(self) -> None:
+        self.fingerprint: str | None = None
+        self.source_files: tuple[Path, ...] = ()
+        self.renders: dict[str, str] = {}
+        self.node_trees: dict[str, list[Node]] = {}
+        self.version_note_nodes: dict[str, list[Node]] = {}
+        self.docnames: set[str] = set()
+
+    def refresh(self, chango: ChanGo) -> bool:
+        """Recompute the fingerprint and drop all entries if it changed.
+
+        Returns:
+            :obj:`bool`: Whether the fingerprint changed.
+        """
+        paths = collect_source_paths(chango.scanner)
+        fingerprint = compute_fingerprint(paths)
+        # Sphinx treats dependencies that are not files as missing and would always rebuild
+        self.source_files = tuple(sorted(path for path in paths if path.is_file()))
+        if fingerprint == self.fingerprint:
+            return False
+
+        self.renders.clear()
+        self.node_trees.clear()
+        self.version_note_nodes.clear()
+        self.fingerprint = fingerprint
+        return True
+
+    def get_node_tree(self, key: str) -> list[Node] | None:
+        if (node_tree := self.node_trees.get(key)) is None:
+            return None
+        return _copy_nodes(node_tree)
+
+    def merge(self, other: "HistoryCache") -> None:
+        """Take over the entries of a cache from a parallel reading process."""
+        self.docnames.update(other.docnames)
+        if other.fingerprint == self.fingerprint:
+            self.renders.update(other.renders)
+            self.node_trees.update(other.node_trees)
+            self.version_note_nodes.update(other.version_note_nodes)
+
+
+class SharedHistoryCache:
+    """File based cache for rendered version histories that is shared between the processes of
+    a parallel build. Entries are keyed by the fingerprint of the change note files and the
+    directive options. Each entry is built by exactly one process while the other processes wait
+    for it and load the result.
+
+    Args:
+        directory (:class:`pathlib.Path`): The directory to store the entries in.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+
+    def _path(self, fingerprint: str, key: str) -> Path:
+        name = hashlib.sha256(f"{fingerprint}\0{key}".encode()).hexdigest()
+        return self.directory / f"{name}.pickle"
+
+    @staticmethod
+    def _read(path: Path) -> str | list[Node] | None:
+        try:
+            return pickle.loads(path.read_bytes())
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+
+    def get_or_build(
+        self, fingerprint: str, key: str, build: typing.Callable[[], str | list[Node]]
+    ) -> str | list[Node]:
+        """Get the entry for the fingerprint and key, building and storing it if necessary."""
+        path = self._path(fingerprint, key)
+        if (value := self._read(path)) is not None:
+            return value
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with file_lock(path.with_suffix(".lock")):
+            # Another process may have built the entry while we were waiting for the lock
+            if (value := self._read(path)) is not None:
+                return value
+            value = build()
+            atomic_write_bytes(path, pickle.dumps(value))
+            return value
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with contextlib.suppress(FileNotFoundError):
+            shutil.rmtree(self.directory)
+
+
+def get_shared_history_cache(env: BuildEnvironment) -> SharedHistoryCache:
+    """Get the shared cache, which is stored in the doctree directory of the build."""
+    return SharedHistoryCache(Path(env.doctreedir) / "chango")
+
+
+def get_history_cache(env: BuildEnvironment) -> HistoryCache:
+    """Get the cache of the build environment, creating it if necessary."""
+    if not isinstance(cache := getattr(env, "chango_history_cache", None), HistoryCache):
+        cache = HistoryCache()
+        env.chango_history_cache = cache  # type: ignore[attr-defined]
+    return cache
+
+
+def on_env_get_outdated(
+    app: Sphinx,
+    env: BuildEnvironment,
+    added: set[str],  # noqa: ARG001
+    changed: set[str],  # noqa: ARG001
+    removed: set[str],  # noqa: ARG001
+) -> list[str]:
+    # Dependencies only cover modified files. Added or removed change notes are detected by
+    # comparing the fingerprint of the whole tree
+    cache = get_history_cache(env)
+    if cache.refresh(get_chango_instance(app.config.chango_pyproject_toml_path)):
+        # This runs in the main process before any documents are read in parallel
+        get_shared_history_cache(env).clear()
+        return sorted(cache.docnames)
+    return []
+
+
+def on_env_purge_doc(
+    app: Sphinx,  # noqa: ARG001
+    env: BuildEnvironment,
+    docname: str,
+) -> None:
+    get_history_cache(env).docnames.discard(docname)
+
+
+def on_env_merge_info(
+    app: Sphinx,  # noqa: ARG001
+    env: BuildEnvironment,
+    docnames: set[str],  # noqa: ARG001
+    other: BuildEnvironment,
+) -> None:
+    get_history_cache(env).merge(get_history_cache(other))
+
+
 def directive_factory(app: Sphinx) -> type[SphinxDirective]:
     """Create a directive class that uses the chango instance from the Sphinx app config.
     This approach is necessary because the `option_spec` attribute of a directive class can
@@ -89,18 +251,85 @@ def directive_factory(app: Sphinx) -> type[SphinxDirective]:
 
     class ChangoDirective(SphinxDirective):
         has_content = True
+        # Whether nodes of a version note had to be parsed while building the current tree
+        _parsed = False
         option_spec = parse_function(  # type: ignore[assignment]
             chango_instance.load_version_history
         )
 
+        def _build_version_note_nodes(self, version_note: VersionNote) -> list[Node]:
+            cache = get_history_cache(self.env)
+            uid = version_note.version.uid if version_note.version else None
+            if uid is not None and uid in cache.version_note_nodes:
+                return _copy_nodes(cache.version_note_nodes[uid])
+
+            if (node_list := version_note.build_nodes()) is None:
+                self._parsed = True
+                return self.parse_text_to_nodes(
+                    version_note.render(MarkupLanguage.RESTRUCTUREDTEXT)
+                )
+
+            # Unreleased changes are not cached, as they are the most likely to change
+            if uid is not None:
+                cache.version_note_nodes[uid] = _copy_nodes(node_list)
+            return node_list
+
+        def _load(self, cache: HistoryCache, key: str) -> list[Node] | None:
+            node_tree: list[Node] | None = None
+
+            def build() -> str | list[Node]:
+                nonlocal node_tree
+                version_history = chango_instance.load_version_history(**self.options)
+                self._parsed = False
+                node_tree = version_history.build_nodes(self._build_version_note_nodes)
+                # Parsed nodes are bound to this document, so other documents get the text
+                if node_tree is None or self._parsed:
+                    return version_history.render(MarkupLanguage.RESTRUCTUREDTEXT)
+                return _copy_nodes(node_tree)
+
+            value = get_shared_history_cache(self.env).get_or_build(
+                typing.cast("str", cache.fingerprint), key, build
+            )
+            if isinstance(value, str):
+                cache.renders[key] = value
+            else:
+                cache.node_trees[key] = value
+            if node_tree is not None:
+                return node_tree
+            return cache.get_node_tree(key)
+
         def run(self) -> list[Node]:
             title = " ".join(self.content)
-            text = chango_instance.load_version_history(**self.options).render(
-                MarkupLanguage.RESTRUCTUREDTEXT
-            )
+
+            cache = get_history_cache(self.env)
+            if cache.fingerprint is None:
+                cache.refresh(chango_instance)
+            # Rebuild this document on incremental builds if the change notes change
+            cache.docnames.add(self.env.docname)
+            for path in cache.source_files:
+                self.env.note_dependency(path)
+
+            key = json.dumps(self.options, sort_keys=True, default=repr)
+            node_tree = cache.get_node_tree(key)
+            if node_tree is None and key not in cache.renders:
+                node_tree = self._load(cache, key)
+
+            if node_tree is None:
+                text = cache.renders[key]
+                if title:
+                    decoration = len(title) * "="
+                    text = f"{decoration}\n{title}\n{decoration}\n\n{text}"
+                return self.parse_text_to_nodes(text, allow_section_headings=True)
+
             if title:
-                decoration = len(title) * "="
-                text = f"{decoration}\n{title}\n{decoration}\n\n{text}"
-            return self.parse_text_to_nodes(text, allow_section_headings=True)
+                section = nodes.section("", names=[nodes.fully_normalize_name(title)])
+                section += nodes.title(title, title)
+                section.extend(node_tree)
+                node_tree = [section]
+            # The parser would assign the ids and handle duplicate names
+            for node in node_tree:
+                for section in node.findall(nodes.section):
+                    self.state.document.note_implicit_target(section, section)
+            return node_tree
 
     return ChangoDirective
@@ -48,6 +48,12 @@ class TestChangeNote:
         assert isinstance(change_note.uid, str)
         assert len(change_note.uid) == len(shortuuid.ShortUUID().uuid())
 
+    def test_uid_factory(self, monkeypatch):
+        monkeypatch.setattr(CommentChangeNote, "UID_FACTORY", lambda: "factory-uid")
+        assert CommentChangeNote(slug="slug", comment="comment").uid == "factory-uid"
+        assert CommentChangeNote(slug="slug", comment="comment", uid="uid").uid == "uid"
+        assert CommentChangeNote.build_template(slug="slug").uid == "factory-uid"
+
     def test_init_invalid_slug(self):
         with pytest.raises(ValidationError, match="slug must not contain"):
             CommentChangeNote(slug="slug.with.dot", comment="this is a comment")
@@ -128,6 +134,26 @@ class TestChangeNote:
             if path:
                 path.unlink()
 
+    def test_to_file_atomic(self, tmp_path, monkeypatch):
+        path = tmp_path / "slug.uid.txt"
+        path.write_text("old content")
+
+        def fsync(*_, **__):
+            raise OSError("fsync failed")
+
+        # If writing fails midway, the existing file must not be touched
+        change_note = CommentChangeNote(slug="slug", comment="new content", uid="uid")
+        monkeypatch.setattr("chango._utils.files.os.fsync", fsync)
+        with pytest.raises(OSError, match="fsync failed"):
+            change_note.to_file(directory=tmp_path)
+        assert path.read_text() == "old content"
+
+        monkeypatch.undo()
+        assert change_note.to_file(directory=tmp_path) == path
+        assert path.read_text() == "new content"
+        # no temporary files are left behind
+        assert [file.name for file in tmp_path.iterdir()] == ["slug.uid.txt"]
+
     def test_build_from_github_event(self, monkeypatch):
         monkeypatch.setattr(
             self.change_note, "build_from_github_event", ChangeNote.build_from_github_event
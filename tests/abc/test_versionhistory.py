@@ -6,7 +6,9 @@ import datetime as dtm
 import pytest
 
 from chango import Version
+from chango.abc import VersionHistory
 from chango.concrete import CommentChangeNote, CommentVersionNote, HeaderVersionHistory
+from chango.constants import MarkupLanguage
 
 
 class TestVersionHistory:
@@ -86,3 +88,50 @@ class TestVersionHistory:
         for version_note in self.version_notes:
             self.version_history.add_version_note(version_note)
         assert len(self.version_history) == len(self.version_notes)
+
+    def test_render_fragments(self):
+        for version_note in self.version_notes:
+            self.version_history.add_version_note(version_note)
+
+        fragments = self.version_history.render_fragments(MarkupLanguage.MARKDOWN)
+        assert [fragment.uid for fragment in fragments] == list(self.version_history)
+        for position, (fragment, version_note) in enumerate(
+            zip(fragments, self.version_notes, strict=True)
+        ):
+            single_history = HeaderVersionHistory()
+            single_history.add_version_note(version_note)
+            assert fragment.position == position
+            assert fragment.date == version_note.version.date
+            assert fragment.markup == MarkupLanguage.MARKDOWN
+            assert fragment.content == single_history.render(MarkupLanguage.MARKDOWN)
+
+        # Rendering fragments must not modify the version history
+        assert list(self.version_history.values()) == self.version_notes
+
+    def test_render_fragments_selection(self):
+        for version_note in self.version_notes:
+            self.version_history.add_version_note(version_note)
+
+        fragments = self.version_history.render_fragments(
+            MarkupLanguage.HTML, uids=["1.0.1", "1.0.3"], positions={"1.0.1": 10, "1.0.3": 30}
+        )
+        assert [(fragment.uid, fragment.position) for fragment in fragments] == [
+            ("1.0.1", 10),
+            ("1.0.3", 30),
+        ]
+
+    def test_merge_fragments_not_implemented(self):
+        class NoMergeVersionHistory(VersionHistory):
+            def render(self, markup: str) -> str:  # noqa: ARG002
+                return ""
+
+        with pytest.raises(NotImplementedError, match="does not support merging"):
+            NoMergeVersionHistory().merge_fragments([])
+
+    def test_build_nodes_default(self):
+        class TextOnlyVersionHistory(HeaderVersionHistory):
+            build_nodes = VersionHistory.build_nodes
+
+        version_history = TextOnlyVersionHistory()
+        version_history.add_version_note(self.version_note)
+        assert version_history.build_nodes(lambda note: note.build_nodes()) is None
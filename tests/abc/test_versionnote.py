@@ -6,6 +6,7 @@ import datetime as dtm
 import pytest
 
 from chango import Version
+from chango.abc import VersionNote
 from chango.concrete import CommentChangeNote, CommentVersionNote
 
 
@@ -90,3 +91,9 @@ class TestVersionNote:
         for change_note in self.change_notes:
             self.version_note.add_change_note(change_note)
         assert len(self.version_note) == len(self.change_notes)
+
+    def test_build_nodes_default(self):
+        class TextOnlyVersionNote(CommentVersionNote):
+            build_nodes = VersionNote.build_nodes
+
+        assert TextOnlyVersionNote(version=self.version).build_nodes() is None
@@ -0,0 +1,32 @@
+#  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
+#
+#  SPDX-License-Identifier: MIT
+from pathlib import Path
+
+from chango.abc import ChanGo
+from chango.concrete import (
+    CommentChangeNote,
+    CommentVersionNote,
+    DirectoryChanGo,
+    DirectoryVersionScanner,
+    HeaderVersionHistory,
+)
+from chango.constants import MarkupLanguage
+
+
+def render_versions(chango: ChanGo) -> dict:
+    # Versions released on the same date have no fixed order in the rendered history, so the
+    # version notes are compared individually
+    return {
+        version: chango.load_version_note(version).render(MarkupLanguage.MARKDOWN)
+        for version in (*chango.scanner.get_available_versions(), None)
+    }
+
+
+def build_directory_chango(base_directory: Path) -> DirectoryChanGo:
+    return DirectoryChanGo(
+        change_note_type=CommentChangeNote,
+        version_note_type=CommentVersionNote,
+        version_history_type=HeaderVersionHistory,
+        scanner=DirectoryVersionScanner(base_directory, "unreleased"),
+    )
@@ -0,0 +1,24 @@
+#  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
+#
+#  SPDX-License-Identifier: MIT
+from docutils import nodes
+from docutils.core import publish_doctree
+
+
+def parse_rst(text: str) -> list[nodes.Node]:
+    """Parse reStructuredText the same way as the Sphinx extension does, i.e. without
+    promoting sections to the document title.
+    """
+    doctree = publish_doctree(
+        text, settings_overrides={"doctitle_xform": False, "report_level": 5}
+    )
+    return list(doctree.children)
+
+
+def format_nodes(node_list: list[nodes.Node]) -> str:
+    """Format nodes for comparison. Ids are left out, as they are assigned by the document."""
+    node_list = [node.deepcopy() for node in node_list]
+    for node in node_list:
+        for element in node.findall(nodes.Element):
+            element["ids"] = []
+    return "".join(node.pformat() for node in node_list)
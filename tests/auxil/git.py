@@ -0,0 +1,31 @@
+#  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
+#
+#  SPDX-License-Identifier: MIT
+import os
+import subprocess
+from pathlib import Path
+
+
+def git(repository: Path, *args: str, timestamp: int | None = None) -> str:
+    env = {
+        **os.environ,
+        "GIT_AUTHOR_NAME": "chango",
+        "GIT_AUTHOR_EMAIL": "chango@example.com",
+        "GIT_COMMITTER_NAME": "chango",
+        "GIT_COMMITTER_EMAIL": "chango@example.com",
+    }
+    if timestamp is not None:
+        env["GIT_AUTHOR_DATE"] = env["GIT_COMMITTER_DATE"] = f"@{timestamp} +0000"
+    return subprocess.run(
+        ["git", "-C", str(repository), *args], capture_output=True, check=True, text=True, env=env
+    ).stdout
+
+
+def init_repository(repository: Path) -> Path:
+    git(repository, "init", "--quiet", "--initial-branch=main")
+    return repository
+
+
+def commit_all(repository: Path, timestamp: int, message: str = "commit") -> None:
+    git(repository, "add", "--all")
+    git(repository, "commit", "--quiet", "--message", message, timestamp=timestamp)
@@ -0,0 +1,32 @@
+#  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
+#
+#  SPDX-License-Identifier: MIT
+import subprocess
+import sys
+
+
+def run_python(code: str, *args: str) -> subprocess.CompletedProcess:
+    """Run code in a fresh interpreter, such that no modules are imported yet."""
+    return subprocess.run(
+        [sys.executable, *args, "-c", code], capture_output=True, text=True, check=True
+    )
+
+
+def get_imported_modules(code: str) -> set[str]:
+    """Names of the modules that are imported after running the code in a fresh interpreter."""
+    stdout = run_python(
+        f"{code}\nimport sys\nprint('MODULES', ' '.join(sorted(sys.modules)))"
+    ).stdout
+    return set(stdout.rsplit("MODULES", 1)[1].split())
+
+
+def get_import_time(module: str) -> int:
+    """Cumulative import time of the module in microseconds as reported by -X importtime."""
+    # The first run includes writing bytecode caches
+    run_python(f"import {module}")
+    stderr = run_python(f"import {module}", "-X", "importtime").stderr
+    for line in stderr.splitlines():
+        _, _, cumulative, name = (part.strip() for part in line.replace(":", "|", 1).split("|"))
+        if name == module:
+            return int(cumulative)
+    raise AssertionError(f"Import time of {module} not reported:\n{stderr}")
@@ -0,0 +1,396 @@
+#  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
+#
+#  SPDX-License-Identifier: MIT
+import functools
+import json
+import multiprocessing
+import shutil
+import sys
+import unittest.mock
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pytest
+import shortuuid
+
+from chango._utils import git as chango_git
+from chango.concrete import (
+    BackwardCompatibleChanGo,
+    CommentChangeNote,
+    CommentVersionNote,
+    DirectoryChanGo,
+    DirectoryVersionScanner,
+    HeaderVersionHistory,
+    MemoryChanGo,
+    MemoryVersionScanner,
+)
+from chango.concrete.sections import GitHubSectionChangeNote, Section, SectionVersionNote
+from chango.config import ChanGoConfig
+from tests.auxil.files import data_path
+from tests.auxil.git import commit_all, git, init_repository
+from tests.cli.conftest import ReuseCliRunner
+
+NOTE_COUNT = 15
+SPAWN_CONFIG_MODULE = """
+from pathlib import Path
+
+from chango.concrete import (
+    BackwardCompatibleChanGo,
+    CommentChangeNote,
+    CommentVersionNote,
+    DirectoryChanGo,
+    DirectoryVersionScanner,
+    HeaderVersionHistory,
+)
+
+
+class ConfigChangeNote(CommentChangeNote):
+    pass
+
+
+chango_instance = DirectoryChanGo(
+    change_note_type=ConfigChangeNote,
+    version_note_type=CommentVersionNote,
+    version_history_type=HeaderVersionHistory,
+    scanner=DirectoryVersionScanner(Path(__file__).parent / "changes", "unreleased"),
+)
+"""
+
+
+@pytest.fixture
+def chango(tmp_path, monkeypatch) -> DirectoryChanGo:
+    monkeypatch.setattr("chango._utils.files._GIT_HELPER.git_available", False)
+    base_directory = tmp_path / "changes"
+    shutil.copytree(data_path("directoryversionscanner"), base_directory)
+    for path in base_directory.rglob("not-a-change-note.txt"):
+        path.unlink()
+    instance = DirectoryChanGo(
+        change_note_type=CommentChangeNote,
+        version_note_type=CommentVersionNote,
+        version_history_type=HeaderVersionHistory,
+        scanner=DirectoryVersionScanner(base_directory, "unreleased"),
+    )
+    monkeypatch.setattr("chango._cli.check.get_chango_instance", lambda: instance)
+    return instance
+
+
+@pytest.fixture
+def backward_compatible(chango, monkeypatch) -> BackwardCompatibleChanGo:
+    legacy_directory = chango.scanner.base_directory.parent / "legacy"
+    (legacy_directory / "unreleased").mkdir(parents=True)
+    (legacy_directory / "unreleased" / ".gitkeep").touch()
+    (legacy_directory / "0.1_2023-01-01").mkdir()
+    (legacy_directory / "0.1_2023-01-01" / "legacy.uid_legacy_0.txt").write_text("legacy")
+    legacy = DirectoryChanGo(
+        change_note_type=CommentChangeNote,
+        version_note_type=CommentVersionNote,
+        version_history_type=HeaderVersionHistory,
+        scanner=DirectoryVersionScanner(legacy_directory, "unreleased"),
+    )
+    instance = BackwardCompatibleChanGo(main_instance=chango, legacy_instances=(legacy,))
+    monkeypatch.setattr("chango._cli.check.get_chango_instance", lambda: instance)
+    return instance
+
+
+def check_json(cli: ReuseCliRunner, *args: str, exit_code: int = 1) -> dict:
+    result = cli.invoke(args=["check", "--format", "json", *args])
+    assert result.check_exit_code(exit_code)
+    return json.loads(result.stdout)
+
+
+class TestCheck:
+    @pytest.mark.usefixtures("chango")
+    def test_valid(self, cli: ReuseCliRunner):
+        result = cli.invoke(args=["check"])
+        assert result.check_exit_code()
+        assert result.stdout == f"Checked {NOTE_COUNT} change note(s), found 0 problem(s).\n"
+
+    @pytest.mark.usefixtures("chango")
+    def test_valid_json(self, cli: ReuseCliRunner):
+        assert check_json(cli, exit_code=0) == {"checked": NOTE_COUNT, "problems": []}
+
+    def test_all_problems_reported(self, cli: ReuseCliRunner, chango):
+        scanner = chango.scanner
+        invalid = scanner.unreleased_directory / "comment-change-note.uid_ur_0.txt"
+        invalid.write_bytes(b"\xff")
+        orphan = scanner.unreleased_directory / "README.md"
+        orphan.write_text("orphan")
+        duplicate = scanner.base_directory / "1.1_2024-01-01" / "other-slug.uid_1-2_0.txt"
+        duplicate.write_text("duplicate")
+        original = scanner.base_directory / "1.2_2024-01-02" / "comment-change-note.uid_1-2_0.txt"
+
+        decode_error = "'utf-8' codec can't decode byte 0xff in position 0: invalid start byte"
+
+        result = cli.invoke(args=["check"])
+        assert result.check_exit_code(1)
+        lines = result.stdout.splitlines()
+        assert lines[-1] == f"Checked {NOTE_COUNT + 1} change note(s), found 4 problem(s)."
+        assert set(lines[:-1]) == {
+            f"{duplicate}: duplicate: UID 'uid_1-2_0' is also used by {original}.",
+            f"{original}: duplicate: UID 'uid_1-2_0' is also used by {duplicate}.",
+            f"{invalid}: invalid: {decode_error}",
+            f"{orphan}: orphan: File name does not match '<slug>.<uid>.<extension>'.",
+        }
+
+        problems = check_json(cli)["problems"]
+        assert {(problem["kind"], problem["uid"], problem["version"]) for problem in problems} == {
+            ("duplicate", "uid_1-2_0", "1.1"),
+            ("duplicate", "uid_1-2_0", "1.2"),
+            ("invalid", "uid_ur_0", None),
+            ("orphan", None, None),
+        }
+
+    def test_packed_version(self, cli: ReuseCliRunner, chango):
+        scanner = chango.scanner
+        (
+            scanner.base_directory / "1.2_2024-01-02" / "comment-change-note.uid_1-2_1.txt"
+        ).write_bytes(b"\xff")
+        scanner.pack_version("1.2")
+
+        problems = check_json(cli)["problems"]
+        assert len(problems) == 1
+        assert problems[0]["kind"] == "invalid"
+        assert problems[0]["version"] == "1.2"
+        assert problems[0]["path"].endswith("comment-change-note.uid_1-2_1.txt")
+
+    @pytest.mark.parametrize("jobs", ["2", "0"])
+    def test_jobs(self, cli: ReuseCliRunner, chango, jobs):
+        directory = chango.scanner.unreleased_directory
+        for idx in range(200):
+            data = b"\xff" if idx % 50 == 0 else b"comment"
+            (directory / f"slug.uid_many-{idx:03}.txt").write_bytes(data)
+
+        sequential = check_json(cli, "--jobs", "1")
+        assert sequential["checked"] == NOTE_COUNT + 200
+        assert [problem["uid"] for problem in sequential["problems"]] == [
+            "uid_many-000",
+            "uid_many-050",
+            "uid_many-100",
+            "uid_many-150",
+        ]
+        assert check_json(cli, "--jobs", jobs) == sequential
+
+    def test_jobs_spawn_config_note_type(self, cli: ReuseCliRunner, tmp_path, monkeypatch):
+        # The change note type is defined in the config module, which spawned workers must
+        # import although its directory is no longer in sys.path
+        module_name = f"check_spawn_config_{shortuuid.uuid()}"
+        shutil.copytree(data_path("directoryversionscanner"), tmp_path / "changes")
+        for path in (tmp_path / "changes").rglob("not-a-change-note.txt"):
+            path.unlink()
+        for idx in range(100):
+            (tmp_path / "changes" / "unreleased" / f"slug.uid_many-{idx:03}.txt").write_text("x")
+        (tmp_path / f"{module_name}.py").write_text(SPAWN_CONFIG_MODULE)
+        (tmp_path / "pyproject.toml").write_text(
+            "[tool.chango]\n"
+            'sys_path = "."\n'
+            f'chango_instance = {{ name = "chango_instance", module = "{module_name}" }}\n'
+        )
+        monkeypatch.setattr(
+            "chango._utils.check.ProcessPoolExecutor",
+            functools.partial(
+                ProcessPoolExecutor, mp_context=multiprocessing.get_context("spawn")
+            ),
+        )
+        try:
+            instance = ChanGoConfig.load(tmp_path).import_chango_instance()
+            assert str(tmp_path) not in sys.path
+            monkeypatch.setattr("chango._cli.check.get_chango_instance", lambda: instance)
+            assert check_json(cli, "--jobs", "2", exit_code=0) == {
+                "checked": NOTE_COUNT + 100,
+                "problems": [],
+            }
+        finally:
+            sys.modules.pop(module_name, None)
+
+    def test_backward_compatible(self, cli: ReuseCliRunner, chango, backward_compatible):
+        legacy_directory = backward_compatible.scanner.scanners[1].base_directory
+        invalid = legacy_directory / "0.1_2023-01-01" / "invalid.uid_legacy_1.txt"
+        invalid.write_bytes(b"\xff")
+        duplicate = chango.scanner.unreleased_directory / "duplicate.uid_legacy_0.txt"
+        duplicate.write_text("duplicate")
+
+        result = check_json(cli)
+        assert result["checked"] == NOTE_COUNT + 3
+        assert {(problem["kind"], problem["path"]) for problem in result["problems"]} == {
+            ("duplicate", str(duplicate)),
+            ("duplicate", str(legacy_directory / "0.1_2023-01-01" / "legacy.uid_legacy_0.txt")),
+            ("invalid", str(invalid)),
+        }
+
+    def test_hidden_files_ignored(self, cli: ReuseCliRunner, chango):
+        (chango.scanner.unreleased_directory / ".gitkeep").touch()
+        (chango.scanner.base_directory / "1.1_2024-01-01" / ".gitkeep").touch()
+        assert check_json(cli, exit_code=0) == {"checked": NOTE_COUNT, "problems": []}
+
+    def test_jobs_dynamic_note_type(self, cli: ReuseCliRunner, tmp_path, monkeypatch):
+        # Classes built by with_sections can't be pickled and are parsed in-process
+        (tmp_path / "unreleased").mkdir()
+        instance = DirectoryChanGo(
+            change_note_type=GitHubSectionChangeNote.with_sections(
+                [Section(uid="section", title="Section", is_required=True)]
+            ),
+            version_note_type=SectionVersionNote,
+            version_history_type=HeaderVersionHistory,
+            scanner=DirectoryVersionScanner(tmp_path, "unreleased"),
+        )
+        for idx in range(100):
+            data = "invalid" if idx == 0 else 'section = "content"'
+            (tmp_path / "unreleased" / f"slug.uid_many-{idx:03}.toml").write_text(data)
+        monkeypatch.setattr("chango._cli.check.get_chango_instance", lambda: instance)
+
+        result = check_json(cli, "--jobs", "2")
+        assert result["checked"] == 100  # noqa: PLR2004
+        assert [problem["uid"] for problem in result["problems"]] == ["uid_many-000"]
+
+    def test_other_scanner(self, cli: ReuseCliRunner, chango, monkeypatch):
+        instance = MemoryChanGo(
+            change_note_type=CommentChangeNote,
+            version_note_type=CommentVersionNote,
+            version_history_type=HeaderVersionHistory,
+            scanner=MemoryVersionScanner(),
+        )
+        instance.import_from(chango)
+        monkeypatch.setattr("chango._cli.check.get_chango_instance", lambda: instance)
+        assert check_json(cli, "--jobs", "4", exit_code=0) == {
+            "checked": NOTE_COUNT,
+            "problems": [],
+        }
+
+
+@pytest.fixture
+def repository(chango) -> Path:
+    path = chango.scanner.base_directory.parent
+    init_repository(path)
+    commit_all(path, timestamp=1_700_000_000)
+    return path
+
+
+class TestCheckStaged:
+    def test_nothing_staged(self, cli: ReuseCliRunner, repository):
+        (repository / "changes" / "unreleased" / "unstaged.uid_unstaged.txt").write_bytes(b"\xff")
+        assert check_json(cli, "--staged", exit_code=0) == {"checked": 0, "problems": []}
+
+    def test_staged_problems(self, cli: ReuseCliRunner, chango, repository):
+        unreleased = chango.scanner.unreleased_directory
+        valid = unreleased / "valid.uid_valid.txt"
+        valid.write_text("valid")
+        invalid = unreleased / "invalid.uid_invalid.txt"
+        invalid.write_bytes(b"\xff")
+        duplicate = unreleased / "duplicate.uid_1-1_0.txt"
+        duplicate.write_text("duplicate")
+        orphan = unreleased / "README.md"
+        orphan.write_text("orphan")
+        git(repository, "add", "--all")
+        # The staged content is checked, not the working tree
+        invalid.write_text("fixed, but not staged")
+
+        result = check_json(cli, "--staged", "--jobs", "2")
+        assert result["checked"] == 3  # noqa: PLR2004
+        assert {(problem["kind"], problem["path"]) for problem in result["problems"]} == {
+            ("duplicate", str(duplicate)),
+            ("invalid", str(invalid)),
+            ("orphan", str(orphan)),
+        }
+        original = (
+            chango.scanner.base_directory / "1.1_2024-01-01" / "comment-change-note.uid_1-1_0.txt"
+        )
+        assert f"also used by {original}." in next(
+            problem["message"] for problem in result["problems"] if problem["kind"] == "duplicate"
+        )
+
+    def test_staged_version_directory(self, cli: ReuseCliRunner, chango, repository):
+        path = (
+            chango.scanner.base_directory / "1.2_2024-01-02" / "comment-change-note.uid_1-2_0.txt"
+        )
+        path.write_bytes(b"\xff")
+        git(repository, "add", "--all")
+
+        problems = check_json(cli, "--staged")["problems"]
+        assert [(problem["kind"], problem["version"]) for problem in problems] == [
+            ("invalid", "1.2")
+        ]
+
+    def test_renamed_note_no_collision(self, cli: ReuseCliRunner, chango, repository):
+        scanner = chango.scanner
+        git(
+            repository,
+            "mv",
+            str(scanner.unreleased_directory / "comment-change-note.uid_ur_0.txt"),
+            str(scanner.base_directory / "1.3_2024-01-03" / "comment-change-note.uid_ur_0.txt"),
+        )
+        assert check_json(cli, "--staged", exit_code=0) == {"checked": 1, "problems": []}
+
+    def test_collision_with_packed_note(self, cli: ReuseCliRunner, chango, repository):
+        scanner = chango.scanner
+        scanner.pack_version("1.2")
+        commit_all(repository, timestamp=1_700_000_001)
+        duplicate = scanner.unreleased_directory / "duplicate.uid_1-2_0.txt"
+        duplicate.write_text("duplicate")
+        git(repository, "add", "--all")
+
+        problems = check_json(cli, "--staged")["problems"]
+        assert len(problems) == 1
+        assert problems[0]["kind"] == "duplicate"
+        assert f"{scanner.PACK_SUFFIX}/comment-change-note.uid_1-2_0.txt" in problems[0]["message"]
+
+    def test_collision_reuses_scanner(self, cli: ReuseCliRunner, chango, repository, monkeypatch):
+        scanner = chango.scanner
+        scanner.pack_version("1.2")
+        commit_all(repository, timestamp=1_700_000_001)
+        (scanner.unreleased_directory / "duplicate.uid_1-2_0.txt").write_text("duplicate")
+        git(repository, "add", "--all")
+        # Prime the scanner's caches, which the collision check reuses
+        scanner.list_files("1.2")
+
+        run_git = chango_git._run_git
+        git_commands = []
+
+        def spy(cwd, *args):
+            git_commands.append(args[0])
+            return run_git(cwd, *args)
+
+        monkeypatch.setattr(chango_git, "_run_git", spy)
+        monkeypatch.setattr(
+            "chango.concrete._directoryversionscanner.PackReader",
+            unittest.mock.Mock(side_effect=AssertionError("pack parsed again")),
+        )
+
+        problems = check_json(cli, "--staged")["problems"]
+        assert [problem["kind"] for problem in problems] == ["duplicate"]
+        assert "ls-files" not in git_commands
+
+    def test_backward_compatible(self, cli: ReuseCliRunner, chango, backward_compatible):
+        repository = chango.scanner.base_directory.parent
+        legacy_directory = backward_compatible.scanner.scanners[1].base_directory
+        init_repository(repository)
+        commit_all(repository, timestamp=1_700_000_000)
+        invalid = legacy_directory / "unreleased" / "invalid.uid_legacy_1.txt"
+        invalid.write_bytes(b"\xff")
+        duplicate = chango.scanner.unreleased_directory / "duplicate.uid_legacy_0.txt"
+        duplicate.write_text("duplicate")
+        git(repository, "add", "--all")
+
+        result = check_json(cli, "--staged")
+        assert result["checked"] == 2  # noqa: PLR2004
+        assert {(problem["kind"], problem["path"]) for problem in result["problems"]} == {
+            ("duplicate", str(duplicate)),
+            ("invalid", str(invalid)),
+        }
+
+    @pytest.mark.usefixtures("chango")
+    def test_not_a_repository(self, cli: ReuseCliRunner):
+        result = cli.invoke(args=["check", "--staged"])
+        assert result.check_exit_code(2)
+        assert "is not part of a git repository" in result.stderr
+
+    def test_other_scanner(self, cli: ReuseCliRunner, monkeypatch):
+        instance = MemoryChanGo(
+            change_note_type=CommentChangeNote,
+            version_note_type=CommentVersionNote,
+            version_history_type=HeaderVersionHistory,
+            scanner=MemoryVersionScanner(),
+        )
+        monkeypatch.setattr("chango._cli.check.get_chango_instance", lambda: instance)
+        result = cli.invoke(args=["check", "--staged"])
+        assert result.check_exit_code(2)
+        assert "requires a DirectoryVersionScanner" in result.stderr
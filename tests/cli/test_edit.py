@@ -2,9 +2,15 @@
 #
 #  SPDX-License-Identifier: MIT
 
+import shutil
 from pathlib import Path
 from unittest.mock import MagicMock
 
+from click import UsageError
+
+from chango.concrete import DirectoryVersionScanner
+from chango.error import ChanGoError
+from tests.auxil.files import data_path
 from tests.cli.conftest import ReuseCliRunner
 
 
@@ -23,3 +29,36 @@ class TestEdit:
 
         mock_chango_instance.scanner.lookup_change_note.assert_called_once_with("some_uid")
         launch_mock.assert_called_once_with(test_path.as_posix())
+
+    def test_unknown_uid(self, cli: ReuseCliRunner, mock_chango_instance, monkeypatch):
+        launch_mock = MagicMock()
+        monkeypatch.setattr("typer.launch", launch_mock)
+        mock_chango_instance.scanner.lookup_change_note.side_effect = ChanGoError(
+            "Change note 'some_uid' not found"
+        )
+
+        result = cli.invoke(args=["edit", "some_uid"])
+
+        assert result.check_exit_code(UsageError.exit_code)
+        assert "Change note 'some_uid' not found" in result.stderr
+        launch_mock.assert_not_called()
+
+    def test_packed_version(
+        self, cli: ReuseCliRunner, mock_chango_instance, monkeypatch, tmp_path
+    ):
+        monkeypatch.setattr("chango._utils.files._GIT_HELPER.git_available", False)
+        launch_mock = MagicMock()
+        monkeypatch.setattr("typer.launch", launch_mock)
+
+        base_directory = tmp_path / "changes"
+        shutil.copytree(data_path("directoryversionscanner"), base_directory)
+        scanner = DirectoryVersionScanner(base_directory, "unreleased")
+        scanner.pack_version("1.2")
+        mock_chango_instance.scanner = scanner
+        uid = next(iter(scanner.get_changes("1.2")))
+
+        result = cli.invoke(args=["edit", uid])
+
+        assert result.check_exit_code(UsageError.exit_code)
+        assert "chango unpack --uid 1.2" in result.stderr
+        launch_mock.assert_not_called()
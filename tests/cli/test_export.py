@@ -0,0 +1,83 @@
+#  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
+#
+#  SPDX-License-Identifier: MIT
+import json
+import shutil
+
+import pytest
+
+from chango.concrete import (
+    CommentChangeNote,
+    CommentVersionNote,
+    DirectoryChanGo,
+    DirectoryVersionScanner,
+    HeaderVersionHistory,
+)
+from tests.auxil.files import data_path
+from tests.cli.conftest import ReuseCliRunner
+
+
+@pytest.fixture
+def chango(tmp_path, monkeypatch) -> DirectoryChanGo:
+    base_directory = tmp_path / "changes"
+    shutil.copytree(data_path("directoryversionscanner"), base_directory)
+    instance = DirectoryChanGo(
+        change_note_type=CommentChangeNote,
+        version_note_type=CommentVersionNote,
+        version_history_type=HeaderVersionHistory,
+        scanner=DirectoryVersionScanner(base_directory, "unreleased"),
+    )
+    monkeypatch.setattr("chango._cli.export.get_chango_instance", lambda: instance)
+    return instance
+
+
+def expected_records(chango: DirectoryChanGo) -> list[dict]:
+    scanner = chango.scanner
+    return [
+        {
+            "version_uid": version.uid if version else None,
+            "version_date": version.date.isoformat() if version else None,
+            "uid": uid,
+            "slug": "comment-change-note",
+            "fields": {"comment": chango.load_change_note(uid).comment},
+            "pull_requests": [],
+        }
+        for version in [
+            *sorted(
+                scanner.get_available_versions(), key=lambda version: (version.date, version.uid)
+            ),
+            None,
+        ]
+        for uid in scanner.get_changes(version)
+    ]
+
+
+class TestExport:
+    @pytest.mark.parametrize("jobs", ["1", "3"])
+    def test_stdout(self, cli: ReuseCliRunner, chango, jobs):
+        result = cli.invoke(args=["export", "--format", "jsonl", "--jobs", jobs])
+        assert result.check_exit_code()
+        assert [json.loads(line) for line in result.stdout.splitlines()] == expected_records(
+            chango
+        )
+
+    def test_output_file(self, cli: ReuseCliRunner, chango, tmp_path):
+        output = tmp_path / "export.jsonl"
+        result = cli.invoke(args=["export", "-o", output.as_posix()])
+        assert result.check_exit_code()
+        assert result.stdout == f"Export written to {output}\n"
+        lines = output.read_text().splitlines()
+        assert [json.loads(line) for line in lines] == expected_records(chango)
+
+    @pytest.mark.usefixtures("chango")
+    def test_range(self, cli: ReuseCliRunner):
+        result = cli.invoke(args=["export", "--start-from", "1.2", "--end-at", "1.2"])
+        assert result.check_exit_code()
+        records = [json.loads(line) for line in result.stdout.splitlines()]
+        assert records
+        assert {record["version_uid"] for record in records} == {"1.2"}
+
+    @pytest.mark.usefixtures("chango")
+    def test_unknown_format(self, cli: ReuseCliRunner):
+        result = cli.invoke(args=["export", "--format", "csv"])
+        assert result.check_exit_code(2)
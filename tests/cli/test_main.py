@@ -1,12 +1,79 @@
 #  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
 #
 #  SPDX-License-Identifier: MIT
+import pytest
+
 from chango.__about__ import __version__
+from tests.auxil.imports import get_import_time, get_imported_modules, run_python
 from tests.cli.conftest import ReuseCliRunner
 
+# Generous on purpose to avoid flaky tests on slow machines. Importing all subcommands
+# eagerly takes several times as long.
+STARTUP_BUDGET_US = 150_000
+SUBCOMMAND_MODULES = {
+    "chango._cli.check",
+    "chango._cli.config",
+    "chango._cli.edit",
+    "chango._cli.export",
+    "chango._cli.new",
+    "chango._cli.pack",
+    "chango._cli.release",
+    "chango._cli.report",
+    "chango._cli.serve",
+    "chango._cli.watch",
+}
+
+
+def run_main(*args: str) -> str:
+    return f"""
+import sys
+sys.argv = ["chango", *{args!r}]
+from chango._cli import main
+try:
+    main()
+except SystemExit:
+    pass
+"""
+
 
 class TestMain:
     def test_version(self, cli: ReuseCliRunner):
         result = cli.invoke(args=["--version"])
         assert result.check_exit_code()
         assert result.stdout == __version__ + "\n"
+
+    def test_version_entry_point(self):
+        assert run_python(run_main("--version")).stdout == __version__ + "\n"
+
+    def test_version_imports_nothing(self):
+        modules = get_imported_modules(run_main("--version"))
+        assert {module for module in modules if module.startswith("chango")} == {
+            "chango",
+            "chango.__about__",
+            "chango._cli",
+            "chango._cli._daemon",
+            "chango._utils",
+            "chango._utils.lazy",
+        }
+        assert "click" not in modules
+        assert "typer" not in modules
+
+    @pytest.mark.parametrize("args", [("relase",), ()], ids=["typo", "none"])
+    def test_no_subcommand_invoked(self, args):
+        modules = get_imported_modules(run_main(*args))
+        assert "chango._cli._app" in modules
+        assert not modules & SUBCOMMAND_MODULES
+        assert "chango.config" not in modules
+        assert "pydantic" not in modules
+
+    def test_subcommand_imported_on_invocation(self):
+        modules = get_imported_modules(run_main("report", "--help"))
+        assert modules & SUBCOMMAND_MODULES == {"chango._cli.report"}
+
+    def test_startup_budget(self):
+        assert get_import_time("chango._cli._app") < STARTUP_BUDGET_US
+
+    def test_typo_suggestion(self, cli: ReuseCliRunner):
+        result = cli.invoke(args=["relase"])
+        assert result.check_exit_code(2)
+        assert "Did you mean 'release'?" in result.output
@@ -0,0 +1,91 @@
+#  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
+#
+#  SPDX-License-Identifier: MIT
+import shutil
+import unittest.mock
+
+import pytest
+from click import UsageError
+
+from chango.concrete import BackwardCompatibleVersionScanner, DirectoryVersionScanner
+from tests.auxil.files import data_path
+from tests.cli.conftest import ReuseCliRunner
+
+
+@pytest.fixture
+def scanner(tmp_path, monkeypatch) -> DirectoryVersionScanner:
+    monkeypatch.setattr("chango._utils.files._GIT_HELPER.git_available", False)
+    base_directory = tmp_path / "changes"
+    shutil.copytree(data_path("directoryversionscanner"), base_directory)
+    return DirectoryVersionScanner(base_directory, "unreleased")
+
+
+class TestPack:
+    def test_pack_unpack_uid(self, cli: ReuseCliRunner, scanner, mock_chango_instance):
+        mock_chango_instance.scanner = scanner
+
+        result = cli.invoke(args=["pack", "--uid", "1.1", "--uid", "1.2"])
+        assert result.check_exit_code()
+        assert result.stdout.startswith("Packed version 1.1 into ")
+        assert scanner.is_packed("1.1")
+        assert scanner.is_packed("1.2")
+        assert not scanner.is_packed("1.3")
+
+        result = cli.invoke(args=["unpack", "--uid", "1.2"])
+        assert result.check_exit_code()
+        assert result.stdout.startswith("Unpacked version 1.2 into ")
+        assert scanner.is_packed("1.1")
+        assert not scanner.is_packed("1.2")
+
+    def test_pack_unpack_all(self, cli: ReuseCliRunner, scanner, mock_chango_instance):
+        mock_chango_instance.scanner = scanner
+        versions = scanner.get_available_versions()
+
+        assert cli.invoke(args=["pack", "--uid", "1.1"]).check_exit_code()
+        result = cli.invoke(args=["pack", "--all"])
+        assert result.check_exit_code()
+        # Already packed versions are skipped
+        assert len(result.stdout.splitlines()) == len(versions) - 1
+        assert all(scanner.is_packed(version) for version in versions)
+
+        assert cli.invoke(args=["unpack", "--all"]).check_exit_code()
+        assert not any(scanner.is_packed(version) for version in versions)
+
+    def test_backward_compatible_scanner(self, cli: ReuseCliRunner, scanner, mock_chango_instance):
+        mock_chango_instance.scanner = BackwardCompatibleVersionScanner(
+            [unittest.mock.MagicMock(), scanner]
+        )
+        assert cli.invoke(args=["pack", "--uid", "1.1"]).check_exit_code()
+        assert scanner.is_packed("1.1")
+
+    @pytest.mark.parametrize("args", [[], ["--uid", "1.1", "--all"]])
+    def test_invalid_arguments(self, cli: ReuseCliRunner, scanner, mock_chango_instance, args):
+        mock_chango_instance.scanner = scanner
+        result = cli.invoke(args=["pack", *args])
+        assert result.check_exit_code(UsageError.exit_code)
+        assert "either at least one '--uid' or '--all'" in result.stderr
+
+    def test_version_not_available(self, cli: ReuseCliRunner, scanner, mock_chango_instance):
+        mock_chango_instance.scanner = scanner
+        result = cli.invoke(args=["unpack", "--uid", "1.4"])
+        assert result.check_exit_code(UsageError.exit_code)
+        assert "Version '1.4' not available" in result.stderr
+
+    @pytest.mark.parametrize(
+        ("command", "message"), [("pack", "already packed"), ("unpack", "is not packed")]
+    )
+    def test_invalid_state(
+        self, cli: ReuseCliRunner, scanner, mock_chango_instance, command, message
+    ):
+        mock_chango_instance.scanner = scanner
+        if command == "pack":
+            scanner.pack_version("1.1")
+        result = cli.invoke(args=[command, "--uid", "1.1"])
+        assert result.check_exit_code(UsageError.exit_code)
+        assert message in result.stderr
+
+    @pytest.mark.usefixtures("mock_chango_instance")
+    def test_unsupported_scanner(self, cli: ReuseCliRunner):
+        result = cli.invoke(args=["pack", "--all"])
+        assert result.check_exit_code(UsageError.exit_code)
+        assert "DirectoryVersionScanner" in result.stderr
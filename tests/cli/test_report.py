@@ -2,12 +2,23 @@
 #
 #  SPDX-License-Identifier: MIT
 
+import datetime as dtm
 from pathlib import Path
 
 import pytest
 from click import UsageError
 
+from chango import VersionHistoryFragment
+from chango.abc import VersionHistory
+from chango.concrete import (
+    CommentChangeNote,
+    CommentVersionNote,
+    DirectoryChanGo,
+    DirectoryVersionScanner,
+    HeaderVersionHistory,
+)
 from chango.constants import MarkupLanguage
+from tests.auxil.files import data_path
 from tests.cli.conftest import ReuseCliRunner
 
 
@@ -135,3 +146,126 @@ class TestReport:
 
         assert result.check_exit_code(UsageError.exit_code)
         mock_chango_instance.load_version_note.assert_not_called()
+
+    @pytest.mark.parametrize("output", [False, True], ids=["Stdout", "File"])
+    def test_report_monorepo(self, cli: ReuseCliRunner, tmp_path: Path, monkeypatch, output):
+        captured = {}
+
+        class MockMonorepo:
+            @classmethod
+            def from_root(cls, root, executor):
+                captured.update(root=root, executor=executor)
+                return cls()
+
+            def render(self, markup, since):
+                captured.update(markup=markup, since=since)
+                return "expected_render_output"
+
+        monkeypatch.setattr("chango._cli.report.MonorepoChanGo", MockMonorepo)
+        file_path = tmp_path / "output_file"
+        args = ["report", "monorepo", "--root", tmp_path.as_posix(), "--since", "2024-01-02"]
+        args.extend(["--jobs", "2", "--markup", "html"])
+        if output:
+            args.extend(["--output", file_path.as_posix()])
+
+        result = cli.invoke(args=args)
+
+        assert result.check_exit_code()
+        if output:
+            assert result.stdout == f"Report written to {file_path}\n"
+            assert file_path.read_text() == "expected_render_output"
+        else:
+            assert result.stdout == "expected_render_output\n"
+        assert captured["root"] == tmp_path
+        assert captured["executor"]._max_workers == 2  # noqa: PLR2004
+        assert captured["markup"] == MarkupLanguage.HTML
+        assert captured["since"] == dtm.date(2024, 1, 2)
+
+    @pytest.mark.parametrize("args", [["--since", "invalid"], ["--jobs", "0"]])
+    def test_report_monorepo_invalid_options(self, cli: ReuseCliRunner, args):
+        result = cli.invoke(args=["report", "monorepo", *args])
+        assert result.check_exit_code(UsageError.exit_code)
+
+    @pytest.mark.parametrize(
+        "markup", [MarkupLanguage.MARKDOWN, MarkupLanguage.HTML, MarkupLanguage.RESTRUCTUREDTEXT]
+    )
+    def test_report_fragment_merge(self, cli: ReuseCliRunner, tmp_path: Path, monkeypatch, markup):
+        chango = DirectoryChanGo(
+            change_note_type=CommentChangeNote,
+            version_note_type=CommentVersionNote,
+            version_history_type=HeaderVersionHistory,
+            scanner=DirectoryVersionScanner(data_path("directoryversionscanner"), "unreleased"),
+        )
+        monkeypatch.setattr("chango._cli.report.get_chango_instance", lambda: chango)
+        fragment_dir = tmp_path / "fragments"
+
+        # Split across two invocations, as e.g. in two CI jobs
+        for args in [
+            ["--versions", "1.3.1", "--versions", "1.1", "--unreleased"],
+            ["--versions", "1.2", "--versions", "1.3"],
+        ]:
+            result = cli.invoke(
+                args=[
+                    "report",
+                    "fragment",
+                    *args,
+                    "--markup",
+                    markup.value,
+                    "--output-dir",
+                    fragment_dir.as_posix(),
+                ]
+            )
+            assert result.check_exit_code()
+            assert "Fragment written to" in result.stdout
+
+        files = sorted(fragment_dir.iterdir())
+        assert {file.name for file in files} == {
+            f"{uid}.fragment.json" for uid in ["1.1", "1.2", "1.3", "1.3.1", "unreleased"]
+        }
+
+        output = tmp_path / "merged"
+        result = cli.invoke(
+            args=["report", "merge", *(file.as_posix() for file in files), "-o", str(output)]
+        )
+        assert result.check_exit_code()
+        assert output.read_text() == chango.load_version_history().render(markup)
+
+        # Without selecting versions, all versions are rendered
+        all_dir = tmp_path / "all"
+        result = cli.invoke(args=["report", "fragment", "-m", markup.value, "-d", str(all_dir)])
+        assert result.check_exit_code()
+        result = cli.invoke(args=["report", "merge", *map(str, sorted(all_dir.iterdir()))])
+        assert result.check_exit_code()
+        assert result.stdout == chango.load_version_history().render(markup) + "\n"
+
+    def test_report_fragment_unknown_version(self, cli: ReuseCliRunner, mock_chango_instance):
+        mock_chango_instance.scanner.has_unreleased_changes.return_value = False
+        mock_chango_instance.scanner.get_available_versions.return_value = ()
+        result = cli.invoke(args=["report", "fragment", "--versions", "1.0"])
+        assert result.check_exit_code(UsageError.exit_code)
+        assert "Version '1.0' not available" in result.stderr
+
+    def test_report_merge_not_supported(
+        self, cli: ReuseCliRunner, mock_chango_instance, tmp_path: Path
+    ):
+        class NoMergeVersionHistory(VersionHistory):
+            def render(self, markup: str) -> str:  # noqa: ARG002
+                return ""
+
+        path = VersionHistoryFragment(
+            uid="1.0", date=None, markup=MarkupLanguage.MARKDOWN, position=0, content=""
+        ).to_file(tmp_path / "1.0.fragment.json")
+        mock_chango_instance.build_version_history.return_value = NoMergeVersionHistory()
+        result = cli.invoke(args=["report", "merge", path.as_posix()])
+        assert result.check_exit_code(UsageError.exit_code)
+        assert "does not support merging fragments" in result.stderr
+
+    def test_report_merge_invalid_fragment(
+        self, cli: ReuseCliRunner, mock_chango_instance, tmp_path: Path
+    ):
+        path = tmp_path / "invalid.fragment.json"
+        path.write_text("invalid")
+        mock_chango_instance.build_version_history.return_value = HeaderVersionHistory()
+        result = cli.invoke(args=["report", "merge", path.as_posix()])
+        assert result.check_exit_code(UsageError.exit_code)
+        assert "Invalid version history fragment" in result.stderr
@@ -0,0 +1,252 @@
+#  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
+#
+#  SPDX-License-Identifier: MIT
+import json
+import os
+import shutil
+import socket
+import stat
+import subprocess
+import sys
+import time
+import unittest.mock
+from pathlib import Path
+
+import pytest
+import shortuuid
+
+from chango._cli import _daemon, main
+from chango._cli.serve import ChanGoDaemon
+from chango.concrete import CachingChanGo
+from tests.auxil.files import data_path
+
+STARTUP_TIMEOUT = 20
+PRIVATE_DIRECTORY_MODE = 0o700
+PRIVATE_FILE_MODE = 0o600
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch) -> Path:
+    module_name = f"chango_serve_module_{shortuuid.uuid()}"
+    shutil.copytree(data_path("directoryversionscanner"), tmp_path / "changes")
+    (tmp_path / f"{module_name}.py").write_text(
+        "from pathlib import Path\n"
+        "from chango.concrete import (\n"
+        "    CommentChangeNote, CommentVersionNote, DirectoryChanGo, DirectoryVersionScanner,\n"
+        "    HeaderVersionHistory,\n"
+        ")\n"
+        "chango_instance = DirectoryChanGo(\n"
+        "    change_note_type=CommentChangeNote,\n"
+        "    version_note_type=CommentVersionNote,\n"
+        "    version_history_type=HeaderVersionHistory,\n"
+        "    scanner=DirectoryVersionScanner(Path(__file__).parent / 'changes', 'unreleased'),\n"
+        ")\n"
+    )
+    (tmp_path / "pyproject.toml").write_text(
+        "[tool.chango]\n"
+        'sys_path = "."\n'
+        f'chango_instance = {{ name = "chango_instance", module = "{module_name}" }}\n'
+    )
+    runtime_dir = tmp_path / "runtime"
+    runtime_dir.mkdir()
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(runtime_dir))
+    monkeypatch.delenv(_daemon.DAEMON_ENV_VAR, raising=False)
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def daemon(project):
+    process = subprocess.Popen(
+        [sys.executable, "-m", "chango", "serve", "--idle-timeout", "30"],
+        cwd=project,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    socket_path = _daemon.get_socket_path()
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while not socket_path.exists():
+        if process.poll() is not None or time.monotonic() > deadline:
+            process.kill()
+            pytest.fail(f"Daemon did not start: {process.communicate()[1]}")
+        time.sleep(0.05)
+    yield process
+    process.kill()
+    process.wait()
+
+
+class TestClient:
+    @pytest.mark.parametrize(
+        ("args", "expected"),
+        [
+            (["report", "version", "--uid", "1.1"], True),
+            (["release", "--uid", "1.4"], True),
+            (["new", "--slug", "slug", "--no-edit"], True),
+            (["new", "--slug", "slug", "-ne"], True),
+            (["new", "--slug", "slug"], False),
+            (["edit", "uid"], False),
+            (["config", "show"], False),
+            (["report", "version", "--help"], False),
+            (["--help"], False),
+            ([], False),
+        ],
+    )
+    def test_should_forward(self, args, expected, monkeypatch):
+        monkeypatch.delenv(_daemon.DAEMON_ENV_VAR, raising=False)
+        assert _daemon.should_forward(args) is expected
+
+    def test_should_forward_disabled(self, monkeypatch):
+        monkeypatch.setenv(_daemon.DAEMON_ENV_VAR, "0")
+        assert not _daemon.should_forward(["report", "version", "--uid", "1.1"])
+
+    @pytest.mark.parametrize("args", [["--help"], ["report", "version", "--help"]])
+    def test_main_does_not_connect(self, args, monkeypatch):
+        monkeypatch.delenv(_daemon.DAEMON_ENV_VAR, raising=False)
+        monkeypatch.setattr(sys, "argv", ["chango", *args])
+        monkeypatch.setattr(_daemon, "connect", unittest.mock.Mock(side_effect=AssertionError))
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+        assert exc_info.value.code == 0
+
+    def test_socket_path(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+        monkeypatch.chdir(tmp_path)
+        path = _daemon.get_socket_path()
+        assert path.parent == tmp_path / f"chango-{os.getuid()}"
+        assert path.name.startswith("chango-")
+        assert path.suffix == ".sock"
+        assert path == _daemon.get_socket_path(tmp_path / "pyproject.toml")
+        assert path != _daemon.get_socket_path(tmp_path / "other" / "pyproject.toml")
+
+    def test_ensure_socket_directory(self, tmp_path):
+        directory = tmp_path / "sockets"
+        _daemon.ensure_socket_directory(directory)
+        assert stat.S_IMODE(directory.stat().st_mode) == PRIVATE_DIRECTORY_MODE
+        # Existing private directories are reused
+        _daemon.ensure_socket_directory(directory)
+
+        directory.chmod(0o755)
+        with pytest.raises(PermissionError, match="must be a directory with mode 0700"):
+            _daemon.ensure_socket_directory(directory)
+
+    def test_ensure_socket_directory_symlink(self, tmp_path):
+        (tmp_path / "target").mkdir(mode=0o700)
+        (tmp_path / "sockets").symlink_to(tmp_path / "target")
+        with pytest.raises(PermissionError, match="must be a directory"):
+            _daemon.ensure_socket_directory(tmp_path / "sockets")
+
+    @pytest.mark.usefixtures("project")
+    def test_forward_without_daemon(self):
+        assert _daemon.forward(["report", "version", "--uid", "1.1"]) is None
+
+
+@pytest.mark.usefixtures("daemon")
+class TestServe:
+    def test_forward(self, capfd):
+        assert _daemon.forward(["report", "version", "--uid", "1.1"]) == 0
+        assert "this is a comment" in capfd.readouterr().out
+
+    def test_socket_permissions(self):
+        socket_path = _daemon.get_socket_path()
+        assert stat.S_IMODE(socket_path.stat().st_mode) == PRIVATE_FILE_MODE
+        assert stat.S_IMODE(socket_path.parent.stat().st_mode) == PRIVATE_DIRECTORY_MODE
+
+    def test_socket_of_other_user(self, monkeypatch, capfd):
+        socket_path = _daemon.get_socket_path()
+        monkeypatch.setattr(_daemon, "get_socket_path", lambda: socket_path)
+        monkeypatch.setattr(os, "getuid", lambda: socket_path.stat().st_uid + 1)
+        assert _daemon.forward(["report", "version", "--uid", "1.1"]) is None
+        assert "owned by another user" in capfd.readouterr().err
+
+    def test_forward_error(self, capfd):
+        assert _daemon.forward(["report", "version"]) == 2  # noqa: PLR2004
+        assert "Missing option '--uid'" in capfd.readouterr().err
+
+    def test_revalidation(self, project, capfd):
+        assert _daemon.forward(["report", "version", "--uid", "1.1"]) == 0
+        assert "this is an update" not in capfd.readouterr().out
+
+        note = project / "changes" / "1.1_2024-01-01" / "comment-change-note.uid_1-1_0.txt"
+        note.write_text("this is an update")
+        assert _daemon.forward(["report", "version", "--uid", "1.1"]) == 0
+        assert "this is an update" in capfd.readouterr().out
+
+    def test_config_change(self, daemon, project):
+        pyproject_toml = project / "pyproject.toml"
+        pyproject_toml.write_text(pyproject_toml.read_text() + "\n")
+        assert _daemon.forward(["report", "version", "--uid", "1.1"]) is None
+        assert daemon.wait(timeout=STARTUP_TIMEOUT) == 0
+        assert not _daemon.get_socket_path().exists()
+
+    def test_already_running(self, project):
+        result = subprocess.run(
+            [sys.executable, "-m", "chango", "serve"],
+            cwd=project,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        assert result.returncode == 2  # noqa: PLR2004
+        assert "already listening" in result.stderr
+
+
+class TestChanGoDaemon:
+    def test_client_environment(self, project, monkeypatch):
+        monkeypatch.setenv("CHANGO_TEST_VARIABLE", "daemon")
+        daemon = ChanGoDaemon(project / "pyproject.toml", _daemon.get_socket_path(), None)
+        seen = []
+
+        def run_command(args):
+            seen.append((args, os.environ.get("CHANGO_TEST_VARIABLE")))
+            return {"exit_code": 0, "stdout": "", "stderr": ""}
+
+        monkeypatch.setattr(daemon, "run_command", run_command)
+        client, connection = socket.socketpair()
+        with client, connection:
+            request = {
+                "args": ["report"],
+                "cwd": str(project),
+                "env": {"CHANGO_TEST_VARIABLE": "client"},
+            }
+            client.sendall(json.dumps(request).encode())
+            client.shutdown(socket.SHUT_WR)
+            assert daemon.handle(connection)
+
+        assert seen == [(["report"], "client")]
+        assert os.environ["CHANGO_TEST_VARIABLE"] == "daemon"
+        daemon.close()
+
+    @pytest.mark.parametrize("use_caching", [False, True])
+    def test_revalidate_watches_directories(self, project, monkeypatch, use_caching):
+        daemon = ChanGoDaemon(project / "pyproject.toml", _daemon.get_socket_path(), None)
+        if use_caching:
+            daemon.chango = CachingChanGo(daemon.chango)
+        # The change note files are not stat-ed for directory-based scanners
+        monkeypatch.setattr(
+            "chango._cli.serve.collect_source_paths",
+            unittest.mock.Mock(side_effect=AssertionError("change tree fingerprinted")),
+        )
+        try:
+            assert "uid_new" not in daemon.chango.scanner.get_changes(None)
+            daemon.chango.load_version_note(None)
+            (project / "changes" / "unreleased" / "comment-change-note.uid_new.txt").write_text(
+                "new"
+            )
+            assert daemon.revalidate()
+            assert "uid_new" in daemon.chango.scanner.get_changes(None)
+            assert "uid_new" in daemon.chango.load_version_note(None)
+        finally:
+            daemon.close()
+
+
+class TestIdleTimeout:
+    def test_idle_timeout(self, project):
+        subprocess.run(
+            [sys.executable, "-m", "chango", "serve", "--idle-timeout", "0.2"],
+            cwd=project,
+            capture_output=True,
+            timeout=STARTUP_TIMEOUT,
+            check=True,
+        )
+        assert not _daemon.get_socket_path().exists()
@@ -0,0 +1,180 @@
+#  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
+#
+#  SPDX-License-Identifier: MIT
+import shutil
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from chango._cli import watch as watch_module
+from chango._cli.watch import VersionNoteRenderer
+from chango.concrete import (
+    CachingChanGo,
+    CommentChangeNote,
+    CommentVersionNote,
+    DirectoryChanGo,
+    DirectoryVersionScanner,
+    HeaderVersionHistory,
+)
+from chango.constants import MarkupLanguage
+from tests.auxil.files import data_path
+from tests.cli.conftest import ReuseCliRunner
+
+TIMEOUT = 5
+
+
+@pytest.fixture
+def chango(tmp_path) -> DirectoryChanGo:
+    base_directory = tmp_path / "changes"
+    shutil.copytree(data_path("directoryversionscanner"), base_directory)
+    return DirectoryChanGo(
+        change_note_type=CommentChangeNote,
+        version_note_type=CommentVersionNote,
+        version_history_type=HeaderVersionHistory,
+        scanner=DirectoryVersionScanner(base_directory, "unreleased"),
+    )
+
+
+class Watching:
+    """Runs VersionNoteRenderer.watch in a thread and counts the loaded version notes."""
+
+    def __init__(self, renderer: VersionNoteRenderer, monkeypatch) -> None:
+        self.renderer = renderer
+        self.loaded: list[str | None] = []
+        self.stop = threading.Event()
+        self.thread = threading.Thread(target=renderer.watch, args=(0.05, 0.05, self.stop))
+
+        load_version_note = renderer.chango.load_version_note
+
+        def counting_load_version_note(uid):
+            self.loaded.append(uid)
+            return load_version_note(uid)
+
+        monkeypatch.setattr(renderer.chango, "load_version_note", counting_load_version_note)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *_):
+        self.stop.set()
+        self.thread.join()
+
+    @staticmethod
+    def wait_for(path: Path, text: str) -> None:
+        deadline = time.monotonic() + TIMEOUT
+        while not (path.is_file() and text in path.read_text()):
+            if time.monotonic() > deadline:
+                pytest.fail(f"{text!r} was not rendered into {path}")
+            time.sleep(0.01)
+
+
+class TestVersionNoteRenderer:
+    @pytest.mark.parametrize("caching", [False, True], ids=["plain", "caching"])
+    def test_rerender_on_change(self, chango, tmp_path, monkeypatch, caching):
+        instance = CachingChanGo(chango) if caching else chango
+        targets = {
+            tmp_path / "notes.md": MarkupLanguage.MARKDOWN,
+            tmp_path / "notes.html": MarkupLanguage.HTML,
+        }
+        with Watching(VersionNoteRenderer(instance, None, targets), monkeypatch) as watching:
+            for path in targets:
+                watching.wait_for(path, "this is a comment")
+
+            note = chango.scanner.unreleased_directory / "comment-change-note.uid_ur_0.txt"
+            note.write_text("this is an update")
+            for path in targets:
+                watching.wait_for(path, "this is an update")
+
+        assert watching.loaded[:2] == [None, None]
+        assert set(watching.loaded) == {None}
+
+    def test_untouched_versions_ignored(self, chango, tmp_path, monkeypatch):
+        target = tmp_path / "notes.md"
+        renderer = VersionNoteRenderer(chango, "1.2", {target: MarkupLanguage.MARKDOWN})
+        with Watching(renderer, monkeypatch) as watching:
+            watching.wait_for(target, "this is a comment")
+            (
+                chango.scanner.base_directory
+                / "1.1_2024-01-01"
+                / "comment-change-note.uid_1-1_0.txt"
+            ).write_text("this is an update")
+            (chango.scanner.unreleased_directory / "comment-change-note.uid_ur_0.txt").write_text(
+                "this is an update"
+            )
+            time.sleep(0.5)
+        assert watching.loaded == ["1.2"]
+
+    def test_unchanged_file_not_rewritten(self, chango, tmp_path):
+        target = tmp_path / "notes.md"
+        renderer = VersionNoteRenderer(chango, "1.2", {target: MarkupLanguage.MARKDOWN})
+        renderer.render()
+        mtime = target.stat().st_mtime_ns
+        time.sleep(0.01)
+        renderer.render()
+        assert target.stat().st_mtime_ns == mtime
+
+    def test_unavailable_version(self, chango, tmp_path, capsys):
+        target = tmp_path / "notes.md"
+        VersionNoteRenderer(chango, "9.9", {target: MarkupLanguage.MARKDOWN}).render()
+        assert not target.exists()
+        assert "Version '9.9' not available" in capsys.readouterr().err
+
+    def test_fallback_polling(self, chango, tmp_path, monkeypatch):
+        # Pretend the scanner can't be watched directly
+        monkeypatch.setattr(watch_module, "DirectoryVersionScanner", type("Other", (), {}))
+        target = tmp_path / "notes.md"
+        renderer = VersionNoteRenderer(chango, None, {target: MarkupLanguage.MARKDOWN})
+        with Watching(renderer, monkeypatch) as watching:
+            watching.wait_for(target, "this is a comment")
+            (chango.scanner.unreleased_directory / "comment-change-note.uid_new.txt").write_text(
+                "this is new"
+            )
+            watching.wait_for(target, "this is new")
+
+
+class TestWatch:
+    def test_watch(self, cli: ReuseCliRunner, mock_chango_instance, monkeypatch, tmp_path):
+        calls = []
+
+        def watch(self, debounce, poll_interval, _stop):
+            calls.append((self.chango, self.uid, self.targets, debounce, poll_interval))
+            raise KeyboardInterrupt
+
+        monkeypatch.setattr(VersionNoteRenderer, "watch", watch)
+        md, rst = tmp_path / "notes.md", tmp_path / "notes.rst"
+        result = cli.invoke(
+            args=["watch", "--uid", "1.2", "--debounce", "0.2", md.as_posix(), rst.as_posix()]
+        )
+        assert result.check_exit_code()
+        assert result.stdout == "Watching version 1.2\nStopped watching\n"
+        assert calls == [
+            (
+                mock_chango_instance,
+                "1.2",
+                {md: MarkupLanguage.MARKDOWN, rst: MarkupLanguage.RESTRUCTUREDTEXT},
+                0.2,
+                1,
+            )
+        ]
+
+    @pytest.mark.usefixtures("mock_chango_instance")
+    def test_watch_markup_option(self, cli: ReuseCliRunner, monkeypatch):
+        calls = []
+        monkeypatch.setattr(
+            VersionNoteRenderer,
+            "watch",
+            lambda self, *_: calls.append((self.uid, self.targets)) or None,
+        )
+        result = cli.invoke(args=["watch", "--uid", "", "-m", "html", "notes"])
+        assert result.check_exit_code()
+        assert result.stdout == "Watching the unreleased changes\n"
+        assert calls == [(None, {Path("notes"): MarkupLanguage.HTML})]
+
+    @pytest.mark.usefixtures("mock_chango_instance")
+    def test_watch_unknown_markup(self, cli: ReuseCliRunner):
+        result = cli.invoke(args=["watch", "--uid", "1.2", "notes.unknown"])
+        assert result.check_exit_code(2)
+        assert "Can't derive the markup language" in result.stderr
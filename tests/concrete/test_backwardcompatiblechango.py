@@ -46,6 +46,11 @@ class TestBackwardCompatibleChanGo:
         chango = BackwardCompatibleChanGo(MagicMock(), [MagicMock(), MagicMock()])
         assert isinstance(chango.scanner, BackwardCompatibleVersionScanner)
 
+    def test_instances(self):
+        main_instance, legacy_instances = MagicMock(), [MagicMock(), MagicMock()]
+        chango = BackwardCompatibleChanGo(main_instance, legacy_instances)
+        assert chango.instances == (main_instance, *legacy_instances)
+
     def test_build_template_change_note(self):
         expected_template = object()
         main_instance, legacy_instances = self.build_mocks(
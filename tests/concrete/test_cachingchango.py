@@ -0,0 +1,137 @@
+#  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
+#
+#  SPDX-License-Identifier: MIT
+
+import datetime as dtm
+import shutil
+import unittest.mock
+
+import pytest
+
+from chango import Version
+from chango.concrete import (
+    CachingChanGo,
+    CommentChangeNote,
+    CommentVersionNote,
+    DirectoryChanGo,
+    DirectoryVersionScanner,
+    HeaderVersionHistory,
+)
+from chango.constants import MarkupLanguage
+from tests.auxil.files import data_path
+
+
+@pytest.fixture
+def instance(tmp_path, monkeypatch) -> DirectoryChanGo:
+    monkeypatch.setattr("chango._utils.files._GIT_HELPER.git_available", False)
+    base_directory = tmp_path / "changes"
+    shutil.copytree(data_path("directoryversionscanner"), base_directory)
+    instance = DirectoryChanGo(
+        change_note_type=CommentChangeNote,
+        version_note_type=CommentVersionNote,
+        version_history_type=HeaderVersionHistory,
+        scanner=DirectoryVersionScanner(base_directory, "unreleased"),
+    )
+    monkeypatch.setattr(
+        instance, "load_change_note", unittest.mock.Mock(wraps=instance.load_change_note)
+    )
+    return instance
+
+
+@pytest.fixture
+def chango(instance) -> CachingChanGo:
+    return CachingChanGo(instance)
+
+
+class TestCachingChanGo:
+    def test_delegation(self, chango, instance):
+        assert chango.instance is instance
+        assert chango.scanner is instance.scanner
+        assert chango.maxsize == 256  # noqa: PLR2004
+        assert isinstance(chango.build_template_change_note("slug"), CommentChangeNote)
+        assert isinstance(chango.build_version_note(None), CommentVersionNote)
+        assert isinstance(chango.build_version_history(), HeaderVersionHistory)
+        assert chango.get_write_directory("uid", None) == instance.scanner.unreleased_directory
+
+    def test_load_change_note(self, chango, instance):
+        note = chango.load_change_note("uid_1-1_0")
+        assert chango.load_change_note("uid_1-1_0") is note
+        assert instance.load_change_note.call_count == 1
+
+    def test_load_version_note(self, chango, instance):
+        version_note = chango.load_version_note("1.1")
+        assert chango.load_version_note("1.1") is version_note
+        assert chango.load_version_note(chango.scanner.get_version("1.1")) is version_note
+        assert instance.load_change_note.call_count == 3  # noqa: PLR2004
+
+    def test_render(self, chango, instance):
+        expected = instance.load_version_history().render(MarkupLanguage.MARKDOWN)
+        instance.load_change_note.reset_mock()
+
+        assert chango.render_version_history(MarkupLanguage.MARKDOWN) == expected
+        assert chango.render_version_history(MarkupLanguage.MARKDOWN) == expected
+        assert chango.render_version_note("1.2", MarkupLanguage.MARKDOWN) == (
+            instance.load_version_note("1.2").render(MarkupLanguage.MARKDOWN)
+        )
+        # All change notes are only loaded once
+        assert instance.load_change_note.call_count == 15 + 3
+
+    def test_lru_eviction(self, instance):
+        chango = CachingChanGo(instance, maxsize=2)
+        for uid in ("uid_1-1_0", "uid_1-1_1", "uid_1-1_0", "uid_1-1_2"):
+            chango.load_change_note(uid)
+        assert instance.load_change_note.call_count == 3  # noqa: PLR2004
+
+        # uid_1-1_1 was the least recently used entry
+        chango.load_change_note("uid_1-1_0")
+        assert instance.load_change_note.call_count == 3  # noqa: PLR2004
+        chango.load_change_note("uid_1-1_1")
+        assert instance.load_change_note.call_count == 4  # noqa: PLR2004
+
+    def test_write_change_note_invalidates(self, chango):
+        chango.load_version_note(None)
+        before = chango.render_version_history(MarkupLanguage.MARKDOWN)
+
+        note = chango.load_change_note("uid_ur_0")
+        note.comment = "updated comment"
+        chango.write_change_note(note, None)
+
+        assert "updated comment" in chango.render_version_note(None, MarkupLanguage.MARKDOWN)
+        after = chango.render_version_history(MarkupLanguage.MARKDOWN)
+        assert after != before
+        assert "updated comment" in after
+
+        new_note = chango.build_template_change_note("new")
+        new_note.comment = "new comment"
+        chango.write_change_note(new_note, None)
+        assert new_note.uid in chango.load_version_note(None)
+
+    def test_release_invalidates(self, chango):
+        chango.load_version_note(None)
+        chango.render_version_history(MarkupLanguage.MARKDOWN)
+
+        version = Version("1.4", dtm.date(2024, 1, 4))
+        assert chango.release(version)
+        assert len(chango.load_version_note("1.4")) == 3  # noqa: PLR2004
+        assert chango.render_version_history(MarkupLanguage.MARKDOWN).startswith("# 1.4")
+
+    def test_clear_cache(self, chango, instance):
+        chango.load_change_note("uid_1-1_0")
+        chango.clear_cache()
+        chango.load_change_note("uid_1-1_0")
+        assert instance.load_change_note.call_count == 2  # noqa: PLR2004
+
+    def test_invalidation_during_load(self, chango, instance, monkeypatch):
+        load_change_note = instance.load_change_note
+
+        def invalidating_load(uid):
+            # Simulate a concurrent write that happens while the change note is loaded
+            note = load_change_note(uid)
+            chango.clear_cache()
+            return note
+
+        monkeypatch.setattr(instance, "load_change_note", invalidating_load)
+        stale = chango.load_change_note("uid_1-1_0")
+
+        monkeypatch.setattr(instance, "load_change_note", load_change_note)
+        assert chango.load_change_note("uid_1-1_0") is not stale
@@ -8,6 +8,7 @@ import pytest
 from chango import Version
 from chango.concrete import CommentChangeNote, CommentVersionNote
 from chango.error import UnsupportedMarkupError
+from tests.auxil.docutils import format_nodes, parse_rst
 
 
 class TestCommentVersionNote:
@@ -83,3 +84,33 @@ comment 2
 
 comment 3"""
         )
+
+    def test_build_nodes(self):
+        built = self.version_note.build_nodes()
+        assert format_nodes(built) == format_nodes(
+            parse_rst(self.version_note.render("restructuredtext"))
+        )
+
+    @pytest.mark.parametrize(
+        "comment",
+        [
+            "*emphasis*",
+            "``literal``",
+            "reference_",
+            "see https://example.com",
+            "- nested list",
+            "1. enumerated list",
+            "  indented",
+            ":field: list",
+            ".. directive::",
+            "literal block::",
+            "=====",
+            "a\n=",
+        ],
+    )
+    def test_build_nodes_markup(self, comment):
+        self.version_note.add_change_note(CommentChangeNote(slug="markup", comment=comment))
+        assert self.version_note.build_nodes() is None
+
+    def test_build_nodes_empty(self):
+        assert CommentVersionNote(version=self.version).build_nodes() == []
@@ -3,10 +3,15 @@
 #  SPDX-License-Identifier: MIT
 
 import datetime as dtm
+import json
+import shutil
+import threading
+from pathlib import Path
 
 import pytest
 import shortuuid
 
+import chango as chango_module
 from chango import Version
 from chango.action import ChanGoActionData, ParentPullRequest
 from chango.concrete import (
@@ -42,6 +47,21 @@ def chango(scanner) -> DirectoryChanGo:
     )
 
 
+@pytest.fixture
+def tmp_chango(tmp_path, monkeypatch) -> DirectoryChanGo:
+    # Operate on a copy of the data, since releases move files around. git is disabled such that
+    # the files are moved via pathlib.
+    monkeypatch.setattr(chango_module._utils.files._GIT_HELPER, "git_available", False)
+    base_directory = tmp_path / "changes"
+    shutil.copytree(TestDirectoryChango.DATA_ROOT, base_directory)
+    return DirectoryChanGo(
+        change_note_type=CommentChangeNote,
+        version_note_type=CommentVersionNote,
+        version_history_type=HeaderVersionHistory,
+        scanner=DirectoryVersionScanner(base_directory, "unreleased"),
+    )
+
+
 DummySectionChangeNote = GitHubSectionChangeNote.with_sections(
     [
         Section(uid="req_0", title="req_0", is_required=True),
@@ -309,3 +329,133 @@ class TestDirectoryChango:
     def test_get_write_directory_new_str_version(self, chango, change_note):
         with pytest.raises(ChanGoError, match=r"'new-version' not available."):
             chango.get_write_directory(change_note, "new-version")
+
+    def test_packed_version_transparent(self, tmp_chango):
+        expected = tmp_chango.load_version_history().render("markdown")
+        for version in tmp_chango.scanner.get_available_versions():
+            tmp_chango.scanner.pack_version(version.uid)
+
+        assert tmp_chango.load_version_history().render("markdown") == expected
+        assert tmp_chango.load_change_note("uid_1-2_0").comment == "this is a comment"
+        with pytest.raises(ChanGoError, match="packed"):
+            tmp_chango.get_write_directory("uid", "1.2")
+
+    def test_release_removes_journal(self, tmp_chango):
+        version = Version("1.4", dtm.date(2024, 1, 4))
+        assert tmp_chango.release(version)
+        assert not (tmp_chango.scanner.base_directory / tmp_chango.RELEASE_JOURNAL_NAME).exists()
+        assert set(tmp_chango.scanner.get_changes("1.4")) == {f"uid_ur_{i}" for i in range(3)}
+        assert not tmp_chango.scanner.has_unreleased_changes()
+
+    def _write_interrupted_journal(self, chango: DirectoryChanGo) -> tuple:
+        # Simulate a release that was interrupted after moving the first file
+        version = Version("1.4", dtm.date(2024, 1, 4))
+        unreleased = sorted(
+            file
+            for file in chango.scanner.unreleased_directory.iterdir()
+            if file.name.startswith("comment-change-note")
+        )
+        target_directory = chango.get_write_directory("uid", version)
+        moves = [(file, target_directory / file.name) for file in unreleased]
+        (chango.scanner.base_directory / chango.RELEASE_JOURNAL_NAME).write_text(
+            json.dumps(
+                {
+                    "version": {"uid": version.uid, "date": version.date.isoformat()},
+                    "moves": [[str(src), str(dst)] for src, dst in moves],
+                }
+            )
+        )
+        moves[0][0].rename(moves[0][1])
+        chango.scanner.invalidate_caches()
+        return version, moves
+
+    def test_recover_release_roll_forward(self, tmp_chango):
+        version, moves = self._write_interrupted_journal(tmp_chango)
+
+        assert tmp_chango.recover_release()
+        assert all(dst.is_file() and not src.exists() for src, dst in moves)
+        assert tmp_chango.scanner.is_available(version)
+        assert not tmp_chango.scanner.has_unreleased_changes()
+        assert not (tmp_chango.scanner.base_directory / tmp_chango.RELEASE_JOURNAL_NAME).exists()
+
+        assert not tmp_chango.recover_release()
+
+    def test_recover_release_roll_back(self, tmp_chango):
+        version, moves = self._write_interrupted_journal(tmp_chango)
+
+        assert tmp_chango.recover_release(roll_back=True)
+        assert all(src.is_file() and not dst.exists() for src, dst in moves)
+        assert not tmp_chango.scanner.is_available(version)
+        assert not moves[0][1].parent.exists()
+        assert not (tmp_chango.scanner.base_directory / tmp_chango.RELEASE_JOURNAL_NAME).exists()
+
+    def test_release_rolls_forward_interrupted_release(self, tmp_chango):
+        version, _ = self._write_interrupted_journal(tmp_chango)
+
+        assert not tmp_chango.release(Version("1.5", dtm.date(2024, 1, 5)))
+        assert set(tmp_chango.scanner.get_changes(version.uid)) == {
+            f"uid_ur_{i}" for i in range(3)
+        }
+
+    def test_recover_release_after_moving_repository(self, tmp_chango, tmp_path, monkeypatch):
+        # Interrupt the release after moving the first file
+        move_file = chango_module.abc._chango.move_file
+        moved = []
+
+        def crashing_move_file(src, dst):
+            if moved:
+                raise RuntimeError("crash")
+            moved.append(dst)
+            move_file(src, dst)
+
+        monkeypatch.setattr("chango.abc._chango.move_file", crashing_move_file)
+        version = Version("1.4", dtm.date(2024, 1, 4))
+        with pytest.raises(RuntimeError, match="crash"):
+            tmp_chango.release(version)
+        monkeypatch.undo()
+        monkeypatch.setattr(chango_module._utils.files._GIT_HELPER, "git_available", False)
+
+        journal = json.loads(
+            (tmp_chango.scanner.base_directory / tmp_chango.RELEASE_JOURNAL_NAME).read_text()
+        )
+        assert not any(Path(path).is_absolute() for move in journal["moves"] for path in move)
+
+        moved_directory = tmp_path / "moved"
+        shutil.move(tmp_chango.scanner.base_directory, moved_directory)
+        chango = DirectoryChanGo(
+            change_note_type=CommentChangeNote,
+            version_note_type=CommentVersionNote,
+            version_history_type=HeaderVersionHistory,
+            scanner=DirectoryVersionScanner(moved_directory, "unreleased"),
+        )
+        assert chango.recover_release()
+        assert set(chango.scanner.get_changes(version.uid)) == {f"uid_ur_{i}" for i in range(3)}
+        assert not chango.scanner.has_unreleased_changes()
+
+    @pytest.mark.parametrize("content", ['{"version": {"uid": "1.4"', '{"moves": 1}', "[]"])
+    def test_recover_release_invalid_journal(self, tmp_chango, content):
+        journal = tmp_chango.scanner.base_directory / tmp_chango.RELEASE_JOURNAL_NAME
+        journal.write_text(content)
+
+        assert not tmp_chango.recover_release()
+        assert not journal.exists()
+
+        assert tmp_chango.release(Version("1.4", dtm.date(2024, 1, 4)))
+        assert not tmp_chango.scanner.has_unreleased_changes()
+
+    def test_concurrent_write_change_note(self, tmp_chango):
+        notes = [tmp_chango.build_template_change_note(f"slug-{i}") for i in range(20)]
+        threads = [
+            threading.Thread(target=tmp_chango.write_change_note, args=(note, None))
+            for note in notes
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert {note.uid for note in notes} <= set(tmp_chango.scanner.get_changes(None))
+        assert not any(
+            file.name.endswith(".tmp")
+            for file in tmp_chango.scanner.unreleased_directory.iterdir()
+        )
@@ -3,14 +3,20 @@
 #  SPDX-License-Identifier: MIT
 
 import datetime as dtm
+import shutil
+import sys
+import threading
+import time
 from pathlib import Path
 
 import pytest
 
 from chango import Version
 from chango.concrete import DirectoryVersionScanner
+from chango.constants import ChangeNoteOrder
 from chango.error import ChanGoError
 from tests.auxil.files import data_path
+from tests.auxil.git import commit_all, git, init_repository
 
 
 @pytest.fixture
@@ -167,6 +173,76 @@ class TestDirectoryVersionScanner:
 
         assert changes == {f"uid_{uid.replace('.', '-')}_{idx}" for idx in range(3)}
 
+    @pytest.mark.parametrize(
+        ("change_order", "expected"),
+        [
+            # Sorting by file name sorts by slug first
+            (ChangeNoteOrder.FILE_NAME, ("03-newest", "02-new", "01-old")),
+            (ChangeNoteOrder.UID, ("01-old", "02-new", "03-newest")),
+            ("uid", ("01-old", "02-new", "03-newest")),
+        ],
+    )
+    def test_get_changes_order(self, tmp_path, change_order, expected):
+        (tmp_path / "unreleased").mkdir()
+        for slug, uid in (("b", "02-new"), ("c", "01-old"), ("a", "03-newest")):
+            (tmp_path / "unreleased" / f"{slug}.{uid}.txt").write_text("comment")
+
+        scanner = DirectoryVersionScanner(tmp_path, "unreleased", change_order=change_order)
+        assert scanner.change_order is ChangeNoteOrder(change_order)
+        assert scanner.get_changes(None) == expected
+
+    @pytest.mark.skipif(shutil.which("git") is None, reason="git is not available")
+    def test_get_changes_commit_time(self, tmp_path, monkeypatch):
+        repository = init_repository(tmp_path)
+        unreleased = tmp_path / "changes" / "unreleased"
+        unreleased.mkdir(parents=True)
+
+        # Slugs are chosen such that file name order is the reverse of commit order
+        for timestamp, (slug, uid) in enumerate(
+            (("c", "first"), ("b", "second"), ("a", "third")), start=1_700_000_000
+        ):
+            (unreleased / f"{slug}.{uid}.txt").write_text("comment")
+            commit_all(repository, timestamp)
+        (unreleased / "0.uncommitted.txt").write_text("comment")
+
+        scanner = DirectoryVersionScanner(
+            tmp_path / "changes", "unreleased", change_order=ChangeNoteOrder.COMMIT_TIME
+        )
+        assert scanner.get_changes(None) == ("first", "second", "third", "uncommitted")
+
+        # Releasing moves the files - the order must be preserved
+        version_directory = tmp_path / "changes" / "1.0_2024-01-01"
+        version_directory.mkdir()
+        for file in unreleased.iterdir():
+            if file.name == "0.uncommitted.txt":
+                file.rename(version_directory / file.name)
+            else:
+                git(repository, "mv", str(file), str(version_directory / file.name))
+        git(repository, "commit", "--quiet", "--message", "release", timestamp=1_800_000_000)
+        scanner.invalidate_caches()
+        assert scanner.get_changes("1.0") == ("first", "second", "third", "uncommitted")
+
+        # The git history is only queried again if HEAD changes
+        def get_first_commit_times(*_, **__):
+            raise AssertionError("git log should not be called")
+
+        monkeypatch.setattr(
+            "chango.concrete._directoryversionscanner.get_first_commit_times",
+            get_first_commit_times,
+        )
+        scanner.invalidate_caches()
+        assert scanner.get_changes("1.0") == ("first", "second", "third", "uncommitted")
+
+    def test_get_changes_commit_time_no_git_repository(self, tmp_path):
+        (tmp_path / "unreleased").mkdir()
+        for slug, uid in (("b", "second"), ("a", "first")):
+            (tmp_path / "unreleased" / f"{slug}.{uid}.txt").write_text("comment")
+
+        scanner = DirectoryVersionScanner(
+            tmp_path, "unreleased", change_order=ChangeNoteOrder.COMMIT_TIME
+        )
+        assert scanner.get_changes(None) == ("first", "second")
+
     def test_get_changes_not_found(self, scanner):
         with pytest.raises(ChanGoError, match="not available"):
             scanner.get_changes("1.4")
@@ -191,3 +267,192 @@ class TestDirectoryVersionScanner:
             }
         finally:
             new_directory.rmdir()
+
+    @pytest.mark.parametrize("version", ["1.2", None])
+    def test_list_files(self, scanner, version):
+        directory = "1.2_2024-01-02" if version else "unreleased"
+        uid = version.replace(".", "-") if version else "ur"
+        assert sorted(scanner.list_files(version)) == [
+            *(
+                self.DATA_ROOT / directory / f"comment-change-note.uid_{uid}_{idx}.txt"
+                for idx in range(3)
+            ),
+            self.DATA_ROOT / directory / "not-a-change-note.txt",
+        ]
+
+    def test_list_files_not_available(self, scanner):
+        with pytest.raises(ChanGoError, match="not available"):
+            scanner.list_files("1.4")
+
+    def test_pack_unpack_version(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("chango._utils.files._GIT_HELPER.git_available", False)
+        base_directory = tmp_path / "changes"
+        shutil.copytree(self.DATA_ROOT, base_directory)
+        scanner = DirectoryVersionScanner(base_directory, "unreleased")
+        versions = set(scanner.get_available_versions())
+        changes = scanner.get_changes("1.1")
+        contents = {uid: scanner.read_change_note_bytes(uid) for uid in changes}
+
+        pack_path = scanner.pack_version("1.1")
+        assert pack_path == base_directory / f"1.1_2024-01-01{scanner.PACK_SUFFIX}"
+        assert pack_path.is_file()
+        assert scanner.is_packed("1.1")
+        assert not scanner.is_packed("1.2")
+        assert not scanner.is_packed(None)
+        # Files that are not change notes are left in place
+        assert {path.name for path in (base_directory / "1.1_2024-01-01").iterdir()} == {
+            "not-a-change-note.txt",
+            "subdirectory-to-ignore",
+        }
+
+        assert set(scanner.get_available_versions()) == versions
+        assert scanner.get_changes("1.1") == changes
+        for uid, content in contents.items():
+            info = scanner.lookup_change_note(uid)
+            assert info.version == Version("1.1", dtm.date(2024, 1, 1))
+            assert info.file_path.parent == pack_path
+            assert scanner.read_change_note_bytes(uid) == content
+            assert scanner.read_change_note_bytes(info) == content
+        assert {path.name for path in scanner.list_files("1.1")} == {
+            f"comment-change-note.uid_1-1_{idx}.txt" for idx in range(3)
+        }
+        assert {path.parent for path in scanner.list_files("1.1")} == {pack_path}
+
+        with pytest.raises(ChanGoError, match="already packed"):
+            scanner.pack_version("1.1")
+
+        directory = scanner.unpack_version("1.1")
+        assert directory == base_directory / "1.1_2024-01-01"
+        assert not pack_path.exists()
+        assert not scanner.is_packed("1.1")
+        assert scanner.get_changes("1.1") == changes
+        assert {uid: scanner.read_change_note_bytes(uid) for uid in changes} == contents
+
+        with pytest.raises(ChanGoError, match="not packed"):
+            scanner.unpack_version("1.1")
+        with pytest.raises(ChanGoError, match="not available"):
+            scanner.pack_version("1.4")
+
+    def test_pack_removes_empty_directory(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("chango._utils.files._GIT_HELPER.git_available", False)
+        base_directory = tmp_path / "changes"
+        shutil.copytree(self.DATA_ROOT, base_directory)
+        scanner = DirectoryVersionScanner(base_directory, "unreleased")
+
+        scanner.pack_version("1.3.1")
+        assert not (base_directory / "1.3.1_2024-01-03").exists()
+        assert set(scanner.get_changes("1.3.1")) == {f"uid_1-3-1_{idx}" for idx in range(3)}
+
+    def test_pack_takes_precedence(self, tmp_path, monkeypatch):
+        # Simulates an interrupted pack: both the directory and the pack exist
+        monkeypatch.setattr("chango._utils.files._GIT_HELPER.git_available", False)
+        base_directory = tmp_path / "changes"
+        shutil.copytree(self.DATA_ROOT, base_directory)
+        scanner = DirectoryVersionScanner(base_directory, "unreleased")
+
+        pack_path = scanner.pack_version("1.3.1")
+        shutil.copytree(self.DATA_ROOT / "1.3.1_2024-01-03", base_directory / "1.3.1_2024-01-03")
+        scanner.invalidate_caches()
+        assert scanner.is_packed("1.3.1")
+        assert scanner.lookup_change_note("uid_1-3-1_0").file_path.parent == pack_path
+
+    def test_concurrent_rebuilds_coalesced(self, monkeypatch):
+        calls = 0
+        original = DirectoryVersionScanner._scan_available_versions
+
+        def scan_available_versions(self):
+            nonlocal calls
+            calls += 1
+            # Give the other threads time to pile up behind the rebuild
+            time.sleep(0.05)
+            return original(self)
+
+        monkeypatch.setattr(
+            DirectoryVersionScanner, "_scan_available_versions", scan_available_versions
+        )
+        scanner = DirectoryVersionScanner(self.DATA_ROOT, "unreleased")
+        barrier = threading.Barrier(8)
+
+        def read():
+            barrier.wait()
+            scanner.get_available_versions()
+
+        threads = [threading.Thread(target=read) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert calls == 1
+
+    def test_concurrent_readers_and_invalidation(self, scanner):
+        # Switch threads as often as possible to provoke races. On free-threaded builds, the
+        # threads run in parallel anyway.
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+
+        expected_versions = set(scanner.get_available_versions())
+        errors: list[BaseException] = []
+        stop = threading.Event()
+
+        def read():
+            try:
+                while not stop.is_set():
+                    assert set(scanner.get_available_versions()) == expected_versions
+                    assert scanner.get_latest_version() == Version("1.3.1", dtm.date(2024, 1, 3))
+                    assert scanner.is_available("1.2")
+                    assert len(scanner.get_changes("1.2")) == 3  # noqa: PLR2004
+                    assert scanner.lookup_change_note("uid_1-3_1").version.uid == "1.3"
+            except BaseException as exc:
+                errors.append(exc)
+                raise
+
+        def invalidate():
+            while not stop.is_set():
+                scanner.invalidate_caches()
+
+        threads = [threading.Thread(target=read) for _ in range(8)]
+        threads.extend(threading.Thread(target=invalidate) for _ in range(2))
+        try:
+            for thread in threads:
+                thread.start()
+            time.sleep(1)
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
+            sys.setswitchinterval(switch_interval)
+
+        assert not errors
+
+    def test_invalidation_during_rebuild(self, monkeypatch):
+        building = threading.Event()
+        resume = threading.Event()
+        built = threading.Event()
+        original = DirectoryVersionScanner._scan_available_versions
+
+        def scan_available_versions(self):
+            building.set()
+            resume.wait(timeout=5)
+            built.set()
+            return original(self)
+
+        monkeypatch.setattr(
+            DirectoryVersionScanner, "_scan_available_versions", scan_available_versions
+        )
+        scanner = DirectoryVersionScanner(self.DATA_ROOT, "unreleased")
+        thread = threading.Thread(target=scanner.get_available_versions)
+        thread.start()
+        try:
+            assert building.wait(timeout=5)
+            # Doesn't wait for the running rebuild
+            scanner.invalidate_caches()
+            assert not built.is_set()
+        finally:
+            resume.set()
+            thread.join()
+
+        # The snapshot that was built during the invalidation is not published
+        building.clear()
+        resume.set()
+        scanner.get_available_versions()
+        assert building.is_set()
@@ -0,0 +1,156 @@
+#  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
+#
+#  SPDX-License-Identifier: MIT
+import datetime as dtm
+import shutil
+import sys
+import threading
+
+import pytest
+
+from chango import Version
+from chango._utils.pack import write_pack
+from chango.concrete import DirectoryVersionScanner, DirectoryVersionScannerWatcher
+from chango.error import ChanGoError
+from tests.auxil.files import data_path
+
+TIMEOUT = 5
+
+
+@pytest.fixture
+def scanner(tmp_path) -> DirectoryVersionScanner:
+    base_directory = tmp_path / "changes"
+    shutil.copytree(data_path("directoryversionscanner"), base_directory)
+    return DirectoryVersionScanner(base_directory, "unreleased")
+
+
+@pytest.fixture(
+    params=[
+        pytest.param(
+            True,
+            id="inotify",
+            marks=pytest.mark.skipif(
+                not sys.platform.startswith("linux"), reason="inotify is only available on Linux"
+            ),
+        ),
+        pytest.param(False, id="polling"),
+    ]
+)
+def watcher(request, scanner) -> DirectoryVersionScannerWatcher:
+    watcher = DirectoryVersionScannerWatcher(
+        scanner, batch_delay=0.05, poll_interval=0.05, use_inotify=request.param
+    )
+    assert watcher.backend == ("inotify" if request.param else "polling")
+    yield watcher
+    watcher.stop()
+
+
+class TestDirectoryVersionScannerWatcher:
+    def test_no_changes(self, watcher):
+        assert watcher.wait_for_changes(timeout=0.2) == frozenset()
+
+    def test_unreleased_change(self, watcher, scanner):
+        (scanner.unreleased_directory / "comment-change-note.uid_new.txt").write_text("new")
+        assert watcher.wait_for_changes(timeout=TIMEOUT) == {None}
+        assert "uid_new" in scanner.get_changes(None)
+
+    def test_version_change(self, watcher, scanner):
+        (scanner.base_directory / "1.2_2024-01-02" / "comment-change-note.uid_1-2_0.txt").unlink()
+        assert watcher.wait_for_changes(timeout=TIMEOUT) == {"1.2"}
+        assert scanner.get_changes("1.2") == ("uid_1-2_1", "uid_1-2_2")
+
+    def test_new_version(self, watcher, scanner):
+        assert not scanner.is_available("1.4")
+        directory = scanner.base_directory / "1.4_2024-01-04"
+        directory.mkdir()
+        assert watcher.wait_for_changes(timeout=TIMEOUT) == {"1.4"}
+        assert scanner.get_version("1.4") == Version("1.4", dtm.date(2024, 1, 4))
+
+        # Files in the new version directory are watched as well
+        (directory / "comment-change-note.uid_1-4_0.txt").write_text("new")
+        assert watcher.wait_for_changes(timeout=TIMEOUT) == {"1.4"}
+        assert scanner.get_changes("1.4") == ("uid_1-4_0",)
+
+    def test_removed_version(self, watcher, scanner):
+        assert scanner.is_available("1.1")
+        shutil.rmtree(scanner.base_directory / "1.1_2024-01-01")
+        assert "1.1" in watcher.wait_for_changes(timeout=TIMEOUT)
+        assert not scanner.is_available("1.1")
+
+    def test_renamed_version(self, watcher, scanner):
+        (scanner.base_directory / "1.2_2024-01-02").rename(
+            scanner.base_directory / "1.2.1_2024-01-02"
+        )
+        assert watcher.wait_for_changes(timeout=TIMEOUT) >= {"1.2", "1.2.1"}
+        assert not scanner.is_available("1.2")
+        assert scanner.get_changes("1.2.1") == ("uid_1-2_0", "uid_1-2_1", "uid_1-2_2")
+
+        # The renamed directory is still watched under its new path
+        (
+            scanner.base_directory / "1.2.1_2024-01-02" / "comment-change-note.uid_1-2_0.txt"
+        ).unlink()
+        assert watcher.wait_for_changes(timeout=TIMEOUT) == {"1.2.1"}
+
+    def test_packed_version(self, watcher, scanner):
+        write_pack(
+            scanner.base_directory / f"1.2_2024-01-02{scanner.PACK_SUFFIX}",
+            [("comment-change-note.uid_packed.txt", b"packed")],
+        )
+        assert "1.2" in watcher.wait_for_changes(timeout=TIMEOUT)
+        assert scanner.is_packed("1.2")
+        assert scanner.get_changes("1.2") == ("uid_packed",)
+
+    def test_targeted_update(self, watcher, scanner, monkeypatch):
+        scanner.get_available_versions()
+
+        def fail():
+            pytest.fail("The base directory was rescanned")
+
+        monkeypatch.setattr(scanner._DirectoryVersionScanner__available_versions, "_build", fail)
+        (scanner.base_directory / "1.4_2024-01-04").mkdir()
+        assert watcher.wait_for_changes(timeout=TIMEOUT) == {"1.4"}
+        assert {version.uid for version in scanner.get_available_versions()} == {
+            "1.1",
+            "1.2",
+            "1.3",
+            "1.3.1",
+            "1.4",
+        }
+
+    def test_batching(self, watcher, scanner):
+        for idx in range(20):
+            (scanner.unreleased_directory / f"comment-change-note.uid_new-{idx}.txt").write_text(
+                "new"
+            )
+            (
+                scanner.base_directory / "1.1_2024-01-01" / f"comment-change-note.uid_{idx}.txt"
+            ).write_text("new")
+        assert watcher.wait_for_changes(timeout=TIMEOUT) == {None, "1.1"}
+
+    def test_callback(self, watcher, scanner):
+        event = threading.Event()
+        changes = []
+
+        def callback(affected):
+            changes.append(affected)
+            event.set()
+
+        watcher.callback = callback
+        with watcher:
+            (scanner.unreleased_directory / "comment-change-note.uid_new.txt").write_text("new")
+            assert event.wait(TIMEOUT)
+        assert changes == [{None}]
+
+    def test_use_after_stop(self, watcher):
+        watcher.stop()
+        # Stopping again is fine
+        watcher.stop()
+        with pytest.raises(ChanGoError, match="stopped"):
+            watcher.wait_for_changes(timeout=0)
+        with pytest.raises(ChanGoError, match="stopped"):
+            watcher.start()
+
+    def test_start_twice(self, watcher):
+        watcher.start()
+        with pytest.raises(RuntimeError, match="already running"):
+            watcher.start()
@@ -0,0 +1,115 @@
+#  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
+#
+#  SPDX-License-Identifier: MIT
+
+import datetime as dtm
+import shutil
+
+import pytest
+
+from chango import Version
+from chango.concrete import (
+    CommentChangeNote,
+    CommentVersionNote,
+    DirectoryChanGo,
+    DirectoryVersionScanner,
+    GitChanGo,
+    GitVersionScanner,
+    HeaderVersionHistory,
+)
+from chango.concrete.sections import GitHubSectionChangeNote, Section, SectionVersionNote
+from chango.constants import MarkupLanguage
+from chango.error import ChanGoError
+from tests.auxil.files import data_path
+from tests.auxil.git import commit_all, git, init_repository
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git is not available")
+
+
+@pytest.fixture
+def repository(tmp_path):
+    repository = init_repository(tmp_path)
+    shutil.copytree(TestGitChanGo.DATA_ROOT, tmp_path / "changes")
+    commit_all(repository, 1_700_000_000)
+    git(repository, "tag", "v1")
+    return repository
+
+
+@pytest.fixture
+def chango(repository):
+    scanner = GitVersionScanner(repository / "changes", "unreleased", ref="v1")
+    yield GitChanGo(
+        change_note_type=CommentChangeNote,
+        version_note_type=CommentVersionNote,
+        version_history_type=HeaderVersionHistory,
+        scanner=scanner,
+    )
+    scanner.close()
+
+
+class TestGitChanGo:
+    DATA_ROOT = data_path("directoryversionscanner")
+
+    def test_init(self, chango):
+        assert chango.encoding == "utf-8"
+        assert chango.change_note_type is CommentChangeNote
+        assert chango.version_note_type is CommentVersionNote
+        assert chango.version_history_type is HeaderVersionHistory
+        assert isinstance(chango.scanner, GitVersionScanner)
+
+    @pytest.mark.parametrize("uid", [None, "uid"])
+    def test_build_template_change_note(self, chango, uid):
+        note = chango.build_template_change_note("slug", uid)
+        assert isinstance(note, CommentChangeNote)
+        assert note.slug == "slug"
+        if uid is not None:
+            assert note.uid == uid
+
+    def test_build_version_note(self, chango):
+        version = Version("uid", dtm.date.today())
+        note = chango.build_version_note(version)
+        assert isinstance(note, CommentVersionNote)
+        assert note.version == version
+
+    def test_build_version_note_sections(self, repository):
+        change_note_type = GitHubSectionChangeNote.with_sections([Section(uid="a", title="A")])
+        chango = GitChanGo(
+            change_note_type=change_note_type,
+            version_note_type=SectionVersionNote,
+            version_history_type=HeaderVersionHistory,
+            scanner=GitVersionScanner(repository / "changes", "unreleased"),
+        )
+        note = chango.build_version_note(None)
+        assert isinstance(note, SectionVersionNote)
+
+    def test_build_version_history(self, chango):
+        assert isinstance(chango.build_version_history(), HeaderVersionHistory)
+
+    def test_load_change_note(self, chango):
+        note = chango.load_change_note("uid_1-2_1")
+        assert isinstance(note, CommentChangeNote)
+        assert note.uid == "uid_1-2_1"
+        assert note.slug == "comment-change-note"
+        assert note.comment == chango.scanner.lookup_change_note("uid_1-2_1").file_path.read_text()
+
+    def test_load_version_history_matches_directory(self, repository, chango):
+        directory_chango = DirectoryChanGo(
+            change_note_type=CommentChangeNote,
+            version_note_type=CommentVersionNote,
+            version_history_type=HeaderVersionHistory,
+            scanner=DirectoryVersionScanner(repository / "changes", "unreleased"),
+        )
+        expected = directory_chango.load_version_history().render(MarkupLanguage.MARKDOWN)
+
+        # Modifying the working tree does not affect the history at the tag
+        shutil.rmtree(repository / "changes" / "1.1_2024-01-01")
+        assert chango.load_version_history().render(MarkupLanguage.MARKDOWN) == expected
+
+    def test_read_only(self, chango):
+        note = chango.build_template_change_note("slug")
+        with pytest.raises(ChanGoError, match="read-only"):
+            chango.get_write_directory(note, None)
+        with pytest.raises(ChanGoError, match="read-only"):
+            chango.write_change_note(note, None)
+        with pytest.raises(ChanGoError, match="read-only"):
+            chango.release(Version("1.4", dtm.date(2024, 1, 4)))
@@ -0,0 +1,195 @@
+#  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
+#
+#  SPDX-License-Identifier: MIT
+
+import datetime as dtm
+import shutil
+
+import pytest
+
+from chango import Version
+from chango.concrete import DirectoryVersionScanner, GitVersionScanner
+from chango.constants import ChangeNoteOrder
+from chango.error import ChanGoError
+from tests.auxil.files import data_path
+from tests.auxil.git import commit_all, git, init_repository
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git is not available")
+
+
+@pytest.fixture
+def repository(tmp_path):
+    repository = init_repository(tmp_path)
+    shutil.copytree(TestGitVersionScanner.DATA_ROOT, tmp_path / "changes")
+    commit_all(repository, 1_700_000_000)
+    git(repository, "tag", "v1")
+
+    # Changes after the tag. The working tree is also modified without committing.
+    (tmp_path / "changes" / "unreleased" / "comment-change-note.uid_ur_3.txt").write_text("new")
+    (tmp_path / "changes" / "1.4_2024-01-04").mkdir()
+    (tmp_path / "changes" / "1.4_2024-01-04" / "comment-change-note.uid_1-4_0.txt").write_text(
+        "new"
+    )
+    commit_all(repository, 1_700_000_001)
+    (tmp_path / "changes" / "unreleased" / "comment-change-note.uid_ur_4.txt").write_text("new")
+    return repository
+
+
+@pytest.fixture
+def scanner(repository):
+    scanner = GitVersionScanner(repository / "changes", "unreleased", ref="v1")
+    yield scanner
+    scanner.close()
+
+
+class TestGitVersionScanner:
+    DATA_ROOT = data_path("directoryversionscanner")
+
+    def test_init(self, repository, scanner):
+        assert scanner.base_directory == repository / "changes"
+        assert scanner.unreleased_directory == repository / "changes" / "unreleased"
+        assert scanner.ref == "v1"
+        assert scanner.change_order is ChangeNoteOrder.FILE_NAME
+
+    def test_init_base_directory_not_exists(self, tmp_path):
+        with pytest.raises(ValueError, match="does not exist"):
+            GitVersionScanner(tmp_path / "does-not-exist", "unreleased")
+
+    def test_init_no_git_repository(self, tmp_path):
+        with pytest.raises(ValueError, match="not part of a git repository"):
+            GitVersionScanner(tmp_path, "unreleased")
+
+    def test_unknown_ref(self, repository):
+        scanner = GitVersionScanner(repository / "changes", "unreleased", ref="unknown")
+        with pytest.raises(ChanGoError, match="can not be resolved"):
+            scanner.get_available_versions()
+
+    def test_get_available_versions(self, scanner):
+        assert set(scanner.get_available_versions()) == {
+            Version("1.1", dtm.date(2024, 1, 1)),
+            Version("1.2", dtm.date(2024, 1, 2)),
+            Version("1.3", dtm.date(2024, 1, 3)),
+            Version("1.3.1", dtm.date(2024, 1, 3)),
+        }
+        assert set(scanner.get_available_versions(start_from="1.2", end_at="1.3")) == {
+            Version("1.2", dtm.date(2024, 1, 2)),
+            Version("1.3", dtm.date(2024, 1, 3)),
+        }
+
+    def test_head(self, repository):
+        scanner = GitVersionScanner(repository / "changes", "unreleased")
+        assert scanner.is_available("1.4")
+        # Uncommitted changes in the working tree are not considered
+        assert scanner.get_changes(None) == tuple(f"uid_ur_{idx}" for idx in range(4))
+
+    @pytest.mark.parametrize(
+        ("version", "expected"),
+        [
+            ("1.1", True),
+            (Version("1.1", dtm.date(2024, 1, 1)), True),
+            (Version("1.1", dtm.date(2024, 5, 1)), False),
+            ("1.4", False),
+            (None, True),
+        ],
+    )
+    def test_is_available(self, scanner, version, expected):
+        assert scanner.is_available(version) is expected
+        assert (version in scanner) is expected
+
+    def test_get_latest_version(self, scanner):
+        assert scanner.get_latest_version() == Version("1.3.1", dtm.date(2024, 1, 3))
+
+    def test_get_latest_version_nothing_released(self, repository):
+        scanner = GitVersionScanner(repository / "changes" / "no-released", "unreleased")
+        with pytest.raises(ChanGoError, match="No versions available"):
+            scanner.get_latest_version()
+
+    def test_get_version(self, scanner):
+        assert scanner.get_version("1.2") == Version("1.2", dtm.date(2024, 1, 2))
+        with pytest.raises(ChanGoError, match="not available"):
+            scanner.get_version("1.4")
+
+    @pytest.mark.parametrize("version", ["1.1", "1.2", "1.3", "1.3.1", None])
+    def test_get_changes(self, scanner, version):
+        uid = (version or "ur").replace(".", "-")
+        assert scanner.get_changes(version) == tuple(f"uid_{uid}_{idx}" for idx in range(3))
+
+    def test_get_changes_not_found(self, scanner):
+        with pytest.raises(ChanGoError, match="not available"):
+            scanner.get_changes("1.4")
+
+    def test_lookup_change_note(self, repository, scanner):
+        info = scanner.lookup_change_note("uid_1-2_1")
+        assert info.uid == "uid_1-2_1"
+        assert info.version == Version("1.2", dtm.date(2024, 1, 2))
+        assert info.file_path == (
+            repository / "changes" / "1.2_2024-01-02" / "comment-change-note.uid_1-2_1.txt"
+        )
+
+        info = scanner.lookup_change_note("uid_ur_0")
+        assert info.version is None
+
+        with pytest.raises(ChanGoError, match="not found in any version"):
+            scanner.lookup_change_note("uid_1-4_0")
+
+    def test_read_change_note_bytes(self, scanner):
+        for version in ("1.1", "1.2", None):
+            for uid in scanner.get_changes(version):
+                assert (
+                    scanner.read_change_note_bytes(uid)
+                    == scanner.lookup_change_note(uid).file_path.read_bytes()
+                )
+
+        with pytest.raises(ChanGoError, match="not found in any version"):
+            scanner.read_change_note_bytes("uid_1-4_0")
+
+        # The process is restarted on demand after closing
+        scanner.close()
+        assert scanner.read_change_note_bytes("uid_1-1_0") == b"this is a comment"
+
+    def test_invalidate_caches(self, repository):
+        scanner = GitVersionScanner(repository / "changes", "unreleased", ref="main")
+        assert not scanner.is_available("1.5")
+
+        (repository / "changes" / "1.5_2024-01-05").mkdir()
+        (repository / "changes" / "1.5_2024-01-05" / "slug.uid_1-5_0.txt").write_text("new")
+        commit_all(repository, 1_700_000_002)
+
+        assert not scanner.is_available("1.5")
+        scanner.invalidate_caches()
+        assert scanner.is_available("1.5")
+
+    @pytest.mark.parametrize("change_order", [ChangeNoteOrder.UID, ChangeNoteOrder.COMMIT_TIME])
+    def test_change_order(self, repository, change_order):
+        unreleased = repository / "changes" / "unreleased"
+        (unreleased / "comment-change-note.uid_ur_4.txt").unlink()
+        for timestamp, (slug, uid) in enumerate(
+            (("c", "uid_ur_5"), ("b", "uid_ur_6"), ("a", "uid_ur_7")), start=1_700_000_010
+        ):
+            (unreleased / f"{slug}.{uid}.txt").write_text("comment")
+            commit_all(repository, timestamp)
+
+        scanner = GitVersionScanner(
+            repository / "changes", "unreleased", change_order=change_order
+        )
+        assert scanner.get_changes(None)[-3:] == ("uid_ur_5", "uid_ur_6", "uid_ur_7")
+
+    def test_packed_version(self, repository, monkeypatch):
+        monkeypatch.setattr("chango._utils.files._GIT_HELPER.git_available", False)
+        directory_scanner = DirectoryVersionScanner(repository / "changes", "unreleased")
+        expected = {
+            uid: directory_scanner.read_change_note_bytes(uid)
+            for uid in directory_scanner.get_changes("1.2")
+        }
+        pack_path = directory_scanner.pack_version("1.2")
+        commit_all(repository, 1_700_000_002)
+
+        scanner = GitVersionScanner(repository / "changes", "unreleased")
+        assert scanner.is_available(Version("1.2", dtm.date(2024, 1, 2)))
+        assert scanner.get_changes("1.2") == tuple(expected)
+        for uid, data in expected.items():
+            info = scanner.lookup_change_note(uid)
+            assert info.version == Version("1.2", dtm.date(2024, 1, 2))
+            assert info.file_path.parent == pack_path
+            assert scanner.read_change_note_bytes(uid) == data
+        scanner.close()
@@ -5,11 +5,13 @@ import datetime as dtm
 from pathlib import Path
 
 import pytest
+from docutils import nodes
 
 from chango import Version
 from chango.concrete import CommentChangeNote, CommentVersionNote, HeaderVersionHistory
 from chango.constants import MarkupLanguage
-from chango.error import UnsupportedMarkupError
+from chango.error import UnsupportedMarkupError, ValidationError
+from tests.auxil.docutils import format_nodes, parse_rst
 from tests.auxil.files import data_path
 
 
@@ -66,3 +68,86 @@ class TestHeaderVersionHistory:
         version_history = HeaderVersionHistory()
         with pytest.raises(UnsupportedMarkupError, match="Got unsupported markup 'unsupported'"):
             version_history.render("unsupported")
+
+    @pytest.mark.parametrize(
+        "markup", [MarkupLanguage.MARKDOWN, MarkupLanguage.HTML, MarkupLanguage.RESTRUCTUREDTEXT]
+    )
+    @pytest.mark.parametrize(
+        "unreleased_changes", [False, True], ids=["without-unreleased", "with-unreleased"]
+    )
+    def test_merge_fragments(self, unreleased_changes: bool, markup: MarkupLanguage):
+        version_history = HeaderVersionHistory()
+        for version_note in self.get_version_notes(unreleased_changes=unreleased_changes):
+            version_history.add_version_note(version_note)
+
+        fragments = version_history.render_fragments(markup)
+        merged = HeaderVersionHistory().merge_fragments(reversed(fragments))
+        assert merged == version_history.render(markup)
+
+    def test_merge_fragments_same_date(self):
+        # Versions released on the same day are rendered in insertion order
+        date = dtm.date(2024, 1, 1)
+        version_history = HeaderVersionHistory()
+        for uid in ["1.1", "1.0", "1.2"]:
+            version_history.add_version_note(CommentVersionNote(version=Version(uid, date)))
+        positions = {uid: position for position, uid in enumerate(version_history)}
+
+        # Fragments rendered from different version histories, e.g. in different processes
+        fragments = []
+        for uid in ["1.2", "1.0", "1.1"]:
+            partial_history = HeaderVersionHistory()
+            partial_history.add_version_note(version_history[uid])
+            fragments.extend(
+                partial_history.render_fragments(MarkupLanguage.MARKDOWN, positions=positions)
+            )
+
+        assert HeaderVersionHistory().merge_fragments(fragments) == version_history.render(
+            MarkupLanguage.MARKDOWN
+        )
+
+    def test_merge_fragments_duplicate(self):
+        version_history = HeaderVersionHistory()
+        version_history.add_version_note(self.get_version_notes(unreleased_changes=False)[0])
+        fragments = version_history.render_fragments(MarkupLanguage.MARKDOWN)
+        with pytest.raises(ValidationError, match=r"more than one fragment for version '1\.0\.0'"):
+            HeaderVersionHistory().merge_fragments(fragments * 2)
+
+    def test_merge_fragments_different_markup(self):
+        version_history = HeaderVersionHistory()
+        for version_note in self.get_version_notes(unreleased_changes=False)[:2]:
+            version_history.add_version_note(version_note)
+        fragments = [
+            version_history.render_fragments(MarkupLanguage.MARKDOWN, uids=["1.0.0"])[0],
+            version_history.render_fragments(MarkupLanguage.HTML, uids=["1.0.1"])[0],
+        ]
+        with pytest.raises(ValidationError, match="different markup languages"):
+            HeaderVersionHistory().merge_fragments(fragments)
+
+    @pytest.mark.parametrize(
+        "unreleased_changes", [False, True], ids=["without-unreleased", "with-unreleased"]
+    )
+    def test_build_nodes(self, unreleased_changes: bool):
+        version_history = HeaderVersionHistory()
+        for version_note in self.get_version_notes(unreleased_changes=unreleased_changes):
+            version_history.add_version_note(version_note)
+
+        built = version_history.build_nodes(lambda note: note.build_nodes())
+        assert format_nodes(built) == format_nodes(
+            parse_rst(version_history.render(MarkupLanguage.RESTRUCTUREDTEXT))
+        )
+        assert all(section["names"] and not section["ids"] for section in built)
+
+    def test_build_nodes_callback(self):
+        version_history = HeaderVersionHistory()
+        for version_note in self.get_version_notes(unreleased_changes=True):
+            version_history.add_version_note(version_note)
+
+        received = []
+
+        def build_version_note_nodes(note):
+            received.append(note.uid)
+            return [nodes.paragraph(text=f"built {note.uid}")]
+
+        built = version_history.build_nodes(build_version_note_nodes)
+        assert received == [None, "1.0.2", "1.0.1", "1.0.0"]
+        assert built[1].children[-1].astext() == "built 1.0.2"
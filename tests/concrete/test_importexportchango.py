@@ -0,0 +1,53 @@
+#  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
+#
+#  SPDX-License-Identifier: MIT
+
+import pytest
+
+from chango.concrete import (
+    CommentChangeNote,
+    CommentVersionNote,
+    HeaderVersionHistory,
+    MemoryChanGo,
+    MemoryVersionScanner,
+    SQLiteChanGo,
+    SQLiteVersionScanner,
+)
+from tests.auxil.chango import build_directory_chango, render_versions
+from tests.auxil.files import data_path
+
+DATA_ROOT = data_path("directoryversionscanner")
+NOTE_COUNT = 15
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def chango(request, tmp_path):
+    kwargs = {
+        "change_note_type": CommentChangeNote,
+        "version_note_type": CommentVersionNote,
+        "version_history_type": HeaderVersionHistory,
+    }
+    if request.param == "memory":
+        yield MemoryChanGo(scanner=MemoryVersionScanner(), **kwargs)
+        return
+
+    scanner = SQLiteVersionScanner(tmp_path / "changes.sqlite")
+    yield SQLiteChanGo(scanner=scanner, **kwargs)
+    scanner.close()
+
+
+class TestImportExportChanGo:
+    def test_import_export_roundtrip(self, chango, tmp_path, monkeypatch):
+        monkeypatch.setattr("chango._utils.files._GIT_HELPER.git_available", False)
+        source = build_directory_chango(DATA_ROOT)
+        expected = render_versions(source)
+
+        assert chango.import_from(source) == NOTE_COUNT
+        assert render_versions(chango) == expected
+
+        target_directory = tmp_path / "exported"
+        (target_directory / "unreleased").mkdir(parents=True)
+        target = build_directory_chango(target_directory)
+        assert chango.export_to(target) == NOTE_COUNT
+        target.scanner.invalidate_caches()
+        assert render_versions(target) == expected
@@ -0,0 +1,68 @@
+#  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
+#
+#  SPDX-License-Identifier: MIT
+
+import datetime as dtm
+from pathlib import Path
+
+import pytest
+
+from chango import Version
+from chango.concrete import (
+    CommentChangeNote,
+    CommentVersionNote,
+    HeaderVersionHistory,
+    MemoryChanGo,
+    MemoryVersionScanner,
+)
+from chango.concrete.sections import GitHubSectionChangeNote, Section, SectionVersionNote
+from chango.constants import MarkupLanguage
+from chango.error import ChanGoError
+
+
+@pytest.fixture
+def chango() -> MemoryChanGo:
+    return MemoryChanGo(
+        change_note_type=CommentChangeNote,
+        version_note_type=CommentVersionNote,
+        version_history_type=HeaderVersionHistory,
+        scanner=MemoryVersionScanner(),
+    )
+
+
+class TestMemoryChanGo:
+    def test_init(self, chango):
+        assert chango.change_note_type is CommentChangeNote
+        assert chango.version_note_type is CommentVersionNote
+        assert chango.version_history_type is HeaderVersionHistory
+        assert isinstance(chango.scanner, MemoryVersionScanner)
+
+    def test_build_version_note_sections(self):
+        chango = MemoryChanGo(
+            change_note_type=GitHubSectionChangeNote.with_sections([Section(uid="a", title="A")]),
+            version_note_type=SectionVersionNote,
+            version_history_type=HeaderVersionHistory,
+            scanner=MemoryVersionScanner(),
+        )
+        assert isinstance(chango.build_version_note(None), SectionVersionNote)
+
+    def test_write_load_change_note(self, chango):
+        note = chango.build_template_change_note("slug")
+        assert chango.write_change_note(note, None) == Path(note.file_name)
+        assert chango.load_change_note(note.uid) is note
+        assert chango.scanner.get_changes(None) == (note.uid,)
+
+    def test_release(self, chango):
+        version = Version("1.0", dtm.date(2024, 1, 1))
+        assert not chango.release(version)
+
+        notes = [chango.build_template_change_note(f"slug-{idx}") for idx in range(3)]
+        for note in notes:
+            chango.write_change_note(note, None)
+        assert chango.release(version)
+        assert chango.scanner.get_changes(version) == tuple(note.uid for note in notes)
+        assert chango.load_version_history().render(MarkupLanguage.MARKDOWN).startswith("# 1.0")
+
+    def test_get_write_directory(self, chango):
+        with pytest.raises(ChanGoError, match="in memory"):
+            chango.get_write_directory("uid", None)
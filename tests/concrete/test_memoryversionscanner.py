@@ -0,0 +1,110 @@
+#  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
+#
+#  SPDX-License-Identifier: MIT
+
+import datetime as dtm
+from pathlib import Path
+
+import pytest
+
+from chango import Version
+from chango.concrete import CommentChangeNote, MemoryVersionScanner
+from chango.error import ChanGoError
+
+
+@pytest.fixture
+def scanner() -> MemoryVersionScanner:
+    scanner = MemoryVersionScanner()
+    for version in TestMemoryVersionScanner.VERSIONS:
+        for idx in range(2):
+            scanner.add_change_note(
+                CommentChangeNote(slug="slug", uid=f"{version.uid}_{idx}", comment="comment"),
+                version,
+            )
+    scanner.add_change_note(CommentChangeNote(slug="slug", uid="ur", comment="comment"), None)
+    return scanner
+
+
+class TestMemoryVersionScanner:
+    VERSIONS = (
+        Version("1.1", dtm.date(2024, 1, 1)),
+        Version("1.3", dtm.date(2024, 1, 3)),
+        Version("1.2", dtm.date(2024, 1, 2)),
+    )
+
+    @pytest.mark.parametrize(
+        ("version", "expected"),
+        [
+            ("1.1", True),
+            (Version("1.1", dtm.date(2024, 1, 1)), True),
+            (Version("1.1", dtm.date(2024, 5, 1)), False),
+            ("1.4", False),
+            (None, True),
+        ],
+    )
+    def test_is_available(self, scanner, version, expected):
+        assert scanner.is_available(version) is expected
+
+    def test_empty(self):
+        scanner = MemoryVersionScanner()
+        assert not scanner.has_unreleased_changes()
+        assert scanner.get_available_versions() == ()
+        assert scanner.get_changes(None) == ()
+        with pytest.raises(ChanGoError, match="No versions available"):
+            scanner.get_latest_version()
+
+    def test_get_latest_version(self, scanner):
+        assert scanner.get_latest_version() == self.VERSIONS[1]
+
+    def test_get_available_versions(self, scanner):
+        assert scanner.get_available_versions() == tuple(
+            sorted(self.VERSIONS, key=lambda version: version.date)
+        )
+        assert scanner.get_available_versions(start_from="1.2") == self.VERSIONS[2:0:-1]
+        assert scanner.get_available_versions(end_at="1.1") == self.VERSIONS[:1]
+
+    def test_lookup_change_note(self, scanner):
+        info = scanner.lookup_change_note("1.2_0")
+        assert info.uid == "1.2_0"
+        assert info.version == self.VERSIONS[2]
+        assert info.file_path == Path("slug.1.2_0.txt")
+        assert scanner.lookup_change_note("ur").version is None
+
+        with pytest.raises(ChanGoError, match="not found"):
+            scanner.lookup_change_note("unknown")
+        with pytest.raises(ChanGoError, match="not found"):
+            scanner.get_change_note("unknown")
+
+    def test_get_version(self, scanner):
+        assert scanner.get_version("1.3") == self.VERSIONS[1]
+        with pytest.raises(ChanGoError, match="not available"):
+            scanner.get_version("1.4")
+
+    def test_get_changes(self, scanner):
+        assert scanner.get_changes("1.1") == ("1.1_0", "1.1_1")
+        assert scanner.get_changes(self.VERSIONS[1]) == ("1.3_0", "1.3_1")
+        assert scanner.get_changes(None) == ("ur",)
+        with pytest.raises(ChanGoError, match="not available"):
+            scanner.get_changes("1.4")
+
+    def test_add_change_note(self, scanner):
+        note = scanner.get_change_note("1.1_0")
+        scanner.add_change_note(note, "1.2")
+        assert scanner.get_changes("1.1") == ("1.1_1",)
+        assert scanner.get_changes("1.2") == ("1.2_0", "1.2_1", "1.1_0")
+        assert scanner.lookup_change_note("1.1_0").version == self.VERSIONS[2]
+
+        with pytest.raises(ChanGoError, match="not available yet"):
+            scanner.add_change_note(note, "1.4")
+        with pytest.raises(ChanGoError, match="already available"):
+            scanner.add_change_note(note, Version("1.1", dtm.date(2024, 2, 2)))
+
+    def test_release_changes(self, scanner):
+        version = Version("1.4", dtm.date(2024, 1, 4))
+        assert scanner.release_changes(version)
+        assert scanner.get_changes(version) == ("ur",)
+        assert not scanner.has_unreleased_changes()
+        assert scanner.lookup_change_note("ur").version == version
+
+        assert not scanner.release_changes(Version("1.5", dtm.date(2024, 1, 5)))
+        assert not scanner.is_available("1.5")
@@ -0,0 +1,139 @@
+#  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
+#
+#  SPDX-License-Identifier: MIT
+
+import datetime as dtm
+import shutil
+
+import pytest
+
+from chango import Version
+from chango.concrete import (
+    CommentChangeNote,
+    CommentVersionNote,
+    HeaderVersionHistory,
+    SQLiteChanGo,
+    SQLiteVersionScanner,
+)
+from chango.concrete.sections import (
+    GitHubSectionChangeNote,
+    PullRequest,
+    Section,
+    SectionVersionNote,
+)
+from chango.error import ChanGoError
+from tests.auxil.chango import build_directory_chango
+from tests.auxil.files import data_path
+
+
+@pytest.fixture
+def chango(tmp_path):
+    scanner = SQLiteVersionScanner(tmp_path / "changes.sqlite")
+    yield SQLiteChanGo(
+        change_note_type=CommentChangeNote,
+        version_note_type=CommentVersionNote,
+        version_history_type=HeaderVersionHistory,
+        scanner=scanner,
+    )
+    scanner.close()
+
+
+class TestSQLiteChanGo:
+    DATA_ROOT = data_path("directoryversionscanner")
+
+    def test_init(self, chango):
+        assert chango.encoding == "utf-8"
+        assert chango.change_note_type is CommentChangeNote
+        assert chango.version_note_type is CommentVersionNote
+        assert chango.version_history_type is HeaderVersionHistory
+        assert isinstance(chango.scanner, SQLiteVersionScanner)
+
+    def test_build_version_note_sections(self, tmp_path):
+        chango = SQLiteChanGo(
+            change_note_type=GitHubSectionChangeNote.with_sections([Section(uid="a", title="A")]),
+            version_note_type=SectionVersionNote,
+            version_history_type=HeaderVersionHistory,
+            scanner=SQLiteVersionScanner(tmp_path / "changes.sqlite"),
+        )
+        assert isinstance(chango.build_version_note(None), SectionVersionNote)
+
+    def test_write_change_note(self, chango):
+        note = chango.build_template_change_note("slug")
+        note.comment = "comment"
+
+        path = chango.write_change_note(note, None)
+        assert path == chango.scanner.lookup_change_note(note.uid).file_path
+        assert chango.load_change_note(note.uid).comment == "comment"
+
+        # Overwriting keeps the position
+        other = chango.build_template_change_note("other")
+        chango.write_change_note(other, None)
+        note.comment = "updated"
+        chango.write_change_note(note, None)
+        assert chango.scanner.get_changes(None) == (note.uid, other.uid)
+        assert chango.load_change_note(note.uid).comment == "updated"
+
+    def test_write_change_note_version(self, chango):
+        version = Version("1.0", dtm.date(2024, 1, 1))
+        note = chango.build_template_change_note("slug")
+        with pytest.raises(ChanGoError, match="not available yet"):
+            chango.write_change_note(note, "1.0")
+
+        chango.write_change_note(note, version)
+        assert chango.scanner.get_changes("1.0") == (note.uid,)
+        chango.write_change_note(chango.build_template_change_note("slug"), "1.0")
+        assert chango.scanner.get_changes(version)[0] == note.uid
+        assert len(chango.scanner.get_changes(version)) > 1
+
+        with pytest.raises(ChanGoError, match="already available"):
+            chango.write_change_note(note, Version("1.0", dtm.date(2024, 2, 2)))
+        # The failed transaction did not modify the database
+        assert chango.scanner.get_changes(version)[0] == note.uid
+
+    def test_write_change_note_pull_requests(self, tmp_path):
+        chango = SQLiteChanGo(
+            change_note_type=GitHubSectionChangeNote.with_sections([Section(uid="a", title="A")]),
+            version_note_type=SectionVersionNote,
+            version_history_type=HeaderVersionHistory,
+            scanner=SQLiteVersionScanner(tmp_path / "changes.sqlite"),
+        )
+        note = chango.change_note_type(
+            slug="slug", a="content", pull_requests=(PullRequest(uid="1", author_uids=("a",)),)
+        )
+        chango.write_change_note(note, None)
+        assert chango.scanner.get_changes_by_pull_request("1") == (note.uid,)
+        assert chango.scanner.get_changes_by_pull_request("2") == ()
+
+        note.pull_requests = (PullRequest(uid="2", author_uids=("a",)),)
+        chango.write_change_note(note, None)
+        assert chango.scanner.get_changes_by_pull_request("1") == ()
+        assert chango.scanner.get_changes_by_pull_request("2") == (note.uid,)
+        chango.scanner.close()
+
+    def test_release(self, chango):
+        version = Version("1.0", dtm.date(2024, 1, 1))
+        assert not chango.release(version)
+        assert not chango.scanner.is_available("1.0")
+
+        notes = [chango.build_template_change_note(f"slug-{idx}") for idx in range(3)]
+        for note in notes:
+            chango.write_change_note(note, None)
+
+        assert chango.release(version)
+        assert not chango.scanner.has_unreleased_changes()
+        assert chango.scanner.get_changes(version) == tuple(note.uid for note in notes)
+
+    def test_get_write_directory(self, chango):
+        with pytest.raises(ChanGoError, match="database"):
+            chango.get_write_directory("uid", None)
+
+    def test_import_overwrites(self, chango, tmp_path):
+        base_directory = tmp_path / "changes"
+        shutil.copytree(self.DATA_ROOT, base_directory)
+        source = build_directory_chango(base_directory)
+        chango.import_from(source)
+
+        (base_directory / "unreleased" / "comment-change-note.uid_ur_0.txt").write_text("new")
+        chango.import_from(source)
+        assert chango.load_change_note("uid_ur_0").comment == "new"
+        assert set(chango.scanner.get_changes(None)) == {f"uid_ur_{idx}" for idx in range(3)}
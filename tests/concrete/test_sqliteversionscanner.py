@@ -0,0 +1,140 @@
+#  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
+#
+#  SPDX-License-Identifier: MIT
+
+import datetime as dtm
+from pathlib import Path
+
+import pytest
+
+from chango import Version
+from chango.concrete import (
+    CommentChangeNote,
+    CommentVersionNote,
+    DirectoryChanGo,
+    DirectoryVersionScanner,
+    HeaderVersionHistory,
+    SQLiteChanGo,
+    SQLiteVersionScanner,
+)
+from chango.error import ChanGoError
+from tests.auxil.files import data_path
+
+
+@pytest.fixture
+def scanner(tmp_path):
+    scanner = SQLiteVersionScanner(tmp_path / "changes.sqlite")
+    chango = SQLiteChanGo(
+        change_note_type=CommentChangeNote,
+        version_note_type=CommentVersionNote,
+        version_history_type=HeaderVersionHistory,
+        scanner=scanner,
+    )
+    chango.import_from(
+        DirectoryChanGo(
+            change_note_type=CommentChangeNote,
+            version_note_type=CommentVersionNote,
+            version_history_type=HeaderVersionHistory,
+            scanner=DirectoryVersionScanner(data_path("directoryversionscanner"), "unreleased"),
+        )
+    )
+    yield scanner
+    scanner.close()
+
+
+class TestSQLiteVersionScanner:
+    def test_init(self, tmp_path):
+        scanner = SQLiteVersionScanner(tmp_path / "changes.sqlite")
+        assert scanner.database == tmp_path / "changes.sqlite"
+        # The database is only created on first use
+        assert not scanner.database.exists()
+        assert not scanner.has_unreleased_changes()
+        assert scanner.database.is_file()
+        scanner.close()
+
+    def test_init_relative(self):
+        scanner = SQLiteVersionScanner("changes.sqlite")
+        assert scanner.database == Path(__file__).parent / "changes.sqlite"
+
+    def test_directory_not_exists(self):
+        with pytest.raises(ValueError, match="does not exist"):
+            SQLiteVersionScanner("does_not_exist/changes.sqlite")
+
+    @pytest.mark.parametrize(
+        ("version", "expected"),
+        [
+            ("1.1", True),
+            (Version("1.1", dtm.date(2024, 1, 1)), True),
+            (Version("1.1", dtm.date(2024, 5, 1)), False),
+            ("1.4", False),
+            (None, True),
+        ],
+    )
+    def test_is_available(self, scanner, version, expected):
+        assert scanner.is_available(version) is expected
+
+    def test_get_latest_version(self, scanner):
+        assert scanner.get_latest_version() == Version("1.3.1", dtm.date(2024, 1, 3))
+
+    def test_get_latest_version_empty(self, tmp_path):
+        scanner = SQLiteVersionScanner(tmp_path / "changes.sqlite")
+        with pytest.raises(ChanGoError, match="No versions available"):
+            scanner.get_latest_version()
+        scanner.close()
+
+    # Binding a sequence to placeholders that sqlite3 considers named is deprecated
+    @pytest.mark.filterwarnings("error::DeprecationWarning")
+    def test_get_available_versions(self, scanner):
+        assert scanner.get_available_versions() == (
+            Version("1.1", dtm.date(2024, 1, 1)),
+            Version("1.2", dtm.date(2024, 1, 2)),
+            Version("1.3", dtm.date(2024, 1, 3)),
+            Version("1.3.1", dtm.date(2024, 1, 3)),
+        )
+        assert scanner.get_available_versions(start_from="1.2", end_at="1.3") == (
+            Version("1.2", dtm.date(2024, 1, 2)),
+            Version("1.3", dtm.date(2024, 1, 3)),
+        )
+
+    def test_lookup_change_note(self, scanner):
+        info = scanner.lookup_change_note("uid_1-2_1")
+        assert info.uid == "uid_1-2_1"
+        assert info.version == Version("1.2", dtm.date(2024, 1, 2))
+        assert info.file_path == scanner.database / "comment-change-note.uid_1-2_1.txt"
+        assert scanner.lookup_change_note("uid_ur_0").version is None
+
+        with pytest.raises(ChanGoError, match="not found"):
+            scanner.lookup_change_note("unknown")
+
+    def test_get_version(self, scanner):
+        assert scanner.get_version("1.3") == Version("1.3", dtm.date(2024, 1, 3))
+        with pytest.raises(ChanGoError, match="not available"):
+            scanner.get_version("1.4")
+
+    @pytest.mark.parametrize("version", ["1.1", Version("1.2", dtm.date(2024, 1, 2)), None])
+    def test_get_changes(self, scanner, version):
+        uid = version.uid if isinstance(version, Version) else (version or "ur")
+        # Import preserves the order of the source
+        assert scanner.get_changes(version) == tuple(
+            f"uid_{uid.replace('.', '-')}_{idx}" for idx in range(3)
+        )
+
+    def test_get_changes_not_found(self, scanner):
+        with pytest.raises(ChanGoError, match="not available"):
+            scanner.get_changes("1.4")
+
+    def test_read_change_note_bytes(self, scanner):
+        assert scanner.read_change_note_bytes("uid_1-1_0") == b"this is a comment"
+        with pytest.raises(ChanGoError, match="not found"):
+            scanner.read_change_note_bytes("unknown")
+
+    def test_transaction_rollback(self, scanner):
+        def delete_all():
+            with scanner.transaction() as connection:
+                connection.execute("DELETE FROM change_notes")
+                raise RuntimeError
+
+        with pytest.raises(RuntimeError):
+            delete_all()
+        assert scanner.has_unreleased_changes()
+        assert scanner.get_changes("1.1")
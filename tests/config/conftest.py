@@ -0,0 +1,31 @@
+#  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
+#
+#  SPDX-License-Identifier: MIT
+import sys
+from pathlib import Path
+
+import pytest
+import shortuuid
+
+from chango.config import ChanGoConfig
+
+
+@pytest.fixture
+def project(tmp_path) -> Path:
+    module_name = f"chango_config_module_{shortuuid.uuid()}"
+    (tmp_path / f"{module_name}.py").write_text("chango_instance = object()\n")
+    (tmp_path / "pyproject.toml").write_text(
+        "[tool.chango]\n"
+        'sys_path = "."\n'
+        f'chango_instance = {{ name = "chango_instance", module = "{module_name}" }}\n'
+    )
+    yield tmp_path
+    # The module is imported by the tests
+    sys.modules.pop(module_name, None)
+
+
+@pytest.fixture
+def config(project) -> ChanGoConfig:
+    config = ChanGoConfig.load(project)
+    config.import_chango_instance()
+    return config
@@ -6,7 +6,9 @@ from contextlib import contextmanager
 from pathlib import Path
 from types import SimpleNamespace
 
-from chango.config import ChanGoConfig, get_chango_instance
+import pytest
+
+from chango.config import CONFIG_CACHE_DIR_ENV_VAR, ChanGoConfig, get_chango_instance
 
 
 @contextmanager
@@ -38,3 +40,57 @@ class TestConfigModule:
 
         # to ensure that other tests still pass
         get_chango_instance.cache_clear()
+
+    @pytest.fixture
+    def load_calls(self, monkeypatch) -> list:
+        load_calls = []
+        load = ChanGoConfig.load
+
+        def spy(path=None):
+            load_calls.append(path)
+            return load(path)
+
+        monkeypatch.setattr(ChanGoConfig, "load", spy)
+        yield load_calls
+        get_chango_instance.cache_clear()
+
+    def test_get_chango_instance_shared_per_path(self, project, load_calls):
+        with temporary_chdir(project):
+            instance = get_chango_instance()
+            assert get_chango_instance(".") is instance
+            assert get_chango_instance(project) is instance
+            assert get_chango_instance(str(project / "pyproject.toml")) is instance
+        assert load_calls == [None]
+
+    def test_get_chango_instance_persistent_cache(
+        self, project, load_calls, monkeypatch, tmp_path
+    ):
+        monkeypatch.setenv(CONFIG_CACHE_DIR_ENV_VAR, str(tmp_path / "cache"))
+        instance = get_chango_instance(project)
+        assert len(load_calls) == 1
+
+        # Simulates a new process
+        get_chango_instance.cache_clear()
+        assert get_chango_instance(project) is instance
+        assert len(load_calls) == 1
+
+        (project / "pyproject.toml").write_text(
+            (project / "pyproject.toml").read_text() + "\n# comment\n"
+        )
+        get_chango_instance.cache_clear()
+        assert get_chango_instance(project) is instance
+        assert len(load_calls) == 2  # noqa: PLR2004
+
+    @pytest.mark.usefixtures("load_calls")
+    def test_get_chango_instance_imports_once(self, project, monkeypatch, tmp_path):
+        monkeypatch.setenv(CONFIG_CACHE_DIR_ENV_VAR, str(tmp_path / "cache"))
+        import_calls = []
+        import_chango_instance = ChanGoConfig.import_chango_instance
+
+        def spy(self):
+            import_calls.append(self)
+            return import_chango_instance(self)
+
+        monkeypatch.setattr(ChanGoConfig, "import_chango_instance", spy)
+        get_chango_instance(project)
+        assert len(import_calls) == 1
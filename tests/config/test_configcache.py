@@ -0,0 +1,69 @@
+#  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
+#
+#  SPDX-License-Identifier: MIT
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from chango.config import ChanGoConfig, ConfigCache
+
+
+def touch(path: Path) -> None:
+    """Ensure a different modification time, independent of the file system resolution."""
+    os.utime(path, ns=(time.time_ns() + 10**9, time.time_ns() + 10**9))
+
+
+class TestConfigCache:
+    @pytest.fixture
+    def cache(self, tmp_path) -> ConfigCache:
+        return ConfigCache(tmp_path / "cache")
+
+    def test_get_missing(self, cache, project):
+        assert cache.get(project / "pyproject.toml") is None
+
+    def test_set_get(self, cache, config, project):
+        pyproject_toml_path = project / "pyproject.toml"
+        cache.set(pyproject_toml_path, config)
+
+        cached = cache.get(pyproject_toml_path)
+        assert cached == config
+        assert cached.sys_path == project.resolve()
+        assert cached.import_chango_instance() is config.import_chango_instance()
+
+    def test_invalidated_by_pyproject_toml(self, cache, config, project):
+        pyproject_toml_path = project / "pyproject.toml"
+        cache.set(pyproject_toml_path, config)
+        touch(pyproject_toml_path)
+        assert cache.get(pyproject_toml_path) is None
+
+    def test_invalidated_by_module(self, cache, config, project):
+        pyproject_toml_path = project / "pyproject.toml"
+        cache.set(pyproject_toml_path, config)
+        touch(project / f"{config.chango_instance.module}.py")
+        assert cache.get(pyproject_toml_path) is None
+
+    def test_invalidated_by_chango_version(self, cache, config, project, monkeypatch):
+        pyproject_toml_path = project / "pyproject.toml"
+        cache.set(pyproject_toml_path, config)
+        monkeypatch.setattr("chango.config._cache.__version__", "0.0.0")
+        assert cache.get(pyproject_toml_path) is None
+
+    @pytest.mark.parametrize("content", ["not json", "[]", '{"chango_version": 1}'])
+    def test_invalid_entry(self, cache, config, project, content):
+        pyproject_toml_path = project / "pyproject.toml"
+        cache.set(pyproject_toml_path, config)
+        for path in cache.directory.iterdir():
+            path.write_text(content)
+        assert cache.get(pyproject_toml_path) is None
+
+    def test_get_does_not_parse_pyproject_toml(self, cache, config, project, monkeypatch):
+        pyproject_toml_path = project / "pyproject.toml"
+        cache.set(pyproject_toml_path, config)
+
+        def fail(*_, **__):
+            raise AssertionError("Settings sources must not be used")
+
+        monkeypatch.setattr(ChanGoConfig, "settings_customise_sources", fail)
+        assert cache.get(pyproject_toml_path) == config
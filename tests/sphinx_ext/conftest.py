@@ -56,6 +56,20 @@ class MockVersionHistory(SimpleNamespace):
         self.received_kwargs = kwargs
         return self.RENDERED_CONTENT
 
+    def build_nodes(self, build_version_note_nodes) -> None:  # noqa: ARG002
+        return None
+
+
+class MockVersionScanner(SimpleNamespace):
+    def has_unreleased_changes(self) -> bool:
+        return False
+
+    def get_available_versions(self) -> tuple:
+        return ()
+
+    def get_changes(self, uid) -> tuple:  # noqa: ARG002
+        return ()
+
 
 class MockChanGo(SimpleNamespace):
     def __init__(self):
@@ -63,6 +77,7 @@ class MockChanGo(SimpleNamespace):
         self.received_kwargs = None
         self.received_args = None
         self.version_history = MockVersionHistory()
+        self.scanner = MockVersionScanner()
 
     def load_version_history(
         self, *args, start_from: str | None = None, end_at: str | None = None, **kwargs
@@ -1,7 +1,12 @@
 #  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
 #
 #  SPDX-License-Identifier: MIT
+import functools
 import logging
+import multiprocessing
+import os
+import shutil
+import time
 from collections.abc import Callable, Sequence
 from pathlib import Path
 from string import Template
@@ -10,14 +15,24 @@ from typing import Annotated
 import pytest
 import shortuuid
 from _pytest.tmpdir import TempPathFactory
+from sphinx.errors import ExtensionError
 from sphinx.testing.util import SphinxTestApp
 from sphinx.util.logging import pending_warnings
 
 from chango import __version__
 from chango._utils.types import PathLike
+from chango.abc import VersionHistory
+from chango.concrete import (
+    CommentChangeNote,
+    CommentVersionNote,
+    DirectoryChanGo,
+    DirectoryVersionScanner,
+    HeaderVersionHistory,
+)
 from chango.constants import MarkupLanguage
+from chango.sphinx_ext._util import SharedHistoryCache
 from tests.auxil.files import data_path, path_to_python_string
-from tests.sphinx_ext.conftest import MockChanGo, MockStorage
+from tests.sphinx_ext.conftest import MockCGConfig, MockChanGo, MockStorage
 
 MAKE_APP_TYPE = Callable[..., SphinxTestApp]
 
@@ -352,3 +367,383 @@ class TestSphinxExt:
             "end_at": None,
         }
         assert validator_kwargs == {"sequence_validator": "1,2,3", "flag_validator": None}
+
+
+@pytest.fixture
+def change_notes_dir(tmp_path) -> Path:
+    directory = tmp_path / "changes"
+    shutil.copytree(data_path("directoryversionscanner"), directory)
+    return directory
+
+
+@pytest.fixture
+def chango(monkeypatch, change_notes_dir) -> DirectoryChanGo:
+    chango = DirectoryChanGo(
+        change_note_type=CommentChangeNote,
+        version_note_type=CommentVersionNote,
+        version_history_type=HeaderVersionHistory,
+        scanner=DirectoryVersionScanner(change_notes_dir, "unreleased"),
+    )
+    load_version_history = chango.load_version_history
+    chango.load_calls = []
+
+    # Keeps the signature, which is used for parsing the directive options
+    @functools.wraps(load_version_history)
+    def spy(**kwargs):
+        chango.load_calls.append(kwargs)
+        return load_version_history(**kwargs)
+
+    chango.load_version_history = spy
+    monkeypatch.setattr(MockCGConfig, "import_chango_instance", lambda _: chango)
+    return chango
+
+
+class TestHistoryCache:
+    @staticmethod
+    def build(srcdir: Path, make_app: MAKE_APP_TYPE) -> SphinxTestApp:
+        app = make_app(srcdir=srcdir, freshenv=False)
+        TestSphinxExt.assert_successful_build(app)
+        return app
+
+    def test_multiple_directives(self, chango, make_app, tmp_path_factory):
+        directive = """
+.. chango::
+
+.. chango::
+
+.. chango::
+   :start_from: "1.2"
+"""
+        srcdir = TestSphinxExt.create_template(
+            directive_insert=directive, tmp_path_factory=tmp_path_factory
+        )
+        app = self.build(srcdir, make_app)
+
+        # The first two directives share the rendered output
+        assert chango.load_calls == [{}, {"start_from": "1.2"}]
+        content = app.outdir.joinpath("index.html").read_text(encoding="utf-8")
+        # 15 change notes each for the first two directives, 12 for the third one
+        assert content.count("this is a comment") == 42  # noqa: PLR2004
+
+    @pytest.mark.usefixtures("chango")
+    def test_dependencies(self, make_app, tmp_path_factory, change_notes_dir):
+        srcdir = TestSphinxExt.create_template(tmp_path_factory=tmp_path_factory)
+        app = self.build(srcdir, make_app)
+
+        dependencies = {Path(path) for path in app.env.dependencies["index"]}
+        assert (
+            change_notes_dir / "1.1_2024-01-01" / "comment-change-note.uid_1-1_0.txt"
+            in dependencies
+        )
+        assert change_notes_dir / "unreleased" / "comment-change-note.uid_ur_0.txt" in dependencies
+        assert all(path.is_file() for path in dependencies)
+
+    def test_incremental_build(self, chango, make_app, tmp_path_factory, change_notes_dir):
+        srcdir = TestSphinxExt.create_template(tmp_path_factory=tmp_path_factory)
+        self.build(srcdir, make_app)
+        assert len(chango.load_calls) == 1
+
+        # Nothing changed, so the document is not read again
+        self.build(srcdir, make_app)
+        assert len(chango.load_calls) == 1
+
+        # Modified change note
+        path = change_notes_dir / "1.1_2024-01-01" / "comment-change-note.uid_1-1_0.txt"
+        path.write_text("modified comment")
+        os.utime(path, ns=(time.time_ns() + 10**9, time.time_ns() + 10**9))
+        app = self.build(srcdir, make_app)
+        assert len(chango.load_calls) == 2  # noqa: PLR2004
+        assert "modified comment" in app.outdir.joinpath("index.html").read_text("utf-8")
+
+        # Added change note
+        (change_notes_dir / "unreleased" / "comment-change-note.uid_new.txt").write_text(
+            "added comment"
+        )
+        app = self.build(srcdir, make_app)
+        assert len(chango.load_calls) == 3  # noqa: PLR2004
+        assert "added comment" in app.outdir.joinpath("index.html").read_text("utf-8")
+
+    def test_cache_reused_for_unrelated_changes(self, chango, make_app, tmp_path_factory):
+        srcdir = TestSphinxExt.create_template(tmp_path_factory=tmp_path_factory)
+        self.build(srcdir, make_app)
+
+        # The document itself changes, but the change notes don't
+        index = srcdir / "index.rst"
+        index.write_text(index.read_text() + "\nSome more text.\n")
+        os.utime(index, ns=(time.time_ns() + 10**9, time.time_ns() + 10**9))
+        app = self.build(srcdir, make_app)
+
+        assert len(chango.load_calls) == 1
+        assert "Some more text." in app.outdir.joinpath("index.html").read_text("utf-8")
+
+    @staticmethod
+    def get_body(app: SphinxTestApp) -> str:
+        content = app.outdir.joinpath("index.html").read_text(encoding="utf-8")
+        return content[
+            content.index('<div class="body"') : content.index('<div class="sphinxsidebar"')
+        ]
+
+    @pytest.mark.parametrize("headline", ["", "Changelog"], ids=["no_headline", "headline"])
+    def test_nodes_match_text_path(
+        self, chango, make_app, tmp_path_factory, monkeypatch, headline
+    ):
+        directive = f'.. chango:: {headline}\n\n.. chango::\n   :start_from: "1.3"\n'
+        app = self.build(
+            TestSphinxExt.create_template(
+                directive_insert=directive, tmp_path_factory=tmp_path_factory
+            ),
+            make_app,
+        )
+        node_body = self.get_body(app)
+
+        monkeypatch.setattr(HeaderVersionHistory, "build_nodes", VersionHistory.build_nodes)
+        app = self.build(
+            TestSphinxExt.create_template(
+                directive_insert=directive, tmp_path_factory=tmp_path_factory
+            ),
+            make_app,
+        )
+        assert self.get_body(app) == node_body
+        assert chango.load_calls == [{}, {"start_from": "1.3"}] * 2
+
+    @pytest.mark.usefixtures("chango")
+    def test_version_note_nodes_cached(self, make_app, tmp_path_factory, monkeypatch):
+        built = []
+        build_nodes = CommentVersionNote.build_nodes
+
+        def spy(self):
+            built.append(self.uid)
+            return build_nodes(self)
+
+        monkeypatch.setattr(CommentVersionNote, "build_nodes", spy)
+        directive = '.. chango::\n\n.. chango::\n   :start_from: "1.3"\n'
+        app = self.build(
+            TestSphinxExt.create_template(
+                directive_insert=directive, tmp_path_factory=tmp_path_factory
+            ),
+            make_app,
+        )
+
+        # The released versions are built only once, the unreleased changes for each directive
+        assert sorted(built, key=str) == sorted(
+            [None, None, "1.1", "1.2", "1.3", "1.3.1"], key=str
+        )
+        cache = app.env.chango_history_cache
+        assert set(cache.version_note_nodes) == {"1.1", "1.2", "1.3", "1.3.1"}
+        assert len(cache.node_trees) == 2  # noqa: PLR2004
+        assert not cache.renders
+
+    def test_version_note_fallback(self, chango, make_app, tmp_path_factory, change_notes_dir):
+        (change_notes_dir / "1.2_2024-01-02" / "comment-change-note.uid_markup.txt").write_text(
+            "Some *emphasized* text"
+        )
+        app = self.build(
+            TestSphinxExt.create_template(tmp_path_factory=tmp_path_factory), make_app
+        )
+
+        assert "<em>emphasized</em>" in self.get_body(app)
+        cache = app.env.chango_history_cache
+        assert "1.2" not in cache.version_note_nodes
+        # Trees that contain parsed nodes are not cached
+        assert not cache.node_trees
+        assert len(chango.load_calls) == 1
+
+
+class TestSharedHistoryCache:
+    @staticmethod
+    def build_in_process(directory: Path, log: Path) -> None:
+        def build() -> str:
+            with log.open("a") as file:
+                file.write("built\n")
+            time.sleep(0.1)
+            return "rendered"
+
+        assert (
+            SharedHistoryCache(directory).get_or_build("fingerprint", "key", build) == "rendered"
+        )
+
+    def test_get_or_build(self, tmp_path):
+        cache = SharedHistoryCache(tmp_path / "cache")
+        calls = []
+
+        def build() -> str:
+            calls.append(None)
+            return f"rendered {len(calls)}"
+
+        assert cache.get_or_build("fingerprint", "key", build) == "rendered 1"
+        assert cache.get_or_build("fingerprint", "key", build) == "rendered 1"
+        assert cache.get_or_build("fingerprint", "other", build) == "rendered 2"
+        assert cache.get_or_build("other", "key", build) == "rendered 3"
+
+        cache.clear()
+        assert not cache.directory.exists()
+        assert cache.get_or_build("fingerprint", "key", build) == "rendered 4"
+
+    def test_built_once_across_processes(self, tmp_path):
+        log = tmp_path / "log.txt"
+        context = multiprocessing.get_context("fork")
+        processes = [
+            context.Process(target=self.build_in_process, args=(tmp_path / "cache", log))
+            for _ in range(4)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+        assert all(process.exitcode == 0 for process in processes)
+        assert log.read_text() == "built\n"
+
+    def test_parallel_build(self, chango, make_app, tmp_path_factory, tmp_path):
+        log = tmp_path / "log.txt"
+        load_version_history = chango.load_version_history
+
+        # Calls in the worker processes are not visible to the parent process otherwise
+        @functools.wraps(load_version_history)
+        def spy(**kwargs):
+            with log.open("a") as file:
+                file.write("loaded\n")
+            return load_version_history(**kwargs)
+
+        chango.load_version_history = spy
+        documents = [f"doc{i}" for i in range(8)]
+        srcdir = TestSphinxExt.create_template(
+            tmp_path_factory=tmp_path_factory,
+            directive_insert=".. toctree::\n\n" + "\n".join(f"   {doc}" for doc in documents),
+        )
+        for doc in documents:
+            srcdir.joinpath(f"{doc}.rst").write_text(f"{doc}\n====\n\n.. chango::\n")
+
+        app = make_app(srcdir=srcdir, parallel=4)
+        TestSphinxExt.assert_successful_build(app)
+
+        assert log.read_text() == "loaded\n"
+        for doc in documents:
+            content = app.outdir.joinpath(f"{doc}.html").read_text("utf-8")
+            assert content.count("this is a comment") == 15  # noqa: PLR2004
+
+
+@pytest.mark.usefixtures("chango")
+class TestPagination:
+    TOCTREE = ".. toctree::\n\n   changelog/index"
+
+    @staticmethod
+    def create_template(tmp_path_factory: TempPathFactory, pagination: str) -> Path:
+        return TestSphinxExt.create_template(
+            tmp_path_factory=tmp_path_factory,
+            conf_value_insert=f"chango_pagination = {pagination!r}",
+            directive_insert=TestPagination.TOCTREE,
+        )
+
+    @staticmethod
+    def get_mtimes(directory: Path) -> dict[str, int]:
+        return {path.name: path.stat().st_mtime_ns for path in directory.iterdir()}
+
+    def test_version_pages(self, make_app, tmp_path_factory):
+        srcdir = self.create_template(tmp_path_factory, "version")
+        app = TestHistoryCache.build(srcdir, make_app)
+
+        directory = srcdir / "changelog"
+        assert {path.name for path in directory.iterdir()} == {
+            ".chango-pages.json",
+            "index.rst",
+            "unreleased.rst",
+            "1.3.1.rst",
+            "1.3.rst",
+            "1.2.rst",
+            "1.1.rst",
+        }
+        header, entries = directory.joinpath("index.rst").read_text("utf-8").split("\n\n    ")
+        assert header == "=========\nChangelog\n=========\n\n.. toctree::\n    :maxdepth: 1"
+        # Newest first. 1.3 and 1.3.1 were released on the same day
+        pages = entries.split()
+        assert pages[0] == "unreleased"
+        assert set(pages[1:3]) == {"1.3", "1.3.1"}
+        assert pages[3:] == ["1.2", "1.1"]
+        assert directory.joinpath("1.2.rst").read_text("utf-8").startswith("1.2\n===\n")
+
+        content = app.outdir.joinpath("changelog", "1.2.html").read_text("utf-8")
+        assert content.count("this is a comment") == 3  # noqa: PLR2004
+
+    def test_year_pages(self, make_app, tmp_path_factory):
+        srcdir = self.create_template(tmp_path_factory, "year")
+        app = TestHistoryCache.build(srcdir, make_app)
+
+        directory = srcdir / "changelog"
+        assert {path.stem for path in directory.glob("*.rst")} == {"index", "unreleased", "2024"}
+        assert directory.joinpath("2024.rst").read_text("utf-8").startswith("====\n2024\n====\n")
+
+        content = app.outdir.joinpath("changelog", "2024.html").read_text("utf-8")
+        assert content.count("this is a comment") == 12  # noqa: PLR2004
+
+    def test_only_changed_pages_rewritten(self, make_app, tmp_path_factory, change_notes_dir):
+        srcdir = self.create_template(tmp_path_factory, "version")
+        TestHistoryCache.build(srcdir, make_app)
+        directory = srcdir / "changelog"
+        mtimes = self.get_mtimes(directory)
+
+        # Nothing changed, so no page is written again
+        TestHistoryCache.build(srcdir, make_app)
+        assert self.get_mtimes(directory) == mtimes
+
+        path = change_notes_dir / "1.2_2024-01-02" / "comment-change-note.uid_1-2_0.txt"
+        path.write_text("modified comment")
+        os.utime(path, ns=(time.time_ns() + 10**9, time.time_ns() + 10**9))
+        app = TestHistoryCache.build(srcdir, make_app)
+
+        new_mtimes = self.get_mtimes(directory)
+        assert {name for name in mtimes if new_mtimes[name] != mtimes[name]} == {
+            "1.2.rst",
+            ".chango-pages.json",
+        }
+        assert "modified comment" in app.outdir.joinpath("changelog", "1.2.html").read_text(
+            "utf-8"
+        )
+
+    def test_packed_version_rewritten(self, chango, make_app, tmp_path_factory, monkeypatch):
+        monkeypatch.setattr("chango._utils.files._GIT_HELPER.git_available", False)
+        scanner = chango.scanner
+        scanner.pack_version("1.2")
+        srcdir = self.create_template(tmp_path_factory, "version")
+        TestHistoryCache.build(srcdir, make_app)
+        directory = srcdir / "changelog"
+        mtimes = self.get_mtimes(directory)
+
+        version_directory = scanner.unpack_version("1.2")
+        (version_directory / "comment-change-note.uid_1-2_0.txt").write_text("modified comment")
+        pack_path = scanner.pack_version("1.2")
+        os.utime(pack_path, ns=(time.time_ns() + 10**9, time.time_ns() + 10**9))
+        app = TestHistoryCache.build(srcdir, make_app)
+
+        new_mtimes = self.get_mtimes(directory)
+        assert {name for name in mtimes if new_mtimes[name] != mtimes[name]} == {
+            "1.2.rst",
+            ".chango-pages.json",
+        }
+        assert "modified comment" in app.outdir.joinpath("changelog", "1.2.html").read_text(
+            "utf-8"
+        )
+
+    def test_removed_pages(self, make_app, tmp_path_factory, change_notes_dir):
+        srcdir = self.create_template(tmp_path_factory, "version")
+        TestHistoryCache.build(srcdir, make_app)
+        directory = srcdir / "changelog"
+        # Files that were not generated by chango are left untouched
+        directory.joinpath("custom.rst").write_text("Custom\n======\n")
+
+        shutil.rmtree(change_notes_dir / "unreleased")
+        (change_notes_dir / "unreleased").mkdir()
+        TestHistoryCache.build(srcdir, make_app)
+
+        assert not directory.joinpath("unreleased.rst").exists()
+        assert directory.joinpath("custom.rst").exists()
+        assert "unreleased" not in directory.joinpath("index.rst").read_text("utf-8")
+
+    def test_disabled_by_default(self, make_app, tmp_path_factory):
+        srcdir = TestSphinxExt.create_template(tmp_path_factory=tmp_path_factory)
+        TestHistoryCache.build(srcdir, make_app)
+        assert not srcdir.joinpath("changelog").exists()
+
+    def test_invalid_pagination(self, make_app, tmp_path_factory):
+        with pytest.raises(ExtensionError, match="Expected 'chango_pagination' to be one of"):
+            make_app(srcdir=self.create_template(tmp_path_factory, "month"))
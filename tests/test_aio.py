@@ -0,0 +1,131 @@
+#  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
+#
+#  SPDX-License-Identifier: MIT
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from chango.aio import AsyncChanGo
+from chango.concrete import (
+    CachingChanGo,
+    CommentChangeNote,
+    CommentVersionNote,
+    DirectoryChanGo,
+    DirectoryVersionScanner,
+    HeaderVersionHistory,
+)
+from chango.constants import MarkupLanguage
+from tests.auxil.files import data_path
+
+
+@pytest.fixture(scope="module")
+def chango() -> DirectoryChanGo:
+    return DirectoryChanGo(
+        change_note_type=CommentChangeNote,
+        version_note_type=CommentVersionNote,
+        version_history_type=HeaderVersionHistory,
+        scanner=DirectoryVersionScanner(data_path("directoryversionscanner"), "unreleased"),
+    )
+
+
+class TestAsyncChanGo:
+    def test_init(self, chango):
+        executor = ThreadPoolExecutor()
+        async_chango = AsyncChanGo(chango, max_concurrency=2, executor=executor)
+        assert async_chango.chango is chango
+        assert async_chango.max_concurrency == 2  # noqa: PLR2004
+        assert async_chango.executor is executor
+        executor.shutdown()
+
+        with pytest.raises(ValueError, match="at least 1"):
+            AsyncChanGo(chango, max_concurrency=0)
+
+    def test_aload_change_note(self, chango):
+        note = asyncio.run(AsyncChanGo(chango).aload_change_note("uid_1-1_0"))
+        assert note.uid == "uid_1-1_0"
+        assert note.comment == chango.load_change_note("uid_1-1_0").comment
+
+    @pytest.mark.parametrize("version", ["1.2", None])
+    def test_aload_version_note(self, chango, version):
+        version_note = asyncio.run(AsyncChanGo(chango).aload_version_note(version))
+        assert version_note.version == chango.load_version_note(version).version
+        assert list(version_note) == list(chango.load_version_note(version))
+
+    def test_aload_version_note_delegates(self, chango):
+        caching = CachingChanGo(chango)
+        version_note = caching.load_version_note("1.2")
+        # The cached version note is returned instead of loading the change notes again
+        assert asyncio.run(AsyncChanGo(caching).aload_version_note("1.2")) is version_note
+
+    @pytest.mark.parametrize(
+        ("start_from", "end_at"), [(None, None), ("1.2", None), (None, "1.3"), ("1.2", "1.3")]
+    )
+    def test_aload_version_history(self, chango, start_from, end_at):
+        history = asyncio.run(
+            AsyncChanGo(chango).aload_version_history(start_from=start_from, end_at=end_at)
+        )
+        expected = chango.load_version_history(start_from=start_from, end_at=end_at)
+        assert list(history) == list(expected)
+        assert history.render(MarkupLanguage.MARKDOWN) == expected.render(MarkupLanguage.MARKDOWN)
+
+    def test_aiter_version_notes(self, chango):
+        async def collect():
+            return [note async for note in AsyncChanGo(chango).aiter_version_notes()]
+
+        notes = asyncio.run(collect())
+        assert {note.uid for note in notes} == set(chango.load_version_history())
+
+    def test_aiter_version_notes_early_exit(self, chango):
+        async def first():
+            async for note in AsyncChanGo(chango).aiter_version_notes():
+                return note
+            return None
+
+        assert asyncio.run(first()) is not None
+
+    def test_bounded_concurrency(self, chango, monkeypatch):
+        lock = threading.Lock()
+        running = 0
+        max_running = 0
+        original = chango.load_change_note
+
+        def load_change_note(uid):
+            nonlocal running, max_running
+            with lock:
+                running += 1
+                max_running = max(max_running, running)
+            time.sleep(0.01)
+            with lock:
+                running -= 1
+            return original(uid)
+
+        monkeypatch.setattr(chango, "load_change_note", load_change_note)
+        asyncio.run(AsyncChanGo(chango, max_concurrency=2).aload_version_history())
+        assert 1 < max_running <= 2  # noqa: PLR2004
+
+    def test_event_loop_not_blocked(self, chango, monkeypatch):
+        original = chango.load_change_note
+
+        def load_change_note(uid):
+            time.sleep(0.01)
+            return original(uid)
+
+        monkeypatch.setattr(chango, "load_change_note", load_change_note)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        async def main():
+            task = asyncio.create_task(ticker())
+            await AsyncChanGo(chango).aload_version_history()
+            task.cancel()
+
+        asyncio.run(main())
+        assert ticks > 1
@@ -0,0 +1,184 @@
+#  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
+#
+#  SPDX-License-Identifier: MIT
+import datetime as dtm
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from chango import Version
+from chango.concrete import (
+    CommentChangeNote,
+    CommentVersionNote,
+    HeaderVersionHistory,
+    MemoryChanGo,
+    MemoryVersionScanner,
+)
+from chango.concrete.sections import GitHubSectionChangeNote, PullRequest, Section
+from chango.export import ChangeNoteRecord, iter_change_note_records
+
+
+class DummySectionChangeNote(
+    GitHubSectionChangeNote.with_sections(
+        [
+            Section(uid="req_section", title="Required Section", is_required=True),
+            Section(uid="opt_section", title="Optional Section"),
+        ]
+    )
+):
+    OWNER = "my-username"
+    REPOSITORY = "my-repo"
+
+
+VERSIONS = [Version(f"1.{idx}", dtm.date(2024, 1, idx + 1)) for idx in range(8)]
+
+
+@pytest.fixture
+def chango() -> MemoryChanGo:
+    instance = MemoryChanGo(
+        change_note_type=CommentChangeNote,
+        version_note_type=CommentVersionNote,
+        version_history_type=HeaderVersionHistory,
+        scanner=MemoryVersionScanner(),
+    )
+    for version in [None, *VERSIONS]:
+        for idx in range(3):
+            prefix = version.uid if version else "unreleased"
+            instance.write_change_note(
+                CommentChangeNote(slug="slug", comment=f"{prefix} {idx}", uid=f"{prefix}_{idx}"),
+                version,
+            )
+    return instance
+
+
+def expected_uids(versions: list[Version | None]) -> list[str]:
+    return [
+        f"{version.uid if version else 'unreleased'}_{idx}"
+        for version in versions
+        for idx in range(3)
+    ]
+
+
+class TestChangeNoteRecord:
+    def test_comment_change_note(self):
+        record = ChangeNoteRecord.from_change_note(
+            CommentChangeNote(slug="slug", comment="comment", uid="uid"), VERSIONS[0]
+        )
+        assert record == ChangeNoteRecord(
+            "1.0", dtm.date(2024, 1, 1), "uid", "slug", {"comment": "comment"}, ()
+        )
+        assert json.loads(json.dumps(record.to_json())) == {
+            "version_uid": "1.0",
+            "version_date": "2024-01-01",
+            "uid": "uid",
+            "slug": "slug",
+            "fields": {"comment": "comment"},
+            "pull_requests": [],
+        }
+
+    def test_section_change_note(self):
+        change_note = DummySectionChangeNote(
+            slug="slug",
+            uid="uid",
+            req_section="required",
+            pull_requests=(PullRequest(uid="1", author_uids=("author",), closes_threads=("2",)),),
+        )
+        record = ChangeNoteRecord.from_change_note(change_note, None).to_json()
+        assert record["version_uid"] is None
+        assert record["version_date"] is None
+        assert record["fields"] == {"req_section": "required", "opt_section": None}
+        assert record["pull_requests"] == [
+            {"uid": "1", "author_uids": ["author"], "closes_threads": ["2"]}
+        ]
+
+    def test_to_json_known_types(self):
+        record = ChangeNoteRecord(
+            None,
+            None,
+            "uid",
+            "slug",
+            {
+                "date": dtm.date(2024, 1, 1),
+                "timestamp": dtm.datetime(2024, 1, 1, 12, tzinfo=dtm.UTC),
+                "pull_requests": (PullRequest(uid="1", author_uids=("author",)),),
+                "nested": {"numbers": (1, 2.5), "flag": True},
+            },
+            ({"uid": "1", "closes_threads": ("2",)},),
+        )
+        assert json.loads(json.dumps(record.to_json())) == {
+            "version_uid": None,
+            "version_date": None,
+            "uid": "uid",
+            "slug": "slug",
+            "fields": {
+                "date": "2024-01-01",
+                "timestamp": "2024-01-01T12:00:00+00:00",
+                "pull_requests": [{"uid": "1", "author_uids": ["author"], "closes_threads": []}],
+                "nested": {"numbers": [1, 2.5], "flag": True},
+            },
+            "pull_requests": [{"uid": "1", "closes_threads": ["2"]}],
+        }
+
+    def test_to_json_unknown_type(self):
+        record = ChangeNoteRecord(None, None, "uid", "slug", {"path": Path("path")}, ())
+        with pytest.raises(TypeError, match=r"PosixPath|WindowsPath"):
+            record.to_json()
+
+
+class TestIterChangeNoteRecords:
+    def test_order(self, chango):
+        records = list(iter_change_note_records(chango))
+        assert [record.uid for record in records] == expected_uids([*VERSIONS, None])
+        assert records[0].fields == {"comment": "1.0 0"}
+        assert records[-1].version_uid is None
+
+    def test_order_by_date_and_uid(self):
+        instance = MemoryChanGo(
+            change_note_type=CommentChangeNote,
+            version_note_type=CommentVersionNote,
+            version_history_type=HeaderVersionHistory,
+            scanner=MemoryVersionScanner(),
+        )
+        versions = [
+            Version("2.0", dtm.date(2024, 2, 1)),
+            Version("1.1", dtm.date(2024, 1, 1)),
+            Version("1.0", dtm.date(2024, 1, 1)),
+        ]
+        for version in versions:
+            instance.write_change_note(
+                CommentChangeNote(slug="slug", comment="comment", uid=version.uid), version
+            )
+        records = iter_change_note_records(instance)
+        assert [record.version_uid for record in records] == ["1.0", "1.1", "2.0"]
+
+    def test_range(self, chango):
+        records = iter_change_note_records(chango, start_from="1.2", end_at="1.3")
+        assert [record.uid for record in records] == expected_uids(VERSIONS[2:4])
+
+    @pytest.mark.parametrize("prefetch", [0, 1, 3, 100])
+    def test_executor_deterministic(self, chango, prefetch):
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            records = list(iter_change_note_records(chango, executor=executor, prefetch=prefetch))
+        assert records == list(iter_change_note_records(chango))
+
+    def test_executor_lazy(self, chango, monkeypatch):
+        loaded = []
+        lock = threading.Lock()
+        get_changes = chango.scanner.get_changes
+
+        def recording_get_changes(uid):
+            with lock:
+                loaded.append(uid)
+            return get_changes(uid)
+
+        monkeypatch.setattr(chango.scanner, "get_changes", recording_get_changes)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            records = iter_change_note_records(chango, executor=executor, prefetch=2)
+            assert next(records).uid == "1.0_0"
+            # Only the versions within the prefetch window were submitted
+            assert len(loaded) <= 2  # noqa: PLR2004
+            records.close()
+        assert len(loaded) <= 3  # noqa: PLR2004
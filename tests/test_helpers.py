@@ -1,12 +1,16 @@
 #  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
 #
 #  SPDX-License-Identifier: MIT
+import time
 from pathlib import Path
 
-from chango.helpers import change_uid_from_file, ensure_uid
+from chango._utils.filename import FileName
+from chango.helpers import change_uid_from_file, ensure_uid, time_ordered_uid
 
 
 class TestHelpers:
+    ULID_LENGTH = 26
+
     def test_ensure_uid_none(self):
         assert ensure_uid(None) is None
 
@@ -30,3 +34,18 @@ class TestHelpers:
     def test_change_uid_from_file(self):
         assert change_uid_from_file("slug.uid.md") == "uid"
         assert change_uid_from_file(Path("slug.uid.md")) == "uid"
+
+    def test_time_ordered_uid(self):
+        uids = [time_ordered_uid() for _ in range(1000)]
+        assert len(set(uids)) == len(uids)
+        assert uids == sorted(uids)
+        for uid in uids:
+            assert len(uid) == self.ULID_LENGTH
+            assert FileName.from_string(f"slug.{uid}.txt").uid == uid
+
+    def test_time_ordered_uid_time_component(self):
+        first = time_ordered_uid()
+        time.sleep(0.01)
+        second = time_ordered_uid()
+        # The first 10 characters encode the timestamp
+        assert first[:10] < second[:10]
@@ -0,0 +1,64 @@
+#  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
+#
+#  SPDX-License-Identifier: MIT
+import sys
+
+import pytest
+
+import chango
+import chango.concrete
+from chango._version import Version
+from chango.concrete._directorychango import DirectoryChanGo
+from tests.auxil.imports import get_import_time, get_imported_modules
+
+# Generous on purpose to avoid flaky tests on slow machines. Eagerly importing all submodules
+# takes several times as long.
+IMPORT_TIME_BUDGET_US = 50_000
+HEAVY_MODULES = ("docutils", "pydantic", "pydantic_settings", "shortuuid", "tomlkit")
+
+
+class TestImports:
+    def test_import_time_budget(self):
+        assert get_import_time("chango") < IMPORT_TIME_BUDGET_US
+
+    @pytest.mark.parametrize(
+        "code",
+        [
+            "import chango",
+            "import chango; chango.Version; chango.ChangeNoteInfo",
+            "import chango; chango.helpers.change_uid_from_file",
+            "from chango import Version, helpers",
+            "import chango.concrete",
+        ],
+    )
+    def test_heavy_modules_not_imported(self, code):
+        modules = get_imported_modules(code)
+        assert not [module for module in modules if module.split(".")[0] in HEAVY_MODULES]
+
+    @pytest.mark.parametrize(
+        "code",
+        [
+            "from chango.concrete import CommentVersionNote, HeaderVersionHistory",
+            "from chango.concrete.sections import SectionVersionNote",
+        ],
+    )
+    def test_docutils_not_imported(self, code):
+        # docutils is only needed for building nodes in the Sphinx extension
+        modules = get_imported_modules(code)
+        assert not [module for module in modules if module.split(".")[0] == "docutils"]
+
+    @pytest.mark.parametrize("module", [chango, chango.concrete], ids=lambda m: m.__name__)
+    def test_all_attributes_available(self, module):
+        for name in module.__all__:
+            assert getattr(module, name) is not None
+        assert set(module.__all__) <= set(dir(module))
+
+    def test_lazy_attributes_are_identical(self):
+        assert chango.Version is Version
+        assert chango.concrete.DirectoryChanGo is DirectoryChanGo
+        assert chango.concrete.sections is sys.modules["chango.concrete.sections"]
+
+    @pytest.mark.parametrize("module", [chango, chango.concrete], ids=lambda m: m.__name__)
+    def test_unknown_attribute(self, module):
+        with pytest.raises(AttributeError, match=f"module '{module.__name__}' has no attribute"):
+            module.does_not_exist  # noqa: B018
@@ -0,0 +1,253 @@
+#  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
+#
+#  SPDX-License-Identifier: MIT
+import datetime as dtm
+import shutil
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from chango import Version
+from chango.concrete import (
+    CommentChangeNote,
+    CommentVersionNote,
+    HeaderVersionHistory,
+    MemoryChanGo,
+    MemoryVersionScanner,
+)
+from chango.config import clear_chango_instances, get_chango_instance
+from chango.constants import MarkupLanguage
+from chango.error import UnsupportedMarkupError
+from chango.monorepo import MonorepoChanGo, discover_chango_configs
+from tests.auxil.files import data_path
+
+CONFIG_MODULE = """
+from chango.concrete import (
+    CommentChangeNote,
+    CommentVersionNote,
+    DirectoryChanGo,
+    DirectoryVersionScanner,
+    HeaderVersionHistory,
+)
+
+chango_instance = DirectoryChanGo(
+    change_note_type=CommentChangeNote,
+    version_note_type=CommentVersionNote,
+    version_history_type=HeaderVersionHistory,
+    scanner=DirectoryVersionScanner("changes", "unreleased"),
+)
+"""
+
+PYPROJECT_TOML = """
+[tool.chango]
+sys_path = "."
+chango_instance = {{ name = "chango_instance", module = "{module}" }}
+"""
+
+
+def build_memory_chango(versions: dict[Version | None, list[str]]) -> MemoryChanGo:
+    chango = MemoryChanGo(
+        change_note_type=CommentChangeNote,
+        version_note_type=CommentVersionNote,
+        version_history_type=HeaderVersionHistory,
+        scanner=MemoryVersionScanner(),
+    )
+    for version, comments in versions.items():
+        for idx, comment in enumerate(comments):
+            uid = f"{version.uid if version else 'unreleased'}_{idx}"
+            chango.write_change_note(
+                CommentChangeNote(slug="slug", comment=comment, uid=uid), version
+            )
+    return chango
+
+
+@pytest.fixture
+def monorepo() -> MonorepoChanGo:
+    return MonorepoChanGo(
+        {
+            "pkg_b": build_memory_chango(
+                {
+                    Version("2.0", dtm.date(2024, 2, 1)): ["b 2.0"],
+                    Version("1.0", dtm.date(2024, 1, 1)): ["b 1.0"],
+                }
+            ),
+            "pkg_a": build_memory_chango(
+                {
+                    None: ["a unreleased"],
+                    Version("0.2", dtm.date(2024, 1, 15)): ["a 0.2"],
+                    Version("0.1", dtm.date(2024, 1, 1)): ["a 0.1"],
+                }
+            ),
+        }
+    )
+
+
+@pytest.fixture
+def monorepo_root(tmp_path) -> Path:
+    modules = []
+    for package in ["pkg_a", "nested/pkg_b"]:
+        directory = tmp_path / package
+        shutil.copytree(data_path("directoryversionscanner"), directory / "changes")
+        module = f"monorepo_config_{package.replace('/', '_')}"
+        (directory / f"{module}.py").write_text(CONFIG_MODULE)
+        (directory / "pyproject.toml").write_text(PYPROJECT_TOML.format(module=module))
+        modules.append(module)
+
+    # Neither of these must be discovered
+    (tmp_path / "no_chango").mkdir()
+    (tmp_path / "no_chango" / "pyproject.toml").write_text("[tool.other]\nkey = 1\n")
+    (tmp_path / ".hidden").mkdir()
+    (tmp_path / ".hidden" / "pyproject.toml").write_text(PYPROJECT_TOML.format(module="x"))
+
+    yield tmp_path
+
+    for module in modules:
+        sys.modules.pop(module, None)
+
+
+class TestDiscoverChangoConfigs:
+    def test_discover(self, monorepo_root):
+        assert discover_chango_configs(monorepo_root) == {
+            "nested/pkg_b": monorepo_root / "nested" / "pkg_b" / "pyproject.toml",
+            "pkg_a": monorepo_root / "pkg_a" / "pyproject.toml",
+        }
+
+    def test_discover_root(self, tmp_path):
+        (tmp_path / "pyproject.toml").write_text(PYPROJECT_TOML.format(module="module"))
+        assert discover_chango_configs(tmp_path) == {".": tmp_path / "pyproject.toml"}
+
+    def test_discover_empty(self, tmp_path):
+        assert discover_chango_configs(tmp_path) == {}
+
+
+class TestMonorepoChanGo:
+    def test_init(self, monorepo):
+        executor = ThreadPoolExecutor()
+        instance = MonorepoChanGo(monorepo.instances, executor=executor)
+        assert instance.instances == monorepo.instances
+        assert instance.instances is not monorepo.instances
+        assert instance.executor is executor
+        executor.shutdown()
+
+    def test_load_version_notes(self, monorepo):
+        notes = monorepo.load_version_notes()
+        assert [(note.package, note.version_note.uid) for note in notes] == [
+            ("pkg_a", None),
+            ("pkg_b", "2.0"),
+            ("pkg_a", "0.2"),
+            ("pkg_a", "0.1"),
+            ("pkg_b", "1.0"),
+        ]
+        for package, version_note in notes:
+            assert list(version_note) == list(
+                monorepo.instances[package].load_version_note(version_note.version)
+            )
+
+    def test_load_version_notes_filters(self, monorepo):
+        notes = monorepo.load_version_notes(since=dtm.date(2024, 1, 15), include_unreleased=False)
+        assert [(note.package, note.version_note.uid) for note in notes] == [
+            ("pkg_b", "2.0"),
+            ("pkg_a", "0.2"),
+        ]
+
+    def test_load_version_notes_shared_executor(self, monorepo):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            monorepo.executor = executor
+            assert len(monorepo.load_version_notes()) == 5  # noqa: PLR2004
+            # The executor is not shut down by the instance
+            assert executor.submit(lambda: 1).result() == 1
+
+    def test_render_markdown(self, monorepo):
+        assert monorepo.render(MarkupLanguage.MARKDOWN, since=dtm.date(2024, 1, 15)) == (
+            "# Unreleased\n\n"
+            "## pkg_a\n\n- a unreleased\n\n"
+            "# 2024-02-01\n\n"
+            "## pkg_b 2.0\n\n- b 2.0\n\n"
+            "# 2024-01-15\n\n"
+            "## pkg_a 0.2\n\n- a 0.2"
+        )
+
+    def test_render_groups_by_date(self, monorepo):
+        text = monorepo.render(MarkupLanguage.MARKDOWN, include_unreleased=False)
+        assert text.count("# 2024-01-01\n") == 1
+        assert text.index("## pkg_a 0.1") < text.index("## pkg_b 1.0")
+
+    def test_render_html(self, monorepo):
+        text = monorepo.render(MarkupLanguage.HTML, include_unreleased=False)
+        assert text.startswith("<h1>2024-02-01</h1>\n\n<h2>pkg_b 2.0</h2>\n\n<ul>")
+
+    def test_render_rst(self, monorepo):
+        text = monorepo.render(MarkupLanguage.RESTRUCTUREDTEXT)
+        assert text.startswith("Unreleased\n==========\n\npkg_a\n-----\n\n- a unreleased")
+        assert "2024-02-01\n==========\n\npkg_b 2.0\n---------\n\n" in text
+
+    def test_render_unsupported_markup(self, monorepo):
+        with pytest.raises(UnsupportedMarkupError, match="unsupported markup"):
+            monorepo.render(MarkupLanguage.ASCIIDOC)
+
+    def test_write_report(self, monorepo, tmp_path):
+        path = tmp_path / "CHANGES.md"
+        monorepo.write_report(path, MarkupLanguage.MARKDOWN)
+        assert path.read_text(encoding="utf-8") == monorepo.render(MarkupLanguage.MARKDOWN)
+
+    def test_from_root_same_module_name(self, tmp_path):
+        for package in ["a", "b"]:
+            directory = tmp_path / package
+            shutil.copytree(data_path("directoryversionscanner"), directory / "changes")
+            (directory / "config.py").write_text(CONFIG_MODULE)
+            (directory / "pyproject.toml").write_text(PYPROJECT_TOML.format(module="config"))
+
+        monorepo = MonorepoChanGo.from_root(tmp_path)
+        assert {
+            package: instance.scanner.base_directory
+            for package, instance in monorepo.instances.items()
+        } == {"a": tmp_path / "a" / "changes", "b": tmp_path / "b" / "changes"}
+
+    def test_from_root_relative_module(self, tmp_path):
+        for package in ["a", "b"]:
+            directory = tmp_path / package
+            shutil.copytree(data_path("directoryversionscanner"), directory / "changes")
+            (directory / "tools").mkdir()
+            (directory / "tools" / "__init__.py").write_text("")
+            (directory / "tools" / "config.py").write_text(
+                CONFIG_MODULE.replace('"changes"', '"../changes"')
+            )
+            (directory / "pyproject.toml").write_text(
+                "[tool.chango]\n"
+                'sys_path = "."\n'
+                'chango_instance = { name = "chango_instance", module = ".config", '
+                'package = "tools" }\n'
+            )
+
+        monorepo = MonorepoChanGo.from_root(tmp_path)
+        assert {
+            package: instance.scanner.base_directory
+            for package, instance in monorepo.instances.items()
+        } == {"a": tmp_path / "a" / "changes", "b": tmp_path / "b" / "changes"}
+        assert "tools" not in sys.modules
+
+    def test_from_root_reuses_instances(self, monorepo_root):
+        try:
+            instance = get_chango_instance(monorepo_root / "pkg_a" / "pyproject.toml")
+            monorepo = MonorepoChanGo.from_root(monorepo_root)
+            assert monorepo.instances["pkg_a"] is instance
+        finally:
+            clear_chango_instances()
+
+    def test_from_root_module_not_found(self, tmp_path):
+        (tmp_path / "pyproject.toml").write_text(PYPROJECT_TOML.format(module="missing"))
+        with pytest.raises(ModuleNotFoundError, match="No module named 'missing'"):
+            MonorepoChanGo.from_root(tmp_path)
+
+    def test_from_root(self, monorepo_root):
+        monorepo = MonorepoChanGo.from_root(monorepo_root)
+        assert list(monorepo.instances) == ["nested/pkg_b", "pkg_a"]
+        for package, instance in monorepo.instances.items():
+            assert instance.scanner.base_directory == monorepo_root / package / "changes"
+
+        notes = monorepo.load_version_notes()
+        # 4 versions and the unreleased changes per package
+        assert len(notes) == 10  # noqa: PLR2004
+        assert [note.package for note in notes[:2]] == ["nested/pkg_b", "pkg_a"]
@@ -0,0 +1,59 @@
+#  SPDX-FileCopyrightText: 2024-present Hinrich Mahler <chango@mahlerhome.de>
+#
+#  SPDX-License-Identifier: MIT
+import datetime as dtm
+import hashlib
+import json
+
+import pytest
+
+from chango import VersionHistoryFragment
+from chango.constants import MarkupLanguage
+from chango.error import ValidationError
+
+
+class TestVersionHistoryFragment:
+    fragment = VersionHistoryFragment(
+        uid="1.0",
+        date=dtm.date(2024, 1, 1),
+        markup=MarkupLanguage.MARKDOWN,
+        position=3,
+        content="# 1.0\n*2024-01-01*\n\n- ümlaut",
+    )
+
+    def test_content_hash(self):
+        assert (
+            self.fragment.content_hash
+            == hashlib.sha256(self.fragment.content.encode("utf-8")).hexdigest()
+        )
+
+    @pytest.mark.parametrize("uid", ["1.0", None], ids=["Released", "Unreleased"])
+    def test_string_round_trip(self, uid):
+        fragment = VersionHistoryFragment(
+            uid=uid,
+            date=dtm.date(2024, 1, 1) if uid else None,
+            markup=MarkupLanguage.HTML,
+            position=0,
+            content="<p>content</p>",
+        )
+        assert VersionHistoryFragment.from_string(fragment.to_string()) == fragment
+
+    def test_file_round_trip(self, tmp_path):
+        path = self.fragment.to_file(tmp_path / "1.0.fragment.json")
+        assert path == tmp_path / "1.0.fragment.json"
+        assert VersionHistoryFragment.from_file(path) == self.fragment
+
+    def test_hash_mismatch(self):
+        data = json.loads(self.fragment.to_string())
+        data["content"] = "tampered"
+        with pytest.raises(ValidationError, match="does not match its hash"):
+            VersionHistoryFragment.from_string(json.dumps(data))
+
+    @pytest.mark.parametrize(
+        "string",
+        ["no json", "{}", '{"uid": "1.0", "date": "invalid"}'],
+        ids=["NoJSON", "MissingKeys", "InvalidDate"],
+    )
+    def test_invalid(self, string):
+        with pytest.raises(ValidationError, match="Invalid version history fragment"):
+            VersionHistoryFragment.from_string(string)